@@ -9,9 +9,45 @@
 extern "C" {
 #endif
 
+/*
+ * Cholesky factorization method, set process-wide (thread-safe; read
+ * once per factorization); OkCholeskyLapack requires a build with LAPACK
+ * (make USE_LAPACK=1).
+ */
+typedef enum OPTKIT_CHOLESKY_METHOD {
+	OkCholeskyAuto = 0,
+	OkCholeskySerial = 1,
+	OkCholeskyTasks = 2,
+	OkCholeskyLapack = 3
+} OPTKIT_CHOLESKY_METHOD;
+
+ok_status linalg_cholesky_lapack_available(int * available);
+ok_status linalg_cholesky_set_method(const OPTKIT_CHOLESKY_METHOD method);
+ok_status linalg_cholesky_set_block_size(const size_t blk_dim);
+ok_status linalg_cholesky_get_config(OPTKIT_CHOLESKY_METHOD * method,
+	size_t * blk_dim);
 ok_status linalg_cholesky_decomp(void * linalg_handle, matrix * A);
 ok_status linalg_cholesky_svx(void * linalg_handle, const matrix * L,
 	vector * x);
+ok_status linalg_cholesky_update(void * linalg_handle, matrix * L,
+	vector * x, const int downdate);
+
+/*
+ * rectangular full packed (RFP) storage of a symmetric n x n matrix, or
+ * of its lower Cholesky factor: n(n + 1)/2 entries, held in a
+ * (2 * (n / 2) + 1) x (n - n / 2) matrix (see linalg_rfp_size)
+ */
+ok_status linalg_rfp_size(const size_t n, size_t * size1, size_t * size2);
+ok_status linalg_rfp_blocks(const matrix * R, matrix * L11, matrix * L21,
+	matrix * U22);
+ok_status linalg_rfp_gram(void * linalg_handle,
+	const enum CBLAS_TRANSPOSE transA, const ok_float alpha,
+	const matrix * A, const ok_float beta, matrix * R);
+ok_status linalg_cholesky_decomp_rfp(void * linalg_handle, matrix * R);
+ok_status linalg_cholesky_svx_rfp(void * linalg_handle, const matrix * R,
+	vector * x);
+ok_status linalg_cholesky_svx_rfp_batch(void * linalg_handle,
+	const matrix * R, matrix * X);
 
 /* TODO: consider changing this to matrix_reduce_unary(const enum t, matrix A,
 	vector v, const enum reduction_op, const enum unary_op) */
@@ -19,6 +55,8 @@ ok_status linalg_matrix_row_squares(const enum CBLAS_TRANSPOSE t,
 	const matrix * A, vector * v);
 ok_status linalg_matrix_broadcast_vector(matrix * A, const vector * v,
 	const enum OPTKIT_TRANSFORM operation, const enum CBLAS_SIDE side);
+ok_status linalg_matrix_diag_scale(matrix * A, const vector * d,
+	const vector * e);
 ok_status linalg_matrix_reduce_indmin(indvector * indices, vector * minima,
 	const matrix * A, const enum CBLAS_SIDE side);
 ok_status linalg_matrix_reduce_min(vector * minima, const matrix * A,
@@ -105,6 +105,14 @@ ok_status vector_safe_recip(vector * v);
 ok_status vector_sqrt(vector * v);
 ok_status vector_pow(vector * v, const ok_float x);
 ok_status vector_exp(vector * v);
+ok_status vector_axpby(vector * z, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y);
+ok_status vector_axpbypcz(vector * w, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y, const ok_float gamma,
+	const vector * z);
+ok_status vector_relaxed_dual_update(vector * zt12, vector * zt,
+	const vector * z12, const vector * z_prev, const vector * z,
+	const ok_float alpha);
 ok_status vector_indmin(const vector * v, size_t * idx);
 ok_status vector_min(const vector * v, ok_float * minval);
 ok_status vector_max(const vector * v, ok_float * maxval);
@@ -0,0 +1,57 @@
+#ifndef OPTKIT_OPERATOR_PANEL_H_
+#define OPTKIT_OPERATOR_PANEL_H_
+
+#include "optkit_abstract_operator.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * dense m x n operator s * DAE, with A a (row-major) host array that is
+ * never resident as a whole: products stream A through a panel of
+ * panel_rows rows. A may be a memory mapping of a file, in which case
+ * each product is one pass over the file.
+ *
+ * the scalings d, e and s are applied to each panel as it is loaded, so
+ * equilibrating or scaling the operator leaves A untouched. if form_gram
+ * is set (e.g., by a direct projector), the Gram matrix (s * DAE)ᵀ(s *
+ * DAE), lower triangle, is accumulated (SYRK per panel) in the same pass
+ * as the equilibration statistics, and kept until handed off.
+ */
+typedef struct panel_operator_data{
+	void * dense_handle;
+	const ok_float * A;
+	size_t panel_rows;
+	matrix * panel;
+	vector * d, * e, * v;
+	ok_float scaling;
+	matrix * gram;
+	int form_gram;
+	size_t passes;
+} panel_operator_data;
+
+void * panel_operator_data_alloc(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows);
+ok_status panel_operator_data_free(void * data);
+ok_status panel_operator_mul(void * data, vector * input, vector * output);
+ok_status panel_operator_mul_t(void * data, vector * input, vector * output);
+ok_status panel_operator_mul_fused(void * data, ok_float alpha, vector * input,
+	ok_float beta, vector * output);
+ok_status panel_operator_mul_t_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output);
+
+operator * panel_operator_alloc(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows);
+
+ok_status panel_operator_scale(operator * A, const ok_float scaling);
+ok_status panel_operator_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const ok_float pnorm);
+ok_status panel_operator_gram(operator * A, matrix * G);
+ok_status panel_operator_passes(operator * A, size_t * passes);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_OPERATOR_PANEL_H_ */
@@ -0,0 +1,45 @@
+#ifndef OPTKIT_OPERATOR_SCALED_H_
+#define OPTKIT_OPERATOR_SCALED_H_
+
+#include "optkit_abstract_operator.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * m x n operator s * DAE, wrapping an operator A of any kind that has no
+ * in-place scaling (e.g., a composed or otherwise matrix-free operator).
+ * the scalings d, e and s are owned by the wrapper and applied around
+ * each product with A, so scaling the wrapper leaves A untouched.
+ *
+ * u, v are work vectors of size n, m.
+ */
+typedef struct scaled_operator_data{
+	void * dense_handle;
+	operator * A;
+	vector * d, * e;
+	vector * u, * v;
+	ok_float scaling;
+} scaled_operator_data;
+
+void * scaled_operator_data_alloc(operator * A);
+ok_status scaled_operator_data_free(void * data);
+ok_status scaled_operator_mul(void * data, vector * input, vector * output);
+ok_status scaled_operator_mul_t(void * data, vector * input, vector * output);
+ok_status scaled_operator_mul_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output);
+ok_status scaled_operator_mul_t_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output);
+
+operator * scaled_operator_alloc(operator * A);
+
+ok_status scaled_operator_scale(operator * A, const ok_float scaling);
+ok_status scaled_operator_scale_left(operator * A, const vector * v);
+ok_status scaled_operator_scale_right(operator * A, const vector * v);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_OPERATOR_SCALED_H_ */
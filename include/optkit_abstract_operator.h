@@ -23,7 +23,9 @@ typedef enum OPTKIT_OPERATOR{
 	OkOperatorAdd = 103,
 	OkOperatorCat = 104,
 	OkOperatorSplit = 105,
+	OkOperatorScaled = 106,
 	OkOperatorDense = 201,
+	OkOperatorPanel = 202,
 	OkOperatorSparseCSR = 301,
 	OkOperatorSparseCSC = 302,
 	OkOperatorSparseCOO = 303,
@@ -73,8 +75,12 @@ static const char * optkit_op2str(OPTKIT_OPERATOR optype)
 		return "concatenation operator";
 	case OkOperatorSplit:
 		return "splitting operator";
+	case OkOperatorScaled:
+		return "scaled operator";
 	case OkOperatorDense:
 		return "dense operator";
+	case OkOperatorPanel:
+		return "panel (streamed dense) operator";
 	case OkOperatorSparseCSC:
 		return "sparse CSC operator";
 	case OkOperatorSparseCSR:
@@ -8,12 +8,21 @@
 extern "C" {
 #endif
 
-/* CGLS helper struct */
+/*
+ * CGLS helper struct
+ *
+ * norm_ref: if positive, CGLS stops when ||s|| < tol * norm_ref instead of
+ * ||s|| < tol * ||s_0||, so that a solve warm-started from x != 0 stops at
+ * the accuracy of a cold start with norm_ref = ||Aᵀb||
+ * iters: iterations taken by the last solve
+ */
 typedef struct cgls_helper{
 	vector p, q, r, s;
 	ok_float norm_s, norm_s0, norm_x, xmax;
 	ok_float alpha, beta, delta, gamma, gamma_prev, shrink;
 	void * blas_handle;
+	ok_float norm_ref;
+	uint iters;
 } cgls_helper;
 
 cgls_helper * cgls_helper_alloc(size_t m, size_t n);
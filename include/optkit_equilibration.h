@@ -5,18 +5,100 @@
 #include "optkit_operator_transforms.h"
 #include "optkit_operator_dense.h"
 #include "optkit_operator_sparse.h"
+#include "optkit_operator_scaled.h"
 
 #ifdef __cplusplus
 extern "C" {
 #endif
 
+#ifndef kEQUILMAXITER
+#define kEQUILMAXITER 300u
+#define kEQUILTOL (ok_float) 1e-2
+#endif
+
+#ifndef kNORMESTBLOCK
+#define kNORMESTBLOCK 2u
+#define kNORMESTMAXITER 16u
+#define kNORMESTTOL (ok_float) 1e-2
+#endif
+
+#ifndef kEQUILPROBES
+#define kEQUILPROBES 16u
+#define kEQUILPASSES 8u
+#endif
+
+/*
+ * dense equilibration methods:
+ *	OkEquilSinkhorn: regularized Sinkhorn-Knopp (row/column 1-norms);
+ *		stops when the 2-norm changes of d and e both fall below tol
+ *	OkEquilRuiz: Ruiz scaling (row/column inf-norms); stops when all
+ *		row and column inf-norms are within tol of 1
+ *
+ * operator equilibration method:
+ *	OkEquilRandomized: Ruiz scaling in the 2-norm, with the row/column
+ *		norms estimated from probes random sign vectors per pass
+ *		(probes apply and probes adjoint calls); maxiter is the number
+ *		of passes. stops when all estimated (normalized) row and
+ *		column norms are within tol of 1
+ */
+typedef enum OPTKIT_EQUILIBRATION_METHOD {
+	OkEquilSinkhorn = 0,
+	OkEquilRuiz = 1,
+	OkEquilRandomized = 2
+} OPTKIT_EQUILIBRATION_METHOD;
+
+typedef struct EquilibrationSettings {
+	uint method, maxiter;
+	ok_float tol;
+	uint probes;
+} equilibration_settings;
+
+/*
+ * iterations taken, and the spread (max / min) of the row and column
+ * norms of D * A * E, in the norm of the method (empty rows and columns
+ * are left out). for OkEquilRandomized, iterations counts passes and
+ * the spreads are those of the norms estimated in the last pass
+ */
+typedef struct EquilibrationInfo {
+	uint iterations;
+	ok_float row_spread, col_spread;
+} equilibration_info;
+
+/*
+ * operator norm estimate, and a basis V (host, column-major, size2 x
+ * block) of the leading right singular subspace it was found in; steps
+ * and apply + adjoint calls taken in iterations, products
+ */
+typedef struct OperatorNormEstimate {
+	ok_float norm;
+	size_t size2, block;
+	ok_float * V;
+	uint iterations, products;
+} operator_norm_estimate;
+
+ok_status equilibration_default_settings(equilibration_settings * settings);
+ok_status equilibration_randomized_settings(
+	equilibration_settings * settings);
+int equilibration_settings_are_default(const equilibration_settings * settings);
+ok_status matrix_equilibrate(void * linalg_handle, ok_float * A_in,
+	matrix * A_out, vector * d, vector * e, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings, equilibration_info * info);
 ok_status regularized_sinkhorn_knopp(void * linalg_handle, ok_float * A_in,
 	matrix * A_out, vector * d, vector *e, enum CBLAS_ORDER ord);
 
 ok_status operator_regularized_sinkhorn(void * linalg_handle, operator * A,
 	vector * d, vector * e, const ok_float pnorm);
+ok_status operator_randomized_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info);
+ok_status operator_equilibrate_settings(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info);
 ok_status operator_equilibrate(void * linalg_handle, operator * A, vector * d,
 	vector * e, const ok_float pnorm);
+ok_status operator_norm_estimate_free(operator_norm_estimate * est);
+ok_status operator_estimate_norm_lanczos(void * linalg_handle, operator * A,
+	const ok_float rtol, const uint maxiter, operator_norm_estimate * est);
 ok_status operator_estimate_norm(void * linalg_handle, operator * A,
 	ok_float * norm_est);
 
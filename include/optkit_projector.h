@@ -2,8 +2,13 @@
 #define OPTKIT_PROJECTOR_H_
 
 #include "optkit_dense.h"
+#include "optkit_sparse.h"
 #include "optkit_abstract_operator.h"
+#include "optkit_operator_dense.h"
+#include "optkit_operator_sparse.h"
+#include "optkit_operator_panel.h"
 #include "optkit_cg.h"
+#include "optkit_sparse_ldl.h"
 
 #ifdef __cplusplus
 extern "C" {
@@ -20,7 +25,9 @@ extern "C" {
 typedef enum OPTKIT_PROJECTOR {
 	OkProjectorDenseDirect = 101,
 	OkProjectorSparseDirect = 102,
-	OkProjectorIndirect = 103
+	OkProjectorIndirect = 103,
+	OkProjectorPanelDirect = 104,
+	OkProjectorIndirectPCG = 105
 } OPTKIT_PROJECTOR;
 
 typedef struct projector {
@@ -35,6 +42,11 @@ typedef struct projector {
 
 ok_status projector_normalization(projector * P, int * normalized);
 ok_status projector_get_norm(projector * P, ok_float * norm);
+ok_status projector_get_factor_memory(projector * P, size_t * bytes);
+ok_status projector_get_refinement_residual(projector * P,
+	ok_float * residual);
+ok_status projector_get_cg_iterations(projector * P, uint * iterations);
+ok_status projector_clear_warm_start(projector * P);
 
 typedef struct direct_projector {
 	matrix * A;
@@ -48,12 +60,24 @@ ok_status direct_projector_initialize(void * linalg_handle,
 	direct_projector * P, const int normalize);
 ok_status direct_projector_project(void * linalg_handle, direct_projector * P,
 	vector * x_in, vector * y_in, vector * x_out, vector * y_out);
+ok_status direct_projector_project_batch(void * linalg_handle,
+	direct_projector * P, matrix * X_in, matrix * Y_in, matrix * X_out,
+	matrix * Y_out);
 ok_status direct_projector_free(direct_projector * P);
 
+/*
+ * indirect projection onto {(x, y) : y = Ax}, with CGLS.
+ *
+ * dx holds the correction x_out - x_in of the last projection, from which
+ * CGLS is warm-started in the next one; iterations accumulates the CGLS
+ * iterations of all projections since allocation.
+ */
 typedef struct indirect_projector {
 	operator * A;
 	void * cgls_work;
 	uint flag;
+	vector * dx;
+	uint iterations;
 } indirect_projector;
 
 ok_status indirect_projector_alloc(indirect_projector * P, operator * A);
@@ -64,20 +88,89 @@ ok_status indirect_projector_project(void * linalg_handle,
 	vector * y_out);
 ok_status indirect_projector_free(indirect_projector * P);
 
+/*
+ * factor precision of a dense direct projector; also accepted as the
+ * direct argument of the abstract POGS solver (0: indirect projector)
+ */
+typedef enum OPTKIT_DIRECT_FACTOR {
+	OkDirectFull = 1,
+	OkDirectMixed = 2,
+	OkDirectPacked = 3
+} OPTKIT_DIRECT_FACTOR;
+
+/*
+ * direct projection onto {(x, y) : y = Ax} for dense A, with a Cholesky
+ * factor of I + AᵀA (skinny A) or I + AAᵀ (fat A).
+ *
+ * mixed precision mode (OkDirectMixed): the factor is formed and stored
+ * in single precision (L32, host memory, in the layout of A) instead of
+ * L, and each projection refines the solution of the linear system with
+ * up to refinement_steps steps of iterative refinement against A, which
+ * stays in full precision. refinement_residual is the relative residual
+ * ||b - (I + AᵀA)x|| / ||b|| (resp. I + AAᵀ) of the last projection.
+ *
+ * packed mode (OkDirectPacked): I + AᵀA (or I + AAᵀ) is formed and
+ * factored in rectangular full packed storage (see linalg_rfp_size): L
+ * holds n(n + 1)/2 instead of n² entries, n = min(m, n).
+ */
 typedef struct dense_direct_projector {
 	matrix * A;
 	matrix * L;
 	void * linalg_handle;
 	ok_float normA;
 	int skinny, normalized;
+	float * L32, * w32;
+	vector * rhs, * r;
+	ok_float * w;
+	uint refinement_steps;
+	ok_float refinement_residual;
+	int packed;
 } dense_direct_projector;
 
 void * dense_direct_projector_data_alloc(matrix * A);
+void * dense_direct_projector_data_alloc_mixed(matrix * A);
+void * dense_direct_projector_data_alloc_packed(matrix * A);
 ok_status dense_direct_projector_data_free(void * data);
+ok_status dense_direct_projector_factor(void * data);
 ok_status dense_direct_projector_initialize(void * data, const int normalize);
 ok_status dense_direct_projector_project(void * data, vector * x_in,
 	vector * y_in, vector * x_out, vector * y_out, ok_float tol);
 projector * dense_direct_projector_alloc(matrix * A);
+projector * dense_direct_projector_alloc_mixed(matrix * A);
+projector * dense_direct_projector_alloc_packed(matrix * A);
+
+/*
+ * direct projection onto {(x, y) : y = Ax} for sparse A, by solving the
+ * quasi-definite KKT system
+ *
+ *	[ I   Aᵀ ] [ x ]   [ x_in ]
+ *	[ A   -I ] [ s ] = [ y_in ],	y = s + y_in,
+ *
+ * with a sparse LDLᵀ factorization of K. the ordering and symbolic
+ * analysis of K are computed once; the numeric factorization is redone
+ * when the values of A change. K and the factor live in host memory.
+ */
+typedef struct sparse_direct_projector {
+	sp_matrix * A;
+	sparse_ldl F;
+	size_t m, n;
+	ok_int * K_ptr, * K_ind;
+	ok_float * K_val;
+	ok_int * A_ind, * A_ptr;
+	ok_float * A_val;
+	size_t * K_map;
+	ok_float * rhs, * y_in;
+	ok_float normA;
+	int normalized;
+} sparse_direct_projector;
+
+void * sparse_direct_projector_data_alloc(sp_matrix * A);
+ok_status sparse_direct_projector_data_free(void * data);
+ok_status sparse_direct_projector_factor(void * data);
+ok_status sparse_direct_projector_initialize(void * data, const int normalize);
+ok_status sparse_direct_projector_project(void * data, vector * x_in,
+	vector * y_in, vector * x_out, vector * y_out, ok_float tol);
+projector * sparse_direct_projector_alloc(sp_matrix * A);
 
 typedef struct indirect_projector_generic {
 	operator * A;
@@ -86,6 +179,8 @@ typedef struct indirect_projector_generic {
 	ok_float normA;
 	int normalized;
 	uint flag;
+	vector * dx;
+	uint iterations;
 } indirect_projector_generic;
 
 void * indirect_projector_data_alloc(operator * A);
@@ -95,6 +190,84 @@ ok_status indirect_projector_g_project(void * data, vector * x_in,
 	vector * y_in, vector * x_out, vector * y_out, ok_float tol);
 projector * indirect_projector_generic_alloc(operator * A);
 
+/*
+ * preconditioner of a PCG projector; also accepted as the direct argument
+ * of the abstract POGS solver, selecting a PCG projector with block size
+ * kPRECONDBLOCK for OkPrecondBlockJacobi
+ */
+typedef enum OPTKIT_PRECONDITIONER {
+	OkPrecondJacobi = 4,
+	OkPrecondBlockJacobi = 5
+} OPTKIT_PRECONDITIONER;
+
+#ifndef kPRECONDBLOCK
+#define kPRECONDBLOCK 32u
+#endif
+
+/*
+ * indirect projection onto {(x, y) : y = Ax} by preconditioned CG on
+ *
+ *	(I + AᵀA)x_out = x_in + Aᵀy_in,	y_out = Ax_out,
+ *
+ * warm-started from the previous x_out.
+ *
+ * the preconditioner M of I + AᵀA is formed at initialize and kept for
+ * the life of the projector:
+ *	- Jacobi: d = diag(I + AᵀA)⁻¹,
+ *	- block-Jacobi: Cholesky factors of the diagonal blocks of I + AᵀA
+ *	  with block size block, block j stored in columns
+ *	  [j * block, (j + 1) * block) of the block x n matrix L.
+ * the column norms and diagonal blocks of AᵀA are read from the stored
+ * entries of dense and sparse (CSR, CSC) operators; for other operators
+ * they are formed from n products with A.
+ *
+ * rhs, a are work vectors of size n, m; C is an m x block work matrix,
+ * allocated only for operators probed by products.
+ */
+typedef struct pcg_projector {
+	operator * A;
+	operator * M;
+	void * pcg_work;
+	void * linalg_handle;
+	OPTKIT_PRECONDITIONER precond;
+	size_t block;
+	vector * d;
+	matrix * L, * C;
+	vector * rhs, * a;
+	ok_float normA;
+	int normalized, initialized;
+	uint iterations;
+} pcg_projector;
+
+void * pcg_projector_data_alloc(operator * A,
+	const OPTKIT_PRECONDITIONER precond, const size_t block);
+ok_status pcg_projector_data_free(void * data);
+ok_status pcg_projector_initialize(void * data, const int normalize);
+ok_status pcg_projector_project(void * data, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out, ok_float tol);
+projector * pcg_projector_alloc(operator * A,
+	const OPTKIT_PRECONDITIONER precond, const size_t block);
+
+/*
+ * direct projection onto {(x, y) : y = Ax} for a tall (m >= n) panel
+ * operator A, whose rows are streamed from host memory (or a memory-mapped
+ * file): only the n x n Cholesky factor L of I + AᵀA is resident.
+ */
+typedef struct panel_direct_projector {
+	operator * A;
+	matrix * L;
+	void * linalg_handle;
+	ok_float normA;
+	int normalized;
+} panel_direct_projector;
+
+void * panel_direct_projector_data_alloc(operator * A);
+ok_status panel_direct_projector_data_free(void * data);
+ok_status panel_direct_projector_initialize(void * data, const int normalize);
+ok_status panel_direct_projector_project(void * data, vector * x_in,
+	vector * y_in, vector * x_out, vector * y_out, ok_float tol);
+projector * panel_direct_projector_alloc(operator * A);
+
 #ifdef __cplusplus
 }
 #endif
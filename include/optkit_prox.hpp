@@ -551,6 +551,15 @@ ok_status function_vector_mul_(function_vector_<T> * f, const vector_<T> * v);
 template<typename T>
 ok_status function_vector_div_(function_vector_<T> * f, const vector_<T> * v);
 template<typename T>
+ok_status function_vector_scatter_va_(function_vector_<T> * f,
+	const function_t_<T> * h, const size_t * indices, size_t count);
+template<typename T>
+ok_status function_vector_mul_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count);
+template<typename T>
+ok_status function_vector_div_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count);
+template<typename T>
 ok_status function_vector_print_(function_vector_<T> *f);
 template<typename T>
 ok_status prox_eval_vector_(const function_vector_<T> * f, T rho,
@@ -572,6 +581,12 @@ ok_status function_vector_memcpy_va(function_vector * f, function_t * h);
 ok_status function_vector_memcpy_av(function_t * h, function_vector * f);
 ok_status function_vector_mul(function_vector * f, const vector * v);
 ok_status function_vector_div(function_vector * f, const vector * v);
+ok_status function_vector_scatter_va(function_vector * f, const function_t * h,
+	const size_t * indices, size_t count);
+ok_status function_vector_mul_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count);
+ok_status function_vector_div_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count);
 ok_status function_vector_print(function_vector *f);
 ok_status prox_eval_vector(const function_vector * f, ok_float rho,
 	const vector * x_in, vector * x_out);
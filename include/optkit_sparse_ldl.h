@@ -0,0 +1,57 @@
+#ifndef OPTKIT_SPARSE_LDL_H_
+#define OPTKIT_SPARSE_LDL_H_
+
+#include "optkit_defs.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * sparse LDLᵀ factorization (host memory) of a symmetric matrix K,
+ *
+ *	P K Pᵀ = L D Lᵀ,
+ *
+ * with L unit lower triangular and D diagonal. the work is split into
+ *
+ *	analysis: fill-reducing (minimum degree) ordering P, elimination
+ *		tree and column counts of L; depends only on the pattern of K
+ *	factorization: numeric values of L, D for the current values of K
+ *
+ * so that matrices sharing a sparsity pattern are analyzed once. K is
+ * given in compressed sparse column form, with either both triangles or
+ * only the upper triangle stored; entries below the diagonal are
+ * ignored. no pivoting is performed: K should be quasi-definite (or
+ * definite), so that the factorization exists for any symmetric ordering.
+ *
+ * the analysis keeps the pattern of K with both triangles (Sp, Si), and
+ * the position Sk[q] of entry q in the stored upper triangle of K, from
+ * which the factorization gathers the values.
+ */
+typedef struct sparse_ldl {
+	size_t size, nnz_L;
+	ok_int * perm, * iperm;
+	ok_int * Sp, * Si, * Sk;
+	ok_int * parent, * Lnz, * Lp, * Li;
+	ok_float * Lx, * D;
+	ok_float * y;
+	ok_int * pattern, * flag;
+	int analyzed, factored;
+} sparse_ldl;
+
+ok_status sparse_ldl_alloc(sparse_ldl * F, size_t size);
+ok_status sparse_ldl_free(sparse_ldl * F);
+ok_status sparse_ldl_min_degree(size_t size, const ok_int * Kp,
+	const ok_int * Ki, ok_int * perm);
+ok_status sparse_ldl_analyze(sparse_ldl * F, const ok_int * Kp,
+	const ok_int * Ki);
+ok_status sparse_ldl_factor(sparse_ldl * F, const ok_int * Kp,
+	const ok_int * Ki, const ok_float * Kx);
+ok_status sparse_ldl_solve(sparse_ldl * F, ok_float * x);
+ok_status sparse_ldl_memory(const sparse_ldl * F, size_t * bytes);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_SPARSE_LDL_H_ */
@@ -0,0 +1,55 @@
+#ifndef OPTKIT_ANDERSON_H_
+#define OPTKIT_ANDERSON_H_
+
+#include "optkit_dense.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef ANDERSON_CONSTANTS
+#define ANDERSON_CONSTANTS
+#define kANDERSONTYPE 2u
+#define kANDERSONMEMORY 5u
+#define kANDERSONSAFEGUARD (ok_float) 1.
+#define kANDERSONREG (ok_float) 1e-10
+#endif /* ANDERSON_CONSTANTS */
+
+/*
+ * Anderson acceleration helper for a fixed-point iteration w <- T(w).
+ *
+ * history of the last (up to) lookback residual differences,
+ *	DF = [..., f_i - f_{i-1}, ...],	f_i = T(w_i) - w_i,
+ * and image differences,
+ *	DG = [..., g_i - g_{i-1}, ...],	g_i = T(w_i),
+ * is kept in the columns of DF and DG (circular buffer).
+ *
+ * type 2: gamma = argmin ||f - DF * gamma||_2
+ * type 1: gamma solves (DW' * DF) gamma = DW' * f, with DW = DG - DF
+ *
+ * accelerated iterate: w+ = g - DG * gamma
+ */
+typedef struct anderson_accelerator{
+	size_t vector_dim, lookback_dim, n_hist, index;
+	uint type;
+	int has_iterate, has_prev, accelerated;
+	ok_float safeguard, regularization, norm_f_prev;
+	vector w, f, g, f_prev, g_prev;
+	matrix DF, DG, gram;
+	vector gamma;
+	ok_float * gram_host, * gamma_host;
+	size_t accepted, rejected;
+} anderson_accelerator;
+
+anderson_accelerator * anderson_accelerator_alloc(size_t vector_dim,
+	size_t lookback_dim, uint type, ok_float safeguard);
+ok_status anderson_accelerator_free(anderson_accelerator * aa);
+ok_status anderson_reset(anderson_accelerator * aa);
+ok_status anderson_accelerate(void * linalg_handle, anderson_accelerator * aa,
+	vector * iterate);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_ANDERSON_H_ */
@@ -27,6 +27,11 @@ typedef struct POGSMatrix {
 	vector * d, * e;
 	ok_float normA;
 	int skinny, normalized, equilibrated;
+	/* A (and factor L) are views of caller-owned host memory */
+	int borrowed;
+	/* outcome and wall-clock time of the equilibration in pogs_init */
+	equilibration_info equil;
+	ok_float equil_time;
 } pogs_matrix;
 
 typedef struct POGSSolver {
@@ -37,21 +42,59 @@ typedef struct POGSSolver {
 	pogs_settings * settings;
 	void * linalg_handle;
 	ok_float init_time;
+	pogs_telemetry * telemetry;
+	volatile int cancel;
 } pogs_solver;
 
+/*
+ * K problems solved against one pogs_matrix: column j of each (m + n) x K
+ * matrix holds the block vector [y; x] for the problem in batch slot j.
+ * index[j] maps slots to problems; per-problem state is indexed by problem.
+ */
+typedef struct POGSBatch {
+	size_t K, m, n;
+	matrix * primal, * primal12, * dual, * dual12, * prev, * temp;
+	vector * swap;
+	pogs_variables ** z;
+	function_vector * f, * g;
+	ok_float * rho;
+	adapt_params * rho_params;
+	pogs_objectives * obj;
+	pogs_residuals * res;
+	pogs_tolerances * eps;
+	size_t * index;
+} pogs_batch;
+
 int is_direct(void);
 
 POGS_PRIVATE ok_status pogs_matrix_alloc(pogs_matrix ** M, size_t m, size_t n,
 	enum CBLAS_ORDER ord);
+POGS_PRIVATE ok_status pogs_matrix_view(pogs_matrix ** M, ok_float * A_equil,
+	ok_float * LLT_factorization, size_t m, size_t n, enum CBLAS_ORDER ord);
 POGS_PRIVATE ok_status pogs_matrix_free(pogs_matrix * M);
 POGS_PRIVATE ok_status pogs_solver_alloc(pogs_solver ** solver, size_t m,
 	size_t n, enum CBLAS_ORDER ord);
+POGS_PRIVATE ok_status pogs_solver_view_alloc(pogs_solver ** solver,
+	ok_float * A_equil, ok_float * LLT_factorization, size_t m, size_t n,
+	enum CBLAS_ORDER ord);
 POGS_PRIVATE ok_status pogs_solver_free(pogs_solver * solver);
 POGS_PRIVATE ok_status equilibrate(void * linalg_handle, ok_float * A_orig,
-	pogs_matrix * M, enum CBLAS_ORDER ord);
+	pogs_matrix * M, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings);
 POGS_PRIVATE ok_status estimate_norm(void * linalg_handle, pogs_matrix * M,
 	ok_float * normest);
 POGS_PRIVATE ok_status normalize_DAE(void * linalg_handle, pogs_matrix * M);
+POGS_PRIVATE ok_status pogs_matrix_cache_key(pogs_cache_key * key,
+	const ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings);
+POGS_PRIVATE ok_status pogs_matrix_load_cached(pogs_matrix * M,
+	const pogs_cache_entry * entry);
+POGS_PRIVATE ok_status pogs_matrix_cache(pogs_matrix * M,
+	const pogs_cache_key * key);
+POGS_PRIVATE ok_status pogs_solver_resize_rows(pogs_solver * solver,
+	const size_t * removed, size_t n_removed, size_t n_appended);
+POGS_PRIVATE ok_status pogs_matrix_refactor(void * linalg_handle,
+	pogs_matrix * M);
 POGS_PRIVATE ok_status update_problem(pogs_solver * solver, function_vector * f,
 	function_vector * g);
 POGS_PRIVATE ok_status initialize_variables(pogs_solver * solver);
@@ -65,12 +108,48 @@ POGS_PRIVATE int check_convergence(void * linalg_handle, pogs_solver * solver,
 POGS_PRIVATE ok_status project_primal(void * linalg_handle, projector_ * proj,
 	pogs_variables * z,  ok_float alpha);
 POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info);
+POGS_PRIVATE ok_status block_vector_view_column(block_vector ** z,
+	matrix * Z, size_t j, size_t m, size_t n);
+POGS_PRIVATE ok_status block_vector_view_free(block_vector * z);
+POGS_PRIVATE ok_status pogs_batch_alloc(pogs_batch ** batch, size_t K,
+	size_t m, size_t n, enum CBLAS_ORDER ord);
+POGS_PRIVATE ok_status pogs_batch_free(pogs_batch * batch);
+POGS_PRIVATE ok_status pogs_batch_swap(pogs_batch * batch, size_t i, size_t j);
+POGS_PRIVATE ok_status project_primal_batch(void * linalg_handle,
+	projector_ * proj, pogs_batch * batch, size_t K, ok_float alpha);
+POGS_PRIVATE ok_status update_residuals_batch(void * linalg_handle,
+	pogs_solver * solver, pogs_batch * batch, size_t K);
+POGS_PRIVATE ok_status pogs_batch_loop(pogs_solver * solver,
+	pogs_batch * batch, pogs_info * info, pogs_output * output);
 
 pogs_solver * pogs_init(ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord);
+pogs_solver * pogs_init_equil(ok_float * A, size_t m, size_t n,
+	enum CBLAS_ORDER ord, const equilibration_settings * equil);
 ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	function_vector * g, const pogs_settings * settings, pogs_info * info,
 	pogs_output * output);
+ok_status pogs_update_objectives(pogs_solver * solver,
+	const size_t * f_indices, const function_t * f_values, size_t f_count,
+	const size_t * g_indices, const function_t * g_values, size_t g_count);
+ok_status pogs_solver_append_rows(pogs_solver * solver, const ok_float * R,
+	size_t k, enum CBLAS_ORDER ord);
+ok_status pogs_solver_remove_rows(pogs_solver * solver,
+	const size_t * indices, size_t k);
+ok_status pogs_solve_batch(pogs_solver * solver, size_t K,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output);
+ok_status pogs_solve_path(pogs_solver * solver, function_vector * f,
+	function_vector * g, const pogs_settings * settings, size_t K,
+	const ok_float * lambda, pogs_info * info, pogs_output * output);
+ok_status pogs_solve_many_threads(size_t N, pogs_solver ** solvers,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output, size_t n_threads);
 ok_status pogs_finish(pogs_solver * solver, int reset);
+ok_status pogs_telemetry_enable(pogs_solver * solver, size_t capacity);
+ok_status pogs_telemetry_disable(pogs_solver * solver);
+ok_status pogs_telemetry_read(const pogs_solver * solver,
+	pogs_telemetry_record * records, size_t * count);
+ok_status pogs_cancel(pogs_solver * solver);
 ok_status pogs(ok_float * A, function_vector * f, function_vector * g,
 	const pogs_settings * settings, pogs_info * info, pogs_output * output,
 	enum CBLAS_ORDER ord, int reset);
@@ -79,6 +158,11 @@ pogs_solver * pogs_load_solver(ok_float * A_equil,
 	ok_float * e, ok_float * z, ok_float * z12, ok_float * z_dual,
 	ok_float * z_dual12, ok_float * z_prev, ok_float rho,
 	size_t m, size_t n, enum CBLAS_ORDER ord);
+pogs_solver * pogs_load_solver_view(ok_float * A_equil,
+	ok_float * LLT_factorization, ok_float * d,
+	ok_float * e, ok_float * z, ok_float * z12, ok_float * z_dual,
+	ok_float * z_dual12, ok_float * z_prev, ok_float rho,
+	size_t m, size_t n, enum CBLAS_ORDER ord);
 ok_status pogs_extract_solver(pogs_solver * solver, ok_float * A_equil,
 	ok_float * LLT_factorization, ok_float * d,
 	ok_float * e, ok_float * z, ok_float * z12, ok_float * z_dual,
@@ -4,7 +4,10 @@
 #include "optkit_abstract_operator.h"
 #include "optkit_operator_dense.h"
 #include "optkit_operator_sparse.h"
+#include "optkit_operator_panel.h"
+#include "optkit_operator_scaled.h"
 #include "optkit_operator_typesafe.h"
+#include <pthread.h>
 #include "optkit_timer.h"
 
 #ifndef OPTKIT_POGS_IMPLEMENTATION_
@@ -26,8 +29,67 @@ typedef struct POGSWork {
 		vector * d, vector * e, const ok_float pnorm);
 	ok_float normA;
 	int skinny, normalized, equilibrated;
+	/* cache key of the operator A as given to pogs_init */
+	pogs_cache_key key;
+	int keyed;
+	ok_float equil_time;
+	/*
+	 * operators with no in-place scaling are wrapped in a scaled
+	 * operator A (owned by W) and equilibrated by the randomized
+	 * method with settings equil
+	 */
+	int wrapped;
+	equilibration_settings equil;
+	equilibration_info equil_info;
+	/* apply + adjoint calls taken by the last norm estimate */
+	uint norm_products;
 } pogs_work;
 
+/*
+ * checkpoint file: this header, followed by (host, ok_float) arrays
+ *
+ *	A_equil		key.nnz entries: values of the equilibrated operator
+ *	L		L_size entries: factor of a dense direct projector
+ *	d, e		key.size1, key.size2 entries
+ *	z, z12, zt, zt12, zprev	(key.size1 + key.size2) entries each
+ *
+ * the key identifies the operator given to pogs_init (contents, shape,
+ * layout, kind, projector, equilibration norm and precision).
+ */
+#ifndef OPTKIT_POGS_CHECKPOINT_VERSION
+#define OPTKIT_POGS_CHECKPOINT_VERSION 2u
+#endif
+
+typedef struct POGSCheckpointHeader {
+	char magic[8];
+	uint version;
+	pogs_cache_key key;
+	size_t L_size;
+	ok_float normA, rho;
+	uint k;
+} pogs_checkpoint_header;
+
+/*
+ * asynchronous checkpoints, every interval iterations: the iterates are
+ * copied to a host staging buffer in the solver thread and written by a
+ * background thread to filename (via a temporary file and rename, so
+ * the last complete checkpoint survives a crash during a write). a
+ * checkpoint due while the previous write is in flight is skipped. the
+ * static part (equilibrated operator, factor, d, e) is staged once.
+ */
+typedef struct POGSCheckpointer {
+	char * filename;
+	uint interval;
+	pogs_checkpoint_header header;
+	pogs_cache_entry * entry;
+	ok_float * z;
+	pthread_t thread;
+	pthread_mutex_t lock;
+	int busy, joinable;
+	ok_status err;
+	size_t written;
+} pogs_checkpointer;
+
 typedef struct POGSSolver {
 	pogs_work * W;
 	pogs_variables * z;
@@ -36,6 +98,15 @@ typedef struct POGSSolver {
 	pogs_settings * settings;
 	void * linalg_handle;
 	ok_float init_time;
+	pogs_checkpointer * checkpoint;
+	pogs_telemetry * telemetry;
+	volatile int cancel;
+	/*
+	 * k: iteration count of the iterates, set by each solve (and by
+	 * pogs_checkpoint_restore). k_start: count restored from a
+	 * checkpoint, continued by the next solve with settings->resume
+	 */
+	uint k, k_start;
 } pogs_solver;
 
 POGS_PRIVATE ok_status pogs_work_alloc(pogs_work ** W, operator * A, int direct);
@@ -48,6 +119,20 @@ POGS_PRIVATE ok_status equilibrate(void * linalg_handle, pogs_work * W,
 POGS_PRIVATE ok_float estimate_norm(void * linalg_handle, pogs_work * W,
 	ok_float * normest);
 POGS_PRIVATE ok_status normalize_DAE(void * linalg_handle, pogs_work * W);
+POGS_PRIVATE ok_status update_projector_tol(const pogs_residuals * res,
+	const pogs_tolerances * eps, ok_float * tol);
+POGS_PRIVATE ok_status pogs_work_cache_key(pogs_cache_key * key, operator * A,
+	const int direct, const ok_float equil_norm, int * cacheable);
+POGS_PRIVATE ok_status pogs_work_load_cached(pogs_work * W,
+	const pogs_cache_entry * entry);
+POGS_PRIVATE ok_status pogs_work_export(pogs_work * W,
+	const pogs_cache_key * key, pogs_cache_entry ** entry);
+POGS_PRIVATE ok_status pogs_work_cache(pogs_work * W,
+	const pogs_cache_key * key);
+POGS_PRIVATE ok_status pogs_checkpoint_stage(pogs_solver * solver,
+	pogs_checkpointer * ckpt, uint k);
+POGS_PRIVATE ok_status pogs_checkpoint_async(pogs_solver * solver, uint k);
+POGS_PRIVATE ok_status pogs_checkpoint_wait(pogs_checkpointer * ckpt);
 POGS_PRIVATE ok_status update_problem(pogs_solver * solver, function_vector * f,
 	function_vector * g);
 POGS_PRIVATE ok_status initialize_variables(pogs_solver * solver);
@@ -61,9 +146,20 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info);
 
 pogs_solver * pogs_init(operator * A, const int direct,
 	const ok_float equil_norm);
+pogs_solver * pogs_init_equil(operator * A, const int direct,
+	const ok_float equil_norm, const equilibration_settings * equil);
 ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	function_vector * g, const pogs_settings * settings, pogs_info * info,
 	pogs_output * output);
+ok_status pogs_update_objectives(pogs_solver * solver,
+	const size_t * f_indices, const function_t * f_values, size_t f_count,
+	const size_t * g_indices, const function_t * g_values, size_t g_count);
+ok_status pogs_solve_path(pogs_solver * solver, function_vector * f,
+	function_vector * g, const pogs_settings * settings, size_t K,
+	const ok_float * lambda, pogs_info * info, pogs_output * output);
+ok_status pogs_solve_many_threads(size_t N, pogs_solver ** solvers,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output, size_t n_threads);
 ok_status pogs_finish(pogs_solver * solver, const int reset);
 ok_status pogs(operator * A, function_vector * f, function_vector * g,
 	const pogs_settings * settings, pogs_info * info, pogs_output * output,
@@ -74,16 +170,23 @@ operator * pogs_dense_operator_gen(const ok_float * A, size_t m, size_t n,
 operator * pogs_sparse_operator_gen(const ok_float * val, const ok_int * ind,
 	const ok_int * ptr, size_t m, size_t n, size_t nnz,
 	enum CBLAS_ORDER order);
+operator * pogs_panel_operator_gen(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows);
 ok_status pogs_dense_operator_free(operator * A);
 ok_status pogs_sparse_operator_free(operator * A);
-// pogs_solver * pogs_load_solver(operator * op_equil,
-// 	operator * LLT_factorization, ok_float * d, ok_float * e, ok_float * z,
-// 	ok_float * z12, ok_float * z_dual, ok_float * z_dual12,
-// 	ok_float * z_prev, ok_float rho, size_t m, size_t n, int direct);
-// void pogs_extract_solver(pogs_solver * solver, operator * op_equil,
-// 	operator * LLT_factorization, ok_float * d, ok_float * e, ok_float * z,
-// 	ok_float * z12, ok_float * z_dual, ok_float * z_dual12,
-// 	ok_float * z_prev, ok_float * rho);
+ok_status pogs_panel_operator_free(operator * A);
+ok_status pogs_checkpoint_save(pogs_solver * solver, const char * filename);
+pogs_solver * pogs_checkpoint_restore(operator * A, const int direct,
+	const ok_float equil_norm, const char * filename);
+ok_status pogs_checkpoint_enable(pogs_solver * solver, const char * filename,
+	uint interval);
+ok_status pogs_checkpoint_disable(pogs_solver * solver);
+ok_status pogs_checkpoint_count(pogs_solver * solver, size_t * count);
+ok_status pogs_telemetry_enable(pogs_solver * solver, size_t capacity);
+ok_status pogs_telemetry_disable(pogs_solver * solver);
+ok_status pogs_telemetry_read(const pogs_solver * solver,
+	pogs_telemetry_record * records, size_t * count);
+ok_status pogs_cancel(pogs_solver * solver);
 
 #ifdef __cplusplus
 }
@@ -0,0 +1,103 @@
+#ifndef OPTKIT_POGS_CACHE_H_
+#define OPTKIT_POGS_CACHE_H_
+
+#include <stdint.h>
+#include "optkit_defs.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* default cache capacity: 256 MB */
+#define kPOGSCACHECAPACITY ((size_t) 1 << 28)
+
+/*
+ * cache key: content hash of the input matrix, plus the shape, layout,
+ * precision and solver variant (projector kind, equilibration norm, ...)
+ * that together determine the cached factorization.
+ *
+ * check is a second hash of the same contents, chained from the seed
+ * kPOGSCACHECHECKSEED; a hit must match both, so a lookup reuses another
+ * matrix's factorization only on a 128-bit collision.
+ */
+#define kPOGSCACHECHECKSEED 0x9E3779B97F4A7C15ULL
+
+typedef struct POGSCacheKey {
+	uint64_t hash, check;
+	size_t size1, size2, nnz;
+	enum CBLAS_ORDER order;
+	uint variant;
+	size_t precision;
+} pogs_cache_key;
+
+/*
+ * cached (host) copies of the solver matrix state after pogs_init:
+ *
+ *	A_equil = D * A * E / normA	(nnz entries)
+ *	d, e				(size1 and size2 entries)
+ *	L, Cholesky factor of projector	(L_size entries, 0 if not direct)
+ *
+ * pins counts lookups not yet released; pinned entries are not evicted.
+ */
+typedef struct POGSCacheEntry {
+	pogs_cache_key key;
+	ok_float * A_equil, * d, * e, * L;
+	size_t L_size, bytes, pins;
+	ok_float normA;
+	/* row/column norm spreads reached by the equilibration */
+	ok_float equil_row_spread, equil_col_spread;
+	struct POGSCacheEntry * prev, * next;
+} pogs_cache_entry;
+
+typedef struct POGSCacheStats {
+	size_t hits, misses, evictions, entries, bytes, capacity;
+} pogs_cache_stats;
+
+/*
+ * operator norm estimates: the last estimate, and the subspace V (size2
+ * x block, column-major) it was found in, for each of the most recently
+ * initialized operators, by identity (address), kind and shape. unlike
+ * the factorization cache, entries survive changes to the operator's
+ * values, and serve as the starting point of the next estimate.
+ */
+#ifndef kPOGSNORMCACHESIZE
+#define kPOGSNORMCACHESIZE 16u
+#endif
+
+typedef struct POGSNormCacheEntry {
+	const void * id;
+	uint kind;
+	size_t size1, size2, block;
+	ok_float * V;
+	ok_float norm;
+	uint64_t stamp;
+} pogs_norm_cache_entry;
+
+uint64_t pogs_cache_hash(const void * data, size_t bytes, uint64_t seed);
+ok_status pogs_cache_key_set(pogs_cache_key * key, uint64_t hash,
+	uint64_t check, size_t size1, size_t size2, size_t nnz,
+	enum CBLAS_ORDER order, uint variant);
+int pogs_cache_key_match(const pogs_cache_key * k1,
+	const pogs_cache_key * k2);
+pogs_cache_entry * pogs_cache_entry_alloc(const pogs_cache_key * key,
+	size_t L_size);
+ok_status pogs_cache_entry_free(pogs_cache_entry * entry);
+
+pogs_cache_entry * pogs_cache_lookup(const pogs_cache_key * key);
+ok_status pogs_cache_release(pogs_cache_entry * entry);
+ok_status pogs_cache_insert(pogs_cache_entry * entry);
+
+ok_status pogs_cache_set_capacity(size_t bytes);
+ok_status pogs_cache_clear(void);
+ok_status pogs_cache_get_stats(pogs_cache_stats * stats);
+ok_status pogs_norm_cache_load(const void * id, uint kind, size_t size1,
+	size_t size2, ok_float ** V, size_t * block, ok_float * norm);
+ok_status pogs_norm_cache_store(const void * id, uint kind, size_t size1,
+	size_t size2, const ok_float * V, size_t block, ok_float norm);
+ok_status pogs_norm_cache_clear(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_POGS_CACHE_H_ */
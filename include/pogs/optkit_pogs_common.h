@@ -5,6 +5,9 @@
 #include "optkit_prox.hpp"
 #include "optkit_equilibration.h"
 #include "optkit_projector.h"
+#include "optkit_pogs_cache.h"
+#include "optkit_anderson.h"
+#include "optkit_pogs_telemetry.h"
 
 #ifdef __cplusplus
 extern "C" {
@@ -30,6 +33,9 @@ extern "C" {
 #define kVERBOSE 2u
 #define kSUPPRESS 0u
 #define kRESUME 0
+#define kACCELERATE 0
+#define kCHECKINTERVAL 1u
+#define kTIMELIMIT (ok_float) 0
 #define kRHOMAX (ok_float) 1e4
 #define kRHOMIN (ok_float) 1e-4
 #define kDELTAMAX (ok_float) 2.
@@ -66,13 +72,44 @@ typedef struct POGSSettings {
 	uint maxiter, verbose, suppress;
 	int adaptiverho, gapstop, warmstart, resume;
 	ok_float * x0, * nu0;
+	int accelerate;
+	uint anderson_type, anderson_memory;
+	ok_float anderson_safeguard;
+	uint check_interval;
+	ok_float time_limit;
 } pogs_settings;
 
+/*
+ * how a solve ended: converged, maxiter reached, or interrupted by the
+ * time limit (settings->time_limit, in seconds) or by pogs_cancel();
+ * OkPogsUnsolved if it stopped on error
+ */
+typedef enum OPTKIT_POGS_STATUS {
+	OkPogsUnsolved = 0,
+	OkPogsConverged = 1,
+	OkPogsMaxIter = 2,
+	OkPogsTimeLimit = 3,
+	OkPogsCancelled = 4
+} OPTKIT_POGS_STATUS;
+
+/*
+ * equil_time: wall-clock time of the equilibration in pogs_init (0 if it
+ * was reused from the factorization cache); equil_row_spread and
+ * equil_col_spread: max / min of the row and column norms of the
+ * equilibrated matrix (dense POGS; 0 where not measured); cg_iters:
+ * total CGLS iterations of the indirect projections in the solve (0 for
+ * direct projectors)
+ */
 typedef struct POGSInfo {
 	int err;
 	int converged;
 	uint k;
 	ok_float obj, rho, setup_time, solve_time;
+	uint k_accel;
+	ok_float refinement_residual;
+	int status;
+	ok_float equil_time, equil_row_spread, equil_col_spread;
+	uint cg_iters;
 } pogs_info;
 
 typedef struct POGSOutput {
@@ -85,8 +122,22 @@ typedef struct POGSVariables {
 	size_t m, n;
 } pogs_variables;
 
+/*
+ * thread safety: the POGS libraries keep two pieces of process-wide
+ * mutable state, the factorization cache and the dense Cholesky backend
+ * settings (linalg_cholesky_set_method, linalg_cholesky_set_block_size);
+ * both are internally synchronized. changing the Cholesky settings while
+ * other threads factor affects only factorizations started afterwards.
+ * otherwise, distinct solvers may be initialized, solved and freed
+ * concurrently from different threads (e.g., via pogs_solve_many_threads,
+ * or from Python threads: ctypes releases the GIL during calls); a single
+ * solver must not be used by two threads at once. verbose output of
+ * concurrent solves may interleave.
+ */
 int private_api_accessible(void);
 ok_status set_default_settings(pogs_settings * settings);
+ok_status pogs_parallel_for(size_t N, size_t n_threads,
+	ok_status (* task)(void * data, size_t i), void * data);
 
 /* forward declarations */
 POGS_PRIVATE ok_status block_vector_alloc(block_vector ** z, size_t m,
@@ -105,6 +156,13 @@ POGS_PRIVATE ok_status update_objective(void * linalg_handle,
 	pogs_variables * z, pogs_objectives * obj);
 POGS_PRIVATE ok_status update_tolerances(void * linalg_handle,
 	pogs_variables * z, pogs_objectives * obj, pogs_tolerances * eps);
+POGS_PRIVATE ok_status estimate_residuals(void * linalg_handle,
+	pogs_variables * z, pogs_residuals * res);
+POGS_PRIVATE int full_check_due(void * linalg_handle,
+	const pogs_settings * settings, pogs_variables * z,
+	const pogs_tolerances * eps, const uint k);
+POGS_PRIVATE int interrupt_due(const pogs_settings * settings,
+	const volatile int * cancel, double start);
 POGS_PRIVATE ok_status set_prev(pogs_variables * z);
 POGS_PRIVATE ok_status prox(void * linalg_handle, const function_vector * f,
 	const function_vector * g, pogs_variables * z, ok_float rho);
@@ -116,9 +174,21 @@ POGS_PRIVATE ok_status adaptrho(pogs_variables * z,
 POGS_PRIVATE ok_status copy_output(pogs_output * output,
 	const pogs_variables * z, const vector * d, const vector * e,
 	const ok_float rho, const uint suppress);
+POGS_PRIVATE ok_status accelerator_alloc(anderson_accelerator ** aa,
+	vector * iterate, const pogs_settings * settings, size_t m, size_t n);
+POGS_PRIVATE ok_status accelerator_free(anderson_accelerator * aa,
+	vector * iterate);
+POGS_PRIVATE ok_status accelerate(void * linalg_handle,
+	anderson_accelerator * aa, vector * iterate, pogs_variables * z);
 POGS_PRIVATE ok_status print_header_string(void);
 POGS_PRIVATE ok_status print_iter_string(pogs_residuals * res,
 	pogs_tolerances * eps, pogs_objectives * obj, uint k);
+POGS_PRIVATE ok_status telemetry_record(pogs_telemetry * t,
+	pogs_telemetry_record * record, const uint k, const int checked,
+	const pogs_residuals * res, const pogs_tolerances * eps,
+	const pogs_objectives * obj, const ok_float rho);
+POGS_PRIVATE ok_status scale_path_objectives(function_vector * f_path,
+	const function_vector * f, const ok_float lambda);
 
 /* private API */
 #ifndef OPTKIT_POGS_IMPLEMENTATION_
@@ -214,6 +284,12 @@ POGS_PRIVATE ok_status update_settings(pogs_settings * settings,
 	settings->resume = input->resume;
 	settings->x0 = input->x0;
 	settings->nu0 = input->nu0;
+	settings->accelerate = input->accelerate;
+	settings->anderson_type = input->anderson_type;
+	settings->anderson_memory = input->anderson_memory;
+	settings->anderson_safeguard = input->anderson_safeguard;
+	settings->check_interval = input->check_interval;
+	settings->time_limit = input->time_limit;
 	return OPTKIT_SUCCESS;
 }
 
@@ -291,6 +367,72 @@ POGS_PRIVATE ok_status update_tolerances(void * linalg_handle,
 	return OPTKIT_SUCCESS;
 }
 
+/*
+ * cheap residual estimates, from iterates already at hand (no GEMVs):
+ *
+ *	primal ~ ||z^{k+1/2} - z^{k+1}||
+ *	dual   ~ ||z^{k+1} - z^k||
+ */
+POGS_PRIVATE ok_status estimate_residuals(void * linalg_handle,
+	pogs_variables * z, pogs_residuals * res)
+{
+	OK_CHECK_PTR(z);
+	OK_CHECK_PTR(res);
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(z->temp->vec, z->primal12->vec) );
+	OK_RETURNIF_ERR( blas_axpy(linalg_handle, -kOne, z->primal->vec,
+		z->temp->vec) );
+	OK_RETURNIF_ERR( blas_nrm2(linalg_handle, z->temp->vec,
+		&res->primal) );
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(z->temp->vec, z->primal->vec) );
+	OK_RETURNIF_ERR( blas_axpy(linalg_handle, -kOne, z->prev->vec,
+		z->temp->vec) );
+	return OK_SCAN_ERR( blas_nrm2(linalg_handle, z->temp->vec,
+		&res->dual) );
+}
+
+/*
+ * full convergence check (objectives, tolerances and residuals) is due at
+ * iteration k if:
+ *	- k is a multiple of settings->check_interval, or
+ *	- k is the final iteration, or
+ *	- the cheap residual estimates pass the tolerances from the most
+ *	  recent full check
+ *
+ * (the solver only reports convergence certified by a full check)
+ */
+POGS_PRIVATE int full_check_due(void * linalg_handle,
+	const pogs_settings * settings, pogs_variables * z,
+	const pogs_tolerances * eps, const uint k)
+{
+	pogs_residuals est = (pogs_residuals){OK_NAN, OK_NAN, OK_NAN};
+
+	if (settings->check_interval <= 1 || k % settings->check_interval == 0 ||
+		k >= settings->maxiter)
+		return 1;
+
+	if (estimate_residuals(linalg_handle, z, &est))
+		return 1;
+	return est.primal < eps->primal && est.dual < eps->dual;
+}
+
+/*
+ * OkPogsCancelled if cancellation of the solve was requested,
+ * OkPogsTimeLimit if settings->time_limit > 0 seconds have passed since
+ * start (pogs_telemetry_clock), otherwise 0
+ */
+POGS_PRIVATE int interrupt_due(const pogs_settings * settings,
+	const volatile int * cancel, double start)
+{
+	if (*cancel)
+		return OkPogsCancelled;
+	if (settings->time_limit > 0 && pogs_telemetry_clock() - start >=
+		(double) settings->time_limit)
+		return OkPogsTimeLimit;
+	return 0;
+}
+
 /* z^k <- z^{k+1} */
 POGS_PRIVATE ok_status set_prev(pogs_variables * z)
 {
@@ -306,10 +448,8 @@ POGS_PRIVATE ok_status set_prev(pogs_variables * z)
 POGS_PRIVATE ok_status prox(void * linalg_handle, const function_vector * f,
 	const function_vector * g, pogs_variables * z, ok_float rho)
 {
-	OK_RETURNIF_ERR(
-		vector_memcpy_vv(z->temp->vec, z->primal->vec) );
-	OK_RETURNIF_ERR(
-		blas_axpy(linalg_handle, -kOne, z->dual->vec, z->temp->vec) );
+	OK_RETURNIF_ERR( vector_axpby(z->temp->vec, kOne, z->primal->vec,
+		-kOne, z->dual->vec) );
 	OK_RETURNIF_ERR(
 		prox_eval_vector(f, rho, z->temp->y, z->primal12->y) );
 	return OK_SCAN_ERR(
@@ -326,15 +466,9 @@ POGS_PRIVATE ok_status update_dual(void * linalg_handle, pogs_variables * z,
 	ok_float alpha)
 {
 	OK_CHECK_PTR(z);
-	vector_memcpy_vv(z->dual12->vec, z->primal12->vec);
-	blas_axpy(linalg_handle, -kOne, z->prev->vec, z->dual12->vec);
-	blas_axpy(linalg_handle, kOne, z->dual->vec, z->dual12->vec);
-
-	blas_axpy(linalg_handle, alpha, z->primal12->vec, z->dual->vec);
-	blas_axpy(linalg_handle, kOne - alpha, z->prev->vec, z->dual->vec);
-	blas_axpy(linalg_handle, -kOne, z->primal->vec, z->dual->vec);
-
-	return OPTKIT_SUCCESS;
+	return OK_SCAN_ERR( vector_relaxed_dual_update(z->dual12->vec,
+		z->dual->vec, z->primal12->vec, z->prev->vec, z->primal->vec,
+		alpha) );
 }
 
 
@@ -438,6 +572,67 @@ POGS_PRIVATE ok_status copy_output(pogs_output * output,
 	return OPTKIT_SUCCESS;
 }
 
+/*
+ * allocate Anderson accelerator over the ADMM iterate (z, zt), of
+ * length 2 * (m + n), if requested by settings; else *aa = OK_NULL
+ */
+POGS_PRIVATE ok_status accelerator_alloc(anderson_accelerator ** aa,
+	vector * iterate, const pogs_settings * settings, size_t m, size_t n)
+{
+	OK_CHECK_PTR(aa);
+	OK_CHECK_PTR(iterate);
+	OK_CHECK_PTR(settings);
+	if (*aa != OK_NULL)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	if (!settings->accelerate)
+		return OPTKIT_SUCCESS;
+
+	*aa = anderson_accelerator_alloc(2 * (m + n), settings->anderson_memory,
+		settings->anderson_type, settings->anderson_safeguard);
+	if (!*aa)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+	return OK_SCAN_ERR( vector_calloc(iterate, 2 * (m + n)) );
+}
+
+POGS_PRIVATE ok_status accelerator_free(anderson_accelerator * aa,
+	vector * iterate)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	if (!aa)
+		return err;
+	OK_MAX_ERR( err, anderson_accelerator_free(aa) );
+	if (iterate && iterate->data)
+		OK_MAX_ERR( err, vector_free(iterate) );
+	return err;
+}
+
+/*
+ * Anderson step on the fixed-point map (z^k, zt^k) -> (z^{k+1}, zt^{k+1})
+ * realized by one POGS iteration:
+ *
+ *	iterate = [z^{k+1}; zt^{k+1}]
+ *	iterate <- anderson(iterate)
+ *	[z^{k+1}; zt^{k+1}] = iterate
+ */
+POGS_PRIVATE ok_status accelerate(void * linalg_handle,
+	anderson_accelerator * aa, vector * iterate, pogs_variables * z)
+{
+	OK_CHECK_PTR(aa);
+	OK_CHECK_VECTOR(iterate);
+	OK_CHECK_PTR(z);
+
+	vector zi = (vector){0, 0, OK_NULL}, zti = (vector){0, 0, OK_NULL};
+	OK_RETURNIF_ERR( vector_subvector(&zi, iterate, 0, z->primal->size) );
+	OK_RETURNIF_ERR( vector_subvector(&zti, iterate, z->primal->size,
+		z->dual->size) );
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(&zi, z->primal->vec) );
+	OK_RETURNIF_ERR( vector_memcpy_vv(&zti, z->dual->vec) );
+	OK_RETURNIF_ERR( anderson_accelerate(linalg_handle, aa, iterate) );
+	OK_RETURNIF_ERR( vector_memcpy_vv(z->primal->vec, &zi) );
+	return OK_SCAN_ERR( vector_memcpy_vv(z->dual->vec, &zti) );
+}
+
 POGS_PRIVATE ok_status print_header_string(void)
 {
 	printf("\n   #    %s    %s    %s   %s   %s        %s    %s\n",
@@ -460,6 +655,59 @@ POGS_PRIVATE ok_status print_iter_string(pogs_residuals * res,
 		res->gap, eps->gap, obj->primal);
 	return OPTKIT_SUCCESS;
 }
+
+/*
+ * complete the record of iteration k (phase times already set) and append
+ * it to telemetry buffer t; no-op if t is NULL
+ */
+POGS_PRIVATE ok_status telemetry_record(pogs_telemetry * t,
+	pogs_telemetry_record * record, const uint k, const int checked,
+	const pogs_residuals * res, const pogs_tolerances * eps,
+	const pogs_objectives * obj, const ok_float rho)
+{
+	if (!t)
+		return OPTKIT_SUCCESS;
+	OK_CHECK_PTR(record);
+	OK_CHECK_PTR(res);
+	OK_CHECK_PTR(eps);
+	OK_CHECK_PTR(obj);
+	record->k = k;
+	record->checked = checked;
+	record->res_primal = res->primal;
+	record->res_dual = res->dual;
+	record->res_gap = res->gap;
+	record->eps_primal = eps->primal;
+	record->eps_dual = eps->dual;
+	record->eps_gap = eps->gap;
+	record->obj_primal = obj->primal;
+	record->obj_dual = obj->dual;
+	record->obj_gap = obj->gap;
+	record->rho = rho;
+	return OK_SCAN_ERR( pogs_telemetry_push(t, record) );
+}
+
+/*
+ * regularization path point: copy (host) objectives f to f_path, with
+ * the weight c of every FnAbs term scaled by lambda
+ */
+POGS_PRIVATE ok_status scale_path_objectives(function_vector * f_path,
+	const function_vector * f, const ok_float lambda)
+{
+	OK_CHECK_FNVECTOR(f_path);
+	OK_CHECK_FNVECTOR(f);
+	size_t i;
+	if (f_path->size != f->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	if (lambda < 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	for (i = 0; i < f->size; ++i) {
+		f_path->objectives[i] = f->objectives[i];
+		if (f->objectives[i].h == FnAbs)
+			f_path->objectives[i].c *= lambda;
+	}
+	return OPTKIT_SUCCESS;
+}
 #endif /* OPTKIT_POGS_IMPLEMENTATION_ */
 
 #ifdef __cplusplus
@@ -0,0 +1,53 @@
+#ifndef OPTKIT_POGS_TELEMETRY_H_
+#define OPTKIT_POGS_TELEMETRY_H_
+
+#include "optkit_defs.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * per-iteration record of a POGS solve. residuals, tolerances and
+ * objectives are those of the most recent full convergence check
+ * (checked: the check was performed at iteration k). phase times, in
+ * seconds on a monotonic clock, are spent in the prox step (including
+ * z^k <- z^{k+1}), the projection, the dual update and the convergence
+ * check.
+ */
+typedef struct POGSTelemetryRecord {
+	uint k;
+	int checked;
+	ok_float res_primal, res_dual, res_gap;
+	ok_float eps_primal, eps_dual, eps_gap;
+	ok_float obj_primal, obj_dual, obj_gap;
+	ok_float rho;
+	double t_prox, t_project, t_dual, t_check;
+} pogs_telemetry_record;
+
+/*
+ * ring buffer of the records of the most recent iterations: count records
+ * have been written since the last clear, of which the last
+ * min(count, capacity) are retained
+ */
+typedef struct POGSTelemetry {
+	pogs_telemetry_record * records;
+	size_t capacity, count;
+	double lap;
+} pogs_telemetry;
+
+double pogs_telemetry_clock(void);
+ok_status pogs_telemetry_alloc(pogs_telemetry ** t, size_t capacity);
+ok_status pogs_telemetry_free(pogs_telemetry * t);
+ok_status pogs_telemetry_clear(pogs_telemetry * t);
+double pogs_telemetry_lap(pogs_telemetry * t);
+ok_status pogs_telemetry_push(pogs_telemetry * t,
+	const pogs_telemetry_record * record);
+ok_status pogs_telemetry_copy(const pogs_telemetry * t,
+	pogs_telemetry_record * records, size_t * count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* OPTKIT_POGS_TELEMETRY_H_ */
@@ -0,0 +1,128 @@
+"""
+Memory traffic of one POGS iteration's vector updates: the unfused
+sequence of memcpy / set_all / BLAS axpy calls versus the fused
+single-pass kernels (vector_axpby, vector_axpbypcz and
+vector_relaxed_dual_update).
+
+usage:
+
+	OPTKIT_USE_LOCALLIBS=1 python admm_kernels.py [size] [repeats]
+
+traffic is counted in vector streams: one stream is one read or one write
+of a length-(m + n) vector. each kernel is bandwidth-bound, so the ratio
+of streams bounds the achievable speedup.
+"""
+from __future__ import print_function
+import sys
+import time
+import numpy as np
+from ctypes import c_void_p, byref
+from optkit.libs.linsys import DenseLinsysLibs
+
+# streams per element, per iteration
+UNFUSED_STREAMS = {
+	# temp = primal; temp -= dual (memcpy + axpy)
+	'prox input': 2 + 3,
+	# temp = 0; 3 x axpy
+	'relaxation': 1 + 3 * 3,
+	# dual12 = primal12; 5 x axpy
+	'dual update': 2 + 5 * 3,
+}
+FUSED_STREAMS = {
+	'prox input': 3,
+	'relaxation': 4,
+	'dual update': 6,
+}
+KERNELS = ('prox input', 'relaxation', 'dual update')
+
+def run_unfused(lib, hdl, kernel, z, alpha):
+	primal, primal12, dual, dual12, prev, temp = z
+	if kernel == 'prox input':
+		lib.vector_memcpy_vv(temp, primal)
+		lib.blas_axpy(hdl, -1, dual, temp)
+	elif kernel == 'relaxation':
+		lib.vector_set_all(temp, 0)
+		lib.blas_axpy(hdl, alpha, primal12, temp)
+		lib.blas_axpy(hdl, 1 - alpha, prev, temp)
+		lib.blas_axpy(hdl, 1, dual, temp)
+	else:
+		lib.vector_memcpy_vv(dual12, primal12)
+		lib.blas_axpy(hdl, -1, prev, dual12)
+		lib.blas_axpy(hdl, 1, dual, dual12)
+		lib.blas_axpy(hdl, alpha, primal12, dual)
+		lib.blas_axpy(hdl, 1 - alpha, prev, dual)
+		lib.blas_axpy(hdl, -1, primal, dual)
+
+def run_fused(lib, hdl, kernel, z, alpha):
+	primal, primal12, dual, dual12, prev, temp = z
+	if kernel == 'prox input':
+		lib.vector_axpby(temp, 1, primal, -1, dual)
+	elif kernel == 'relaxation':
+		lib.vector_axpbypcz(temp, alpha, primal12, 1 - alpha, prev, 1, dual)
+	else:
+		lib.vector_relaxed_dual_update(dual12, dual, primal12, prev, primal,
+									   alpha)
+
+def best_time(call, repeats):
+	best = np.inf
+	for _ in range(repeats):
+		start = time.time()
+		call()
+		best = min(best, time.time() - start)
+	return best
+
+def main(size=int(2**23), repeats=20, alpha=1.7):
+	lib = DenseLinsysLibs().get()
+	if lib is None:
+		raise RuntimeError('optkit dense library (cpu64) not found')
+
+	hdl = c_void_p()
+	lib.blas_make_handle(byref(hdl))
+	z = []
+	for _ in range(6):
+		v = lib.vector(0, 0, None)
+		lib.vector_calloc(v, size)
+		v_py = np.random.rand(size).astype(lib.pyfloat)
+		lib.vector_memcpy_va(v, v_py.ctypes.data_as(lib.ok_float_p), 1)
+		z.append(v)
+
+	bytes_per_stream = size * np.dtype(lib.pyfloat).itemsize
+	total = {'unfused': 0., 'fused': 0.}
+	print('vector length: {}, {:.1f} MB per stream'.format(
+		  size, bytes_per_stream / 1e6))
+	print('{:>12} {:>8} {:>10} {:>8} {:>8} {:>10} {:>8}'.format(
+		  'kernel', 'streams', 'time (ms)', 'GB/s', 'streams', 'time (ms)',
+		  'GB/s'))
+	print('{:>12} {:>28} {:>28}'.format('', 'unfused', 'fused'))
+
+	for kernel in KERNELS:
+		t_unfused = best_time(
+			lambda: run_unfused(lib, hdl, kernel, z, alpha), repeats)
+		t_fused = best_time(
+			lambda: run_fused(lib, hdl, kernel, z, alpha), repeats)
+		s_unfused = UNFUSED_STREAMS[kernel]
+		s_fused = FUSED_STREAMS[kernel]
+		total['unfused'] += t_unfused
+		total['fused'] += t_fused
+		print('{:>12} {:>8} {:>10.2f} {:>8.1f} {:>8} {:>10.2f} {:>8.1f}'.format(
+			  kernel, s_unfused, 1e3 * t_unfused,
+			  s_unfused * bytes_per_stream / t_unfused / 1e9, s_fused,
+			  1e3 * t_fused, s_fused * bytes_per_stream / t_fused / 1e9))
+
+	streams_unfused = sum(UNFUSED_STREAMS.values())
+	streams_fused = sum(FUSED_STREAMS.values())
+	print('per iteration: {} -> {} streams ({:.1f} MB -> {:.1f} MB), '
+		  '{:.2f} ms -> {:.2f} ms ({:.2f}x)'.format(
+		  streams_unfused, streams_fused,
+		  streams_unfused * bytes_per_stream / 1e6,
+		  streams_fused * bytes_per_stream / 1e6,
+		  1e3 * total['unfused'], 1e3 * total['fused'],
+		  total['unfused'] / total['fused']))
+
+	for v in z:
+		lib.vector_free(v)
+	lib.blas_destroy_handle(hdl)
+
+if __name__ == '__main__':
+	args = [int(arg) for arg in sys.argv[1:3]]
+	main(*args)
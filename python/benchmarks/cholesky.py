@@ -0,0 +1,82 @@
+"""
+Dense Cholesky factorization time by method and block size: the serial
+block algorithm (the previous linalg_cholesky_decomp), the task-parallel
+tiled algorithm and, in builds with LAPACK (make USE_LAPACK=1), potrf.
+
+usage:
+
+	OPTKIT_USE_LOCALLIBS=1 OMP_NUM_THREADS=<threads> \\
+		python cholesky.py [size] [repeats]
+
+the task-parallel method runs on OMP_NUM_THREADS threads when the
+library is built with USE_OPENMP=1, and serially otherwise.
+"""
+from __future__ import print_function
+import sys
+import time
+import numpy as np
+from ctypes import c_int, c_void_p, byref
+from optkit.libs.linsys import DenseLinsysLibs
+
+BLOCK_SIZES = (64, 128, 256, 512)
+
+def spd_matrix(size, pyfloat):
+	B = np.random.rand(size, size) / size**0.5
+	return (np.eye(size) + B.dot(B.T)).astype(pyfloat)
+
+def best_time(lib, hdl, L, A_ptr, order, repeats):
+	best = np.inf
+	for _ in range(repeats):
+		lib.matrix_memcpy_ma(L, A_ptr, order)
+		start = time.time()
+		err = lib.linalg_cholesky_decomp(hdl, L)
+		best = min(best, time.time() - start)
+		if err:
+			raise RuntimeError('linalg_cholesky_decomp: error {}'.format(err))
+	return best
+
+def main(size=4096, repeats=3):
+	lib = DenseLinsysLibs().get()
+	if lib is None:
+		raise RuntimeError('optkit dense library (cpu64) not found')
+
+	hdl = c_void_p()
+	lib.blas_make_handle(byref(hdl))
+	order = lib.enums.CblasColMajor
+	A = spd_matrix(size, lib.pyfloat)
+	A_ptr = A.ctypes.data_as(lib.ok_float_p)
+	L = lib.matrix(0, 0, 0, None, 0)
+	lib.matrix_calloc(L, size, size, order)
+
+	lapack = c_int(0)
+	lib.linalg_cholesky_lapack_available(byref(lapack))
+	# baseline: the previous routine, serial with 128 x 128 blocks
+	runs = [('serial', lib.enums.CHOLESKY_SERIAL, 128)]
+	runs += [('tasks', lib.enums.CHOLESKY_TASKS, b) for b in BLOCK_SIZES]
+	if lapack.value:
+		runs.append(('lapack', lib.enums.CHOLESKY_LAPACK, 0))
+
+	flops = size**3 / 3.
+	print('matrix size: {0} x {0}'.format(size))
+	print('{:>8} {:>6} {:>10} {:>8} {:>8}'.format(
+		  'method', 'block', 'time (s)', 'GFLOP/s', 'speedup'))
+
+	baseline = None
+	for name, method, blk_dim in runs:
+		lib.linalg_cholesky_set_method(method)
+		lib.linalg_cholesky_set_block_size(blk_dim)
+		t = best_time(lib, hdl, L, A_ptr, order, repeats)
+		if baseline is None:
+			baseline = t
+		print('{:>8} {:>6} {:>10.3f} {:>8.2f} {:>8.2f}'.format(
+			  name, blk_dim if blk_dim else '-', t, flops / t / 1e9,
+			  baseline / t))
+
+	lib.linalg_cholesky_set_method(lib.enums.CHOLESKY_AUTO)
+	lib.linalg_cholesky_set_block_size(0)
+	lib.matrix_free(L)
+	lib.blas_destroy_handle(hdl)
+
+if __name__ == '__main__':
+	args = [int(arg) for arg in sys.argv[1:3]]
+	main(*args)
@@ -9,7 +9,7 @@ if int(getenv('OPTKIT_C_TESTING', 0)) == 0:
 		from optkit.api import backend
 
 	# C implementations
-	from optkit.api import PogsSolver, PogsObjective
+	from optkit.api import PogsSolver, PogsSolverPool, PogsObjective
 	from optkit.api import Clustering, ClusteringSettings
 
 	del utils
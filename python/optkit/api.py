@@ -17,6 +17,7 @@ C implementations
 """
 pogs_types = None
 PogsSolver = None
+PogsSolverPool = None
 PogsObjective = None
 
 clustering_types = None
@@ -35,6 +36,7 @@ def set_backend(gpu=False, double=True):
 	## C implementations
 	global pogs_types
 	global PogsSolver
+	global PogsSolverPool
 	global PogsObjective
 
 	global clustering_types
@@ -49,6 +51,7 @@ def set_backend(gpu=False, double=True):
 	## C implemenetations
 	pogs_types = PogsTypes(backend)
 	PogsSolver = pogs_types.Solver
+	PogsSolverPool = pogs_types.SolverPool
 	PogsObjective = pogs_types.Objective
 
 	clustering_types = ClusteringTypes(backend)
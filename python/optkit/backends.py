@@ -66,6 +66,25 @@ class OKBackend(object):
 	def libguard_active(self):
 		return self.__LIBGUARD_ON
 
+	@property
+	def factorization_cache(self):
+		if self.pogs is None:
+			return None
+		stats = self.pogs.pogs_cache_stats()
+		if self.pogs.pogs_cache_get_stats(byref(stats)):
+			raise RuntimeError('factorization cache query failed')
+		return {field: getattr(stats, field) for field, _ in stats._fields_}
+
+	def set_factorization_cache_capacity(self, capacity_bytes):
+		if self.pogs is not None:
+			if self.pogs.pogs_cache_set_capacity(int(capacity_bytes)):
+				raise RuntimeError('factorization cache resize failed')
+
+	def clear_factorization_cache(self):
+		if self.pogs is not None:
+			if self.pogs.pogs_cache_clear():
+				raise RuntimeError('factorization cache clear failed')
+
 	def increment_cobject_count(self):
 		self.__COBJECT_COUNT += 1
 		self.__LIBGUARD_ON = True
@@ -43,7 +43,9 @@ def attach_cg_ctypes(lib, single_precision=False):
 					('gamma', ok_float),
 					('gamma_prev', ok_float),
 					('shrink', ok_float),
-					('blas_handle', c_void_p)]
+					('blas_handle', c_void_p),
+					('norm_ref', ok_float),
+					('iters', c_uint)]
 
 	lib.cgls_helper = cgls_helper
 	lib.cgls_helper_p = POINTER(lib.cgls_helper)
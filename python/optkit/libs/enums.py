@@ -24,6 +24,7 @@ class OKEnums(object):
 	NULL = 0
 	IDENTITY = 101
 	DENSE = 201
+	PANEL = 202
 	SPARSE_CSR = 301
 	SPARSE_CSC = 302
 	SPARSE_COO = 303
@@ -33,6 +34,35 @@ class OKEnums(object):
 	DENSE_DIRECT = 101
 	SPARSE_DIRECT = 102
 	INDIRECT = 103
+	PANEL_DIRECT = 104
+	INDIRECT_PCG = 105
+
+	# Optkit PCG projector preconditioners (also accepted as direct)
+	PRECOND_JACOBI = 4
+	PRECOND_BLOCK_JACOBI = 5
+
+	# Optkit direct projector factor precision
+	DIRECT_FULL = 1
+	DIRECT_MIXED = 2
+	DIRECT_PACKED = 3
+
+	# Dense Cholesky factorization method
+	CHOLESKY_AUTO = 0
+	CHOLESKY_SERIAL = 1
+	CHOLESKY_TASKS = 2
+	CHOLESKY_LAPACK = 3
+
+	# Dense equilibration method
+	EQUIL_SINKHORN = 0
+	EQUIL_RUIZ = 1
+	EQUIL_RANDOMIZED = 2
+
+	# POGS solve status
+	POGS_UNSOLVED = 0
+	POGS_CONVERGED = 1
+	POGS_MAXITER = 2
+	POGS_TIME_LIMIT = 3
+	POGS_CANCELLED = 4
 
 	# Errors
 	OPTKIT_SUCCESS = 0
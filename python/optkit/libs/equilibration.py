@@ -1,4 +1,4 @@
-from ctypes import c_uint, c_void_p
+from ctypes import POINTER, Structure, c_uint, c_size_t, c_void_p
 from optkit.libs.loader import OptkitLibs
 from optkit.libs.linsys import attach_base_ctypes, attach_dense_linsys_ctypes,\
 	attach_sparse_linsys_ctypes, attach_base_ccalls, attach_vector_ccalls, \
@@ -20,19 +20,67 @@ class EquilibrationLibs(OptkitLibs):
 		self.attach_calls.append(attach_equilibration_ccalls)
 		self.attach_calls.append(attach_operator_equilibration_ccalls)
 
+def attach_equilibration_ctypes(lib, single_precision=False):
+	if not 'ok_float' in lib.__dict__:
+		attach_dense_linsys_ctypes(lib, single_precision)
+
+	ok_float = lib.ok_float
+
+	class EquilibrationSettings(Structure):
+		_fields_ = [('method', c_uint),
+					('maxiter', c_uint),
+					('tol', ok_float),
+					('probes', c_uint)]
+
+	lib.equilibration_settings = EquilibrationSettings
+	lib.equilibration_settings_p = POINTER(lib.equilibration_settings)
+
+	class EquilibrationInfo(Structure):
+		_fields_ = [('iterations', c_uint),
+					('row_spread', ok_float),
+					('col_spread', ok_float)]
+
+	lib.equilibration_info = EquilibrationInfo
+	lib.equilibration_info_p = POINTER(lib.equilibration_info)
+
+	class OperatorNormEstimate(Structure):
+		_fields_ = [('norm', ok_float),
+					('size2', c_size_t),
+					('block', c_size_t),
+					('V', lib.ok_float_p),
+					('iterations', c_uint),
+					('products', c_uint)]
+
+	lib.operator_norm_estimate = OperatorNormEstimate
+	lib.operator_norm_estimate_p = POINTER(lib.operator_norm_estimate)
+
 def attach_equilibration_ccalls(lib, single_precision=False):
 	if not 'matrix_p' in lib.__dict__:
 		attach_dense_linsys_ctypes(lib, single_precision)
+	if not 'equilibration_settings_p' in lib.__dict__:
+		attach_equilibration_ctypes(lib, single_precision)
 
 	ok_float_p = lib.ok_float_p
 	vector_p = lib.vector_p
 	matrix_p = lib.matrix_p
+	equilibration_settings_p = lib.equilibration_settings_p
+	equilibration_info_p = lib.equilibration_info_p
 
 	# argument types
+	lib.equilibration_default_settings.argtypes = [equilibration_settings_p]
+	lib.equilibration_randomized_settings.argtypes = [
+			equilibration_settings_p]
+	lib.matrix_equilibrate.argtypes = [c_void_p, ok_float_p, matrix_p,
+									   vector_p, vector_p, c_uint,
+									   equilibration_settings_p,
+									   equilibration_info_p]
 	lib.regularized_sinkhorn_knopp.argtypes = [c_void_p, ok_float_p, matrix_p,
 											   vector_p, vector_p, c_uint]
 
 	# return types
+	lib.equilibration_default_settings.restype = c_uint
+	lib.equilibration_randomized_settings.restype = c_uint
+	lib.matrix_equilibrate.restype = c_uint
 	lib.regularized_sinkhorn_knopp.restype = c_uint
 
 def attach_operator_equilibration_ccalls(lib, single_precision=False):
@@ -40,19 +88,39 @@ def attach_operator_equilibration_ccalls(lib, single_precision=False):
 		attach_dense_linsys_ctypes(lib, single_precision)
 	if not 'operator_p' in lib.__dict__:
 		attach_operator_ctypes(lib, single_precision)
+	if not 'equilibration_settings_p' in lib.__dict__:
+		attach_equilibration_ctypes(lib, single_precision)
 
 	ok_float = lib.ok_float
 	vector_p = lib.vector_p
 	operator_p = lib.operator_p
+	equilibration_settings_p = lib.equilibration_settings_p
+	equilibration_info_p = lib.equilibration_info_p
+	operator_norm_estimate_p = lib.operator_norm_estimate_p
 
 	# argument types
 	lib.operator_regularized_sinkhorn.argtypes = [c_void_p, operator_p,
 												  vector_p, vector_p, ok_float]
+	lib.operator_randomized_equilibrate.argtypes = [
+			c_void_p, operator_p, vector_p, vector_p,
+			equilibration_settings_p, equilibration_info_p]
+	lib.operator_equilibrate_settings.argtypes = [
+			c_void_p, operator_p, vector_p, vector_p,
+			equilibration_settings_p, equilibration_info_p]
 	lib.operator_equilibrate.argtypes = [c_void_p, operator_p, vector_p,
 										 vector_p, ok_float]
-	lib.operator_estimate_norm.argtypes = [c_void_p, operator_p]
+	lib.operator_norm_estimate_free.argtypes = [operator_norm_estimate_p]
+	lib.operator_estimate_norm_lanczos.argtypes = [c_void_p, operator_p,
+												   ok_float, c_uint,
+												   operator_norm_estimate_p]
+	lib.operator_estimate_norm.argtypes = [c_void_p, operator_p,
+										   lib.ok_float_p]
 
 	# return types
 	lib.operator_regularized_sinkhorn.restype = c_uint
+	lib.operator_randomized_equilibrate.restype = c_uint
+	lib.operator_equilibrate_settings.restype = c_uint
 	lib.operator_equilibrate.restype = c_uint
+	lib.operator_norm_estimate_free.restype = c_uint
+	lib.operator_estimate_norm_lanczos.restype = c_uint
 	lib.operator_estimate_norm.restype = c_uint
\ No newline at end of file
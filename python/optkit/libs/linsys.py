@@ -134,6 +134,12 @@ def attach_vector_ccalls(lib, single_precision=False):
 	lib.vector_sqrt.argtypes = [vector_p]
 	lib.vector_pow.argtypes = [vector_p, ok_float]
 	lib.vector_exp.argtypes = [vector_p]
+	lib.vector_axpby.argtypes = [vector_p, ok_float, vector_p, ok_float,
+								 vector_p]
+	lib.vector_axpbypcz.argtypes = [vector_p, ok_float, vector_p, ok_float,
+									vector_p, ok_float, vector_p]
+	lib.vector_relaxed_dual_update.argtypes = [vector_p, vector_p, vector_p,
+											   vector_p, vector_p, ok_float]
 	lib.vector_indmin.argtypes = [vector_p, c_size_t_p]
 	lib.vector_min.argtypes = [vector_p, ok_float_p]
 	lib.vector_max.argtypes = [vector_p, ok_float_p]
@@ -178,6 +184,9 @@ def attach_vector_ccalls(lib, single_precision=False):
 	lib.vector_sqrt.restype = c_uint
 	lib.vector_pow.restype = c_uint
 	lib.vector_exp.restype = c_uint
+	lib.vector_axpby.restype = c_uint
+	lib.vector_axpbypcz.restype = c_uint
+	lib.vector_relaxed_dual_update.restype = c_uint
 	lib.vector_indmin.restype = c_uint
 	lib.vector_min.restype = c_uint
 	lib.vector_max.restype = c_uint
@@ -205,6 +214,8 @@ def attach_dense_linsys_ccalls(lib, single_precision=False):
 	vector_p = lib.vector_p
 	indvector_p = lib.indvector_p
 	matrix_p = lib.matrix_p
+	c_int_p = lib.c_int_p
+	c_size_t_p = lib.c_size_t_p
 
 	# Matrix
 	# ------
@@ -295,21 +306,48 @@ def attach_dense_linsys_ccalls(lib, single_precision=False):
 	# LINALG
 	# -------
 	## arguments
+	lib.linalg_cholesky_lapack_available.argtypes = [c_int_p]
+	lib.linalg_cholesky_set_method.argtypes = [c_uint]
+	lib.linalg_cholesky_set_block_size.argtypes = [c_size_t]
+	lib.linalg_cholesky_get_config.argtypes = [POINTER(c_uint), c_size_t_p]
 	lib.linalg_cholesky_decomp.argtypes = [c_void_p, matrix_p]
 	lib.linalg_cholesky_svx.argtypes = [c_void_p, matrix_p, vector_p]
+	lib.linalg_cholesky_update.argtypes = [c_void_p, matrix_p, vector_p,
+										   c_int]
+	lib.linalg_rfp_size.argtypes = [c_size_t, c_size_t_p, c_size_t_p]
+	lib.linalg_rfp_blocks.argtypes = [matrix_p, matrix_p, matrix_p, matrix_p]
+	lib.linalg_rfp_gram.argtypes = [c_void_p, c_uint, ok_float, matrix_p,
+									ok_float, matrix_p]
+	lib.linalg_cholesky_decomp_rfp.argtypes = [c_void_p, matrix_p]
+	lib.linalg_cholesky_svx_rfp.argtypes = [c_void_p, matrix_p, vector_p]
+	lib.linalg_cholesky_svx_rfp_batch.argtypes = [c_void_p, matrix_p,
+												  matrix_p]
 	lib.linalg_matrix_row_squares.argtypes = [c_uint, matrix_p, vector_p]
 	lib.linalg_matrix_broadcast_vector.argtypes = [matrix_p, vector_p, c_uint,
 												   c_uint]
+	lib.linalg_matrix_diag_scale.argtypes = [matrix_p, vector_p, vector_p]
 	lib.linalg_matrix_reduce_indmin.argtypes = [indvector_p, vector_p,
 										 		matrix_p, c_uint]
 	lib.linalg_matrix_reduce_min.argtypes = [vector_p, matrix_p, c_uint]
 	lib.linalg_matrix_reduce_max.argtypes = [vector_p, matrix_p, c_uint]
 
 	## return values
+	lib.linalg_cholesky_lapack_available.restype = c_uint
+	lib.linalg_cholesky_set_method.restype = c_uint
+	lib.linalg_cholesky_set_block_size.restype = c_uint
+	lib.linalg_cholesky_get_config.restype = c_uint
 	lib.linalg_cholesky_decomp.restype = c_uint
 	lib.linalg_cholesky_svx.restype = c_uint
+	lib.linalg_cholesky_update.restype = c_uint
+	lib.linalg_rfp_size.restype = c_uint
+	lib.linalg_rfp_blocks.restype = c_uint
+	lib.linalg_rfp_gram.restype = c_uint
+	lib.linalg_cholesky_decomp_rfp.restype = c_uint
+	lib.linalg_cholesky_svx_rfp.restype = c_uint
+	lib.linalg_cholesky_svx_rfp_batch.restype = c_uint
 	lib.linalg_matrix_row_squares.restype = c_uint
 	lib.linalg_matrix_broadcast_vector.restype = c_uint
+	lib.linalg_matrix_diag_scale.restype = c_uint
 	lib.linalg_matrix_reduce_indmin.restype = c_uint
 	lib.linalg_matrix_reduce_min.restype = c_uint
 	lib.linalg_matrix_reduce_max.restype = c_uint
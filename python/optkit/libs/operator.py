@@ -47,6 +47,9 @@ def attach_operator_ccalls(lib, single_precision=False):
 		attach_operator_ctypes(lib, single_precision)
 
 	# check VECTORP, MATRIXP, SPARSEMATRIXP, OPERATORP exist
+	ok_float = lib.ok_float
+	ok_float_p = lib.ok_float_p
+	c_size_t_p = lib.c_size_t_p
 	vector_p = lib.vector_p
 	matrix_p = lib.matrix_p
 	sparse_matrix_p = lib.sparse_matrix_p
@@ -56,8 +59,26 @@ def attach_operator_ccalls(lib, single_precision=False):
 	lib.dense_operator_alloc.argtypes = [matrix_p]
 	lib.sparse_operator_alloc.argtypes = [sparse_matrix_p]
 	lib.diagonal_operator_alloc.argtypes = [vector_p]
+	lib.panel_operator_alloc.argtypes = [ok_float_p, c_size_t, c_size_t,
+										 c_size_t]
+	lib.panel_operator_equilibrate.argtypes = [c_void_p, operator_p, vector_p,
+											   vector_p, ok_float]
+	lib.panel_operator_gram.argtypes = [operator_p, matrix_p]
+	lib.scaled_operator_alloc.argtypes = [operator_p]
+	lib.scaled_operator_scale.argtypes = [operator_p, ok_float]
+	lib.scaled_operator_scale_left.argtypes = [operator_p, vector_p]
+	lib.scaled_operator_scale_right.argtypes = [operator_p, vector_p]
+	lib.panel_operator_passes.argtypes = [operator_p, c_size_t_p]
 
 	# return types
 	lib.dense_operator_alloc.restype = operator_p
 	lib.sparse_operator_alloc.restype = operator_p
-	lib.diagonal_operator_alloc.restype = operator_p
\ No newline at end of file
+	lib.diagonal_operator_alloc.restype = operator_p
+	lib.panel_operator_alloc.restype = operator_p
+	lib.panel_operator_equilibrate.restype = c_uint
+	lib.panel_operator_gram.restype = c_uint
+	lib.scaled_operator_alloc.restype = operator_p
+	lib.scaled_operator_scale.restype = c_uint
+	lib.scaled_operator_scale_left.restype = c_uint
+	lib.scaled_operator_scale_right.restype = c_uint
+	lib.panel_operator_passes.restype = c_uint
\ No newline at end of file
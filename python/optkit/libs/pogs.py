@@ -1,5 +1,5 @@
 from ctypes import POINTER, CFUNCTYPE, Structure, c_int, c_uint, c_size_t, \
-				   c_void_p
+				   c_void_p, c_char_p, c_uint64, c_double
 from numpy import nan
 from optkit.libs.loader import OptkitLibs
 from optkit.libs.enums import OKFunctionEnums
@@ -9,8 +9,8 @@ from optkit.libs.linsys import attach_base_ctypes, attach_dense_linsys_ctypes,\
 from optkit.libs.prox import attach_prox_ctypes, attach_prox_ccalls
 from optkit.libs.operator import attach_operator_ctypes, attach_operator_ccalls
 from optkit.libs.cg import attach_cg_ctypes, attach_cg_ccalls
-from optkit.libs.equilibration import attach_equilibration_ccalls, \
-	attach_operator_equilibration_ccalls
+from optkit.libs.equilibration import attach_equilibration_ctypes, \
+	attach_equilibration_ccalls, attach_operator_equilibration_ccalls
 from optkit.libs.projector import attach_projector_ctypes, \
 	attach_projector_ccalls, attach_operator_projector_ctypes_ccalls
 
@@ -108,7 +108,13 @@ def attach_pogs_common_ctypes(lib, single_precision=False):
 					('warmstart', c_int),
 					('resume', c_int),
 					('x0', ok_float_p),
-					('nu0', ok_float_p)]
+					('nu0', ok_float_p),
+					('accelerate', c_int),
+					('anderson_type', c_uint),
+					('anderson_memory', c_uint),
+					('anderson_safeguard', ok_float),
+					('check_interval', c_uint),
+					('time_limit', ok_float)]
 
 	lib.pogs_settings = PogsSettings
 	lib.pogs_settings_p = POINTER(lib.pogs_settings)
@@ -120,15 +126,29 @@ def attach_pogs_common_ctypes(lib, single_precision=False):
 					('obj', ok_float),
 					('rho', ok_float),
 					('setup_time', ok_float),
-					('solve_time', ok_float)]
+					('solve_time', ok_float),
+					('k_accel', c_uint),
+					('refinement_residual', ok_float),
+					('status', c_int),
+					('equil_time', ok_float),
+					('equil_row_spread', ok_float),
+					('equil_col_spread', ok_float),
+					('cg_iters', c_uint)]
 		def __init__(self):
 			self.err = 0
 			self.converged = 0
 			self.k = 0
+			self.k_accel = 0
+			self.refinement_residual = 0
+			self.status = 0
 			self.obj = nan
 			self.rho = nan
 			self.setup_time = nan
 			self.solve_time = nan
+			self.equil_time = nan
+			self.equil_row_spread = nan
+			self.equil_col_spread = nan
+			self.cg_iters = 0
 
 	lib.pogs_info = PogsInfo
 	lib.pogs_info_p =  POINTER(lib.pogs_info)
@@ -142,6 +162,27 @@ def attach_pogs_common_ctypes(lib, single_precision=False):
 	lib.pogs_output = PogsOutput
 	lib.pogs_output_p =  POINTER(lib.pogs_output)
 
+	class PogsTelemetryRecord(Structure):
+		_fields_ = [('k', c_uint),
+					('checked', c_int),
+					('res_primal', ok_float),
+					('res_dual', ok_float),
+					('res_gap', ok_float),
+					('eps_primal', ok_float),
+					('eps_dual', ok_float),
+					('eps_gap', ok_float),
+					('obj_primal', ok_float),
+					('obj_dual', ok_float),
+					('obj_gap', ok_float),
+					('rho', ok_float),
+					('t_prox', c_double),
+					('t_project', c_double),
+					('t_dual', c_double),
+					('t_check', c_double)]
+
+	lib.pogs_telemetry_record = PogsTelemetryRecord
+	lib.pogs_telemetry_record_p = POINTER(lib.pogs_telemetry_record)
+
 	class AdaptiveRhoParameters(Structure):
 		_fields_ = [('delta', ok_float),
 					('l', ok_float),
@@ -213,6 +254,29 @@ def attach_pogs_common_ctypes(lib, single_precision=False):
 	lib.pogs_variables = PogsVariables
 	lib.pogs_variables_p = POINTER(lib.pogs_variables)
 
+	class PogsCacheStats(Structure):
+		_fields_ = [('hits', c_size_t),
+					('misses', c_size_t),
+					('evictions', c_size_t),
+					('entries', c_size_t),
+					('bytes', c_size_t),
+					('capacity', c_size_t)]
+
+	lib.pogs_cache_stats = PogsCacheStats
+	lib.pogs_cache_stats_p = POINTER(lib.pogs_cache_stats)
+
+	class PogsCacheKey(Structure):
+		_fields_ = [('hash', c_uint64),
+					('check', c_uint64),
+					('size1', c_size_t),
+					('size2', c_size_t),
+					('nnz', c_size_t),
+					('order', c_uint),
+					('variant', c_uint),
+					('precision', c_size_t)]
+
+	lib.pogs_cache_key = PogsCacheKey
+
 def attach_pogs_ctypes(lib, single_precision=False):
 	if not 'matrix_p' in lib.__dict__:
 		attach_dense_linsys_ctypes(lib, single_precision)
@@ -221,6 +285,8 @@ def attach_pogs_ctypes(lib, single_precision=False):
 	if not 'pogs_settings_p' in lib.__dict__:
 		print("HERE")
 		attach_pogs_common_ctypes(lib, single_precision)
+	if not 'equilibration_info' in lib.__dict__:
+		attach_equilibration_ctypes(lib, single_precision)
 
 	ok_float = lib.ok_float
 	vector_p = lib.vector_p
@@ -242,7 +308,10 @@ def attach_pogs_ctypes(lib, single_precision=False):
 					('normA', ok_float),
 					('skinny', c_int),
 					('normalized', c_int),
-					('equilibrated', c_int)]
+					('equilibrated', c_int),
+					('borrowed', c_int),
+					('equil', lib.equilibration_info),
+					('equil_time', ok_float)]
 
 	lib.pogs_matrix = PogsMatrix
 	lib.pogs_matrix_p = POINTER(lib.pogs_matrix)
@@ -256,7 +325,9 @@ def attach_pogs_ctypes(lib, single_precision=False):
 					('rho', ok_float),
 					('settings', pogs_settings_p),
 					('linalg_handle', c_void_p),
-					('init_time', ok_float)]
+					('init_time', ok_float),
+					('telemetry', c_void_p),
+					('cancel', c_int)]
 
 	lib.pogs_solver = PogsSolver
 	lib.pogs_solver_p = POINTER(lib.pogs_solver)
@@ -288,6 +359,17 @@ def attach_pogs_common_ccalls(lib, single_precision=False):
 	lib.set_default_settings.argtypes = [pogs_settings_p]
 	lib.set_default_settings.restype = c_uint
 
+	# factorization cache
+	lib.pogs_cache_get_stats.argtypes = [lib.pogs_cache_stats_p]
+	lib.pogs_cache_set_capacity.argtypes = [c_size_t]
+	lib.pogs_cache_clear.argtypes = []
+	lib.pogs_norm_cache_clear.argtypes = []
+
+	lib.pogs_cache_get_stats.restype = c_uint
+	lib.pogs_cache_set_capacity.restype = c_uint
+	lib.pogs_cache_clear.restype = c_uint
+	lib.pogs_norm_cache_clear.restype = c_uint
+
 	# Private API
 	if lib.full_api_accessible:
 		## argtypes
@@ -297,6 +379,8 @@ def attach_pogs_common_ccalls(lib, single_precision=False):
 											  pogs_settings_p, c_size_t,
 											  c_size_t]
 		lib.set_prev.argtypes = [pogs_variables_p]
+		lib.estimate_residuals.argtypes = [c_void_p, pogs_variables_p,
+										   pogs_residuals_p]
 		lib.prox.argtypes = [c_void_p, function_vector_p, function_vector_p,
 							 pogs_variables_p, ok_float]
 		lib.update_dual.argtypes = [c_void_p, pogs_variables_p, ok_float]
@@ -309,6 +393,7 @@ def attach_pogs_common_ccalls(lib, single_precision=False):
 		## results
 		lib.initialize_conditions.restype = c_uint
 		lib.set_prev.restype = c_uint
+		lib.estimate_residuals.restype = c_uint
 		lib.prox.restype = c_uint
 		lib.update_dual.restype = c_uint
 		lib.adaptrho.restype = c_uint
@@ -316,6 +401,7 @@ def attach_pogs_common_ccalls(lib, single_precision=False):
 	else:
 		lib.initialize_conditions = AttributeError()
 		lib.set_prev = AttributeError()
+		lib.estimate_residuals = AttributeError()
 		lib.prox = AttributeError()
 		lib.update_dual = AttributeError()
 		lib.adaptrho = AttributeError()
@@ -349,9 +435,37 @@ def attach_pogs_ccalls(lib, single_precision=False):
 
 	## arguments
 	lib.pogs_init.argtypes = [ok_float_p, c_size_t, c_size_t, c_uint]
+	lib.pogs_init_equil.argtypes = [ok_float_p, c_size_t, c_size_t, c_uint,
+									lib.equilibration_settings_p]
 	lib.pogs_solve.argtypes = [c_void_p, function_vector_p, function_vector_p,
 							   pogs_settings_p, pogs_info_p, pogs_output_p]
+	lib.pogs_update_objectives.argtypes = [
+			c_void_p, POINTER(c_size_t), lib.function_p, c_size_t,
+			POINTER(c_size_t), lib.function_p, c_size_t]
+	lib.pogs_solver_append_rows.argtypes = [c_void_p, ok_float_p, c_size_t,
+											c_uint]
+	lib.pogs_solver_remove_rows.argtypes = [c_void_p, POINTER(c_size_t),
+											c_size_t]
+	lib.pogs_solve_batch.argtypes = [c_void_p, c_size_t, function_vector_p,
+									 function_vector_p, pogs_settings_p,
+									 pogs_info_p, pogs_output_p]
+	lib.pogs_solve_path.argtypes = [c_void_p, function_vector_p,
+									function_vector_p, pogs_settings_p,
+									c_size_t, ok_float_p, pogs_info_p,
+									pogs_output_p]
+	lib.pogs_solve_many_threads.argtypes = [c_size_t,
+											POINTER(pogs_solver_p),
+											function_vector_p,
+											function_vector_p,
+											pogs_settings_p, pogs_info_p,
+											pogs_output_p, c_size_t]
 	lib.pogs_finish.argtypes = [c_void_p, c_int]
+	lib.pogs_telemetry_enable.argtypes = [c_void_p, c_size_t]
+	lib.pogs_telemetry_disable.argtypes = [c_void_p]
+	lib.pogs_cancel.argtypes = [c_void_p]
+	lib.pogs_telemetry_read.argtypes = [c_void_p,
+										lib.pogs_telemetry_record_p,
+										POINTER(c_size_t)]
 	lib.pogs.argtypes = [ok_float_p, function_vector_p, function_vector_p,
 						 pogs_settings_p, pogs_info_p, pogs_output_p, c_uint,
 						 c_int]
@@ -359,6 +473,11 @@ def attach_pogs_ccalls(lib, single_precision=False):
 									 ok_float_p, ok_float_p, ok_float_p,
 									 ok_float_p, ok_float_p, ok_float_p,
 									 ok_float, c_size_t, c_size_t, c_uint]
+	lib.pogs_load_solver_view.argtypes = [ok_float_p, ok_float_p,
+										  ok_float_p, ok_float_p, ok_float_p,
+										  ok_float_p, ok_float_p, ok_float_p,
+										  ok_float_p, ok_float, c_size_t,
+										  c_size_t, c_uint]
 	lib.pogs_extract_solver.argtypes = [c_void_p, ok_float_p, ok_float_p,
 										ok_float_p, ok_float_p, ok_float_p,
 										ok_float_p, ok_float_p, ok_float_p,
@@ -366,10 +485,22 @@ def attach_pogs_ccalls(lib, single_precision=False):
 
 	## return types
 	lib.pogs_init.restype = pogs_solver_p
+	lib.pogs_init_equil.restype = pogs_solver_p
 	lib.pogs_solve.restype = c_uint
+	lib.pogs_update_objectives.restype = c_uint
+	lib.pogs_solver_append_rows.restype = c_uint
+	lib.pogs_solver_remove_rows.restype = c_uint
+	lib.pogs_solve_batch.restype = c_uint
+	lib.pogs_solve_path.restype = c_uint
+	lib.pogs_solve_many_threads.restype = c_uint
 	lib.pogs_finish.restype = c_uint
+	lib.pogs_telemetry_enable.restype = c_uint
+	lib.pogs_telemetry_disable.restype = c_uint
+	lib.pogs_telemetry_read.restype = c_uint
+	lib.pogs_cancel.restype = c_uint
 	lib.pogs.restype = c_uint
 	lib.pogs_load_solver.restype = pogs_solver_p
+	lib.pogs_load_solver_view.restype = pogs_solver_p
 	lib.pogs_extract_solver.restype = c_uint
 
 	# Private API
@@ -422,6 +553,8 @@ def attach_pogs_abstract_ctypes(lib, single_precision=False):
 		attach_projector_ctypes(lib, single_precision)
 	if not 'pogs_settings_p' in lib.__dict__:
 		attach_pogs_common_ctypes(lib, single_precision)
+	if not 'equilibration_info' in lib.__dict__:
+		attach_equilibration_ctypes(lib, single_precision)
 
 	ok_float = lib.ok_float
 	vector_p = lib.vector_p
@@ -447,7 +580,14 @@ def attach_pogs_abstract_ctypes(lib, single_precision=False):
 					('normA', ok_float),
 					('skinny', c_int),
 					('normalized', c_int),
-					('equilibrated', c_int)]
+					('equilibrated', c_int),
+					('key', lib.pogs_cache_key),
+					('keyed', c_int),
+					('equil_time', ok_float),
+					('wrapped', c_int),
+					('equil', lib.equilibration_settings),
+					('equil_info', lib.equilibration_info),
+					('norm_products', c_uint)]
 
 	lib.pogs_work = PogsWork
 	lib.pogs_work_p = POINTER(lib.pogs_work)
@@ -460,7 +600,12 @@ def attach_pogs_abstract_ctypes(lib, single_precision=False):
 					('rho', ok_float),
 					('settings', pogs_settings_p),
 					('linalg_handle', c_void_p),
-					('init_time', ok_float)]
+					('init_time', ok_float),
+					('checkpoint', c_void_p),
+					('telemetry', c_void_p),
+					('cancel', c_int),
+					('k', c_uint),
+					('k_start', c_uint)]
 
 	lib.pogs_solver = PogsSolver
 	lib.pogs_solver_p = POINTER(lib.pogs_solver)
@@ -485,20 +630,50 @@ def attach_pogs_abstract_ccalls(lib, single_precision=False):
 
 	## arguments
 	lib.pogs_init.argtypes = [operator_p, c_int, ok_float]
+	lib.pogs_init_equil.argtypes = [operator_p, c_int, ok_float,
+									lib.equilibration_settings_p]
 	lib.pogs_solve.argtypes = [pogs_solver_p, function_vector_p,
 							   function_vector_p, pogs_settings_p, pogs_info_p,
 							   pogs_output_p]
+	lib.pogs_update_objectives.argtypes = [
+			pogs_solver_p, POINTER(c_size_t), lib.function_p, c_size_t,
+			POINTER(c_size_t), lib.function_p, c_size_t]
+	lib.pogs_solve_path.argtypes = [pogs_solver_p, function_vector_p,
+									function_vector_p, pogs_settings_p,
+									c_size_t, ok_float_p, pogs_info_p,
+									pogs_output_p]
+	lib.pogs_solve_many_threads.argtypes = [c_size_t,
+											POINTER(pogs_solver_p),
+											function_vector_p,
+											function_vector_p,
+											pogs_settings_p, pogs_info_p,
+											pogs_output_p, c_size_t]
 	lib.pogs_finish.argtypes = [pogs_solver_p, c_int]
 	lib.pogs.argtypes = [operator_p, function_vector_p, function_vector_p,
 						 pogs_settings_p, pogs_info_p, pogs_output_p, c_int,
 						 ok_float, c_int]
+	lib.pogs_checkpoint_save.argtypes = [pogs_solver_p, c_char_p]
+	lib.pogs_checkpoint_restore.argtypes = [operator_p, c_int, ok_float,
+											c_char_p]
+	lib.pogs_checkpoint_enable.argtypes = [pogs_solver_p, c_char_p, c_uint]
+	lib.pogs_checkpoint_disable.argtypes = [pogs_solver_p]
+	lib.pogs_checkpoint_count.argtypes = [pogs_solver_p, POINTER(c_size_t)]
+	lib.pogs_telemetry_enable.argtypes = [pogs_solver_p, c_size_t]
+	lib.pogs_telemetry_disable.argtypes = [pogs_solver_p]
+	lib.pogs_cancel.argtypes = [pogs_solver_p]
+	lib.pogs_telemetry_read.argtypes = [pogs_solver_p,
+										lib.pogs_telemetry_record_p,
+										POINTER(c_size_t)]
 	lib.pogs_dense_operator_gen.argtypes = [ok_float_p, c_size_t, c_size_t,
 											c_uint]
 	lib.pogs_sparse_operator_gen.argtypes = [ok_float_p, ok_int_p, ok_int_p,
 											 c_size_t, c_size_t, c_size_t,
 											 c_uint]
+	lib.pogs_panel_operator_gen.argtypes = [ok_float_p, c_size_t, c_size_t,
+											c_size_t]
 	lib.pogs_dense_operator_free.argtypes = [operator_p]
 	lib.pogs_sparse_operator_free.argtypes = [operator_p]
+	lib.pogs_panel_operator_free.argtypes = [operator_p]
 
 	# lib.pogs_load_solver.argtypes = [ok_float_p, ok_float_p,
 	# 								 ok_float_p, ok_float_p,
@@ -515,13 +690,28 @@ def attach_pogs_abstract_ccalls(lib, single_precision=False):
 
 	## return types
 	lib.pogs_init.restype = pogs_solver_p
+	lib.pogs_init_equil.restype = pogs_solver_p
 	lib.pogs_solve.restype = c_uint
+	lib.pogs_update_objectives.restype = c_uint
+	lib.pogs_solve_path.restype = c_uint
+	lib.pogs_solve_many_threads.restype = c_uint
 	lib.pogs_finish.restype = c_uint
 	lib.pogs.restype = c_uint
+	lib.pogs_checkpoint_save.restype = c_uint
+	lib.pogs_checkpoint_restore.restype = pogs_solver_p
+	lib.pogs_checkpoint_enable.restype = c_uint
+	lib.pogs_checkpoint_disable.restype = c_uint
+	lib.pogs_checkpoint_count.restype = c_uint
+	lib.pogs_telemetry_enable.restype = c_uint
+	lib.pogs_telemetry_disable.restype = c_uint
+	lib.pogs_telemetry_read.restype = c_uint
+	lib.pogs_cancel.restype = c_uint
 	lib.pogs_dense_operator_gen.restype = operator_p
 	lib.pogs_sparse_operator_gen.restype = operator_p
+	lib.pogs_panel_operator_gen.restype = operator_p
 	lib.pogs_dense_operator_free.restype = c_uint
 	lib.pogs_sparse_operator_free.restype = c_uint
+	lib.pogs_panel_operator_free.restype = c_uint
 
 	# lib.pogs_load_solver.restype = c_void_p
 	# lib.pogs_extract_solver.restype = c_uint
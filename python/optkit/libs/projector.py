@@ -1,5 +1,5 @@
 from ctypes import Structure, CFUNCTYPE, POINTER, c_int, c_uint, c_size_t, \
-				   c_void_p
+				   c_void_p, c_float
 from optkit.libs.loader import OptkitLibs
 from optkit.libs.linsys import attach_base_ctypes, attach_dense_linsys_ctypes,\
 	attach_sparse_linsys_ctypes, attach_base_ccalls, attach_vector_ccalls, \
@@ -65,7 +65,15 @@ def attach_projector_ctypes(lib, single_precision=False):
 					('linalg_handle', c_void_p),
 					('normA', ok_float),
 					('skinny', c_int),
-					('normalized', c_int)]
+					('normalized', c_int),
+					('L32', POINTER(c_float)),
+					('w32', POINTER(c_float)),
+					('rhs', vector_p),
+					('r', vector_p),
+					('w', ok_float_p),
+					('refinement_steps', c_uint),
+					('refinement_residual', ok_float),
+					('packed', c_int)]
 
 	lib.dense_direct_projector = dense_direct_projector
 	lib.dense_direct_projector_p = POINTER(lib.dense_direct_projector)
@@ -76,11 +84,32 @@ def attach_projector_ccalls(lib, single_precision=False):
 	if 'projector_p' not in lib.__dict__:
 		attach_projector_ctypes(lib, single_precision)
 
+	ok_float_p = lib.ok_float_p
+	c_size_t_p = lib.c_size_t_p
 	vector_p = lib.vector_p
 	matrix_p = lib.matrix_p
 	direct_projector_p = lib.direct_projector_p
 	projector_p = lib.projector_p
 
+	# args:
+	# -generic
+	lib.projector_normalization.argtypes = [projector_p, POINTER(c_int)]
+	lib.projector_get_norm.argtypes = [projector_p, ok_float_p]
+	lib.projector_get_factor_memory.argtypes = [projector_p, c_size_t_p]
+	lib.projector_get_refinement_residual.argtypes = [projector_p,
+													  ok_float_p]
+	lib.projector_get_cg_iterations.argtypes = [projector_p, POINTER(c_uint)]
+	lib.projector_clear_warm_start.argtypes = [projector_p]
+
+	# returns:
+	# -generic
+	lib.projector_normalization.restype = c_uint
+	lib.projector_get_norm.restype = c_uint
+	lib.projector_get_factor_memory.restype = c_uint
+	lib.projector_get_refinement_residual.restype = c_uint
+	lib.projector_get_cg_iterations.restype = c_uint
+	lib.projector_clear_warm_start.restype = c_uint
+
 	# args:
 	# -direct
 	lib.direct_projector_alloc.argtypes = [direct_projector_p, matrix_p]
@@ -88,16 +117,25 @@ def attach_projector_ccalls(lib, single_precision=False):
 												c_int]
 	lib.direct_projector_project.argtypes = [c_void_p,
 		direct_projector_p, vector_p, vector_p, vector_p, vector_p]
+	lib.direct_projector_project_batch.argtypes = [c_void_p,
+		direct_projector_p, matrix_p, matrix_p, matrix_p, matrix_p]
 	lib.direct_projector_free.argtypes = [direct_projector_p]
 	lib.dense_direct_projector_alloc.argtypes = [matrix_p]
+	lib.dense_direct_projector_alloc_mixed.argtypes = [matrix_p]
+	lib.dense_direct_projector_alloc_packed.argtypes = [matrix_p]
+	lib.dense_direct_projector_factor.argtypes = [c_void_p]
 
 	# returns:
 	# -direct
 	lib.direct_projector_alloc.restype = c_uint
 	lib.direct_projector_initialize.restype = c_uint
 	lib.direct_projector_project.restype = c_uint
+	lib.direct_projector_project_batch.restype = c_uint
 	lib.direct_projector_free.restype = c_uint
 	lib.dense_direct_projector_alloc.restype = projector_p
+	lib.dense_direct_projector_alloc_mixed.restype = projector_p
+	lib.dense_direct_projector_alloc_packed.restype = projector_p
+	lib.dense_direct_projector_factor.restype = c_uint
 
 def attach_operator_projector_ctypes_ccalls(lib, single_precision=False):
 	if 'ok_float' not in lib.__dict__:
@@ -109,6 +147,9 @@ def attach_operator_projector_ctypes_ccalls(lib, single_precision=False):
 
 	ok_float = lib.ok_float
 	vector_p = lib.vector_p
+	matrix_p = lib.matrix_p
+	ok_float_p = lib.ok_float_p
+	sparse_matrix_p = lib.sparse_matrix_p
 	operator_p = lib.operator_p
 	projector_p = lib.projector_p
 
@@ -116,7 +157,9 @@ def attach_operator_projector_ctypes_ccalls(lib, single_precision=False):
 	class indirect_projector(Structure):
 		_fields_ = [('A', operator_p),
 					('cgls_work', c_void_p),
-					('flag', c_uint)]
+					('flag', c_uint),
+					('dx', vector_p),
+					('iterations', c_uint)]
 
 	lib.indirect_projector = indirect_projector
 	lib.indirect_projector_p = POINTER(lib.indirect_projector)
@@ -128,11 +171,59 @@ def attach_operator_projector_ctypes_ccalls(lib, single_precision=False):
 					('linalg_handle', c_void_p),
 					('normA', ok_float),
 					('normalized', c_int),
-					('flag', c_uint)]
+					('flag', c_uint),
+					('dx', vector_p),
+					('iterations', c_uint)]
 
 	lib.indirect_projector_generic = indirect_projector_generic
 	lib.indirect_projector_generic_p = POINTER(lib.indirect_projector_generic)
 
+	class pcg_projector(Structure):
+		_fields_ = [('A', operator_p),
+					('M', operator_p),
+					('pcg_work', c_void_p),
+					('linalg_handle', c_void_p),
+					('precond', c_uint),
+					('block', c_size_t),
+					('d', vector_p),
+					('L', matrix_p),
+					('C', matrix_p),
+					('rhs', vector_p),
+					('a', vector_p),
+					('normA', ok_float),
+					('normalized', c_int),
+					('initialized', c_int),
+					('iterations', c_uint)]
+
+	lib.pcg_projector = pcg_projector
+	lib.pcg_projector_p = POINTER(lib.pcg_projector)
+
+	ok_int_p = lib.ok_int_p
+
+	class sparse_ldl(Structure):
+		_fields_ = [('size', c_size_t),
+					('nnz_L', c_size_t),
+					('perm', ok_int_p),
+					('iperm', ok_int_p),
+					('Sp', ok_int_p),
+					('Si', ok_int_p),
+					('Sk', ok_int_p),
+					('parent', ok_int_p),
+					('Lnz', ok_int_p),
+					('Lp', ok_int_p),
+					('Li', ok_int_p),
+					('Lx', ok_float_p),
+					('D', ok_float_p),
+					('y', ok_float_p),
+					('pattern', ok_int_p),
+					('flag', ok_int_p),
+					('analyzed', c_int),
+					('factored', c_int)]
+
+	lib.sparse_ldl = sparse_ldl
+	lib.sparse_ldl_p = POINTER(lib.sparse_ldl)
+	sparse_ldl_p = lib.sparse_ldl_p
+
 
 	# calls
 	lib.indirect_projector_alloc.argtypes = [indirect_projector_p, operator_p]
@@ -143,9 +234,28 @@ def attach_operator_projector_ctypes_ccalls(lib, single_precision=False):
 											   vector_p]
 	lib.indirect_projector_free.argtypes = [indirect_projector_p]
 	lib.indirect_projector_generic_alloc.argtypes = [operator_p]
+	lib.sparse_direct_projector_alloc.argtypes = [sparse_matrix_p]
+	lib.sparse_direct_projector_factor.argtypes = [c_void_p]
+	lib.panel_direct_projector_alloc.argtypes = [operator_p]
+	lib.pcg_projector_alloc.argtypes = [operator_p, c_uint, c_size_t]
+	lib.sparse_ldl_alloc.argtypes = [sparse_ldl_p, c_size_t]
+	lib.sparse_ldl_free.argtypes = [sparse_ldl_p]
+	lib.sparse_ldl_analyze.argtypes = [sparse_ldl_p, ok_int_p, ok_int_p]
+	lib.sparse_ldl_factor.argtypes = [sparse_ldl_p, ok_int_p, ok_int_p,
+									  ok_float_p]
+	lib.sparse_ldl_solve.argtypes = [sparse_ldl_p, ok_float_p]
 
 	lib.indirect_projector_alloc.restype = c_uint
 	lib.indirect_projector_initialize.restype = c_uint
 	lib.indirect_projector_project.restype = c_uint
 	lib.indirect_projector_free.restype = c_uint
 	lib.indirect_projector_generic_alloc.restype = projector_p
+	lib.sparse_direct_projector_alloc.restype = projector_p
+	lib.sparse_direct_projector_factor.restype = c_uint
+	lib.panel_direct_projector_alloc.restype = projector_p
+	lib.pcg_projector_alloc.restype = projector_p
+	lib.sparse_ldl_alloc.restype = c_uint
+	lib.sparse_ldl_free.restype = c_uint
+	lib.sparse_ldl_analyze.restype = c_uint
+	lib.sparse_ldl_factor.restype = c_uint
+	lib.sparse_ldl_solve.restype = c_uint
@@ -65,6 +65,12 @@ def attach_prox_ccalls(lib, single_precision=False):
 	lib.function_vector_memcpy_av.argtypes = [function_p, function_vector_p]
 	lib.function_vector_mul.argtypes = [function_vector_p, vector_p]
 	lib.function_vector_div.argtypes = [function_vector_p, vector_p]
+	lib.function_vector_scatter_va.argtypes = [function_vector_p, function_p,
+											   POINTER(c_size_t), c_size_t]
+	lib.function_vector_mul_indexed.argtypes = [function_vector_p, vector_p,
+												POINTER(c_size_t), c_size_t]
+	lib.function_vector_div_indexed.argtypes = [function_vector_p, vector_p,
+												POINTER(c_size_t), c_size_t]
 	lib.function_vector_print.argtypes = [function_vector_p]
 
 	## return values
@@ -75,6 +81,9 @@ def attach_prox_ccalls(lib, single_precision=False):
 	lib.function_vector_memcpy_av.restype = c_uint
 	lib.function_vector_mul.restype = c_uint
 	lib.function_vector_div.restype = c_uint
+	lib.function_vector_scatter_va.restype = c_uint
+	lib.function_vector_mul_indexed.restype = c_uint
+	lib.function_vector_div_indexed.restype = c_uint
 	lib.function_vector_print.restype = c_uint
 
 	# Prox & Function evaluation
@@ -15,6 +15,10 @@ WARMSTART_DEFAULT = 0
 VERBOSE_DEFAULT = 2
 SUPPRESS_DEFAULT = 0
 RESUME_DEFAULT = 0
+ACCELERATE_DEFAULT = 0
+ANDERSON_TYPE_DEFAULT = 2
+ANDERSON_MEMORY_DEFAULT = 5
+CHECK_INTERVAL_DEFAULT = 1
 
 class OptkitCPogsTestCase(OptkitCTestCase):
 	class PogsVariablesLocal():
@@ -156,6 +160,14 @@ class OptkitCPogsTestCase(OptkitCTestCase):
 		self.assertScalarEqual(settings.warmstart, WARMSTART_DEFAULT,
 									 TOL )
 		self.assertScalarEqual(settings.resume, RESUME_DEFAULT, TOL )
+		self.assertScalarEqual(settings.accelerate, ACCELERATE_DEFAULT,
+									 TOL )
+		self.assertScalarEqual(settings.anderson_type,
+									 ANDERSON_TYPE_DEFAULT, TOL )
+		self.assertScalarEqual(settings.anderson_memory,
+									 ANDERSON_MEMORY_DEFAULT, TOL )
+		self.assertScalarEqual(settings.check_interval,
+									 CHECK_INTERVAL_DEFAULT, TOL )
 
 	def assert_pogs_scaling(self, lib, solver, f, f_py, g, g_py, local_vars):
 		m = len(f_py)
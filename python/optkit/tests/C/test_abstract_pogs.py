@@ -1,7 +1,7 @@
 import os
 import numpy as np
 from scipy.sparse import csc_matrix, csr_matrix
-from ctypes import c_void_p, byref, cast, addressof
+from ctypes import POINTER, c_void_p, c_size_t, byref, cast, addressof
 from optkit.utils.proxutils import func_eval_python
 from optkit.libs.pogs import PogsAbstractLibs
 from optkit.tests.defs import OptkitTestCase
@@ -48,7 +48,7 @@ class PogsAbstractTestCases(OptkitCPogsTestCase, OptkitCOperatorTestCase):
 		self.free_all_vars()
 		self.exit_call()
 
-	def register_pogs_operator(self, lib, type_='dense', name='o'):
+	def register_pogs_operator(self, lib, type_='dense', name='o', A=None):
 		m, n = self.shape
 
 		if type_ not in self.op_keys:
@@ -56,21 +56,21 @@ class PogsAbstractTestCases(OptkitCPogsTestCase, OptkitCOperatorTestCase):
 							 self.op_keys))
 
 		if type_ == 'dense':
-			A_ = self.A_test.astype(lib.pyfloat)
+			A_ = (self.A_test if A is None else A).astype(lib.pyfloat)
 			A_ptr = A_.ctypes.data_as(lib.ok_float_p)
 			order = lib.enums.CblasRowMajor if A_.flags.c_contiguous \
 					else lib.enums.CblasColMajor
 			o = lib.pogs_dense_operator_gen(A_ptr, m, n, order)
 			free_o = lib.pogs_dense_operator_free
 		elif type_ == 'sparse':
-			A_ = self.A_test_sparse
+			A_ = self.A_test_sparse if A is None else A
 			A_sp = csr_matrix(A_.astype(lib.pyfloat))
 			A_ptr = A_sp.indptr.ctypes.data_as(lib.ok_int_p)
 			A_ind = A_sp.indices.ctypes.data_as(lib.ok_int_p)
 			A_val = A_sp.data.ctypes.data_as(lib.ok_float_p)
 			order = lib.enums.CblasRowMajor
 			o = lib.pogs_sparse_operator_gen(A_val, A_ind, A_ptr, m, n,
-												 self.nnz, order)
+												 A_sp.nnz, order)
 			free_o = lib.pogs_sparse_operator_free
 		else:
 			raise RuntimeError('this should be unreachable due to ValueError '
@@ -318,6 +318,54 @@ class PogsAbstractTestCases(OptkitCPogsTestCase, OptkitCOperatorTestCase):
 						self.free_var('o')
 						self.assertCall( lib.ok_device_reset() )
 
+	def test_pogs_init_cached(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			NO_DEVICE_RESET = 0
+			stats = lib.pogs_cache_stats()
+
+			# fix test matrices: each access to A_test* draws a new one
+			A_dense = self.A_test.astype(lib.pyfloat)
+			A_sp = csr_matrix(self.A_test_sparse.astype(lib.pyfloat))
+			gen = {
+				'dense': lambda: lib.pogs_dense_operator_gen(
+						A_dense.ctypes.data_as(lib.ok_float_p), m, n,
+						lib.enums.CblasRowMajor),
+				'sparse': lambda: lib.pogs_sparse_operator_gen(
+						A_sp.data.ctypes.data_as(lib.ok_float_p),
+						A_sp.indices.ctypes.data_as(lib.ok_int_p),
+						A_sp.indptr.ctypes.data_as(lib.ok_int_p), m, n,
+						A_sp.nnz, lib.enums.CblasRowMajor)}
+
+			for optype in self.op_keys:
+				A = A_dense if optype == 'dense' else A_sp.toarray()
+				for DIRECT in [0, 1, lib.enums.DIRECT_MIXED,
+							   lib.enums.DIRECT_PACKED]:
+					self.assertCall( lib.pogs_cache_clear() )
+					for i in (0, 1):
+						o = gen[optype]()
+						self.register_var('o', o.contents.data,
+										  o.contents.free)
+						solver = lib.pogs_init(o, DIRECT, 1.)
+						if i > 0:
+							self.assert_pogs_equilibration(
+									lib, solver, A, o, None)
+						self.assertCall( lib.pogs_finish(
+								solver, NO_DEVICE_RESET) )
+						self.free_var('o')
+
+					self.assertCall( lib.pogs_cache_get_stats(stats) )
+					self.assertEqual( stats.misses, 1 )
+					self.assertEqual( stats.hits, 1 )
+					self.assertEqual( stats.entries, 1 )
+
+			self.assertCall( lib.pogs_cache_clear() )
+
 	def test_pogs_private_api(self):
 		m, n = self.shape
 		for (gpu, single_precision) in self.CONDITIONS:
@@ -437,6 +485,728 @@ class PogsAbstractTestCases(OptkitCPogsTestCase, OptkitCOperatorTestCase):
 						self.free_vars('f', 'g')
 						self.assertCall( lib.ok_device_reset() )
 
+	def test_pogs_call_matrix_free(self):
+		"""abstract operator pogs: randomized equilibration, other operator"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for probes in [4, 32]:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+				# a dense operator, seen only through apply/adjoint
+				A, o = self.register_pogs_operator(lib, 'dense', 'o')
+				o.contents.kind = 1000
+
+				equil = lib.equilibration_settings()
+				self.assertCall( lib.equilibration_randomized_settings(
+						equil) )
+				equil.probes = probes
+
+				solver = lib.pogs_init_equil(o, 0, 1., equil)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				W = solver.contents.W.contents
+				self.assertEqual( W.wrapped, 1 )
+				self.assertEqual( W.A.contents.kind, 106 )
+				self.assertEqual( W.equil.probes, probes )
+				self.assertTrue( W.equilibrated )
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.assertTrue( info.equil_row_spread >= 1 )
+				self.assertTrue( info.equil_col_spread >= 1 )
+				self.free_vars('solver', 'o')
+
+				if info.converged:
+					self.assert_pogs_convergence(
+							A, settings, output, gpu=gpu,
+							single_precision=single_precision)
+
+				self.free_vars('f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_inexact(self):
+		"""abstract operator pogs: inexact, warm-started CGLS projections"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for DIRECT in [0, 1]:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				A, o = self.register_pogs_operator(lib, 'dense', 'o')
+
+				solver = lib.pogs_init(o, DIRECT, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.free_vars('solver', 'o')
+
+				self.assertEqual( info.err, 0 )
+				if DIRECT:
+					self.assertEqual( info.cg_iters, 0 )
+				else:
+					self.assertTrue( info.cg_iters > 0 )
+
+				self.free_vars('f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_preconditioned(self):
+		"""abstract operator pogs: PCG projections, cached preconditioner"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for precond in (lib.enums.PRECOND_JACOBI,
+							lib.enums.PRECOND_BLOCK_JACOBI):
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				A, o = self.register_pogs_operator(lib, 'sparse', 'o')
+
+				solver = lib.pogs_init(o, precond, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				P = solver.contents.W.contents.P
+				self.assertEqual( P.contents.kind, lib.enums.INDIRECT_PCG )
+				factor_bytes = np.zeros(1).astype(c_size_t)
+				self.assertCall( lib.projector_get_factor_memory(
+						P, factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+				if precond == lib.enums.PRECOND_JACOBI:
+					self.assertEqual( factor_bytes[0], 0 )
+				else:
+					self.assertEqual( factor_bytes[0],
+									  np.dtype(lib.pyfloat).itemsize *
+									  min(n, 32) * n )
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.free_vars('solver', 'o')
+
+				self.assertEqual( info.err, 0 )
+				self.assertTrue( info.cg_iters > 0 )
+
+				self.free_vars('f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_norm_estimate_reuse(self):
+		"""abstract operator pogs: norm estimate restarts across pogs_init"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+			self.assertCall( lib.pogs_norm_cache_clear() )
+
+			A, o = self.register_pogs_operator(lib, 'dense', 'o')
+			o.contents.kind = 1000
+
+			products = []
+			for i in range(2):
+				solver = lib.pogs_init(o, 0, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				W = solver.contents.W.contents
+				self.assertTrue( W.normalized )
+				self.assertTrue( W.normA > 0 )
+				products.append(W.norm_products)
+				self.free_var('solver')
+
+			self.assertTrue( products[0] > 0 )
+			self.assertTrue( products[1] <= products[0] )
+
+			self.assertCall( lib.pogs_norm_cache_clear() )
+			self.free_var('o')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_accelerated(self):
+		"""abstract operator pogs: pogs_solve() call, Anderson acceleration"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				for DIRECT in [0, 1]:
+					f, f_py, g, g_py = self.gen_registered_pogs_fns(
+							lib, m, n)
+					A, o = self.register_pogs_operator(lib, optype, 'o')
+
+					solver = lib.pogs_init(o, DIRECT, 1.)
+					self.register_solver('solver', solver, lib.pogs_finish)
+
+					output, info, settings = self.gen_pogs_params(lib, m, n)
+					settings.accelerate = 1
+
+					self.assertCall( lib.pogs_solve(solver, f, g, settings,
+													info, output.ptr) )
+					self.free_vars('solver', 'o')
+					self.assertTrue( info.k_accel <= info.k )
+
+					if info.converged:
+						self.assert_pogs_convergence(
+								A, settings, output, gpu=gpu,
+								single_precision=single_precision)
+
+					self.free_vars('f', 'g')
+					self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_check_interval(self):
+		"""abstract operator pogs: pogs_solve() call, periodic checks"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				A, o = self.register_pogs_operator(lib, optype, 'o')
+
+				solver = lib.pogs_init(o, 1, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				settings.check_interval = 10
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.free_vars('solver', 'o')
+
+				if info.converged:
+					self.assert_pogs_convergence(
+							A, settings, output, gpu=gpu,
+							single_precision=single_precision)
+				else:
+					self.assertEqual( info.k, settings.maxiter )
+
+				self.free_vars('f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_time_limit(self):
+		"""abstract operator pogs: pogs_solve() call, time limit"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				A, o = self.register_pogs_operator(lib, optype, 'o')
+
+				solver = lib.pogs_init(o, 1, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				settings.maxiter = 10**8
+				settings.abstol = 0
+				settings.reltol = 0
+				settings.verbose = 0
+				settings.time_limit = 1e-3
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.assertEqual( info.status, lib.enums.POGS_TIME_LIMIT )
+				self.assertTrue( 0 < info.k < settings.maxiter )
+
+				settings.time_limit = 0
+				settings.maxiter = 5
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.assertEqual( info.status, lib.enums.POGS_MAXITER )
+
+				self.free_vars('solver', 'o', 'f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_update_objectives(self):
+		"""abstract operator pogs: delta updates of f, g between solves"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				f_ptr = f_py.ctypes.data_as(lib.function_p)
+				A, o = self.register_pogs_operator(lib, optype, 'o')
+				A2, o2 = self.register_pogs_operator(lib, optype, 'o2', A=A)
+
+				# same solves on two solvers: delta vs. full objective updates
+				solver = lib.pogs_init(o, 1, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				solver_full = lib.pogs_init(o2, 1, 1.)
+				self.register_solver('solver_full', solver_full,
+									 lib.pogs_finish)
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				output_full, info_full, _ = self.gen_pogs_params(lib, m, n)
+				settings.maxiter = 100
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.assertCall( lib.pogs_solve(solver_full, f, g, settings,
+												info_full, output_full.ptr) )
+
+				f_idx = np.array([0, m - 1], dtype=np.uintp)
+				f_new = np.zeros(f_idx.size).astype(lib.function)
+				f_new['h'] = lib.function_enums.Square
+				f_new['a'] = 1
+				f_new['b'] = np.random.rand(f_idx.size)
+				f_new['c'] = 1
+
+				self.assertCall( lib.pogs_update_objectives(
+						solver, f_idx.ctypes.data_as(POINTER(c_size_t)),
+						f_new.ctypes.data_as(lib.function_p), f_idx.size,
+						None, None, 0) )
+				self.assertCall( lib.pogs_solve(solver, None, None, settings,
+												info, output.ptr) )
+
+				f_py[f_idx] = f_new
+				self.assertCall( lib.function_vector_memcpy_va(f, f_ptr) )
+				self.assertCall( lib.pogs_solve(solver_full, f, g, settings,
+												info_full, output_full.ptr) )
+
+				self.assertEqual( info.k, info_full.k )
+				self.assertVecEqual( output.x, output_full.x, 1e-7, 1e-7 )
+
+				self.free_vars('solver', 'solver_full', 'o', 'o2', 'f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_telemetry(self):
+		"""abstract operator pogs: per-iteration telemetry"""
+		m, n = self.shape
+		CAPACITY = 10
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				A, o = self.register_pogs_operator(lib, optype, 'o')
+
+				solver = lib.pogs_init(o, 1, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				records = (lib.pogs_telemetry_record * CAPACITY)()
+				count = c_size_t(CAPACITY)
+
+				self.assertNotEqual( lib.pogs_telemetry_read(
+						solver, records, byref(count)), 0 )
+				self.assertCall( lib.pogs_telemetry_enable(solver, CAPACITY) )
+				self.assertCall( lib.pogs_solve(solver, f, g, settings,
+												info, output.ptr) )
+				self.assertCall( lib.pogs_telemetry_read(
+						solver, records, byref(count)) )
+
+				self.assertEqual( count.value, min(info.k, CAPACITY) )
+				for i in range(count.value):
+					self.assertEqual( records[i].k,
+									  info.k - count.value + 1 + i )
+					for field in ('t_prox', 't_project', 't_dual',
+								  't_check'):
+						self.assertTrue( getattr(records[i], field) >= 0 )
+				if info.converged:
+					self.assertTrue( records[count.value - 1].checked )
+
+				self.free_vars('solver', 'o', 'f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_mixed_precision(self):
+		"""abstract operator pogs: pogs_solve() call, single precision factor"""
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			RESIDUAL_TOL = 1e-5 if lib.FLOAT else 1e-6
+
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+			A, o = self.register_pogs_operator(lib, 'dense', 'o')
+
+			solver = lib.pogs_init(o, lib.enums.DIRECT_MIXED, 1.)
+			self.register_solver('solver', solver, lib.pogs_finish)
+
+			factor_bytes = np.zeros(1).astype(c_size_t)
+			self.assertCall( lib.projector_get_factor_memory(
+					solver.contents.W.contents.P,
+					factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+			self.assertEqual( factor_bytes[0], 4 * min(m, n)**2 )
+
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.free_vars('solver', 'o')
+			self.assertTrue( info.refinement_residual <= RESIDUAL_TOL )
+
+			if info.converged:
+				self.assert_pogs_convergence(
+						A, settings, output, gpu=gpu,
+						single_precision=single_precision)
+
+			self.free_vars('f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_panel_operator(self):
+		"""abstract operator pogs: tall A streamed from a memory-mapped file"""
+		A = self.A_test
+		if A.shape[0] < A.shape[1]:
+			A = A.T
+		m, n = A.shape
+		b = np.random.rand(m)
+		PANEL_ROWS = 64
+		filename = os.path.abspath('c_panel_pogs_test.bin')
+
+		# ridge regression: x* = (A^T A + I)^-1 A^T b
+		x_star = np.linalg.solve(A.T.dot(A) + np.eye(n), A.T.dot(b))
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			RTOL = 1e-2 if lib.FLOAT else 1e-3
+
+			A_mm = np.memmap(filename, dtype=lib.pyfloat, mode='w+',
+							 shape=(m, n))
+			A_mm[:] = A
+			A_mm.flush()
+
+			o = lib.pogs_panel_operator_gen(
+					A_mm.ctypes.data_as(lib.ok_float_p), m, n, PANEL_ROWS)
+			self.register_var('o', o, lib.pogs_panel_operator_free)
+			solver = lib.pogs_init(o, 1, 2.)
+			self.register_solver('solver', solver, lib.pogs_finish)
+
+			# equilibration and I + A^T A formed in a single pass over A
+			P = solver.contents.W.contents.P
+			self.assertEqual( P.contents.kind, lib.enums.PANEL_DIRECT )
+			passes = np.zeros(1).astype(c_size_t)
+			self.assertCall( lib.panel_operator_passes(
+					o, passes.ctypes.data_as(lib.c_size_t_p)) )
+			self.assertEqual( passes[0], 1 )
+			factor_bytes = np.zeros(1).astype(c_size_t)
+			self.assertCall( lib.projector_get_factor_memory(
+					P, factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+			self.assertEqual(
+					factor_bytes[0], np.dtype(lib.pyfloat).itemsize * n**2 )
+
+			self.assert_pogs_equilibration(lib, solver, A, o, None)
+			self.assert_pogs_projector(lib, solver.contents.linalg_handle,
+									   P, o)
+
+			f, f_py, f_ptr = self.register_fnvector(lib, m, 'f')
+			g, g_py, g_ptr = self.register_fnvector(lib, n, 'g')
+			f_py['h'] = g_py['h'] = lib.function_enums.Square
+			f_py['a'] = g_py['a'] = 1
+			f_py['c'] = g_py['c'] = 1
+			f_py['b'] = b
+			self.assertCall( lib.function_vector_memcpy_va(f, f_ptr) )
+			self.assertCall( lib.function_vector_memcpy_va(g, g_ptr) )
+
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+			settings.reltol = 1e-5
+			settings.abstol = 1e-6
+			settings.maxiter = 5000
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.assertTrue( info.converged )
+			self.assertVecEqual( output.x, x_star, 0, RTOL )
+
+			self.free_vars('solver', 'o', 'f', 'g')
+			del A_mm
+			os.remove(filename)
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_path(self):
+		"""abstract operator pogs: pogs_solve_path() call"""
+		m, n = self.shape
+		path = [1., 0.5, 0.1]
+		K = len(path)
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				# lasso: min. 1/2 ||y - b||^2 + lambda ||x||_1 s.t. y = Ax
+				f_ = np.zeros(m, dtype=lib.function)
+				g_ = np.zeros(n, dtype=lib.function)
+				f_['h'] = lib.function_enums.Square
+				f_['a'] = 1
+				f_['b'] = np.random.rand(m)
+				f_['c'] = 1
+				g_['h'] = lib.function_enums.Abs
+				g_['a'] = 1
+				g_['c'] = 1
+				f = lib.function_vector(m, f_.ctypes.data_as(lib.function_p))
+				g = lib.function_vector(n, g_.ctypes.data_as(lib.function_p))
+
+				A, o = self.register_pogs_operator(lib, optype, 'o')
+				solver = lib.pogs_init(o, 0, 1.)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				outputs = []
+				for k in range(K):
+					output, _, settings = self.gen_pogs_params(lib, m, n)
+					outputs.append(output)
+				info = (lib.pogs_info * K)()
+				output_c = (lib.pogs_output * K)(*[o_.ptr for o_ in outputs])
+				lambdas = np.array(path, dtype=lib.pyfloat)
+
+				self.assertCall( lib.pogs_solve_path(
+						solver, f, g, settings, K,
+						lambdas.ctypes.data_as(lib.ok_float_p), info,
+						output_c) )
+				self.free_vars('solver', 'o')
+
+				for k in range(K):
+					self.assertEqual( info[k].err, 0 )
+					if info[k].converged:
+						self.assert_pogs_convergence(
+								A, settings, outputs[k], gpu=gpu,
+								single_precision=single_precision)
+
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_path_error(self):
+		"""abstract operator pogs: solver loop error ends the path"""
+		m, n = self.shape
+		path = [1., 0.5, 0.1]
+		K = len(path)
+
+		def fail_products(lib, o, failing):
+			# wrap the products of o to fail while failing() holds
+			wrappers = []
+			def wrap(field):
+				# copy the function pointer: field reads through to o
+				fn = type(field)(cast(field, c_void_p).value)
+				def call(*args):
+					if failing():
+						return lib.enums.OPTKIT_ERROR
+					return fn(*args)
+				wrapper = type(field)(call)
+				wrappers.append(wrapper)
+				return wrapper
+			for name in ('apply', 'adjoint', 'fused_apply',
+						 'fused_adjoint'):
+				setattr(o.contents, name, wrap(getattr(o.contents, name)))
+			return wrappers
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+			lambdas = np.array(path, dtype=lib.pyfloat)
+			outputs = []
+			for k in range(K):
+				output, _, settings = self.gen_pogs_params(lib, m, n)
+				outputs.append(output)
+			output_c = (lib.pogs_output * K)(*[o_.ptr for o_ in outputs])
+			info = (lib.pogs_info * K)()
+			settings.maxiter = 100
+
+			A, o = self.register_pogs_operator(lib, 'dense', 'o')
+			solver = lib.pogs_init(o, 0, 1.)
+			self.register_solver('solver', solver, lib.pogs_finish)
+
+			# products fail once the first point's output is written,
+			# i.e., during the second point
+			wrappers = fail_products(
+					lib, o, lambda: np.any(outputs[0].nu != 0))
+			err = lib.pogs_solve_path(
+					solver, f, g, settings, K,
+					lambdas.ctypes.data_as(lib.ok_float_p), info, output_c)
+			self.assertEqual( info[0].err, 0 )
+			self.assertNotEqual( info[0].status, lib.enums.POGS_UNSOLVED )
+			self.assertNotEqual( err, 0 )
+			self.assertEqual( err, info[1].err )
+			self.assertEqual( info[1].status, lib.enums.POGS_UNSOLVED )
+
+			# the third point is not attempted
+			self.assertEqual( info[2].k, 0 )
+			self.assertEqual( info[2].status, lib.enums.POGS_UNSOLVED )
+			self.free_vars('solver', 'o', 'f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_many_threads(self):
+		"""abstract operator pogs: pogs_solve_many_threads() call"""
+		m, n = self.shape
+		N = 3
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+				f_c = (lib.function_vector * N)(*[f] * N)
+				g_c = (lib.function_vector * N)(*[g] * N)
+
+				solvers = (lib.pogs_solver_p * N)()
+				# keep each operator's data alive until it is freed
+				A_list = []
+				for k in range(N):
+					A, o = self.register_pogs_operator(lib, optype,
+													   'o' + str(k))
+					A_list.append(A)
+					solvers[k] = lib.pogs_init(o, 0, 1.)
+					self.register_solver('solver' + str(k), solvers[k],
+										 lib.pogs_finish)
+
+				outputs = []
+				for k in range(N):
+					output, _, settings = self.gen_pogs_params(lib, m, n)
+					outputs.append(output)
+				info = (lib.pogs_info * N)()
+				output_c = (lib.pogs_output * N)(*[o_.ptr for o_ in outputs])
+
+				self.assertCall( lib.pogs_solve_many_threads(
+						N, solvers, f_c, g_c, settings, info, output_c, 0) )
+
+				for k in range(N):
+					self.assertEqual( info[k].err, 0 )
+					if info[k].converged:
+						self.assert_pogs_convergence(
+								A_list[k], settings, outputs[k], gpu=gpu,
+								single_precision=single_precision)
+					self.free_vars('solver' + str(k), 'o' + str(k))
+
+				self.free_vars('f', 'g')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_checkpoint(self):
+		"""abstract operator pogs: checkpoint/restore"""
+		m, n = self.shape
+		path = os.path.abspath('c_checkpoint_test.ckpt')
+		path_sync = os.path.abspath('c_checkpoint_sync.ckpt')
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for optype in self.op_keys:
+				for DIRECT in [0, 1]:
+					f, f_py, g, g_py = self.gen_registered_pogs_fns(
+							lib, m, n)
+					A, o = self.register_pogs_operator(lib, optype, 'o')
+					solver = lib.pogs_init(o, DIRECT, 1.)
+					self.register_solver('solver', solver, lib.pogs_finish)
+
+					# interrupted solve, checkpointed every 10 iterations
+					output, info, settings = self.gen_pogs_params(lib, m, n)
+					settings.maxiter = 40
+					self.assertCall( lib.pogs_checkpoint_enable(
+							solver, path.encode(), 10) )
+					self.assertCall( lib.pogs_solve(solver, f, g, settings,
+													info, output.ptr) )
+					count = c_size_t(0)
+					self.assertCall( lib.pogs_checkpoint_count(
+							solver, byref(count)) )
+					self.assertTrue( count.value >= 1 )
+					self.assertTrue( os.path.exists(path) )
+
+					# restore to a solver over a fresh copy of A
+					A2, o2 = self.register_pogs_operator(lib, optype, 'o2',
+														 A=A)
+					solver2 = lib.pogs_checkpoint_restore(
+							o2, DIRECT, 1., path.encode())
+					self.assertTrue( bool(solver2) )
+					self.register_solver('solver2', solver2, lib.pogs_finish)
+
+					d = np.zeros(m, dtype=lib.pyfloat)
+					d2 = np.zeros(m, dtype=lib.pyfloat)
+					self.load_to_local(lib, d, solver.contents.W.contents.d)
+					self.load_to_local(lib, d2,
+									   solver2.contents.W.contents.d)
+					self.assertVecEqual( d, d2, 1e-7, 1e-7 )
+
+					settings.maxiter = 2000
+					settings.resume = 1
+					self.assertCall( lib.pogs_solve(solver2, f, g, settings,
+													info, output.ptr) )
+					self.assertEqual( info.err, 0 )
+					if info.converged:
+						self.assert_pogs_convergence(
+								A, settings, output, gpu=gpu,
+								single_precision=single_precision)
+					self.free_vars('solver2', 'o2')
+
+					# synchronous checkpoint: restored solver continues
+					# exactly as the original, and continues its
+					# iteration count (k-dependent rho adaptation and
+					# check schedule disabled for the comparison)
+					self.assertCall( lib.pogs_checkpoint_save(
+							solver, path_sync.encode()) )
+					A3, o3 = self.register_pogs_operator(lib, optype, 'o3',
+														 A=A)
+					solver3 = lib.pogs_checkpoint_restore(
+							o3, DIRECT, 1., path_sync.encode())
+					self.assertTrue( bool(solver3) )
+					self.register_solver('solver3', solver3, lib.pogs_finish)
+					k_saved = solver.contents.k
+					self.assertTrue( k_saved > 0 )
+					self.assertEqual( solver3.contents.k, k_saved )
+
+					settings.maxiter = 20
+					settings.adaptiverho = 0
+					settings.check_interval = 1
+					output3, info3, settings3 = self.gen_pogs_params(
+							lib, m, n)
+					settings3.maxiter = k_saved + 20
+					settings3.adaptiverho = 0
+					settings3.check_interval = 1
+					settings3.resume = 1
+					self.assertCall( lib.pogs_checkpoint_disable(solver) )
+					self.assertCall( lib.pogs_solve(solver, f, g, settings,
+													info, output.ptr) )
+					self.assertCall( lib.pogs_solve(solver3, f, g, settings3,
+													info3, output3.ptr) )
+					self.assertEqual( info3.k, k_saved + info.k )
+					self.assertVecEqual( output.x, output3.x, 1e-5, 1e-5 )
+
+					# the restored count is spent: a further resumed solve
+					# counts from zero
+					settings3.maxiter = 5
+					self.assertCall( lib.pogs_solve(solver3, f, g, settings3,
+													info3, output3.ptr) )
+					self.assertTrue( info3.k <= 5 )
+
+					self.free_vars('solver3', 'o3', 'solver', 'o', 'f', 'g')
+					os.remove(path)
+					os.remove(path_sync)
+					self.assertCall( lib.ok_device_reset() )
+
 	def test_pogs_call_unified(self):
 		"""abstract operator pogs: pogs() call"""
 		m, n = self.shape
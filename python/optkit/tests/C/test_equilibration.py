@@ -105,6 +105,91 @@ class EquilLibsTestCase(OptkitCOperatorTestCase):
 				self.equilibrate(lib, order, A_colmissing)
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_matrix_equilibrate(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * lib.FLOAT - 2 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+			TOL = 1e-3
+
+			A_in_py = self.A_test.astype(lib.pyfloat)
+			A_in_ptr = A_in_py.ctypes.data_as(lib.ok_float_p)
+			order_in = lib.enums.CblasRowMajor if \
+					   A_in_py.flags.c_contiguous else lib.enums.CblasColMajor
+
+			for method in (lib.enums.EQUIL_SINKHORN, lib.enums.EQUIL_RUIZ):
+				for order in (lib.enums.CblasRowMajor,
+							  lib.enums.CblasColMajor):
+					hdl = self.register_blas_handle(lib, 'hdl')
+					A, A_py, A_ptr = self.register_matrix(lib, m, n, order,
+														  'A')
+					d, d_py, d_ptr = self.register_vector(lib, m, 'd')
+					e, e_py, e_ptr = self.register_vector(lib, n, 'e')
+
+					settings = lib.equilibration_settings()
+					info = lib.equilibration_info()
+					self.assertCall( lib.equilibration_default_settings(
+							settings) )
+					settings.method = method
+					settings.tol = TOL
+
+					# iteration cap
+					settings.maxiter = 1
+					self.assertCall( lib.matrix_equilibrate(
+							hdl, A_in_ptr, A, d, e, order_in, settings,
+							info) )
+					self.assertEqual( info.iterations, 1 )
+
+					settings.maxiter = 500
+					self.assertCall( lib.matrix_equilibrate(
+							hdl, A_in_ptr, A, d, e, order_in, settings,
+							info) )
+					self.assertTrue( info.iterations < settings.maxiter )
+
+					self.assertCall( lib.matrix_memcpy_am(A_ptr, A, order) )
+					self.assertCall( lib.vector_memcpy_av(d_ptr, d, 1) )
+					self.assertCall( lib.vector_memcpy_av(e_ptr, e, 1) )
+
+					# A_out = D * A_in * E
+					A_eqx = A_py.dot(self.x_test)
+					DAEx = d_py * A_in_py.dot(e_py * self.x_test)
+					self.assertVecEqual( A_eqx, DAEx, ATOLM, RTOL )
+
+					# reported norm spreads
+					if method == lib.enums.EQUIL_RUIZ:
+						rnorm = np.abs(A_py).max(axis=1)
+						cnorm = np.abs(A_py).max(axis=0)
+						self.assertTrue( info.row_spread <=
+										 (1 + TOL) / (1 - TOL) )
+						self.assertTrue( info.col_spread <=
+										 (1 + TOL) / (1 - TOL) )
+					else:
+						rnorm = np.abs(A_py).sum(axis=1)
+						cnorm = np.abs(A_py).sum(axis=0)
+					self.assertScalarEqual(
+							info.row_spread, rnorm.max() / rnorm.min(),
+							RTOL**0.5 )
+					self.assertScalarEqual(
+							info.col_spread, cnorm.max() / cnorm.min(),
+							RTOL**0.5 )
+
+					# invalid method
+					settings.method = 2
+					self.assertEqual(
+							lib.matrix_equilibrate(
+									hdl, A_in_ptr, A, d, e, order_in,
+									settings, info),
+							lib.enums.OPTKIT_ERROR_DOMAIN )
+
+					self.free_vars('A', 'd', 'e', 'hdl')
+					self.assertCall( lib.ok_device_reset() )
+
 	def test_operator_sinkhorn_knopp(self):
 		m, n = self.shape
 
@@ -192,15 +277,149 @@ class EquilLibsTestCase(OptkitCOperatorTestCase):
 				self.assertCall( lib.vector_memcpy_av(y_ptr, y, 1) )
 				A_eqx = y_py
 
-				# TODO: REPLACE THIS WITH THE REAL TEST BELOW
-				self.assertEqual(status, 1)
-
-				# REAL TEST:
-				# self.assertEqual( status, 0 )
-				# self.assertVecEqual( A_eqx, DAEx, ATOLN, RTOL )
+				self.assertEqual( status, 0 )
+				self.assertVecEqual( A_eqx, DAEx, ATOLN, RTOL )
 				self.free_vars('A', 'o', 'x', 'y', 'd', 'e', 'hdl')
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_operator_randomized_equilibrate(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * single_precision - 2 * gpu
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+
+			# badly scaled rows and columns
+			A_in = np.random.rand(m, n)
+			A_in *= np.power(10., np.random.uniform(-2, 2, m)).reshape(m, 1)
+			A_in *= np.power(10., np.random.uniform(-2, 2, n))
+			spread = lambda v: v.max() / v.min()
+
+			settings = lib.equilibration_settings()
+			self.assertCall( lib.equilibration_randomized_settings(settings) )
+			self.assertEqual( settings.method, lib.enums.EQUIL_RANDOMIZED )
+			info = lib.equilibration_info()
+
+			hdl = self.register_blas_handle(lib, 'hdl')
+			x, x_py, x_ptr = self.register_vector(lib, n, 'x')
+			y, y_py, y_ptr = self.register_vector(lib, m, 'y')
+			d, d_py, d_ptr = self.register_vector(lib, m, 'd')
+			e, e_py, e_ptr = self.register_vector(lib, n, 'e')
+			x_py += self.x_test
+			A_, A, o = self.register_dense_operator(lib, A_in)
+
+			# estimate only: the operator is left as given
+			self.assertCall( lib.operator_randomized_equilibrate(
+					hdl, o, d, e, settings, info) )
+			self.assertCall( lib.vector_memcpy_av(d_ptr, d, 1) )
+			self.assertCall( lib.vector_memcpy_av(e_ptr, e, 1) )
+			self.assertTrue( info.iterations <= settings.maxiter )
+			self.assertTrue( info.row_spread >= 1 )
+			self.assertTrue( info.col_spread >= 1 )
+
+			self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+			self.assertCall( o.contents.apply(o.contents.data, x, y) )
+			self.assertCall( lib.vector_memcpy_av(y_ptr, y, 1) )
+			self.assertVecEqual( y_py, A_in.dot(self.x_test), ATOLM, RTOL )
+
+			DAE = d_py.reshape(m, 1) * A_in * e_py
+			rows, cols = np.linalg.norm(DAE, axis=1), np.linalg.norm(DAE,
+																	  axis=0)
+			self.assertTrue( spread(rows) < spread(np.linalg.norm(A_in,
+																  axis=1)) )
+			self.assertTrue( spread(cols) < spread(np.linalg.norm(A_in,
+																  axis=0)) )
+
+			# a zero probe budget is rejected
+			settings.probes = 0
+			self.assertEqual( lib.operator_randomized_equilibrate(
+					hdl, o, d, e, settings, info),
+					lib.enums.OPTKIT_ERROR_DOMAIN )
+
+			# scaled operator: equilibrated in place, wrapped operator as is
+			s = lib.scaled_operator_alloc(o)
+			self.register_var('s', s.contents.data, s.contents.free)
+			self.assertEqual( s.contents.kind, 106 )
+			self.assertCall( lib.operator_equilibrate(hdl, s, d, e, 1.) )
+			self.assertCall( lib.vector_memcpy_av(d_ptr, d, 1) )
+			self.assertCall( lib.vector_memcpy_av(e_ptr, e, 1) )
+			self.assertCall( s.contents.apply(s.contents.data, x, y) )
+			self.assertCall( lib.vector_memcpy_av(y_ptr, y, 1) )
+			DAEx = d_py * A_in.dot(e_py * self.x_test)
+			self.assertVecEqual( y_py, DAEx, ATOLM, RTOL )
+
+			self.assertCall( lib.scaled_operator_scale(s, 2.) )
+			self.assertCall( s.contents.adjoint(s.contents.data, y, x) )
+			self.assertCall( lib.vector_memcpy_av(x_ptr, x, 1) )
+			self.assertVecEqual( x_py, 2 * e_py * A_in.T.dot(d_py * y_py),
+								 ATOLM, RTOL )
+
+			self.assertCall( o.contents.apply(o.contents.data, x, y) )
+			self.assertCall( lib.vector_memcpy_av(y_ptr, y, 1) )
+			self.assertVecEqual( y_py, A_in.dot(x_py), ATOLM, RTOL )
+
+			self.free_vars('s', 'A', 'o', 'x', 'y', 'd', 'e', 'hdl')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_operator_estimate_norm_lanczos(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			RTOL = 1e-3 if not single_precision else 1e-2
+			MAXITER = 16
+
+			for op_ in self.op_keys:
+				print("operator norm (block Lanczos), operator type:", op_)
+				hdl = self.register_blas_handle(lib, 'hdl')
+				A_, A, o = self.register_operator(lib, op_)
+				pynorm = np.linalg.norm(A_, 2)
+
+				est = lib.operator_norm_estimate()
+				self.assertCall( lib.operator_estimate_norm_lanczos(
+						hdl, o, RTOL, MAXITER, est) )
+				self.assertTrue( est.V )
+				self.assertEqual( est.size2, n )
+				self.assertEqual( est.block, 2 )
+				self.assertTrue( 0 < est.iterations <= MAXITER )
+				self.assertEqual( est.products, 2 * est.block *
+								  est.iterations )
+				self.assertTrue( est.norm <= pynorm * (1 + RTOL) )
+				self.assertTrue( est.norm >= pynorm * (1 - RTOL) )
+				cold_products = est.products
+
+				# the returned subspace is orthonormal; restarting from it
+				# takes no more products than the cold start
+				V = np.ctypeslib.as_array(est.V, (n * est.block,))
+				V = V.reshape((n, est.block), order='F')
+				self.assertTrue( np.allclose(V.T.dot(V), np.eye(est.block),
+											 atol=10 * RTOL) )
+
+				self.assertCall( lib.operator_estimate_norm_lanczos(
+						hdl, o, RTOL, MAXITER, est) )
+				self.assertTrue( est.products <= cold_products )
+				self.assertTrue( est.norm <= pynorm * (1 + RTOL) )
+				self.assertTrue( est.norm >= pynorm * (1 - RTOL) )
+
+				self.assertCall( lib.operator_norm_estimate_free(est) )
+				self.assertFalse( est.V )
+				self.assertEqual( lib.operator_estimate_norm_lanczos(
+						hdl, o, 0, MAXITER, est),
+						lib.enums.OPTKIT_ERROR_DOMAIN )
+
+				self.free_vars('A', 'o', 'hdl')
+				self.assertCall( lib.ok_device_reset() )
+
 	def test_operator_norm(self):
 		m, n = self.shape
 
@@ -1,6 +1,7 @@
 import os
 import numpy as np
-from ctypes import c_float, c_int, c_size_t, c_void_p, Structure, byref
+from ctypes import c_float, c_int, c_uint, c_size_t, c_void_p, Structure, \
+	byref
 from optkit.libs.linsys import DenseLinsysLibs
 from optkit.tests.defs import OptkitTestCase
 from optkit.tests.C.base import OptkitCTestCase
@@ -675,6 +676,219 @@ class DenseLinalgTestCase(OptkitCTestCase):
 				self.free_vars('L', 'x', 'hdl')
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_cholesky_methods(self):
+		(m, n) = self.shape
+		mindim = min(m, n)
+
+		B = self.A_test[:mindim, :mindim] / mindim**0.5
+		AA_test = np.eye(mindim) + B.dot(B.T)
+		chol = np.linalg.cholesky(AA_test)
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOL = RTOL * mindim
+
+			lapack = c_int(0)
+			self.assertCall( lib.linalg_cholesky_lapack_available(
+					byref(lapack)) )
+			methods = [lib.enums.CHOLESKY_AUTO, lib.enums.CHOLESKY_SERIAL,
+					   lib.enums.CHOLESKY_TASKS]
+			if lapack.value:
+				methods.append(lib.enums.CHOLESKY_LAPACK)
+			else:
+				self.assertEqual( lib.linalg_cholesky_set_method(
+								  lib.enums.CHOLESKY_LAPACK),
+								  lib.enums.OPTKIT_ERROR_DOMAIN )
+
+			for method in methods:
+				# block sizes: uneven tiling, default, a single block
+				for blk_dim in (mindim // 7 + 1, 0, 2 * mindim):
+					self.assertCall( lib.linalg_cholesky_set_method(method) )
+					self.assertCall( lib.linalg_cholesky_set_block_size(
+							blk_dim) )
+
+					method_set = c_uint(0)
+					blk_set = c_size_t(0)
+					self.assertCall( lib.linalg_cholesky_get_config(
+							byref(method_set), byref(blk_set)) )
+					self.assertEqual( method_set.value, method )
+					if blk_dim > 0:
+						self.assertEqual( blk_set.value, blk_dim )
+
+					for order in (lib.enums.CblasRowMajor,
+								  lib.enums.CblasColMajor):
+						hdl = self.register_blas_handle(lib, 'hdl')
+						L, L_py, L_ptr = self.register_matrix(
+							lib, mindim, mindim, order, 'L')
+
+						L_py *= 0
+						L_py += AA_test
+						self.assertCall( lib.matrix_memcpy_ma(L, L_ptr,
+															  order) )
+						self.assertCall( lib.linalg_cholesky_decomp(hdl, L) )
+						self.assertCall( lib.matrix_memcpy_am(L_ptr, L,
+															  order) )
+						self.assertVecEqual( np.tril(L_py), chol, ATOL, RTOL )
+
+						self.free_vars('L', 'hdl')
+						self.assertCall( lib.ok_device_reset() )
+
+			self.assertCall( lib.linalg_cholesky_set_method(
+					lib.enums.CHOLESKY_AUTO) )
+			self.assertCall( lib.linalg_cholesky_set_block_size(0) )
+
+	def test_cholesky_update(self):
+		(m, n) = self.shape
+		mindim = min(m, n)
+
+		# AA = I + BB', then AA + xx' and back
+		B = self.A_test[:mindim, :mindim] / mindim**0.5
+		AA_test = np.eye(mindim) + B.dot(B.T)
+		x_rand = np.random.rand(mindim)
+		chol_up = np.linalg.cholesky(AA_test + np.outer(x_rand, x_rand))
+		chol = np.linalg.cholesky(AA_test)
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOL = RTOL * mindim
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				hdl = self.register_blas_handle(lib, 'hdl')
+				L, L_py, L_ptr = self.register_matrix(
+					lib, mindim, mindim, order, 'L')
+				x, x_py, x_ptr = self.register_vector(lib, mindim, 'x')
+
+				L_py *= 0
+				L_py += AA_test
+				self.assertCall( lib.matrix_memcpy_ma(L, L_ptr, order) )
+				self.assertCall( lib.linalg_cholesky_decomp(hdl, L) )
+
+				# update
+				x_py *= 0
+				x_py += x_rand
+				self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+				self.assertCall( lib.linalg_cholesky_update(hdl, L, x, 0) )
+				self.assertCall( lib.matrix_memcpy_am(L_ptr, L, order) )
+				self.assertVecEqual( np.tril(L_py), chol_up, ATOL, RTOL )
+
+				# downdate
+				x_py *= 0
+				x_py += x_rand
+				self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+				self.assertCall( lib.linalg_cholesky_update(hdl, L, x, 1) )
+				self.assertCall( lib.matrix_memcpy_am(L_ptr, L, order) )
+				self.assertVecEqual( np.tril(L_py), chol, ATOL, RTOL )
+
+				# downdate to an indefinite matrix fails
+				x_py *= 0
+				x_py += 10 * mindim
+				self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+				self.assertEqual( lib.linalg_cholesky_update(hdl, L, x, 1),
+								  lib.enums.OPTKIT_ERROR_DOMAIN )
+
+				self.free_vars('L', 'x', 'hdl')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_cholesky_rfp(self):
+		(m, n) = self.shape
+		mindim = min(m, n)
+
+		# both parities of the dimension
+		for dim in (mindim, mindim - 1):
+			A_test = self.A_test[:, :dim] / dim**0.5
+			AA_test = np.eye(dim) + A_test.T.dot(A_test)
+			x_rand = np.random.rand(dim)
+			X_rand = np.random.rand(dim, 3)
+			pysol = np.linalg.solve(AA_test, x_rand)
+			pysol_batch = np.linalg.solve(AA_test, X_rand)
+
+			for (gpu, single_precision) in self.CONDITIONS:
+				lib = self.libs.get(single_precision=single_precision,
+									gpu=gpu)
+				if lib is None:
+					continue
+				self.register_exit(lib.ok_device_reset)
+
+				DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+				RTOL = 10**(-DIGITS)
+				ATOL = RTOL * dim**0.5
+
+				size1 = c_size_t(0)
+				size2 = c_size_t(0)
+				self.assertCall( lib.linalg_rfp_size(dim, byref(size1),
+													 byref(size2)) )
+				self.assertEqual( size1.value * size2.value,
+								  dim * (dim + 1) // 2 )
+
+				for order in (lib.enums.CblasRowMajor,
+							  lib.enums.CblasColMajor):
+					hdl = self.register_blas_handle(lib, 'hdl')
+					A, A_py, A_ptr = self.register_matrix(
+						lib, A_test.shape[0], dim, order, 'A')
+					R, R_py, R_ptr = self.register_matrix(
+						lib, size1.value, size2.value, order, 'R')
+					x, x_py, x_ptr = self.register_vector(lib, dim, 'x')
+					X, X_py, X_ptr = self.register_matrix(
+						lib, dim, 3, order, 'X')
+
+					A_py += A_test
+					self.assertCall( lib.matrix_memcpy_ma(A, A_ptr, order) )
+
+					# R = A^T A, in packed storage
+					self.assertCall( lib.linalg_rfp_gram(
+							hdl, lib.enums.CblasTrans, 1, A, 0, R) )
+					self.assertCall( lib.matrix_memcpy_am(R_ptr, R, order) )
+					n1 = size2.value
+					n2 = dim - n1
+					AA_packed = AA_test - np.eye(dim)
+					self.assertVecEqual(
+							np.tril(R_py[n2 + 1 - n1:n2 + 1, :]),
+							np.tril(AA_packed[:n1, :n1]), ATOL, RTOL )
+					self.assertVecEqual(
+							R_py[n2 + 1:, :], AA_packed[n1:, :n1], ATOL,
+							RTOL )
+					self.assertVecEqual(
+							np.triu(R_py[:n2, n1 - n2:]),
+							np.triu(AA_packed[n1:, n1:]), ATOL, RTOL )
+
+					# R = I + A^T A; factor; solve
+					for i in range(n1):
+						R_py[n2 + 1 - n1 + i, i] += 1
+					for i in range(n2):
+						R_py[i, n1 - n2 + i] += 1
+					self.assertCall( lib.matrix_memcpy_ma(R, R_ptr, order) )
+					self.assertCall( lib.linalg_cholesky_decomp_rfp(hdl, R) )
+
+					x_py *= 0
+					x_py += x_rand
+					self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+					self.assertCall( lib.linalg_cholesky_svx_rfp(hdl, R, x) )
+					self.assertCall( lib.vector_memcpy_av(x_ptr, x, 1) )
+					self.assertVecEqual( x_py, pysol, ATOL, RTOL )
+
+					X_py *= 0
+					X_py += X_rand
+					self.assertCall( lib.matrix_memcpy_ma(X, X_ptr, order) )
+					self.assertCall( lib.linalg_cholesky_svx_rfp_batch(
+							hdl, R, X) )
+					self.assertCall( lib.matrix_memcpy_am(X_ptr, X, order) )
+					self.assertVecEqual( X_py, pysol_batch, ATOL, RTOL )
+
+					self.free_vars('A', 'R', 'x', 'X', 'hdl')
+					self.assertCall( lib.ok_device_reset() )
+
 	def test_row_squares(self):
 		m, n = self.shape
 
@@ -803,6 +1017,46 @@ class DenseLinalgTestCase(OptkitCTestCase):
 				self.free_vars('A', 'd', 'e', 'x', 'y', 'hdl')
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_diag_scale(self):
+		(m, n) = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 5 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				A, A_py, A_ptr = self.register_matrix(lib, m, n, order, 'A')
+				d, d_py, d_ptr = self.register_vector(lib, m, 'd')
+				e, e_py, e_ptr = self.register_vector(lib, n, 'e')
+
+				A_py += self.A_test
+				d_py += np.random.rand(m)
+				e_py += np.random.rand(n)
+				DAE = d_py.reshape(m, 1) * A_py * e_py
+				self.assertCall( lib.matrix_memcpy_ma(A, A_ptr, order) )
+				self.assertCall( lib.vector_memcpy_va(d, d_ptr, 1) )
+				self.assertCall( lib.vector_memcpy_va(e, e_ptr, 1) )
+
+				# A = diag(d) * A * diag(e)
+				self.assertCall( lib.linalg_matrix_diag_scale(A, d, e) )
+				self.assertCall( lib.matrix_memcpy_am(A_ptr, A, order) )
+				for i in range(m):
+					self.assertVecEqual( A_py[i, :], DAE[i, :], ATOLM, RTOL )
+
+				# dimension check
+				self.assertEqual(
+						lib.linalg_matrix_diag_scale(A, e, d),
+						lib.enums.OPTKIT_ERROR_DIMENSION_MISMATCH )
+
+				self.free_vars('A', 'd', 'e')
+				self.assertCall( lib.ok_device_reset() )
+
 	def test_reduce(self):
 		(m, n) = self.shape
 
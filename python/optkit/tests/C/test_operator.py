@@ -1,7 +1,7 @@
 import os
 import numpy as np
 from scipy.sparse import csr_matrix, csc_matrix
-from ctypes import c_void_p, byref, CFUNCTYPE
+from ctypes import c_void_p, c_size_t, byref, CFUNCTYPE
 from optkit.libs.operator import OperatorLibs
 from optkit.tests.C.base import OptkitCTestCase
 
@@ -238,4 +238,69 @@ class OperatorLibsTestCase(OptkitCTestCase):
 				self.exercise_operator(lib, o.contents, np.diag(d_), TOL)
 
 				self.free_vars('o', 'd')
-				self.assertCall( lib.ok_device_reset() )
\ No newline at end of file
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_panel_operator(self):
+		m, n = self.shape
+		A = self.A_test
+		PANEL_ROWS = 37
+		filename = os.path.abspath('c_panel_test.bin')
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * single_precision - 1 * gpu
+			TOL = 10**(-DIGITS)
+
+			# A is streamed from a memory mapping of a file
+			A_mm = np.memmap(filename, dtype=lib.pyfloat, mode='w+',
+							 shape=(m, n))
+			A_mm[:] = A
+			A_mm.flush()
+			A_ptr = A_mm.ctypes.data_as(lib.ok_float_p)
+
+			o = lib.panel_operator_alloc(A_ptr, m, n, PANEL_ROWS)
+			self.register_var('o', o.contents.data, o.contents.free)
+			self.validate_operator(o.contents, m, n, lib.enums.PANEL)
+			self.exercise_operator(lib, o.contents, A, TOL)
+
+			# one pass over A per product
+			passes = np.zeros(1).astype(c_size_t)
+			passes_ptr = passes.ctypes.data_as(lib.c_size_t_p)
+			self.assertCall( lib.panel_operator_passes(o, passes_ptr) )
+			self.assertEqual( passes[0], 4 )
+
+			# equilibrate in one pass: operator becomes DAE
+			hdl = self.register_blas_handle(lib, 'hdl')
+			d, d_, d_ptr = self.register_vector(lib, m, 'd')
+			e, e_, e_ptr = self.register_vector(lib, n, 'e')
+			self.assertCall( lib.panel_operator_equilibrate(hdl, o, d, e, 2.) )
+			self.assertCall( lib.panel_operator_passes(o, passes_ptr) )
+			self.assertEqual( passes[0], 5 )
+			self.assertCall( lib.vector_memcpy_av(d_ptr, d, 1) )
+			self.assertCall( lib.vector_memcpy_av(e_ptr, e, 1) )
+			DA = d_.reshape(-1, 1) * A
+			self.assertVecEqual( np.linalg.norm(DA, axis=1), np.ones(m),
+								 TOL * m**0.5, TOL )
+			DAE = DA * e_
+			self.assertVecEqual( np.linalg.norm(DAE, axis=0), np.ones(n),
+								 TOL * n**0.5, TOL )
+			self.exercise_operator(lib, o.contents, DAE, TOL)
+			self.free_vars('d', 'e', 'hdl')
+
+			# Gram matrix of the (equilibrated) operator, lower triangle
+			G, G_, G_ptr = self.register_matrix(
+					lib, n, n, lib.enums.CblasRowMajor, 'G')
+			self.assertCall( lib.panel_operator_gram(o, G) )
+			self.assertCall( lib.matrix_memcpy_am(
+					G_ptr, G, lib.enums.CblasRowMajor) )
+			self.assertVecEqual( np.tril(G_), np.tril(DAE.T.dot(DAE)),
+								 TOL * n, TOL )
+
+			self.free_vars('G', 'o')
+			del A_mm
+			os.remove(filename)
+			self.assertCall( lib.ok_device_reset() )
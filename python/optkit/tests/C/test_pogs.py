@@ -1,6 +1,8 @@
 import os
+import time
+import threading
 import numpy as np
-from ctypes import c_void_p, byref, cast, addressof
+from ctypes import POINTER, c_void_p, c_size_t, byref, cast, addressof
 from optkit.utils.proxutils import func_eval_python
 from optkit.libs.pogs import PogsLibs
 from optkit.tests.defs import OptkitTestCase
@@ -198,6 +200,29 @@ class PogsTestCase(OptkitCPogsTestCase):
 
 		self.assertEqual( converged, converged_py )
 
+	def assert_pogs_residual_estimate(self, lib, blas_handle, solver,
+									  local_vars):
+		"""residual estimate test
+
+			primal_est = ||z^{k+1/2} - z^{k+1}||
+			dual_est = ||z^{k+1} - z^k||
+
+			in C and Python, check that these quantities agree
+		"""
+		DIGITS = 7 - 2 * lib.FLOAT
+		RTOL = 10**(-DIGITS)
+
+		estimate = lib.pogs_residuals()
+		self.assertCall( lib.estimate_residuals(blas_handle,
+												solver.contents.z, estimate) )
+
+		self.load_all_local(lib, local_vars, solver)
+		primal_py = np.linalg.norm(local_vars.z12 - local_vars.z)
+		dual_py = np.linalg.norm(local_vars.z - local_vars.prev)
+
+		self.assertScalarEqual( estimate.primal, primal_py, RTOL )
+		self.assertScalarEqual( estimate.dual, dual_py, RTOL )
+
 	def test_default_settings(self):
 		for (gpu, single_precision) in self.CONDITIONS:
 			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
@@ -219,6 +244,73 @@ class PogsTestCase(OptkitCPogsTestCase):
 				solver = lib.pogs_init(A_ptr, m, n, order)
 				self.assertCall( lib.pogs_finish(solver, 1) )
 
+	def test_pogs_init_cached(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * (m * n)**0.5
+
+			stats = lib.pogs_cache_stats()
+			order = lib.enums.CblasRowMajor
+			self.assertCall( lib.pogs_cache_clear() )
+
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+			A_equil = [np.zeros((m, n)).astype(lib.pyfloat) for _ in (0, 1)]
+			A_equil_ptr = [Ae.ctypes.data_as(lib.ok_float_p) for Ae in A_equil]
+
+			# miss, then hit on an identical matrix
+			for i in (0, 1):
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.assertCall( lib.matrix_memcpy_am(
+						A_equil_ptr[i], solver.contents.M.contents.A, order) )
+				self.assertCall( lib.pogs_finish(solver, 0) )
+
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.misses, 1 )
+			self.assertEqual( stats.hits, 1 )
+			self.assertEqual( stats.entries, 1 )
+			self.assertTrue( stats.bytes > 0 )
+			self.assertVecEqual( A_equil[0], A_equil[1], ATOLM, RTOL )
+
+			# a different matrix misses; shrinking capacity evicts
+			A *= 2
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.assertCall( lib.pogs_finish(solver, 0) )
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.misses, 2 )
+			self.assertEqual( stats.entries, 2 )
+
+			# sign flips of two entries do not cancel in the key
+			A[0, :2] *= -1
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.assertCall( lib.pogs_finish(solver, 0) )
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.misses, 3 )
+			self.assertEqual( stats.hits, 1 )
+			self.assertEqual( stats.entries, 3 )
+
+			self.assertCall( lib.pogs_cache_set_capacity(stats.bytes - 1) )
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.evictions, 1 )
+			self.assertEqual( stats.entries, 2 )
+
+			# zero capacity disables the cache
+			self.assertCall( lib.pogs_cache_set_capacity(0) )
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.assertCall( lib.pogs_finish(solver, 0) )
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.entries, 0 )
+
+			self.assertCall( lib.pogs_cache_set_capacity(1 << 28) )
+			self.assertCall( lib.pogs_cache_clear() )
+
 	def test_pogs_private_api(self):
 		m, n = self.shape
 
@@ -273,6 +365,8 @@ class PogsTestCase(OptkitCPogsTestCase):
 				self.assert_pogs_check_convergence(lib, hdl, solver, f_list,
 												   g_list, obj, res, tols,
 												   localA, local_vars)
+				self.assert_pogs_residual_estimate(lib, hdl, solver,
+												   local_vars)
 				self.assert_pogs_adapt_rho(lib, solver, res, tols, local_vars)
 				self.assert_pogs_unscaling(lib, output, solver, local_vars)
 
@@ -317,6 +411,7 @@ class PogsTestCase(OptkitCPogsTestCase):
 				self.free_var('solver')
 
 				if info.converged:
+					self.assertEqual( info.status, lib.enums.POGS_CONVERGED )
 					self.assert_pogs_convergence(
 							A, settings, output, gpu=gpu,
 							single_precision=single_precision)
@@ -324,6 +419,616 @@ class PogsTestCase(OptkitCPogsTestCase):
 				self.free_vars('f', 'g')
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_pogs_call_accelerated(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			for ANDERSON_TYPE in (1, 2):
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+				settings.accelerate = 1
+				settings.anderson_type = ANDERSON_TYPE
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+												output.ptr) )
+				self.free_var('solver')
+				self.assertTrue( info.k_accel <= info.k )
+
+				if info.converged:
+					self.assert_pogs_convergence(
+							A, settings, output, gpu=gpu,
+							single_precision=single_precision)
+
+			self.free_vars('f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_equilibration(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			equil = lib.equilibration_settings()
+			self.assertCall( lib.equilibration_default_settings(equil) )
+			equil.tol = 1e-3
+			self.assertCall( lib.pogs_cache_clear() )
+
+			for METHOD in (lib.enums.EQUIL_SINKHORN, lib.enums.EQUIL_RUIZ):
+				equil.method = METHOD
+				solver = lib.pogs_init_equil(A_ptr, m, n, order, equil)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+												output.ptr) )
+				self.free_var('solver')
+				self.assertTrue( info.equil_time >= 0 )
+				self.assertTrue( info.equil_row_spread >= 1 )
+				self.assertTrue( info.equil_col_spread >= 1 )
+				if METHOD == lib.enums.EQUIL_RUIZ:
+					self.assertTrue( info.equil_row_spread <= 1.01 )
+					self.assertTrue( info.equil_col_spread <= 1.01 )
+
+				if info.converged:
+					self.assert_pogs_convergence(
+							A, settings, output, gpu=gpu,
+							single_precision=single_precision)
+
+			# distinct equilibrations are cached separately
+			stats = lib.pogs_cache_stats()
+			self.assertCall( lib.pogs_cache_get_stats(stats) )
+			self.assertEqual( stats.misses, 2 )
+			self.assertCall( lib.pogs_cache_clear() )
+
+			self.free_vars('f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_check_interval(self):
+		m, n = self.shape
+		CHECK_INTERVAL = 10
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.register_solver('solver', solver, lib.pogs_finish)
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+			settings.check_interval = CHECK_INTERVAL
+
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.free_var('solver')
+
+			# convergence is only reported at a full check
+			if info.converged:
+				self.assert_pogs_convergence(
+						A, settings, output, gpu=gpu,
+						single_precision=single_precision)
+			else:
+				self.assertEqual( info.k, settings.maxiter )
+
+			self.free_vars('f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_call_interrupted(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.register_solver('solver', solver, lib.pogs_finish)
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+
+			# unattainable tolerances: only an interruption ends the solve
+			settings.maxiter = 10**8
+			settings.abstol = 0
+			settings.reltol = 0
+			settings.verbose = 0
+
+			# time limit: stops within an iteration of the limit
+			settings.time_limit = 1e-3
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.assertEqual( info.status, lib.enums.POGS_TIME_LIMIT )
+			self.assertEqual( info.converged, 0 )
+			self.assertTrue( 0 < info.k < settings.maxiter )
+			self.assertTrue( all(np.isfinite(output.x)) )
+
+			# cancellation from another thread
+			settings.time_limit = 0
+			solve = threading.Thread(target=lib.pogs_solve, args=(
+					solver, f, g, settings, info, output.ptr))
+			solve.start()
+			time.sleep(0.05)
+			self.assertCall( lib.pogs_cancel(solver) )
+			solve.join(30)
+			self.assertFalse( solve.is_alive() )
+			self.assertEqual( info.status, lib.enums.POGS_CANCELLED )
+			self.assertTrue( 0 < info.k < settings.maxiter )
+
+			# a cancellation does not carry over to the next solve
+			settings.maxiter = 10
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.assertEqual( info.k, 10 )
+			self.assertEqual( info.status, lib.enums.POGS_MAXITER )
+
+			self.free_vars('solver', 'f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_update_objectives(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+			f_ptr = f_py.ctypes.data_as(lib.function_p)
+			g_ptr = g_py.ctypes.data_as(lib.function_p)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			# same solves on two solvers: delta vs. full objective updates
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.register_solver('solver', solver, lib.pogs_finish)
+			solver_full = lib.pogs_init(A_ptr, m, n, order)
+			self.register_solver('solver_full', solver_full,
+								 lib.pogs_finish)
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+			output_full, info_full, _ = self.gen_pogs_params(lib, m, n)
+			settings.maxiter = 100
+
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.assertCall( lib.pogs_solve(solver_full, f, g, settings,
+											info_full, output_full.ptr) )
+
+			# change a few terms (index m - 1 twice: the last value holds)
+			f_idx = np.array([0, m // 2, m - 1, m - 1], dtype=np.uintp)
+			g_idx = np.array([n - 1], dtype=np.uintp)
+			f_new = np.zeros(f_idx.size).astype(lib.function)
+			f_new['h'] = lib.function_enums.Square
+			f_new['a'] = 1
+			f_new['b'] = np.random.rand(f_idx.size)
+			f_new['c'] = 1 + np.random.rand(f_idx.size)
+			g_new = np.zeros(g_idx.size).astype(lib.function)
+			g_new['h'] = lib.function_enums.Abs
+			g_new['a'] = 1
+			g_new['c'] = 0.5
+
+			self.assertCall( lib.pogs_update_objectives(
+					solver, f_idx.ctypes.data_as(POINTER(c_size_t)),
+					f_new.ctypes.data_as(lib.function_p), f_idx.size,
+					g_idx.ctypes.data_as(POINTER(c_size_t)),
+					g_new.ctypes.data_as(lib.function_p), g_idx.size) )
+			self.assertCall( lib.pogs_solve(solver, None, None, settings,
+											info, output.ptr) )
+
+			for k, i in enumerate(f_idx):
+				f_py[i] = f_new[k]
+			g_py[g_idx] = g_new
+			self.assertCall( lib.function_vector_memcpy_va(f, f_ptr) )
+			self.assertCall( lib.function_vector_memcpy_va(g, g_ptr) )
+			self.assertCall( lib.pogs_solve(solver_full, f, g, settings,
+											info_full, output_full.ptr) )
+
+			self.assertEqual( info.k, info_full.k )
+			self.assertVecEqual( output.x, output_full.x, 1e-7, 1e-7 )
+			self.assertVecEqual( output.nu, output_full.nu, 1e-7, 1e-7 )
+
+			# indices out of range
+			bad = np.array([m], dtype=np.uintp)
+			self.assertNotEqual( lib.pogs_update_objectives(
+					solver, bad.ctypes.data_as(POINTER(c_size_t)),
+					f_new.ctypes.data_as(lib.function_p), 1, None, None,
+					0), 0 )
+
+			self.free_vars('solver', 'solver_full', 'f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def assert_pogs_rows_consistent(self, lib, solver, A_orig, order, RTOL):
+		# A_equil = D * A_orig * E, and factor L of I + A_equil'A_equil
+		# (skinny), or of I + A_equil * A_equil' (fat)
+		m, n = A_orig.shape
+		k = min(m, n)
+		A_equil, A_equil_ptr = self.gen_py_matrix(lib, m, n, order)
+		LLT, LLT_ptr = self.gen_py_matrix(lib, k, k, order)
+		d, d_ptr = self.gen_py_vector(lib, m)
+		e, e_ptr = self.gen_py_vector(lib, n)
+		z, z_ptr = self.gen_py_vector(lib, m + n)
+		rho, rho_ptr = self.gen_py_vector(lib, 1)
+		self.assertCall( lib.pogs_extract_solver(
+				solver, A_equil_ptr, LLT_ptr, d_ptr, e_ptr, z_ptr, z_ptr,
+				z_ptr, z_ptr, z_ptr, rho_ptr, order) )
+
+		DAE = d.reshape(-1, 1) * A_orig * e.reshape(1, -1)
+		self.assertVecEqual( A_equil, DAE, RTOL * (m * n)**0.5, RTOL )
+		gram = A_equil.T.dot(A_equil) if m >= n else A_equil.dot(A_equil.T)
+		L = np.tril(LLT)
+		self.assertVecEqual( L.dot(L.T), np.eye(k) + gram, RTOL * k, RTOL )
+		return A_equil
+
+	def test_pogs_append_remove_rows(self):
+		m, n = self.shape
+		A_test = self.A_test
+		if m < n:
+			A_test = A_test.T
+			m, n = n, m
+		K = 20
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None or not lib.direct:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			RTOL = 10**(-5 + 3 * lib.FLOAT)
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				pyorder = 'C' if order == lib.enums.CblasRowMajor else 'F'
+				A_full = np.array(A_test, dtype=lib.pyfloat, order=pyorder)
+
+				# skinny throughout: rank-K update, then downdate
+				A = np.array(A_full[:m - K], order=pyorder)
+				R = np.array(A_full[m - K:], order=pyorder)
+				solver = lib.pogs_init(
+						A.ctypes.data_as(lib.ok_float_p), m - K, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				self.assertCall( lib.pogs_solver_append_rows(
+						solver, R.ctypes.data_as(lib.ok_float_p), K, order) )
+				A_equil = self.assert_pogs_rows_consistent(
+						lib, solver, A_full, order, RTOL)
+
+				removed = np.array([m - 1, 0, 7, 7, m // 2], dtype=np.uintp)
+				self.assertCall( lib.pogs_solver_remove_rows(
+						solver, removed.ctypes.data_as(POINTER(c_size_t)),
+						removed.size) )
+				kept = np.delete(np.arange(m), removed)
+				A_equil_kept = self.assert_pogs_rows_consistent(
+						lib, solver, A_full[kept], order, RTOL)
+				self.assertVecEqual( A_equil_kept, A_equil[kept], 0, 0 )
+
+				# out of range
+				bad = np.array([m], dtype=np.uintp)
+				self.assertNotEqual( lib.pogs_solver_remove_rows(
+						solver, bad.ctypes.data_as(POINTER(c_size_t)), 1), 0 )
+
+				# solve at the new size
+				mk = kept.size
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, mk, n)
+				output, info, settings = self.gen_pogs_params(lib, mk, n)
+				self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+												output.ptr) )
+				self.free_vars('solver', 'f', 'g')
+
+				# fat to skinny: the factor is re-formed at the new size
+				A = np.array(A_full[:n - K], order=pyorder)
+				R = np.array(A_full[n - K:n + K], order=pyorder)
+				solver = lib.pogs_init(
+						A.ctypes.data_as(lib.ok_float_p), n - K, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				self.assertCall( lib.pogs_solver_append_rows(
+						solver, R.ctypes.data_as(lib.ok_float_p), 2 * K,
+						order) )
+				self.assert_pogs_rows_consistent(
+						lib, solver, A_full[:n + K], order, RTOL)
+				self.free_var('solver')
+
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_telemetry(self):
+		m, n = self.shape
+		CAPACITY = 10
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+			# problem matrix
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			solver = lib.pogs_init(A_ptr, m, n, order)
+			self.register_solver('solver', solver, lib.pogs_finish)
+			output, info, settings = self.gen_pogs_params(lib, m, n)
+
+			records = (lib.pogs_telemetry_record * CAPACITY)()
+			count = c_size_t(CAPACITY)
+
+			# no records unless enabled
+			self.assertNotEqual( lib.pogs_telemetry_read(solver, records,
+															byref(count)), 0 )
+			self.assertNotEqual( lib.pogs_telemetry_enable(solver, 0), 0 )
+
+			self.assertCall( lib.pogs_telemetry_enable(solver, CAPACITY) )
+			self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+											output.ptr) )
+			self.assertCall( lib.pogs_telemetry_read(solver, records,
+														byref(count)) )
+
+			# most recent iterations, oldest first
+			self.assertEqual( count.value, min(info.k, CAPACITY) )
+			for i in range(count.value):
+				self.assertEqual( records[i].k,
+								  info.k - count.value + 1 + i )
+				self.assertTrue( records[i].rho > 0 )
+				for field in ('t_prox', 't_project', 't_dual', 't_check'):
+					self.assertTrue( getattr(records[i], field) >= 0 )
+			if info.converged:
+				last = records[count.value - 1]
+				self.assertTrue( last.checked )
+				self.assertEqual( last.obj_primal, info.obj )
+
+			# buffer too small for retained records
+			count = c_size_t(0)
+			if info.k > 0:
+				self.assertNotEqual( lib.pogs_telemetry_read(
+						solver, records, byref(count)), 0 )
+
+			self.assertCall( lib.pogs_telemetry_disable(solver) )
+			count = c_size_t(CAPACITY)
+			self.assertNotEqual( lib.pogs_telemetry_read(solver, records,
+															byref(count)), 0 )
+
+			self.free_vars('solver', 'f', 'g')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_batch(self):
+		m, n = self.shape
+		K = 3
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				# K problems differing in the offsets of f
+				f_arrays, g_arrays = [], []
+				f = (lib.function_vector * K)()
+				g = (lib.function_vector * K)()
+				for k in range(K):
+					f_ = np.zeros(m, dtype=lib.function)
+					g_ = np.zeros(n, dtype=lib.function)
+					f_['h'] = lib.function_enums.Abs
+					f_['a'] = 1
+					f_['b'] = 1 + k
+					f_['c'] = 1
+					g_['h'] = lib.function_enums.IndGe0
+					g_['a'] = 1
+					g_['c'] = 1
+					f_arrays.append(f_)
+					g_arrays.append(g_)
+					f[k] = lib.function_vector(m, f_.ctypes.data_as(
+							lib.function_p))
+					g[k] = lib.function_vector(n, g_.ctypes.data_as(
+							lib.function_p))
+
+				# problem matrix
+				A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+				A += self.A_test
+
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				outputs = []
+				for k in range(K):
+					output, _, settings = self.gen_pogs_params(lib, m, n)
+					outputs.append(output)
+				info = (lib.pogs_info * K)()
+				output_c = (lib.pogs_output * K)(*[o.ptr for o in outputs])
+
+				# solve
+				self.assertCall( lib.pogs_solve_batch(solver, K, f, g,
+													  settings, info,
+													  output_c) )
+				self.free_var('solver')
+
+				for k in range(K):
+					self.assertEqual( info[k].err, 0 )
+					self.assertTrue( info[k].k <= settings.maxiter )
+					if info[k].converged:
+						self.assert_pogs_convergence(
+								A, settings, outputs[k], gpu=gpu,
+								single_precision=single_precision)
+
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_path(self):
+		m, n = self.shape
+		path = [1., 0.5, 0.1]
+		K = len(path)
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				# lasso: min. 1/2 ||y - b||^2 + lambda ||x||_1 s.t. y = Ax
+				f_ = np.zeros(m, dtype=lib.function)
+				g_ = np.zeros(n, dtype=lib.function)
+				f_['h'] = lib.function_enums.Square
+				f_['a'] = 1
+				f_['b'] = np.random.rand(m)
+				f_['c'] = 1
+				g_['h'] = lib.function_enums.Abs
+				g_['a'] = 1
+				g_['c'] = 1
+				f = lib.function_vector(m, f_.ctypes.data_as(lib.function_p))
+				g = lib.function_vector(n, g_.ctypes.data_as(lib.function_p))
+
+				# problem matrix
+				A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+				A += self.A_test
+
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				outputs = []
+				for k in range(K):
+					output, _, settings = self.gen_pogs_params(lib, m, n)
+					outputs.append(output)
+				info = (lib.pogs_info * K)()
+				output_c = (lib.pogs_output * K)(*[o.ptr for o in outputs])
+				lambdas = np.array(path, dtype=lib.pyfloat)
+
+				self.assertCall( lib.pogs_solve_path(
+						solver, f, g, settings, K,
+						lambdas.ctypes.data_as(lib.ok_float_p), info,
+						output_c) )
+
+				# a failing point, and the points after it, are unsolved
+				info_err = (lib.pogs_info * K)()
+				for k in range(K):
+					info_err[k].status = lib.enums.POGS_CANCELLED
+				lambdas_err = np.array([1., -1., 0.1], dtype=lib.pyfloat)
+				self.assertNotEqual( lib.pogs_solve_path(
+						solver, f, g, settings, K,
+						lambdas_err.ctypes.data_as(lib.ok_float_p),
+						info_err, output_c), 0 )
+				self.assertNotEqual(
+						info_err[0].status, lib.enums.POGS_UNSOLVED )
+				for k in (1, 2):
+					self.assertEqual(
+							info_err[k].status, lib.enums.POGS_UNSOLVED )
+				self.free_var('solver')
+
+				for k in range(K):
+					self.assertEqual( info[k].err, 0 )
+					if info[k].converged:
+						self.assert_pogs_convergence(
+								A, settings, outputs[k], gpu=gpu,
+								single_precision=single_precision)
+
+				# input objectives are not modified
+				self.assertTrue( all(g_['c'] == 1) )
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_pogs_solve_many_threads(self):
+		m, n = self.shape
+		N = 4
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			order = lib.enums.CblasRowMajor
+			f_arrays, g_arrays = [], []
+			f = (lib.function_vector * N)()
+			g = (lib.function_vector * N)()
+			for k in range(N):
+				f_ = np.zeros(m, dtype=lib.function)
+				g_ = np.zeros(n, dtype=lib.function)
+				f_['h'] = lib.function_enums.Abs
+				f_['a'] = 1
+				f_['b'] = 1 + k
+				f_['c'] = 1
+				g_['h'] = lib.function_enums.IndGe0
+				g_['a'] = 1
+				g_['c'] = 1
+				f_arrays.append(f_)
+				g_arrays.append(g_)
+				f[k] = lib.function_vector(m, f_.ctypes.data_as(
+						lib.function_p))
+				g[k] = lib.function_vector(n, g_.ctypes.data_as(
+						lib.function_p))
+
+			A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+			A += self.A_test
+
+			solvers = (lib.pogs_solver_p * N)()
+			for k in range(N):
+				solvers[k] = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver' + str(k), solvers[k],
+									 lib.pogs_finish)
+
+			outputs = []
+			for k in range(N):
+				output, _, settings = self.gen_pogs_params(lib, m, n)
+				outputs.append(output)
+			info = (lib.pogs_info * N)()
+			output_c = (lib.pogs_output * N)(*[o.ptr for o in outputs])
+
+			self.assertCall( lib.pogs_solve_many_threads(
+					N, solvers, f, g, settings, info, output_c, 2) )
+			for k in range(N):
+				self.free_var('solver' + str(k))
+
+			# threaded solves match serial solves from a fresh solver
+			for k in range(N):
+				self.assertEqual( info[k].err, 0 )
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				output, info_serial, _ = self.gen_pogs_params(lib, m, n)
+				self.assertCall( lib.pogs_solve(solver, f[k], g[k],
+												settings, info_serial,
+												output.ptr) )
+				self.free_var('solver')
+				self.assertEqual( info[k].k, info_serial.k )
+				self.assertVecEqual( outputs[k].x, output.x, 1e-7, 1e-7 )
+
+			self.assertCall( lib.ok_device_reset() )
+
 	def test_pogs_call_unified(self):
 		m, n = self.shape
 
@@ -482,4 +1187,68 @@ class PogsTestCase(OptkitCPogsTestCase):
 												output.ptr) )
 				self.assertTrue(info.k <= k_orig or not info.converged)
 				self.free_vars('solver', 'f', 'g')
-				self.assertCall( lib.ok_device_reset() )
\ No newline at end of file
+				self.assertCall( lib.ok_device_reset() )
+	def test_pogs_io_view(self):
+		m, n = self.shape
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			# solver views host arrays: CPU only
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None or gpu:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				f, f_py, g, g_py = self.gen_registered_pogs_fns(lib, m, n)
+
+				A, A_ptr = self.gen_py_matrix(lib, m, n, order)
+				A += self.A_test
+
+				solver = lib.pogs_init(A_ptr, m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+				output, info, settings = self.gen_pogs_params(lib, m, n)
+
+				self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+								 output.ptr) )
+				k_orig = info.k
+
+				A_equil, A_equil_ptr = self.gen_py_matrix(lib, m, n, order)
+				if lib.direct:
+					k = min(m, n)
+					LLT, LLT_ptr = self.gen_py_matrix(lib, k, k, order)
+				else:
+					LLT_ptr = LLT = c_void_p()
+
+				d, d_ptr = self.gen_py_vector(lib, m)
+				e, e_ptr = self.gen_py_vector(lib, n)
+				z, z_ptr = self.gen_py_vector(lib, m + n)
+				z12, z12_ptr = self.gen_py_vector(lib, m + n)
+				zt, zt_ptr = self.gen_py_vector(lib, m + n)
+				zt12, zt12_ptr = self.gen_py_vector(lib, m + n)
+				zprev, zprev_ptr = self.gen_py_vector(lib, m + n)
+				rho, rho_ptr = self.gen_py_vector(lib, 1)
+
+				self.assertCall( lib.pogs_extract_solver(
+						solver, A_equil_ptr, LLT_ptr, d_ptr, e_ptr, z_ptr,
+						z12_ptr, zt_ptr, zt12_ptr, zprev_ptr, rho_ptr, order) )
+				self.free_var('solver')
+
+				A_copy = A_equil.copy()
+				solver = lib.pogs_load_solver_view(
+						A_equil_ptr, LLT_ptr, d_ptr, e_ptr, z_ptr, z12_ptr,
+						zt_ptr, zt12_ptr, zprev_ptr, rho[0], m, n, order)
+				self.register_solver('solver', solver, lib.pogs_finish)
+
+				# solver views, and does not modify, the caller's matrix
+				M = solver.contents.M.contents
+				self.assertEqual( M.borrowed, 1 )
+				self.assertEqual( addressof(M.A.contents.data.contents),
+								  A_equil.ctypes.data )
+
+				settings.resume = 1
+				self.assertCall( lib.pogs_solve(solver, f, g, settings, info,
+												output.ptr) )
+				self.assertTrue(info.k <= k_orig or not info.converged)
+				self.assertTrue( np.array_equal(A_equil, A_copy) )
+				self.free_vars('solver', 'f', 'g')
+				self.assertCall( lib.ok_device_reset() )
@@ -1,6 +1,7 @@
 import os
 import numpy as np
-from ctypes import c_void_p, byref, cast
+from scipy.sparse import csc_matrix
+from ctypes import c_void_p, c_size_t, c_uint, byref, cast, POINTER
 from optkit.libs.projector import ProjectorLibs
 from optkit.tests.defs import OptkitTestCase
 from optkit.tests.C.base import OptkitCTestCase, OptkitCOperatorTestCase
@@ -136,6 +137,75 @@ class DirectProjectorTestCase(OptkitCTestCase):
 								   'hdl')
 					self.assertCall( lib.ok_device_reset() )
 
+	def test_projection_batch(self):
+		"""batched projection test
+
+			(1) generate random A, and K input pairs (X[:, k], Y[:, k])
+			(2) project all K pairs onto graph y = Ax in one batched call
+			(3) project each pair with direct_projector_project()
+
+			the batched and the column-by-column outputs should agree,
+			and Y_out == A * X_out should hold to float/double precision
+		"""
+		m, n = self.shape
+		K = 3
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 5 - 2 * single_precision
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * self.shape[0]**0.5
+			ATOLN = RTOL * self.shape[1]**0.5
+
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				hdl = self.register_blas_handle(lib, 'hdl')
+				skinny = 1 if m >= n else 0
+
+				X, X_, X_ptr = self.register_matrix(lib, n, K, order, 'X')
+				Y, Y_, Y_ptr = self.register_matrix(lib, m, K, order, 'Y')
+				Xo, Xo_, Xo_ptr = self.register_matrix(lib, n, K, order, 'Xo')
+				Yo, Yo_, Yo_ptr = self.register_matrix(lib, m, K, order, 'Yo')
+				x_out, xo_, xo_ptr = self.register_vector(lib, n, 'x_out')
+				y_out, yo_, yo_ptr = self.register_vector(lib, m, 'y_out')
+				A, A_, A_ptr = self.register_matrix(lib, m, n, order, 'A')
+
+				X_ += np.random.rand(n, K)
+				Y_ += np.random.rand(m, K)
+				A_ += np.random.rand(m, n)
+				self.assertCall( lib.matrix_memcpy_ma(X, X_ptr, order) )
+				self.assertCall( lib.matrix_memcpy_ma(Y, Y_ptr, order) )
+				self.assertCall( lib.matrix_memcpy_ma(A, A_ptr, order) )
+
+				P = lib.direct_projector(None, None, 0, skinny, 0)
+				self.register_var('P', P, lib.direct_projector_free)
+				self.assertCall( lib.direct_projector_alloc(P, A) )
+				self.assertCall( lib.direct_projector_initialize(hdl, P, 1) )
+				self.assertCall( lib.direct_projector_project_batch(
+						hdl, P, X, Y, Xo, Yo) )
+				self.assertCall( lib.matrix_memcpy_am(Xo_ptr, Xo, order) )
+				self.assertCall( lib.matrix_memcpy_am(Yo_ptr, Yo, order) )
+
+				self.assertVecEqual( A_.dot(Xo_) / P.normA, Yo_, ATOLM, RTOL )
+
+				for k in range(K):
+					x_in = lib.vector(0, 0, None)
+					y_in = lib.vector(0, 0, None)
+					self.assertCall( lib.matrix_column(x_in, X, k) )
+					self.assertCall( lib.matrix_column(y_in, Y, k) )
+					self.assertCall( lib.direct_projector_project(
+							hdl, P, x_in, y_in, x_out, y_out) )
+					self.assertCall( lib.vector_memcpy_av(xo_ptr, x_out, 1) )
+					self.assertCall( lib.vector_memcpy_av(yo_ptr, y_out, 1) )
+					self.assertVecEqual( xo_, Xo_[:, k], ATOLN, RTOL )
+					self.assertVecEqual( yo_, Yo_[:, k], ATOLM, RTOL )
+
+				self.free_vars('P', 'A', 'X', 'Y', 'Xo', 'Yo', 'x_out',
+							   'y_out', 'hdl')
+				self.assertCall( lib.ok_device_reset() )
+
 class IndirectProjectorTestCase(OptkitCOperatorTestCase):
 
 	@classmethod
@@ -330,6 +400,286 @@ class DenseDirectProjectorTestCase(OptkitCTestCase):
 				self.free_vars('A', 'x', 'y', 'x_out', 'y_out', 'hdl')
 				self.assertCall( lib.ok_device_reset() )
 
+	def test_projection_mixed(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 3 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			RESIDUAL_TOL = 1e-5 if lib.FLOAT else 1e-10
+
+			# -----------------------------------------
+			# test projection for each matrix layout, skinny and fat A
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				for (m_, n_) in ((m, n), (n, m)):
+					A_test = self.A_test if m_ == m else self.A_test.T
+					x, x_, x_ptr = self.register_vector(lib, n_, 'x')
+					y, y_, y_ptr = self.register_vector(lib, m_, 'y')
+					x_out, x_proj, x_p_ptr = self.register_vector(
+							lib, n_, 'x_out')
+					y_out, y_proj, y_p_ptr = self.register_vector(
+							lib, m_, 'y_out')
+
+					x_ += np.random.rand(n_)
+					self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+					y_ += np.random.rand(m_)
+					self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+					A, A_, A_ptr = self.register_matrix(
+							lib, m_, n_, order, 'A')
+					A_ += A_test
+					self.assertCall( lib.matrix_memcpy_ma(A, A_ptr, order) )
+
+					p = lib.dense_direct_projector_alloc_mixed(A)
+					self.register_var('p', p.contents.data, p.contents.free)
+					self.assertCall( p.contents.initialize(
+							p.contents.data, 0) )
+
+					# factor stored in single precision
+					factor_bytes = np.zeros(1).astype(c_size_t)
+					self.assertCall( lib.projector_get_factor_memory(
+							p, factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+					self.assertEqual( factor_bytes[0], 4 * min(m_, n_)**2 )
+
+					# refinement reduces the residual of the linear solve
+					P = cast(p.contents.data,
+									lib.dense_direct_projector_p).contents
+					residual = np.zeros(1).astype(lib.pyfloat)
+					residual_ptr = residual.ctypes.data_as(lib.ok_float_p)
+					P.refinement_steps = 0
+					self.assertCall( p.contents.project(
+							p.contents.data, x, y, x_out, y_out, 0) )
+					self.assertCall( lib.projector_get_refinement_residual(
+							p, residual_ptr) )
+					residual_unrefined = residual[0]
+
+					P.refinement_steps = 2
+					self.assertCall( p.contents.project(
+							p.contents.data, x, y, x_out, y_out, 0) )
+					self.assertCall( lib.projector_get_refinement_residual(
+							p, residual_ptr) )
+					self.assertTrue( residual[0] <= RESIDUAL_TOL )
+					if not lib.FLOAT:
+						self.assertTrue( residual[0] < residual_unrefined )
+
+					self.free_var('p')
+
+					self.assertCall( lib.vector_memcpy_av(x_p_ptr, x_out, 1) )
+					self.assertCall( lib.vector_memcpy_av(y_p_ptr, y_out, 1) )
+
+					# (x_out, y_out) on graph, and optimal:
+					# x_out = (I + A'A)^{-1}(x + A'y)
+					x_opt = np.linalg.solve(np.eye(n_) + A_.T.dot(A_),
+											x_ + A_.T.dot(y_))
+					self.assertVecEqual(
+							A_.dot(x_proj), y_proj, RTOL * m_**0.5, RTOL )
+					self.assertVecEqual(
+							x_proj, x_opt, RTOL * n_**0.5, RTOL )
+
+					self.free_vars('A', 'x', 'y', 'x_out', 'y_out')
+					self.assertCall( lib.ok_device_reset() )
+
+	def test_projection_packed(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 3 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+
+			# -----------------------------------------
+			# test projection for each matrix layout, skinny and fat A
+			for order in (lib.enums.CblasRowMajor, lib.enums.CblasColMajor):
+				for (m_, n_) in ((m, n), (n, m)):
+					A_test = self.A_test if m_ == m else self.A_test.T
+					mindim = min(m_, n_)
+					x, x_, x_ptr = self.register_vector(lib, n_, 'x')
+					y, y_, y_ptr = self.register_vector(lib, m_, 'y')
+					x_out, x_proj, x_p_ptr = self.register_vector(
+							lib, n_, 'x_out')
+					y_out, y_proj, y_p_ptr = self.register_vector(
+							lib, m_, 'y_out')
+
+					x_ += np.random.rand(n_)
+					self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+					y_ += np.random.rand(m_)
+					self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+					A, A_, A_ptr = self.register_matrix(
+							lib, m_, n_, order, 'A')
+					A_ += A_test
+					self.assertCall( lib.matrix_memcpy_ma(A, A_ptr, order) )
+
+					p = lib.dense_direct_projector_alloc_packed(A)
+					self.register_var('p', p.contents.data, p.contents.free)
+					self.assertCall( p.contents.initialize(
+							p.contents.data, 0) )
+
+					# packed factor: mindim * (mindim + 1) / 2 entries
+					factor_bytes = np.zeros(1).astype(c_size_t)
+					self.assertCall( lib.projector_get_factor_memory(
+							p, factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+					self.assertEqual(
+							factor_bytes[0], mindim * (mindim + 1) // 2 *
+							np.dtype(lib.pyfloat).itemsize )
+
+					self.assertCall( p.contents.project(
+							p.contents.data, x, y, x_out, y_out, 0) )
+					self.free_var('p')
+
+					self.assertCall( lib.vector_memcpy_av(x_p_ptr, x_out, 1) )
+					self.assertCall( lib.vector_memcpy_av(y_p_ptr, y_out, 1) )
+
+					# (x_out, y_out) on graph, and optimal:
+					# x_out = (I + A'A)^{-1}(x + A'y)
+					x_opt = np.linalg.solve(np.eye(n_) + A_.T.dot(A_),
+											x_ + A_.T.dot(y_))
+					self.assertVecEqual(
+							A_.dot(x_proj), y_proj, RTOL * m_**0.5, RTOL )
+					self.assertVecEqual(
+							x_proj, x_opt, RTOL * n_**0.5, RTOL )
+
+					self.free_vars('A', 'x', 'y', 'x_out', 'y_out')
+					self.assertCall( lib.ok_device_reset() )
+
+class SparseDirectProjectorTestCase(OptkitCOperatorTestCase):
+	@classmethod
+	def setUpClass(self):
+		self.env_orig = os.getenv('OPTKIT_USE_LOCALLIBS', '0')
+		os.environ['OPTKIT_USE_LOCALLIBS'] = '1'
+		self.libs = ProjectorLibs()
+		self.A_test_sparse = self.A_test_sparse_gen
+
+	@classmethod
+	def tearDownClass(self):
+		os.environ['OPTKIT_USE_LOCALLIBS'] = self.env_orig
+
+	def setUp(self):
+		self.x_test = np.random.rand(self.shape[1])
+		self.y_test = np.random.rand(self.shape[0])
+
+	def tearDown(self):
+		self.free_all_vars()
+		self.exit_call()
+
+	def test_alloc_free(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for rowmajor in (True, False):
+				_, A, o = self.register_sparse_operator(
+						lib, self.A_test_sparse, rowmajor)
+
+				p = lib.sparse_direct_projector_alloc(A)
+				self.register_var('p', p.contents.data, p.contents.free)
+				self.assertEqual( p.contents.kind, lib.enums.SPARSE_DIRECT )
+				self.assertEqual( p.contents.size1, m )
+				self.assertEqual( p.contents.size2, n )
+				self.assertNotEqual( p.contents.data, 0 )
+				self.assertNotEqual( p.contents.initialize, 0 )
+				self.assertNotEqual( p.contents.project, 0 )
+				self.assertNotEqual( p.contents.free, 0 )
+				self.free_vars('p', 'A', 'o')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_projection(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			TOL_PLACEHOLDER = 1e-8
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+			ATOLN = RTOL * n**0.5
+
+			for rowmajor in (True, False):
+				x, x_, x_ptr = self.register_vector(lib, n, 'x')
+				y, y_, y_ptr = self.register_vector(lib, m, 'y')
+				x_out, x_proj, x_p_ptr = self.register_vector(lib, n, 'x_out')
+				y_out, y_proj, y_p_ptr = self.register_vector(lib, m, 'y_out')
+
+				x_ += self.x_test
+				self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+				y_ += self.y_test
+				self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+				A_, A, o = self.register_sparse_operator(
+						lib, self.A_test_sparse, rowmajor)
+
+				p = lib.sparse_direct_projector_alloc(A)
+				self.register_var('p', p.contents.data, p.contents.free)
+				self.assertCall( p.contents.initialize(p.contents.data, 0) )
+				self.assertCall( p.contents.project(
+						p.contents.data, x, y, x_out, y_out, TOL_PLACEHOLDER) )
+
+				factor_bytes = np.zeros(1).astype(c_size_t)
+				self.assertCall( lib.projector_get_factor_memory(
+						p, factor_bytes.ctypes.data_as(lib.c_size_t_p)) )
+				self.assertTrue( factor_bytes[0] > 0 )
+				self.free_var('p')
+
+				self.assertCall( lib.vector_memcpy_av(x_p_ptr, x_out, 1) )
+				self.assertCall( lib.vector_memcpy_av(y_p_ptr, y_out, 1) )
+
+				# (x_out, y_out) on graph, and optimal:
+				# x_out = (I + A'A)^{-1}(x + A'y)
+				x_opt = np.linalg.solve(np.eye(n) + A_.T.dot(A_),
+										self.x_test + A_.T.dot(self.y_test))
+				self.assertVecEqual( A_.dot(x_proj), y_proj, ATOLM, RTOL )
+				self.assertVecEqual( x_proj, x_opt, ATOLN, RTOL )
+
+				self.free_vars('A', 'o', 'x', 'y', 'x_out', 'y_out')
+				self.assertCall( lib.ok_device_reset() )
+
+	def test_ldl_triangles(self):
+		n = 12
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None or gpu:
+				continue
+
+			RTOL = 1e-3 if lib.FLOAT else 1e-8
+
+			# K stored with both triangles, or with the upper one only
+			for trial in range(20):
+				B = np.random.rand(n, n) * (np.random.rand(n, n) < 0.3)
+				K = B.T.dot(B) + np.eye(n)
+				b = np.random.rand(n)
+				for K_stored in (K, np.triu(K)):
+					K_sp = csc_matrix(K_stored.astype(lib.pyfloat))
+					K_ptr = K_sp.indptr.astype(np.int32)
+					K_ind = K_sp.indices.astype(np.int32)
+					F = lib.sparse_ldl()
+					self.assertCall( lib.sparse_ldl_alloc(F, n) )
+					self.register_var('F', F, lib.sparse_ldl_free)
+					self.assertCall( lib.sparse_ldl_analyze(
+							F, K_ptr.ctypes.data_as(lib.ok_int_p),
+							K_ind.ctypes.data_as(lib.ok_int_p)) )
+					self.assertCall( lib.sparse_ldl_factor(
+							F, K_ptr.ctypes.data_as(lib.ok_int_p),
+							K_ind.ctypes.data_as(lib.ok_int_p),
+							K_sp.data.ctypes.data_as(lib.ok_float_p)) )
+					x = b.astype(lib.pyfloat)
+					self.assertCall( lib.sparse_ldl_solve(
+							F, x.ctypes.data_as(lib.ok_float_p)) )
+					self.free_var('F')
+					self.assertVecEqual( K.dot(x), b, RTOL * n**0.5, RTOL )
+
 class GenericIndirectProjectorTestCase(OptkitCOperatorTestCase):
 	@classmethod
 	def setUpClass(self):
@@ -424,4 +774,326 @@ class GenericIndirectProjectorTestCase(OptkitCOperatorTestCase):
 				self.assertVecEqual( A_.dot(x_proj), y_proj, ATOLM, RTOL )
 
 				self.free_vars('A', 'o', 'x', 'y', 'x_out', 'y_out', 'hdl')
-				self.assertCall( lib.ok_device_reset() )
\ No newline at end of file
+				self.assertCall( lib.ok_device_reset() )
+	def test_projection_warmstart(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			TOL_CG = 1e-6 if lib.FLOAT else 1e-10
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+			RTOL_X = 10**(-3 + 2 * lib.FLOAT)
+
+			x, x_, x_ptr = self.register_vector(lib, n, 'x')
+			y, y_, y_ptr = self.register_vector(lib, m, 'y')
+			x_out, x_proj, x_p_ptr = self.register_vector(lib, n, 'x_out')
+			y_out, y_proj, y_p_ptr = self.register_vector(lib, m, 'y_out')
+
+			x_ += self.x_test
+			self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+			y_ += self.y_test
+			self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+			A_, A, o = self.register_operator(lib, 'dense')
+
+			p = lib.indirect_projector_generic_alloc(o)
+			self.register_var('p', p.contents.data, p.contents.free)
+			iters = np.zeros(1).astype(c_uint)
+			iters_ptr = iters.ctypes.data_as(POINTER(c_uint))
+
+			# cold start
+			self.assertCall( p.contents.project(
+					p.contents.data, x, y, x_out, y_out, TOL_CG) )
+			self.assertCall( lib.projector_get_cg_iterations(p, iters_ptr) )
+			iters_cold = int(iters[0])
+			self.assertTrue( iters_cold > 0 )
+
+			# same inputs: the warm start already meets the tolerance
+			self.assertCall( p.contents.project(
+					p.contents.data, x, y, x_out, y_out, TOL_CG) )
+			self.assertCall( lib.projector_get_cg_iterations(p, iters_ptr) )
+			self.assertEqual( int(iters[0]), iters_cold )
+
+			# perturbed inputs: fewer iterations than the cold start
+			y_ += 1e-3 * np.random.rand(m)
+			self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+			self.assertCall( p.contents.project(
+					p.contents.data, x, y, x_out, y_out, TOL_CG) )
+			self.assertCall( lib.projector_get_cg_iterations(p, iters_ptr) )
+			self.assertTrue( int(iters[0]) - iters_cold < iters_cold )
+			iters_warm = int(iters[0])
+
+			# cleared warm start: as many iterations as a cold start
+			self.assertCall( lib.projector_clear_warm_start(p) )
+			self.assertCall( p.contents.project(
+					p.contents.data, x, y, x_out, y_out, TOL_CG) )
+			self.assertCall( lib.projector_get_cg_iterations(p, iters_ptr) )
+			iters_cleared = int(iters[0]) - iters_warm
+			self.assertTrue( iters_cleared > iters_warm - iters_cold )
+
+			self.assertCall( lib.vector_memcpy_av(x_p_ptr, x_out, 1) )
+			self.assertCall( lib.vector_memcpy_av(y_p_ptr, y_out, 1) )
+			self.assertVecEqual( A_.dot(x_proj), y_proj, ATOLM, RTOL )
+
+			# projection of the perturbed inputs
+			x_star = np.linalg.solve(
+					np.eye(n) + A_.T.dot(A_), x_ + A_.T.dot(y_))
+			self.assertVecEqual( x_star, x_proj, RTOL_X * n**0.5, RTOL_X )
+
+			self.free_vars('p', 'A', 'o', 'x', 'y', 'x_out', 'y_out')
+			self.assertCall( lib.ok_device_reset() )
+
+class PCGProjectorTestCase(OptkitCOperatorTestCase):
+	@classmethod
+	def setUpClass(self):
+		self.env_orig = os.getenv('OPTKIT_USE_LOCALLIBS', '0')
+		os.environ['OPTKIT_USE_LOCALLIBS'] = '1'
+		self.libs = ProjectorLibs()
+		self.A_test = self.A_test_gen
+		self.A_test_sparse = self.A_test_sparse_gen
+
+	@classmethod
+	def tearDownClass(self):
+		os.environ['OPTKIT_USE_LOCALLIBS'] = self.env_orig
+
+	def setUp(self):
+		# inputs for the tall (transposed) test operators
+		self.x_test = np.random.rand(self.shape[0])
+		self.y_test = np.random.rand(self.shape[1])
+
+	def tearDown(self):
+		self.free_all_vars()
+		self.exit_call()
+
+	def register_tall_operator(self, lib, opkey, scaling=None,
+							   rowmajor=True):
+		"""
+		register the transpose of the test matrix, with its nonzeros
+		shifted to zero mean and its columns optionally scaled: a tall
+		operator for which I + A^T A is well conditioned unless scaled
+		"""
+		A_py = self.A_test_sparse if opkey == 'sparse' else self.A_test
+		A_py = A_py.T - 0.5 * (A_py.T != 0)
+		if scaling is not None:
+			A_py = A_py * scaling
+		if opkey == 'sparse':
+			return self.register_sparse_operator(lib, A_py, rowmajor)
+		else:
+			return self.register_dense_operator(lib, A_py, rowmajor)
+
+	def test_alloc_free(self):
+		m, n = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			for op_ in self.op_keys:
+				for precond in (lib.enums.PRECOND_JACOBI,
+								lib.enums.PRECOND_BLOCK_JACOBI):
+					if self.VERBOSE_TEST:
+						print("test PCG projector alloc, operator type:", op_)
+					_, A, o = self.register_operator(lib, op_)
+
+					p = lib.pcg_projector_alloc(o, precond, 0)
+					self.register_var('p', p.contents.data, p.contents.free)
+					self.assertEqual( p.contents.kind,
+									  lib.enums.INDIRECT_PCG )
+					self.assertEqual( p.contents.size1, m )
+					self.assertEqual( p.contents.size2, n )
+					self.assertNotEqual( p.contents.data, 0 )
+					self.assertNotEqual( p.contents.initialize, 0 )
+					self.assertNotEqual( p.contents.project, 0 )
+					self.assertNotEqual( p.contents.free, 0 )
+
+					data = cast(p.contents.data,
+								POINTER(lib.pcg_projector))
+					self.assertEqual( data.contents.precond, precond )
+					if precond == lib.enums.PRECOND_JACOBI:
+						self.assertEqual( data.contents.block, 1 )
+					else:
+						self.assertEqual( data.contents.block,
+										  min(n, 32) )
+					self.free_vars('p', 'A', 'o')
+					self.assertCall( lib.ok_device_reset() )
+
+	def test_preconditioner(self):
+		"""preconditioner from stored entries (dense, CSR, CSC) or probes"""
+		n, m = self.shape
+		block = 8
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLN = RTOL * n**0.5
+
+			# (operator, row major, probed by products via scaled wrapper)
+			cases = [(op_, rowmajor, False) for op_ in self.op_keys
+					 for rowmajor in (True, False)]
+			cases += [('dense', True, True)]
+			for op_, rowmajor, probe in cases:
+				A_, A, o = self.register_tall_operator(
+						lib, op_, rowmajor=rowmajor)
+				if probe:
+					s = lib.scaled_operator_alloc(o)
+					self.register_var('s', s.contents.data,
+									  s.contents.free)
+					o_pcg = s
+				else:
+					o_pcg = o
+				gram = np.eye(n) + A_.T.dot(A_)
+
+				for precond in (lib.enums.PRECOND_JACOBI,
+								lib.enums.PRECOND_BLOCK_JACOBI):
+					p = lib.pcg_projector_alloc(o_pcg, precond, block)
+					self.register_var('p', p.contents.data, p.contents.free)
+					data = cast(p.contents.data,
+								POINTER(lib.pcg_projector)).contents
+					self.assertEqual( bool(data.C), probe and
+									  precond != lib.enums.PRECOND_JACOBI )
+					self.assertCall( p.contents.initialize(
+							p.contents.data, 0) )
+
+					if precond == lib.enums.PRECOND_JACOBI:
+						d, d_py, d_ptr = self.register_vector(lib, n, 'd')
+						self.assertCall( lib.vector_memcpy_vv(d, data.d) )
+						self.assertCall( lib.vector_memcpy_av(d_ptr, d, 1) )
+						self.assertVecEqual( d_py, 1. / np.diag(gram),
+											 ATOLN, RTOL )
+						self.free_var('d')
+					else:
+						L_py = np.zeros((block, n), dtype=lib.pyfloat)
+						L_ptr = L_py.ctypes.data_as(lib.ok_float_p)
+						self.assertCall( lib.matrix_memcpy_am(
+								L_ptr, data.L, lib.enums.CblasRowMajor) )
+						for j in range(0, n, block):
+							bj = min(block, n - j)
+							L_j = np.tril(L_py[:bj, j:j + bj])
+							self.assertVecEqual(
+									L_j.dot(L_j.T),
+									gram[j:j + bj, j:j + bj], ATOLN, RTOL)
+					self.free_var('p')
+
+				if probe:
+					self.free_var('s')
+				self.free_vars('A', 'o')
+			self.assertCall( lib.ok_device_reset() )
+
+	def test_projection(self):
+		n, m = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			TOL_CG = 1e-6 if lib.FLOAT else 1e-10
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOLM = RTOL * m**0.5
+			RTOL_X = 10**(-3 + 2 * lib.FLOAT)
+
+			for op_ in self.op_keys:
+				for precond in (lib.enums.PRECOND_JACOBI,
+								lib.enums.PRECOND_BLOCK_JACOBI):
+					if self.VERBOSE_TEST:
+						print("PCG projection, operator type:", op_)
+
+					x, x_, x_ptr = self.register_vector(lib, n, 'x')
+					y, y_, y_ptr = self.register_vector(lib, m, 'y')
+					x_out, x_proj, x_p_ptr = self.register_vector(
+							lib, n, 'x_out')
+					y_out, y_proj, y_p_ptr = self.register_vector(
+							lib, m, 'y_out')
+
+					x_ += self.x_test
+					self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+					y_ += self.y_test
+					self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+					A_, A, o = self.register_tall_operator(lib, op_)
+
+					p = lib.pcg_projector_alloc(o, precond, 0)
+					self.register_var('p', p.contents.data, p.contents.free)
+
+					# preconditioner not yet formed
+					self.assertEqual( p.contents.project(
+							p.contents.data, x, y, x_out, y_out, TOL_CG),
+							lib.enums.OPTKIT_ERROR_UNALLOCATED )
+
+					self.assertCall( p.contents.initialize(
+							p.contents.data, 0) )
+					self.assertCall( p.contents.project(
+							p.contents.data, x, y, x_out, y_out, TOL_CG) )
+					self.free_var('p')
+
+					self.assertCall( lib.vector_memcpy_av(x_p_ptr, x_out, 1) )
+					self.assertCall( lib.vector_memcpy_av(y_p_ptr, y_out, 1) )
+
+					x_star = np.linalg.solve(np.eye(n) + A_.T.dot(A_),
+											 x_ + A_.T.dot(y_))
+					self.assertVecEqual( A_.dot(x_proj), y_proj, ATOLM, RTOL )
+					self.assertVecEqual( x_star, x_proj, RTOL_X * n**0.5,
+										 RTOL_X )
+
+					self.free_vars('A', 'o', 'x', 'y', 'x_out', 'y_out')
+					self.assertCall( lib.ok_device_reset() )
+
+	def test_projection_badly_scaled(self):
+		n, m = self.shape
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			TOL_CG = 1e-5 if lib.FLOAT else 1e-8
+
+			x, x_, x_ptr = self.register_vector(lib, n, 'x')
+			y, y_, y_ptr = self.register_vector(lib, m, 'y')
+			x_out, _, _ = self.register_vector(lib, n, 'x_out')
+			y_out, _, _ = self.register_vector(lib, m, 'y_out')
+
+			x_ += self.x_test
+			self.assertCall( lib.vector_memcpy_va(x, x_ptr, 1) )
+			y_ += self.y_test
+			self.assertCall( lib.vector_memcpy_va(y, y_ptr, 1) )
+
+			# columns scaled over four orders of magnitude
+			_, A, o = self.register_tall_operator(
+					lib, 'sparse', np.logspace(-2, 2, n))
+			iters = np.zeros(1).astype(c_uint)
+			iters_ptr = iters.ctypes.data_as(POINTER(c_uint))
+
+			p = lib.indirect_projector_generic_alloc(o)
+			self.register_var('p', p.contents.data, p.contents.free)
+			self.assertCall( p.contents.project(
+					p.contents.data, x, y, x_out, y_out, TOL_CG) )
+			self.assertCall( lib.projector_get_cg_iterations(p, iters_ptr) )
+			iters_cgls = int(iters[0])
+			self.free_var('p')
+
+			for precond in (lib.enums.PRECOND_JACOBI,
+							lib.enums.PRECOND_BLOCK_JACOBI):
+				p = lib.pcg_projector_alloc(o, precond, 0)
+				self.register_var('p', p.contents.data, p.contents.free)
+				self.assertCall( p.contents.initialize(p.contents.data, 0) )
+				self.assertCall( p.contents.project(
+						p.contents.data, x, y, x_out, y_out, TOL_CG) )
+				self.assertCall( lib.projector_get_cg_iterations(
+						p, iters_ptr) )
+				self.assertTrue( 0 < int(iters[0]) < iters_cgls )
+				self.free_var('p')
+
+			self.free_vars('A', 'o', 'x', 'y', 'x_out', 'y_out')
+			self.assertCall( lib.ok_device_reset() )
@@ -1,6 +1,6 @@
 import os
 import numpy as np
-from ctypes import c_int, byref, c_void_p
+from ctypes import POINTER, c_int, c_size_t, byref, c_void_p
 from optkit.libs.prox import ProxLibs
 from optkit.utils.proxutils import func_eval_python, prox_eval_python
 from optkit.tests.defs import OptkitTestCase
@@ -279,6 +279,67 @@ class ProxTestCase(OptkitCTestCase):
 			self.free_vars('f', 'v')
 			self.assertCall( lib.ok_device_reset() )
 
+	def test_math_indexed(self):
+		m, n = self.shape
+		indices = np.array([0, m // 2, m - 1], dtype=np.uintp)
+		indices_ptr = indices.ctypes.data_as(POINTER(c_size_t))
+		count = indices.size
+
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			RTOL = 10**(-7 + 2 * single_precision)
+
+			f, f_py, f_ptr = self.register_fnvector(lib, m, 'f')
+			v = lib.vector(0, 0, None)
+			self.assertCall( lib.vector_calloc(v, m) )
+			self.register_var('v', v, lib.vector_free)
+
+			v_py = (1 + np.random.rand(m)).astype(lib.pyfloat)
+			v_ptr = v_py.ctypes.data_as(lib.ok_float_p)
+			self.assertCall( lib.vector_memcpy_va(v, v_ptr, 1) )
+
+			# scatter
+			h = np.zeros(count).astype(lib.function)
+			h['h'] = lib.function_enums.Square
+			for field in ('a', 'b', 'c', 'd', 'e'):
+				h[field] = 1 + np.random.rand(count)
+			self.assertCall( lib.function_vector_scatter_va(
+					f, h.ctypes.data_as(lib.function_p), indices_ptr,
+					count) )
+			self.assertCall( lib.function_vector_memcpy_av(f_ptr, f) )
+			self.assertTrue( all(f_py['h'][indices] == h['h']) )
+			self.assertEqual( sum(f_py['h'] != 0), count )
+
+			# mul, div: only the indexed entries change
+			expect = f_py.copy()
+			for field in ('a', 'd', 'e'):
+				expect[field][indices] *= v_py[indices]
+			self.assertCall( lib.function_vector_mul_indexed(
+					f, v, indices_ptr, count) )
+			self.assertCall( lib.function_vector_memcpy_av(f_ptr, f) )
+			for field in ('a', 'b', 'c', 'd', 'e'):
+				self.assertVecEqual( f_py[field], expect[field], RTOL, RTOL )
+
+			for field in ('a', 'd', 'e'):
+				expect[field][indices] /= v_py[indices]
+			self.assertCall( lib.function_vector_div_indexed(
+					f, v, indices_ptr, count) )
+			self.assertCall( lib.function_vector_memcpy_av(f_ptr, f) )
+			for field in ('a', 'b', 'c', 'd', 'e'):
+				self.assertVecEqual( f_py[field], expect[field], RTOL, RTOL )
+
+			# out of range index
+			bad = np.array([m], dtype=np.uintp)
+			self.assertNotEqual( lib.function_vector_mul_indexed(
+					f, v, bad.ctypes.data_as(POINTER(c_size_t)), 1), 0 )
+
+			self.free_vars('f', 'v')
+			self.assertCall( lib.ok_device_reset() )
+
 	def test_eval(self):
 		m, n = self.shape
 		scal = self.scalefactor
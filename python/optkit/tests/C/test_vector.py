@@ -259,6 +259,57 @@ class VectorTestCase(OptkitCTestCase):
 			self.free_vars('v', 'w')
 			self.assertCall( lib.ok_device_reset() )
 
+	def test_fused_kernels(self):
+		for (gpu, single_precision) in self.CONDITIONS:
+			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
+			if lib is None:
+				continue
+			self.register_exit(lib.ok_device_reset)
+
+			len_v = 10 + int(1000 * np.random.rand())
+			alpha = 1 + np.random.rand()
+			beta = np.random.rand()
+
+			DIGITS = 7 - 2 * lib.FLOAT - 1 * lib.GPU
+			RTOL = 10**(-DIGITS)
+			ATOL = RTOL * len_v**0.5
+
+			v, v_py, v_ptr = self.register_vector(lib, len_v, 'v')
+			w, w_py, w_ptr = self.register_vector(lib, len_v, 'w', random=True)
+			x, x_py, x_ptr = self.register_vector(lib, len_v, 'x', random=True)
+			y, y_py, y_ptr = self.register_vector(lib, len_v, 'y', random=True)
+			z, z_py, z_ptr = self.register_vector(lib, len_v, 'z', random=True)
+
+			# v = alpha * x + beta * y
+			self.assertCall( lib.vector_axpby(v, alpha, x, beta, y) )
+			self.assertCall( lib.vector_memcpy_av(v_ptr, v, 1) )
+			self.assertVecEqual( v_py, alpha * x_py + beta * y_py, ATOL,
+								 RTOL )
+
+			# w = alpha * x + beta * y - z
+			self.assertCall( lib.vector_axpbypcz(w, alpha, x, beta, y, -1, z) )
+			self.assertCall( lib.vector_memcpy_av(w_ptr, w, 1) )
+			self.assertVecEqual( w_py, alpha * x_py + beta * y_py - z_py,
+								 ATOL, RTOL )
+
+			# v = x - y + w; w += alpha * x + (1 - alpha) * y - z
+			v_expect = x_py - y_py + w_py
+			w_expect = w_py + alpha * x_py + (1 - alpha) * y_py - z_py
+			self.assertCall( lib.vector_relaxed_dual_update(v, w, x, y, z,
+															alpha) )
+			self.assertCall( lib.vector_memcpy_av(v_ptr, v, 1) )
+			self.assertCall( lib.vector_memcpy_av(w_ptr, w, 1) )
+			self.assertVecEqual( v_py, v_expect, ATOL, RTOL )
+			self.assertVecEqual( w_py, w_expect, ATOL, RTOL )
+
+			# dimension mismatch
+			u, _, _ = self.register_vector(lib, len_v + 1, 'u')
+			err = lib.vector_axpby(u, alpha, x, beta, y)
+			self.assertEqual( err, lib.enums.OPTKIT_ERROR_DIMENSION_MISMATCH )
+
+			self.free_vars('u', 'v', 'w', 'x', 'y', 'z')
+			self.assertCall( lib.ok_device_reset() )
+
 	def test_indvector_math(self):
 		for (gpu, single_precision) in self.CONDITIONS:
 			lib = self.libs.get(single_precision=single_precision, gpu=gpu)
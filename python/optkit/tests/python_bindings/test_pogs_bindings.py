@@ -5,6 +5,7 @@ from subprocess import call
 from os import path
 from optkit import *
 from optkit.api import backend
+from optkit.types.pogs.pool import _pool_requirements
 from optkit.tests.defs import OptkitTestCase
 
 class PogsBindingsTestCase(OptkitTestCase):
@@ -34,14 +35,14 @@ class PogsBindingsTestCase(OptkitTestCase):
 			self.assertAlmostEqual(e[i], 3)
 
 		# set block by scalar
-		f.set(end=m/2, b=0.5)
-		for i in range(m / 2):
+		f.set(end=m//2, b=0.5)
+		for i in range(m // 2):
 			self.assertEqual(f.b[i], 0.5)
 
 		# set block by vector
-		c = np.random.rand(m/4)
-		f.set(start=m/2, end=m/2+m/4, c=c)
-		for i, idx in enumerate(range(m/2, m/2 + m/4)):
+		c = np.random.rand(m//4)
+		f.set(start=m//2, end=m//2+m//4, c=c)
+		for i, idx in enumerate(range(m//2, m//2 + m//4)):
 			self.assertAlmostEqual(f.c[idx], c[i])
 
 		# set indices by scalar
@@ -59,6 +60,49 @@ class PogsBindingsTestCase(OptkitTestCase):
 		for i, idx in enumerate(indices):
 			self.assertAlmostEqual(f.d[idx], d[i])
 
+	def test_objective_buffer(self):
+		f = PogsObjective(6, h='Abs', b=1)
+		self.assertEqual(f.buffer.dtype, np.dtype(backend.pogs.function))
+		self.assertEqual(f.buffer.size, 6)
+
+		# vectorized enum validation: names or codes, per entry
+		f.set(h=['Square', 'Abs', 'Square', 'IndGe0', 'Abs', 'Zero'])
+		self.assertTrue(all(f.h == [15, 1, 15, 7, 1, 0]))
+		f.set(start=4, h=np.array([3, 3]))
+		self.assertTrue(all(f.h[4:] == 3))
+		# byte string arrays (str arrays on Python 2)
+		f.set(start=4, h=np.array([b'Abs', b'Zero']))
+		self.assertTrue(all(f.h[4:] == [1, 0]))
+		f.set(start=4, h=np.array([3, 3]))
+		with self.assertRaises(KeyError):
+			f.set(h=['Abs'] * 5 + ['NotAFunction'])
+		with self.assertRaises(IndexError):
+			f.set(start=1, end=2, h=[16])
+		with self.assertRaises(ValueError):
+			f.set(c=-1)
+		with self.assertRaises(ValueError):
+			f.set(start=1, end=3, a=[1, 2, 3])
+		self.assertTrue(all(f.h[:4] == [15, 1, 15, 7]))
+		self.assertTrue(all(f.c == 1))
+
+		# the function vector points at the buffer itself
+		fv = f.function_vector()
+		self.assertEqual(fv.size, 6)
+		self.assertEqual(fv.objectives[1].h, 1)
+		self.assertAlmostEqual(fv.objectives[3].b, 1)
+
+	def test_objective_versions(self):
+		f = PogsObjective(10, h='Abs')
+		version = f.version
+		self.assertEqual(f.changed_since(version).size, 0)
+		f.set(start=2, end=4, b=1)
+		self.assertEqual(f.version, version + 1)
+		self.assertTrue(all(f.changed_since(version) == [2, 3]))
+
+		# entries change through set() only, so changes are recorded
+		with self.assertRaises(ValueError):
+			f.b[0] = 1
+
 	def test_solver_object(self):
 		s = PogsSolver(self.A_test)
 		self.assertFalse( backend.device_reset_allowed )
@@ -75,6 +119,120 @@ class PogsBindingsTestCase(OptkitTestCase):
 		self.assertTrue(s.info.converged or s.info.k == s.settings.maxiter)
 		del s
 
+	def test_solve_equilibration(self):
+		f = PogsObjective(self.shape[0], h='Abs', b=1)
+		g = PogsObjective(self.shape[1], h='IndGe0')
+		for method in ('sinkhorn', 'ruiz'):
+			s = PogsSolver(self.A_test, equil=method, equil_maxiter=100,
+						   equil_tol=1e-3)
+			s.solve(f, g, maxiter=100)
+			self.assertEqual(s.info.err, 0)
+			self.assertTrue(s.info.equil_time >= 0)
+			self.assertTrue(s.info.equil_row_spread >= 1)
+			self.assertTrue(s.info.equil_col_spread >= 1)
+			del s
+		self.assertRaises(ValueError, PogsSolver, self.A_test, equil='l2')
+
+	def test_solve_delta(self):
+		m, n = self.shape
+		A = self.A_test
+		f = PogsObjective(m, h='Abs', b=1)
+		g = PogsObjective(n, h='IndGe0')
+
+		# second solve updates only the changed entries of f
+		s = PogsSolver(A)
+		s.solve(f, g, maxiter=100)
+		f.set(start=0, end=3, h='Square', b=2)
+		s.solve(f, g, maxiter=100)
+
+		# same sequence, full copies of new objectives
+		s_full = PogsSolver(A)
+		s_full.solve(PogsObjective(m, h='Abs', b=1), g, maxiter=100)
+		f_full = PogsObjective(m, h='Abs', b=1)
+		f_full.set(start=0, end=3, h='Square', b=2)
+		s_full.solve(f_full, g, maxiter=100)
+
+		self.assertEqual(s.info.iters, s_full.info.iters)
+		self.assertTrue(np.allclose(s.output.x, s_full.output.x))
+		del s, s_full
+
+	def test_append_remove_rows(self):
+		m, n = self.shape
+		A = self.A_test
+		s = PogsSolver(A)
+		s.append_rows(np.random.rand(4, n))
+		self.assertEqual(s.shape, (m + 4, n))
+		self.assertTrue(np.allclose(s.A[:m], A))
+		s.remove_rows([0, 2, 2])
+		self.assertEqual(s.shape, (m + 2, n))
+		self.assertTrue(np.allclose(s.A[:m - 2], A[[1] + list(range(3, m))]))
+
+		with self.assertRaises(ValueError):
+			s.append_rows(np.random.rand(2, n + 1))
+		with self.assertRaises(IndexError):
+			s.remove_rows([m + 2])
+
+		s.solve(PogsObjective(m + 2, h='Abs', b=1),
+				PogsObjective(n, h='IndGe0'), maxiter=100)
+		self.assertEqual(s.output.y.size, m + 2)
+		del s
+
+	def test_solve_path(self):
+		s = PogsSolver(self.A_test)
+		f = PogsObjective(self.shape[0], h='Square', b=1)
+		g = PogsObjective(self.shape[1], h='Abs')
+		path = [1., 0.5, 0.1]
+		points = 0
+		for weight, info, output in s.solve_path(f, g, path):
+			self.assertEqual(weight, path[points])
+			self.assertEqual(info.err, 0)
+			self.assertEqual(output.x.size, self.shape[1])
+			points += 1
+		self.assertEqual(points, len(path))
+		self.assertTrue(all(g.c == 1))
+		del s
+
+	def test_solver_telemetry(self):
+		s = PogsSolver(self.A_test)
+		f = PogsObjective(self.shape[0], h='Abs', b=1)
+		g = PogsObjective(self.shape[1], h='IndGe0')
+		self.assertTrue(s.telemetry is None)
+
+		s.enable_telemetry(capacity=5)
+		s.solve(f, g)
+		records = s.telemetry
+		self.assertEqual(records.size, min(5, s.info.iters))
+		self.assertEqual(records['k'][-1], s.info.iters)
+		self.assertTrue(all(records['t_project'] >= 0))
+
+		s.disable_telemetry()
+		self.assertTrue(s.telemetry is None)
+		del s
+
+	def test_solver_pool(self):
+		try:
+			_pool_requirements()
+		except ImportError as e:
+			self.skipTest(str(e))
+
+		m, n = self.shape
+		K = 3
+		f_list = [PogsObjective(m, h='Abs', b=k + 1) for k in range(K)]
+		g_list = [PogsObjective(n, h='IndGe0') for k in range(K)]
+
+		with PogsSolverPool(self.A_test, processes=2) as pool:
+			infos, outputs = pool.solve(f_list, g_list)
+
+		s = PogsSolver(self.A_test)
+		for k in range(K):
+			self.assertEqual(infos[k].err, 0)
+			s.solve(f_list[k], g_list[k], resume=0)
+			self.assertEqual(infos[k].iters, s.info.iters)
+			self.assertTrue(np.allclose(outputs[k].x, s.output.x))
+			del s
+			s = PogsSolver(self.A_test)
+		del s
+
 	def test_solver_io(self):
 		f = PogsObjective(self.shape[0], h='Abs', b=1)
 		g = PogsObjective(self.shape[1], h='IndGe0')
@@ -113,4 +271,26 @@ class PogsBindingsTestCase(OptkitTestCase):
 
 		del s
 		del s2
-		del s3
\ No newline at end of file
+		del s3
+	def test_solver_snapshot(self):
+		f = PogsObjective(self.shape[0], h='Abs', b=1)
+		g = PogsObjective(self.shape[1], h='IndGe0')
+		filename = path.abspath('c_snapshot_test.okpogs')
+
+		s = PogsSolver(self.A_test)
+		s.solve(f, g, resume=0)
+		s.save_snapshot(filename)
+		self.assertRaises(ValueError, s.save_snapshot, filename)
+
+		s2 = PogsSolver(self.A_test, 'no_init')
+		s2.load_snapshot(filename)
+		call(['rm', filename])
+		s2.solve(f, g, resume=1)
+
+		self.assertTrue(s2.info.c.k <= s.info.c.k or not s2.info.converged)
+		if s.info.converged and s2.info.converged:
+			self.assertTrue(np.allclose(s.output.x, s2.output.x, rtol=1e-2,
+										atol=1e-2))
+
+		del s
+		del s2
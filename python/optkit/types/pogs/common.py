@@ -1,5 +1,5 @@
-from numpy import zeros, ones, ndarray
-from optkit.utils.pyutils import const_iterator
+from numpy import zeros, ndarray, uint64, flatnonzero, asarray, unique, \
+				  dtype as np_dtype
 
 class PogsTypes(object):
 	def __init__(self, backend):
@@ -9,15 +9,21 @@ class PogsTypes(object):
 		lib = backend.pogs
 
 		class Objective(object):
+			"""
+			Separable objective, stored as a structured array with the
+			layout of the C type function_t (fields h, a, b, c, d, e), so
+			that its buffer can be handed to the solver as a function
+			vector without conversion.
+			"""
 			def __init__(self, n, **params):
 				self.enums = lib.function_enums
 				self.size = n
-				self.__h = zeros(self.size, dtype=int)
-				self.__a = ones(self.size)
-				self.__b = zeros(self.size)
-				self.__c = ones(self.size)
-				self.__d = zeros(self.size)
-				self.__e = zeros(self.size)
+				self.__fns = zeros(self.size, dtype=np_dtype(lib.function))
+				self.__fns['a'] = 1
+				self.__fns['c'] = 1
+				# stamps[i]: version at which entry i was last set
+				self.__version = 0
+				self.__stamps = zeros(self.size, dtype=uint64)
 				if 'f' in params:
 					self.copy_from(params['f'])
 				else:
@@ -29,40 +35,122 @@ class PogsTypes(object):
 									 Objective))
 				if not obj.size == self.size:
 					raise ValueError("Incompatible dimensions")
-				self.__h[:] = obj.__h[:]
+				self.__fns[:] = obj.__fns
+				self.__touch(slice(None))
+
+			def __touch(self, indices):
+				self.__version += 1
+				self.__stamps[indices] = self.__version
+
+			@property
+			def version(self):
+				""" Incremented by each call to set() (or copy_from()). """
+				return self.__version
+
+			def changed_since(self, version):
+				"""
+				Indices of the entries set after the given version, e.g.,
+				to update a solver that last synchronized at that version.
+				"""
+				return flatnonzero(self.__stamps > version)
 
 			def list(self, function_t):
-				return [function_t(*t) for t in self.terms]
+				return [function_t(*t) for t in self.__fns.tolist()]
+
+			@staticmethod
+			def __readonly(arr):
+				# entries change through set(), which records them
+				view = arr.view()
+				view.flags.writeable = False
+				return view
+
+			@property
+			def buffer(self):
+				""" (Read-only) array of function_t, length size. """
+				return self.__readonly(self.__fns)
+
+			def function_vector(self, indices=None, copy=False):
+				"""
+				C function vector over the buffer (or a copy of it), or
+				over a copy of the entries at the given indices; the
+				returned struct points into an array that is kept alive as
+				its _buffer attribute.
+				"""
+				if indices is not None:
+					fns = self.__fns[indices]
+				else:
+					fns = self.__fns.copy() if copy else self.__fns
+				fv = lib.function_vector(fns.size,
+										 fns.ctypes.data_as(lib.function_p))
+				fv._buffer = fns
+				return fv
 
 			@property
 			def arrays(self):
-				return self.__h, self.__a, self.__b, self.__c, self.__d, \
-					   self.__e
+				return self.h, self.a, self.b, self.c, self.d, self.e
 
 			@property
 			def h(self):
-				return self.__h
+				return self.__readonly(self.__fns['h'])
 
 			@property
 			def a(self):
-				return self.__a
+				return self.__readonly(self.__fns['a'])
 
 			@property
 			def b(self):
-				return self.__b
+				return self.__readonly(self.__fns['b'])
 
 			@property
 			def c(self):
-				return self.__c
+				return self.__readonly(self.__fns['c'])
 
 			@property
 			def d(self):
-				return self.__d
+				return self.__readonly(self.__fns['d'])
 
 			@property
 			def e(self):
-				return self.__e
-
+				return self.__readonly(self.__fns['e'])
+
+			def __validate_h(self, h):
+				# validate each distinct value once, then map back
+				if isinstance(h, (int, str)):
+					return self.__validate_h([h])[0]
+				values, inverse = unique(asarray(h), return_inverse=True)
+				if values.dtype.kind in 'iu':
+					if values.size and (
+							values[0] < self.enums.min_enum or
+							values[-1] > self.enums.max_enum):
+						raise IndexError(
+								'values out of range: {}, (valid = {} to {})'
+								''.format(values, self.enums.min_enum,
+								self.enums.max_enum))
+					return values[inverse]
+				elif values.dtype.kind in 'SU':
+					# byte strings: str arrays on Python 2
+					if values.dtype.kind == 'S':
+						values = values.astype('U')
+					invalid = [v for v in values if v not in self.enums.dict]
+					if invalid:
+						raise KeyError('invalid keys: {}. valid keys:\n{}\n'
+									   ''.format(invalid,
+									   list(self.enums.dict.keys())))
+					codes = asarray([self.enums.dict[v] for v in values])
+					return codes[inverse]
+				else:
+					raise TypeError('if specified, argument "h" must be one '
+									'of {}, {}, or {}/{} of these'.format(
+									int, str, list, ndarray))
+
+			def __validate_ce(self, key, value):
+				if (asarray(value) < 0).any():
+					raise ValueError(
+							'Function parameters "c" and "e" must be '
+							'non-negative for function to be convex:\n'
+							'f(x) =def= c * h(ax - b) + dx + ex^2\n, with h '
+							'convex.\n(argument "{}")'.format(key))
+				return value
 
 			def set(self, **params):
 				start = int(params['start']) if 'start' in params else 0
@@ -71,107 +159,52 @@ class PogsTypes(object):
 				if start < 0 : start = self.size + start
 				if end < 0 : end = self.size + end
 
-				r = params.pop('range', range(start,end))
-				range_length = len(r)
-
-				if  range_length == 0:
-					ValueError('index range [{}:{}] results in length-0 array '
-							   'when python array slicing applied to an '
-							   '{} of length {}.'.format(start, end, Objective,
-							   	self.size))
-
-				for item in ['a', 'b', 'c', 'd', 'e', 'h']:
-					if item in params:
-						if isinstance(params[item],(list, ndarray)):
-							if len(params[item]) != range_length:
-								ValueError('keyword argument {} of type {} '
-										   'is incomptably sized with the '
-										   'requested {} slice [{}:{}]'.format(
-										   	item, type(params[item]),
-										   	Objective, start, end))
-
-				if 'h' in params:
-					if isinstance(params['h'], (int, str)):
-						hval = const_iterator(self.enums.validate(params['h']),
-											  range_length)
-					elif isinstance(params['h'], (list, ndarray)):
-						hval = list(map(self.enums.validate, params['h']))
-					else:
-						raise TypeError('if specified, argument "h" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, str, list, ndarray))
-
-					for idx, val in enumerate(hval):
-						self.__h[r[idx]] = val
-
-				if 'a' in params:
-					if isinstance(params['a'], (int, float)):
-						aval = const_iterator(params['a'], range_length)
-					elif isinstance(params['a'], (list, ndarray)):
-						aval = params['a']
-					else:
-						raise TypeError('if specified, argument "a" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, float, list, ndarray))
-
-					for idx, val in enumerate(aval):
-						self.__a[r[idx]] = val
-
-				if 'b' in params:
-					if isinstance(params['b'], (int, float)):
-						bval = const_iterator(params['b'], range_length)
-					elif isinstance(params['b'], (list, ndarray)):
-						bval = params['b']
-					else:
-						raise TypeError('if specified, argument "b" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, float, list, ndarray))
-
-					for idx, val in enumerate(bval):
-						self.__b[r[idx]] = val
-
-				if 'c' in params:
-					if isinstance(params['c'], (int, float)):
-						cval = const_iterator(
-								self.enums.validate_ce(params['c']),
-								range_length)
-					elif isinstance(params['c'], (list, ndarray)):
-						cval = params['c']
-					else:
-						raise TypeError('if specified, argument "c" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, float, list, ndarray))
-
-					for idx, val in enumerate(cval):
-						self.__c[r[idx]] = val
-
-				if 'd' in params:
-					if isinstance(params['d'], (int, float)):
-						dval = const_iterator(params['d'], range_length)
-					elif isinstance(params['d'], (list, ndarray)):
-						dval = params['d']
-					else:
-						raise TypeError('if specified, argument "d" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, float, list, ndarray))
-
-					for idx, val in enumerate(dval):
-						self.__d[r[idx]] = val
-
-				if 'e' in params:
-					if isinstance(params['e'], (int, float)):
-						e_val = const_iterator(
-								self.enums.validate_ce(params['e']),
-								range_length)
-					elif isinstance(params['e'], (list, ndarray)):
-						e_val = params['e']
-					else:
-						raise TypeError('if specified, argument "e" must be '
-										'one of {}, {}, {} or {}'.format(
-										int, float, list, ndarray))
-
-					for idx, val in enumerate(e_val):
-						self.__e[r[idx]] = val
+				r = params.pop('range', None)
+				if r is None:
+					index = slice(start, end)
+					range_length = len(range(start, end))
+				else:
+					index = asarray(r, dtype=int).reshape(-1)
+					range_length = index.size
+
+				if range_length == 0:
+					return
+
+				values = {}
+				for item in ['h', 'a', 'b', 'c', 'd', 'e']:
+					if not item in params:
+						continue
+					value = params[item]
+					if isinstance(value, (list, ndarray)):
+						if len(value) != range_length:
+							raise ValueError(
+									'keyword argument {} of type {} is '
+									'incomptably sized with the requested '
+									'{} slice [{}:{}]'.format(item,
+									type(value), Objective, start, end))
+					elif item == 'h':
+						if not isinstance(value, (int, str)):
+							raise TypeError(
+									'if specified, argument "h" must be one '
+									'of {}, {}, {} or {}'.format(
+									int, str, list, ndarray))
+					elif not isinstance(value, (int, float)):
+						raise TypeError(
+								'if specified, argument "{}" must be one of '
+								'{}, {}, {} or {}'.format(item, int, float,
+								list, ndarray))
+
+					if item == 'h':
+						value = self.__validate_h(value)
+					elif item in ('c', 'e'):
+						value = self.__validate_ce(item, value)
+					values[item] = value
+
+				# validate every argument before writing any
+				for item, value in values.items():
+					self.__fns[item][index] = value
+
+				self.__touch(index)
 
 			def __str__(self):
 				return str("size:\nh: {}\na: {}\nb: {}\n"
@@ -209,6 +242,18 @@ class PogsTypes(object):
 					self.gapstop = options['gapstop']
 				if 'resume' in options:
 					self.resume = options['resume']
+				if 'accelerate' in options:
+					self.accelerate = options['accelerate']
+				if 'anderson_type' in options:
+					self.anderson_type = options['anderson_type']
+				if 'anderson_memory' in options:
+					self.anderson_memory = options['anderson_memory']
+				if 'anderson_safeguard' in options:
+					self.anderson_safeguard = options['anderson_safeguard']
+				if 'check_interval' in options:
+					self.check_interval = options['check_interval']
+				if 'time_limit' in options:
+					self.time_limit = options['time_limit']
 				if 'x0' in options:
 					self.x0 = options['x0'].ctypes.data_as(lib.ok_float_p)
 				if 'nu0' in options:
@@ -354,6 +399,91 @@ class PogsTypes(object):
 				else:
 					self.c.resume = int(resume)
 
+			@property
+			def accelerate(self):
+				return self.c.accelerate
+
+			@accelerate.setter
+			def accelerate(self, accelerate):
+				if not isinstance(accelerate, (int, bool)):
+					raise TypeError('argument "accelerate" must be of '
+									'type {} or {}'.format(int, bool))
+				elif accelerate not in (0, 1, True, False):
+					raise ValueError('argument "accelerate" must be 0 or 1')
+				else:
+					self.c.accelerate = int(accelerate)
+
+			@property
+			def anderson_type(self):
+				return self.c.anderson_type
+
+			@anderson_type.setter
+			def anderson_type(self, anderson_type):
+				if not isinstance(anderson_type, int):
+					raise TypeError('argument "anderson_type" must be of '
+									'type {}'.format(int))
+				elif anderson_type not in (1, 2):
+					raise ValueError('argument "anderson_type" must be 1 or 2')
+				else:
+					self.c.anderson_type = anderson_type
+
+			@property
+			def anderson_memory(self):
+				return self.c.anderson_memory
+
+			@anderson_memory.setter
+			def anderson_memory(self, anderson_memory):
+				if not isinstance(anderson_memory, int):
+					raise TypeError('argument "anderson_memory" must be of '
+									'type {}'.format(int))
+				elif anderson_memory < 1:
+					raise ValueError('argument "anderson_memory" must be >= 1')
+				else:
+					self.c.anderson_memory = anderson_memory
+
+			@property
+			def anderson_safeguard(self):
+				return self.c.anderson_safeguard
+
+			@anderson_safeguard.setter
+			def anderson_safeguard(self, anderson_safeguard):
+				if not isinstance(anderson_safeguard, (float, int)):
+					raise TypeError('argument "anderson_safeguard" must be {} '
+									'or {}'.format(float, int))
+				elif anderson_safeguard <= 0:
+					raise ValueError('argument "anderson_safeguard" must be '
+									 '> 0')
+				else:
+					self.c.anderson_safeguard = anderson_safeguard
+
+			@property
+			def check_interval(self):
+				return self.c.check_interval
+
+			@check_interval.setter
+			def check_interval(self, check_interval):
+				if not isinstance(check_interval, int):
+					raise TypeError('argument "check_interval" must be of '
+									'type {}'.format(int))
+				elif check_interval < 1:
+					raise ValueError('argument "check_interval" must be >= 1')
+				else:
+					self.c.check_interval = check_interval
+
+			@property
+			def time_limit(self):
+				return self.c.time_limit
+
+			@time_limit.setter
+			def time_limit(self, time_limit):
+				if not isinstance(time_limit, (float, int)):
+					raise TypeError('argument "time_limit" must be {} or '
+									'{}'.format(float, int))
+				elif time_limit < 0:
+					raise ValueError('argument "time_limit" must be >= 0')
+				else:
+					self.c.time_limit = time_limit
+
 			@property
 			def x0(self):
 				return self.c.x0
@@ -432,6 +562,34 @@ class PogsTypes(object):
 			def rho(self):
 				return self.c.rho
 
+			@property
+			def accelerated_iters(self):
+				return self.c.k_accel
+
+			@property
+			def refinement_residual(self):
+				return self.c.refinement_residual
+
+			@property
+			def status(self):
+				return self.c.status
+
+			@property
+			def equil_time(self):
+				return self.c.equil_time
+
+			@property
+			def equil_row_spread(self):
+				return self.c.equil_row_spread
+
+			@property
+			def equil_col_spread(self):
+				return self.c.equil_col_spread
+
+			@property
+			def cg_iters(self):
+				return self.c.cg_iters
+
 			def __str__(self):
 				return str(
 						'error: {}\n'.format(self.err).join(
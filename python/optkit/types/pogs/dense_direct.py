@@ -1,7 +1,10 @@
-from numpy import zeros, ones, ndarray, savez, load as np_load
-from ctypes import c_void_p
-from os import path
+from numpy import zeros, ones, ndarray, uintp, array, vstack, delete, unique, \
+				  savez, load as np_load
+from ctypes import POINTER, c_void_p, c_size_t, byref
+from os import path, remove
 from optkit.types.pogs.common import PogsTypes
+from optkit.types.pogs.pool import PogsPoolTypes
+from optkit.types.pogs.snapshot import create_snapshot, open_snapshot
 
 class PogsDenseDirectTypes(PogsTypes):
 	def __init__(self, backend):
@@ -27,19 +30,22 @@ class PogsDenseDirectTypes(PogsTypes):
 				self.shape = (self.m, self.n) = (m, n) = A.shape
 				self.A = A.astype(lib.pyfloat)
 				self.A_ptr = A_ptr = self.A.ctypes.data_as(lib.ok_float_p)
-				self.__f = zeros(m).astype(lib.function)
-				self.__f_ptr = self.__f.ctypes.data_as(lib.function_p)
-				self.__f_c = lib.function_vector(self.m, self.__f_ptr)
-				self.__g = zeros(n).astype(lib.function)
-				self.__g_ptr = self.__g.ctypes.data_as(lib.function_p)
-				self.__g_c = lib.function_vector(self.n, self.__g_ptr)
 				self.layout = layout = lib.enums.CblasRowMajor if \
 					A.flags.c_contiguous else lib.enums.CblasColMajor
 				self.__c_solver = None
+				self.__snapshot = None
+				self.__telemetry_capacity = 0
+				# (f, g, f.version, g.version) held by the C solver
+				self.__synced = None
 
+				equil = self.__equilibration_settings(options)
 				if 'no_init' not in args:
-					self.__register_solver(lib, lib.pogs_init(self.A_ptr, m, n,
-							layout))
+					if equil is None:
+						self.__register_solver(lib, lib.pogs_init(
+								self.A_ptr, m, n, layout))
+					else:
+						self.__register_solver(lib, lib.pogs_init_equil(
+								self.A_ptr, m, n, layout, equil))
 
 				self.settings = SolverSettings()
 				self.info = SolverInfo()
@@ -51,32 +57,71 @@ class PogsDenseDirectTypes(PogsTypes):
 			def c_solver(self):
 			    return self.__c_solver
 
+			@staticmethod
+			def __equilibration_settings(options):
+				"""
+				Pop the equilibration options 'equil' ('sinkhorn' or
+				'ruiz'), 'equil_maxiter' and 'equil_tol' from options;
+				None if none was given.
+				"""
+				method = options.pop('equil', None)
+				maxiter = options.pop('equil_maxiter', None)
+				tol = options.pop('equil_tol', None)
+				if method is None and maxiter is None and tol is None:
+					return None
+
+				methods = {'sinkhorn': lib.enums.EQUIL_SINKHORN,
+						   'ruiz': lib.enums.EQUIL_RUIZ}
+				equil = lib.equilibration_settings()
+				lib.equilibration_default_settings(equil)
+				if method is not None:
+					if method not in methods:
+						raise ValueError(
+								'equil must be one of {}'.format(
+								sorted(methods.keys())))
+					equil.method = methods[method]
+				if maxiter is not None:
+					equil.maxiter = int(maxiter)
+				if tol is not None:
+					if tol < 0:
+						raise ValueError('equil_tol must be nonnegative')
+					equil.tol = float(tol)
+				return equil
+
 			def __register_solver(self, lib, solver):
 				self.__backend.increment_cobject_count()
 				self.__c_solver = solver
+				self.__synced = None
 
 			def __unregister_solver(self):
 				if self.c_solver is None:
 					return
 				lib.pogs_finish(self.c_solver, 0)
 				self.__c_solver = None
+				self.__snapshot = None
+				self.__synced = None
 				self.__backend.decrement_cobject_count()
 
 
-			def __update_function_vectors(self, f, g):
-				for i in range(f.size):
-					self.__f[i] = lib.function(f.h[i], f.a[i], f.b[i],
-												   f.c[i], f.d[i], f.e[i])
-
-				for j in range(g.size):
-					self.__g[j] = lib.function(g.h[j], g.a[j], g.b[j],
-												   g.c[j], g.d[j], g.e[j])
-
-			def solve(self, f, g, **options):
-				if self.c_solver is None:
-					raise ValueError(
-							'No solver intialized, solve() call invalid')
+			def __update_objectives(self, f, g, f_version, g_version):
+				"""
+				Send the C solver only the entries of f, g set since it
+				last synchronized with them (at f_version, g_version).
+				"""
+				f_idx = f.changed_since(f_version).astype(uintp)
+				g_idx = g.changed_since(g_version).astype(uintp)
+				f_values = f.function_vector(f_idx)
+				g_values = g.function_vector(g_idx)
+				err = lib.pogs_update_objectives(
+						self.c_solver,
+						f_idx.ctypes.data_as(POINTER(c_size_t)),
+						f_values.objectives, f_idx.size,
+						g_idx.ctypes.data_as(POINTER(c_size_t)),
+						g_values.objectives, g_idx.size)
+				if err:
+					raise RuntimeError('objective update failed')
 
+			def __check_objectives(self, f, g):
 				if not isinstance(f, Objective) and isinstance(g, Objective):
 					raise TypeError(
 						'inputs f, g must be of type {} \nprovided: {}, '
@@ -88,15 +133,228 @@ class PogsDenseDirectTypes(PogsTypes):
 						'\nsolver dimensions ({}, {})\n provided: '
 						'({}{})'.format(self.m, self.n, f.size, g.size))
 
+			def solve(self, f, g, **options):
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, solve() call invalid')
+
+				self.__check_objectives(f, g)
 
 				# TODO : logic around resume, warmstart, rho input
 
-				self.__update_function_vectors(f, g)
+				# re-solving with the same f, g: update changed entries only
+				synced = self.__synced
+				versions = (f.version, g.version)
+				if synced is not None and synced[0] is f and synced[1] is g:
+					self.__update_objectives(f, g, *synced[2:])
+					f_c, g_c = None, None
+				else:
+					f_c, g_c = f.function_vector(), g.function_vector()
+
 				self.settings.update(**options)
-				lib.pogs_solve(self.c_solver, self.__f_c, self.__g_c,
-								   self.settings.c, self.info.c, self.output.c)
+				lib.pogs_solve(self.c_solver, f_c, g_c, self.settings.c,
+							   self.info.c, self.output.c)
+				self.__synced = (f, g) + versions
 				self.first_run = False
 
+			def solve_many(self, f_list, g_list, **options):
+				"""
+				Solve K problems that share this solver's matrix A in one
+				batched call, with the K iterates advanced together.
+
+				Returns lists of K SolverInfo and K SolverOutput objects.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, solve_many() call invalid')
+
+				if len(f_list) != len(g_list) or len(f_list) == 0:
+					raise ValueError(
+						'inputs f_list, g_list must be non-empty and of '
+						'equal length\nprovided: {}, {}'.format(
+						len(f_list), len(g_list)))
+
+				K = len(f_list)
+				f_c = (lib.function_vector * K)()
+				g_c = (lib.function_vector * K)()
+
+				# objective buffers are passed as is, no copies
+				for k, (f, g) in enumerate(zip(f_list, g_list)):
+					self.__check_objectives(f, g)
+					f_c[k] = f.function_vector()
+					g_c[k] = g.function_vector()
+
+				self.settings.update(**options)
+				infos = [SolverInfo() for k in range(K)]
+				outputs = [SolverOutput(self.m, self.n) for k in range(K)]
+				info_c = (PogsInfo * K)()
+				output_c = (PogsOutput * K)(*[out.c for out in outputs])
+
+				self.__synced = None
+				lib.pogs_solve_batch(self.c_solver, K, f_c, g_c,
+									 self.settings.c, info_c, output_c)
+
+				for k in range(K):
+					infos[k].c = info_c[k]
+				self.first_run = False
+				return infos, outputs
+
+			def solve_path(self, f, g, path, **options):
+				"""
+				Solve along a regularization path: at each weight lambda in
+				path, the weight c of every FnAbs term of f and g is scaled
+				by lambda. Each point is warm started from the iterate and
+				rho of the previous point.
+
+				Generator, yields (lambda, SolverInfo, SolverOutput) one
+				point at a time. A point interrupted by the time limit or
+				cancel() ends the path; an error raises RuntimeError, as
+				later points would resume from the failed iterate.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, solve_path() call invalid')
+
+				self.__check_objectives(f, g)
+
+				# snapshot f, g: the path is generated lazily
+				f_c = f.function_vector(copy=True)
+				g_c = g.function_vector(copy=True)
+
+				self.settings.update(**options)
+				settings_c = PogsSettings.from_buffer_copy(self.settings.c)
+				lambda_ = zeros(1, dtype=lib.pyfloat)
+				lambda_ptr = lambda_.ctypes.data_as(lib.ok_float_p)
+				self.__synced = None
+
+				for weight in path:
+					if weight < 0:
+						raise ValueError('path weights must be >= 0')
+					lambda_[0] = weight
+					info = SolverInfo()
+					output = SolverOutput(self.m, self.n)
+					err = lib.pogs_solve_path(
+							self.c_solver, f_c, g_c, settings_c, 1,
+							lambda_ptr, info.c, output.c)
+					self.first_run = False
+					if err or info.err:
+						raise RuntimeError(
+								'path solve failed at lambda = {} (error {})'
+								''.format(weight, err or info.err))
+
+					# later points resume from this iterate and rho
+					settings_c.warmstart = 0
+					settings_c.resume = 1
+					yield weight, info, output
+
+					# an interrupted point ends the path
+					if info.status in (lib.enums.POGS_TIME_LIMIT,
+									   lib.enums.POGS_CANCELLED):
+						return
+
+			def cancel(self):
+				"""
+				Stop the solve in progress (e.g., called from another
+				thread) at the end of its current iteration; the solve
+				returns the iterate reached so far, with status
+				POGS_CANCELLED.
+				"""
+				if self.c_solver is not None:
+					lib.pogs_cancel(self.c_solver)
+
+			def __resized(self, A):
+				order = 'C' if self.layout == lib.enums.CblasRowMajor else 'F'
+				self.A = array(A, dtype=lib.pyfloat, order=order)
+				self.A_ptr = self.A.ctypes.data_as(lib.ok_float_p)
+				self.shape = (self.m, self.n) = self.A.shape
+				self.output = SolverOutput(self.m, self.n)
+				self.__synced = None
+				self.__snapshot = None
+
+			def append_rows(self, R):
+				"""
+				Append the rows of R (k x n) to A, updating the solver's
+				equilibration and factorization incrementally instead of
+				re-initializing it; the objective f passed to the next
+				solve() should have m + k entries.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, append_rows() call invalid')
+				R = array(R, dtype=lib.pyfloat, ndmin=2)
+				if len(R.shape) != 2 or R.shape[1] != self.n:
+					raise ValueError(
+							'rows must be a k x {} array, provided: '
+							'{}'.format(self.n, R.shape))
+				order = 'C' if self.layout == lib.enums.CblasRowMajor else 'F'
+				R = array(R, order=order)
+				err = lib.pogs_solver_append_rows(
+						self.c_solver, R.ctypes.data_as(lib.ok_float_p),
+						R.shape[0], self.layout)
+				if err:
+					raise RuntimeError('row update failed')
+				self.__resized(vstack((self.A, R)))
+
+			def remove_rows(self, indices):
+				"""
+				Remove the rows of A at the given indices, downdating the
+				solver's factorization instead of re-initializing it; the
+				objective f passed to the next solve() should have the
+				remaining number of entries, in the original row order.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, remove_rows() call invalid')
+				indices = unique(array(indices, dtype=int).reshape(-1))
+				if indices.size and (indices[0] < 0 or
+									 indices[-1] >= self.m):
+					raise IndexError('row indices out of range')
+				indices = indices.astype(uintp)
+				err = lib.pogs_solver_remove_rows(
+						self.c_solver,
+						indices.ctypes.data_as(POINTER(c_size_t)),
+						indices.size)
+				if err:
+					raise RuntimeError('row update failed')
+				self.__resized(delete(self.A, indices, axis=0))
+
+			def enable_telemetry(self, capacity=1000):
+				"""
+				Record residuals, tolerances, objectives, rho and phase
+				timings at each iteration of subsequent solves, keeping the
+				most recent capacity iterations.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, enable_telemetry() call '
+							'invalid')
+				if lib.pogs_telemetry_enable(self.c_solver, int(capacity)):
+					raise ValueError('telemetry capacity must be > 0')
+				self.__telemetry_capacity = int(capacity)
+
+			def disable_telemetry(self):
+				if self.c_solver is not None:
+					lib.pogs_telemetry_disable(self.c_solver)
+				self.__telemetry_capacity = 0
+
+			@property
+			def telemetry(self):
+				"""
+				Records of the last solve, oldest first, as a structured
+				array with the fields of lib.pogs_telemetry_record (None
+				if telemetry is not enabled).
+				"""
+				if self.c_solver is None or self.__telemetry_capacity == 0:
+					return None
+				capacity = self.__telemetry_capacity
+				records = zeros(capacity).astype(lib.pogs_telemetry_record)
+				count = c_size_t(capacity)
+				lib.pogs_telemetry_read(
+						self.c_solver,
+						records.ctypes.data_as(lib.pogs_telemetry_record_p),
+						byref(count))
+				return records[:count.value]
+
 			def load(self, directory, name):
 				filename = path.join(directory, name)
 				if not '.npz' in name:
@@ -272,4 +530,95 @@ class PogsDenseDirectTypes(PogsTypes):
 					savez(filename, z=z, z12=z12, zt=zt, zt12=zt12,
 						  zprev=zprev, rho=rho[0])
 
-		self.Solver = Solver
\ No newline at end of file
+			def save_snapshot(self, filename):
+				"""
+				Write the solver state (equilibrated matrix, factorization,
+				scaling vectors, iterates and rho) to a binary snapshot
+				file, see optkit.types.pogs.snapshot.
+
+				The state is extracted directly into a mapping of the file.
+				"""
+				if self.c_solver is None:
+					raise ValueError(
+							'No solver intialized, save_snapshot() call '
+							'invalid')
+
+				if path.exists(filename):
+					raise ValueError('specified filepath already exists '
+									 'and would be overwritten, aborting.')
+
+				mm, header, arrays = create_snapshot(
+						filename, self.m, self.n, backend.precision_is_32bit,
+						self.layout, lib.direct)
+				ptr = lambda key: arrays[key].ctypes.data_as(lib.ok_float_p)
+				LLT_ptr = ptr('LLT') if lib.direct else c_void_p()
+				rho = zeros(1, dtype=lib.pyfloat)
+
+				err = lib.pogs_extract_solver(
+						self.c_solver, ptr('A_equil'), LLT_ptr, ptr('d'),
+						ptr('e'), ptr('z'), ptr('z12'), ptr('zt'),
+						ptr('zt12'), ptr('zprev'),
+						rho.ctypes.data_as(lib.ok_float_p), self.layout)
+
+				header['rho'] = rho[0]
+				mm.flush()
+				# release the mapping before any remove (rebind rather than
+				# del: arrays is referenced by ptr)
+				arrays = header = mm = None
+				if err:
+					remove(filename)
+					raise RuntimeError('solver export failed')
+
+			def load_snapshot(self, filename):
+				"""
+				Load solver state from a snapshot file written by
+				save_snapshot().
+
+				The file is memory-mapped, and on CPU the C solver views
+				the equilibrated matrix and factorization in place: they
+				are neither read nor copied up front, and the mapping is
+				held until the solver is released. Snapshots of another
+				precision, or loads on GPU, are copied instead.
+				"""
+				mm, header, arrays = open_snapshot(filename)
+				if (header['m'], header['n']) != self.shape:
+					raise ValueError(
+						'snapshot not compatibly sized with solver'
+						'\nsolver dimensions ({}, {})\n snapshot: '
+						'({}, {})'.format(self.m, self.n, header['m'],
+						header['n']))
+				if lib.direct and arrays['LLT'] is None:
+					raise ValueError('snapshot has no factorization, '
+									 'required by direct solver')
+
+				precision = 32 if backend.precision_is_32bit else 64
+				view = not backend.device_is_gpu and \
+					   header['precision'] == precision
+				if not view:
+					arrays = {key: arrays[key].astype(lib.pyfloat) if
+							  arrays[key] is not None else None for key in
+							  arrays}
+
+				ptr = lambda key: arrays[key].ctypes.data_as(lib.ok_float_p)
+				LLT_ptr = ptr('LLT') if lib.direct else c_void_p()
+				load = lib.pogs_load_solver_view if view else \
+					   lib.pogs_load_solver
+
+				if self.c_solver is not None:
+					self.__unregister_solver()
+
+				solver = load(
+						ptr('A_equil'), LLT_ptr, ptr('d'), ptr('e'),
+						ptr('z'), ptr('z12'), ptr('zt'), ptr('zt12'),
+						ptr('zprev'), float(header['rho']), self.m, self.n,
+						int(header['order']))
+				if not solver:
+					raise RuntimeError('snapshot load failed')
+
+				self.__register_solver(lib, solver)
+				if view:
+					self.__snapshot = arrays
+
+		self.Solver = Solver
+		self.SolverPool = PogsPoolTypes(backend, Solver, SolverSettings,
+			SolverInfo, SolverOutput).SolverPool
\ No newline at end of file
@@ -29,12 +29,17 @@ class PogsOperatorTypes(PogsTypes):
 					A.flags.c_contiguous else lib.enums.CblasColMajor
 
 				NO_INIT = bool(options.pop('no_init', False))
-				DIRECT = int(options.pop('direct', False))
+				DIRECT = self.__projector_setting(options)
 				EQUILNORM = float(options.pop('equil_norm', 1.))
 
+				equil = self.__equilibration_settings(options)
 				if not NO_INIT:
-					self.__register_solver(lib, lib.pogs_init(
-							self.A.c_ptr, DIRECT, EQUILNORM))
+					if equil is None:
+						self.__register_solver(lib, lib.pogs_init(
+								self.A.c_ptr, DIRECT, EQUILNORM))
+					else:
+						self.__register_solver(lib, lib.pogs_init_equil(
+								self.A.c_ptr, DIRECT, EQUILNORM, equil))
 				else:
 					self.c_solver = None
 
@@ -48,6 +53,59 @@ class PogsOperatorTypes(PogsTypes):
 			def c_solver(self):
 			    return self.__c_solver
 
+			@staticmethod
+			def __projector_setting(options):
+				"""
+				Pop 'direct' and 'precond' ('jacobi' or 'block_jacobi')
+				from options; a preconditioner selects the PCG projector,
+				and cannot be combined with a direct projector.
+				"""
+				direct = int(options.pop('direct', False))
+				precond = options.pop('precond', None)
+				if precond is None:
+					return direct
+
+				preconditioners = {
+						'jacobi': lib.enums.PRECOND_JACOBI,
+						'block_jacobi': lib.enums.PRECOND_BLOCK_JACOBI}
+				if precond not in preconditioners:
+					raise ValueError(
+							'precond must be one of {}'.format(
+							sorted(preconditioners.keys())))
+				if direct:
+					raise ValueError(
+							'precond applies to indirect projection only; '
+							'cannot be combined with direct')
+				return preconditioners[precond]
+
+			@staticmethod
+			def __equilibration_settings(options):
+				"""
+				Pop the randomized equilibration options 'equil_probes'
+				(random probes per pass), 'equil_passes' and 'equil_tol'
+				from options; None if none was given. These apply to
+				operators with no in-place scaling.
+				"""
+				probes = options.pop('equil_probes', None)
+				passes = options.pop('equil_passes', None)
+				tol = options.pop('equil_tol', None)
+				if probes is None and passes is None and tol is None:
+					return None
+
+				equil = lib.equilibration_settings()
+				lib.equilibration_randomized_settings(equil)
+				if probes is not None:
+					if int(probes) < 1:
+						raise ValueError('equil_probes must be positive')
+					equil.probes = int(probes)
+				if passes is not None:
+					equil.maxiter = int(passes)
+				if tol is not None:
+					if tol < 0:
+						raise ValueError('equil_tol must be nonnegative')
+					equil.tol = float(tol)
+				return equil
+
 			def __register_solver(self, lib, solver):
 				self.__c_solver = solver
 				self.exit_call = lib.pogs_finish
@@ -64,13 +122,8 @@ class PogsOperatorTypes(PogsTypes):
 				self.reset_on_exit = False
 
 			def __update_function_vectors(self, f, g):
-				for i in range(f.size):
-					self.__f[i] = lib.function(f.h[i], f.a[i], f.b[i],
-												   f.c[i], f.d[i], f.e[i])
-
-				for j in range(g.size):
-					self.__g[j] = lib.function(g.h[j], g.a[j], g.b[j],
-												   g.c[j], g.d[j], g.e[j])
+				self.__f[:] = f.buffer
+				self.__g[:] = g.buffer
 
 # 			def solve(self, f, g, **options):
 # 				if self.c_solver is None:
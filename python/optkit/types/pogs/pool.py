@@ -0,0 +1,285 @@
+from numpy import zeros, ndarray, ascontiguousarray, dtype as np_dtype
+from ctypes import c_void_p
+from optkit.libs.pogs import PogsLibs
+
+"""
+Worker side of PogsSolverPool.
+
+Each worker process attaches (by name) to the shared memory blocks holding
+the equilibrated matrix, factorization and scaling vectors computed once
+by the parent, builds one solver viewing them in place, and writes
+solutions directly into a shared output block. Only objectives (as
+function_t record arrays), settings and info structs are pickled.
+"""
+_worker = {}
+
+def _pool_requirements():
+	"""
+	multiprocessing contexts and shared memory (Python 3.8+), imported
+	on first use so the package imports without them
+	"""
+	try:
+		from multiprocessing import get_context
+		from multiprocessing.shared_memory import SharedMemory
+	except ImportError:
+		raise ImportError(
+				'SolverPool requires multiprocessing.get_context and '
+				'multiprocessing.shared_memory (Python 3.8 or later)')
+	return get_context, SharedMemory
+
+def _attach(name, shape, dtype, order='C'):
+	shm = _pool_requirements()[1](name=name)
+	return shm, ndarray(shape, dtype=dtype, buffer=shm.buf, order=order)
+
+def _pool_worker_init(config):
+	lib = PogsLibs().get(single_precision=config['single_precision'],
+						 gpu=config['gpu'])
+	m, n = config['shape']
+	mindim = min(m, n)
+	order = 'C' if config['order'] == lib.enums.CblasRowMajor else 'F'
+
+	_worker.clear()
+	_worker['lib'] = lib
+	_worker['config'] = config
+	_worker['shm'] = []
+	for key, shape in (('A_equil', (m, n)), ('LLT', (mindim, mindim)),
+					   ('d', (m,)), ('e', (n,))):
+		if config['names'][key] is None:
+			_worker[key] = None
+			continue
+		shm, arr = _attach(config['names'][key], shape, lib.pyfloat, order)
+		_worker['shm'].append(shm)
+		_worker[key] = arr
+	_worker['output'] = (None, None, None)
+
+	# one solver per worker, viewing the shared matrix and factor in
+	# place (GPU solvers need device copies, made once per worker)
+	z = zeros(m + n, dtype=lib.pyfloat)
+	z_ptr = z.ctypes.data_as(lib.ok_float_p)
+	LLT = _worker['LLT']
+	LLT_ptr = LLT.ctypes.data_as(lib.ok_float_p) if LLT is not None else \
+			  c_void_p()
+	load = lib.pogs_load_solver if config['gpu'] else \
+		   lib.pogs_load_solver_view
+	_worker['solver'] = load(
+			_worker['A_equil'].ctypes.data_as(lib.ok_float_p), LLT_ptr,
+			_worker['d'].ctypes.data_as(lib.ok_float_p),
+			_worker['e'].ctypes.data_as(lib.ok_float_p),
+			z_ptr, z_ptr, z_ptr, z_ptr, z_ptr, 1., m, n, config['order'])
+
+def _pool_worker_output(name, K):
+	lib = _worker['lib']
+	m, n = _worker['config']['shape']
+	current, shm, arr = _worker['output']
+	if current != name:
+		if shm is not None:
+			shm.close()
+		shm, arr = _attach(name, (K, 2 * (m + n)), lib.pyfloat)
+		_worker['output'] = (name, shm, arr)
+	return arr
+
+def _pool_worker_solve(task):
+	k, f_buffer, g_buffer, settings_bytes, output_name, K = task
+	lib = _worker['lib']
+	m, n = _worker['config']['shape']
+
+	# objectives arrive as function_t records, in the solver's precision
+	f = ascontiguousarray(f_buffer, dtype=np_dtype(lib.function))
+	g = ascontiguousarray(g_buffer, dtype=np_dtype(lib.function))
+	f_c = lib.function_vector(m, f.ctypes.data_as(lib.function_p))
+	g_c = lib.function_vector(n, g.ctypes.data_as(lib.function_p))
+
+	# host pointers from the parent process are not valid here
+	settings = lib.pogs_settings.from_buffer_copy(settings_bytes)
+	settings.x0 = None
+	settings.nu0 = None
+	settings.warmstart = 0
+	settings.resume = 0
+
+	out = _pool_worker_output(output_name, K)[k]
+	output = lib.pogs_output(
+			out[:n].ctypes.data_as(lib.ok_float_p),
+			out[n:n + m].ctypes.data_as(lib.ok_float_p),
+			out[n + m:2 * n + m].ctypes.data_as(lib.ok_float_p),
+			out[2 * n + m:].ctypes.data_as(lib.ok_float_p))
+
+	info = lib.pogs_info()
+	solver = _worker['solver']
+	if not solver:
+		info.err = lib.enums.OPTKIT_ERROR_UNALLOCATED
+	else:
+		# every problem starts cold: clear the iterates of the last one
+		# (rho is reset from settings, as resume = 0)
+		z = solver.contents.z.contents
+		for block in (z.primal, z.primal12, z.dual, z.dual12, z.prev):
+			lib.vector_set_all(block.contents.vec, 0)
+		err = lib.pogs_solve(solver, f_c, g_c, settings, info, output)
+		info.err = info.err or err
+	return k, bytes(info)
+
+class PogsPoolTypes(object):
+	def __init__(self, backend, Solver, SolverSettings, SolverInfo,
+				 SolverOutput):
+		lib = backend.pogs
+		PogsInfo = lib.pogs_info
+
+		class SolverPool(object):
+			"""
+			Process pool for independent POGS problems sharing a matrix A.
+
+			A, and the equilibrated matrix, factorization and scaling
+			vectors produced by one pogs_init in this process, are placed
+			in shared memory. Each worker attaches to these blocks by name
+			and builds one solver viewing them in place
+			(pogs_load_solver_view), reused for all of its problems, so A
+			is neither pickled nor copied; solutions are written by the
+			workers into a shared output block.
+
+			Requires Python 3.8 or later (multiprocessing.shared_memory).
+			"""
+			def __init__(self, A, processes=None, start_method=None,
+						 **options):
+				self.__shm = {}
+				self.__pool = None
+				get_context, self.__SharedMemory = _pool_requirements()
+				if not isinstance(A, ndarray) or len(A.shape) != 2:
+					raise TypeError('input must be a 2-d {}'.format(ndarray))
+
+				try:
+					self.__setup(A, processes, get_context(start_method),
+								 **options)
+				except:
+					self.close()
+					raise
+
+			def __setup(self, A, processes, context, **options):
+
+				self.shape = (self.m, self.n) = (m, n) = A.shape
+				mindim = min(m, n)
+				order = 'C' if A.flags.c_contiguous else 'F'
+				self.layout = lib.enums.CblasRowMajor if order == 'C' else \
+							  lib.enums.CblasColMajor
+
+				self.A = self.__share('A', A.shape, order)
+				self.A[:] = A
+				A_equil = self.__share('A_equil', A.shape, order)
+				d = self.__share('d', (m,))
+				e = self.__share('e', (n,))
+				if lib.direct:
+					LLT = self.__share('LLT', (mindim, mindim), order)
+					LLT_ptr = LLT.ctypes.data_as(lib.ok_float_p)
+				else:
+					LLT_ptr = c_void_p()
+
+				# equilibrate and factor once, export to shared memory
+				solver = Solver(self.A, **options)
+				z = zeros(m + n, dtype=lib.pyfloat)
+				z_ptr = z.ctypes.data_as(lib.ok_float_p)
+				rho = zeros(1, dtype=lib.pyfloat)
+				err = lib.pogs_extract_solver(
+						solver.c_solver,
+						A_equil.ctypes.data_as(lib.ok_float_p), LLT_ptr,
+						d.ctypes.data_as(lib.ok_float_p),
+						e.ctypes.data_as(lib.ok_float_p),
+						z_ptr, z_ptr, z_ptr, z_ptr, z_ptr,
+						rho.ctypes.data_as(lib.ok_float_p), self.layout)
+				del solver
+				if err:
+					raise RuntimeError('solver export failed')
+
+				self.settings = SolverSettings()
+				self.settings.update(**options)
+
+				config = dict(
+						shape=self.shape, order=self.layout,
+						gpu=backend.device_is_gpu,
+						single_precision=backend.precision_is_32bit,
+						names={key: self.__shm[key][0].name if key in
+							   self.__shm else None for key in
+							   ('A_equil', 'LLT', 'd', 'e')})
+				self.__pool = context.Pool(
+						processes, initializer=_pool_worker_init,
+						initargs=(config,))
+
+			def __share(self, key, shape, order='C'):
+				count = 1
+				for dim in shape:
+					count *= dim
+				nbytes = max(1, count * np_dtype(lib.pyfloat).itemsize)
+				shm = self.__SharedMemory(create=True, size=nbytes)
+				arr = ndarray(shape, dtype=lib.pyfloat, buffer=shm.buf,
+							  order=order)
+				self.__shm[key] = (shm, arr)
+				return arr
+
+			def solve(self, f_list, g_list, **options):
+				"""
+				Solve the K problems (f_list[k], g_list[k]) across the
+				worker processes, each from a cold start.
+
+				Returns lists of K SolverInfo and K SolverOutput objects.
+				"""
+				if self.__pool is None:
+					raise ValueError('pool closed, solve() call invalid')
+				if len(f_list) != len(g_list) or len(f_list) == 0:
+					raise ValueError(
+						'inputs f_list, g_list must be non-empty and of '
+						'equal length\nprovided: {}, {}'.format(
+						len(f_list), len(g_list)))
+				for f, g in zip(f_list, g_list):
+					if not (f.size == self.m and g.size == self.n):
+						raise ValueError(
+							'inputs f, g not compatibly sized with solver'
+							'\nsolver dimensions ({}, {})\n provided: '
+							'({}{})'.format(self.m, self.n, f.size, g.size))
+
+				K = len(f_list)
+				m, n = self.shape
+				self.settings.update(**options)
+				settings_bytes = bytes(self.settings.c)
+				out = self.__share('output', (K, 2 * (m + n)))
+				name = self.__shm['output'][0].name
+				infos, outputs = [], []
+
+				try:
+					tasks = [(k, f.buffer, g.buffer, settings_bytes, name, K)
+							 for k, (f, g) in enumerate(zip(f_list, g_list))]
+					infos = [SolverInfo() for k in range(K)]
+					outputs = [SolverOutput(m, n) for k in range(K)]
+					for k, info_bytes in self.__pool.imap_unordered(
+							_pool_worker_solve, tasks):
+						infos[k].c = PogsInfo.from_buffer_copy(info_bytes)
+						outputs[k].x[:] = out[k, :n]
+						outputs[k].y[:] = out[k, n:n + m]
+						outputs[k].mu[:] = out[k, n + m:2 * n + m]
+						outputs[k].nu[:] = out[k, 2 * n + m:]
+				finally:
+					out = None
+					self.__release('output')
+				return infos, outputs
+
+			def __release(self, key):
+				shm, arr = self.__shm.pop(key)
+				del arr
+				shm.close()
+				shm.unlink()
+
+			def close(self):
+				if self.__pool is not None:
+					self.__pool.close()
+					self.__pool.join()
+					self.__pool = None
+				self.A = None
+				for key in list(self.__shm.keys()):
+					self.__release(key)
+
+			def __enter__(self):
+				return self
+
+			def __exit__(self, *exc):
+				self.close()
+
+			def __del__(self):
+				self.close()
+
+		self.SolverPool = SolverPool
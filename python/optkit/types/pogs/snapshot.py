@@ -0,0 +1,115 @@
+from numpy import ndarray, memmap, zeros, uint8, float32, float64, \
+				  dtype as np_dtype
+from optkit.libs.enums import OKEnums
+
+"""
+Versioned binary snapshot of a dense POGS solver.
+
+A snapshot is a single file: a fixed-size header followed by the arrays
+A_equil, LLT (direct solvers only), d, e, z, z12, zt, zt12 and zprev, each
+starting on a SNAPSHOT_ALIGN-byte boundary. The header records the format
+version, floating point precision (32 or 64 bits), matrix layout (CBLAS
+order), direct/indirect projector, problem dimensions, rho, and the byte
+offset of each array (0: array not stored).
+
+Because the arrays are aligned and stored in the solver's precision and
+layout, a memory mapping of the file can be handed to the C solver as is
+(pogs_load_solver_view): no array is read or copied when loading.
+"""
+SNAPSHOT_MAGIC = b'OKPOGSSN'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ALIGN = 4096
+SNAPSHOT_KEYS = ('A_equil', 'LLT', 'd', 'e', 'z', 'z12', 'zt', 'zt12',
+				 'zprev')
+SNAPSHOT_HEADER = np_dtype([
+		('magic', 'S8'), ('version', '<u4'), ('precision', '<u4'),
+		('order', '<u4'), ('direct', '<u4'), ('m', '<u8'), ('n', '<u8'),
+		('rho', '<f8'), ('offsets', '<u8', (len(SNAPSHOT_KEYS),))])
+
+def _snapshot_layout(m, n, direct):
+	mindim = min(m, n)
+	shapes = {
+			'A_equil': (m, n), 'LLT': (mindim, mindim) if direct else None,
+			'd': (m,), 'e': (n,)}
+	for key in SNAPSHOT_KEYS[4:]:
+		shapes[key] = (m + n,)
+	return shapes
+
+def _aligned(offset):
+	return SNAPSHOT_ALIGN * ((offset + SNAPSHOT_ALIGN - 1) // SNAPSHOT_ALIGN)
+
+def _snapshot_arrays(mm, header):
+	m, n = int(header['m']), int(header['n'])
+	dtype = float32 if header['precision'] == 32 else float64
+	order = 'C' if header['order'] == OKEnums.CblasRowMajor else 'F'
+	shapes = _snapshot_layout(m, n, header['direct'])
+	arrays = {}
+	for idx, key in enumerate(SNAPSHOT_KEYS):
+		offset = int(header['offsets'][idx])
+		if offset == 0 or shapes[key] is None:
+			arrays[key] = None
+		else:
+			arrays[key] = ndarray(shapes[key], dtype=dtype, buffer=mm,
+								  offset=offset, order=order)
+	return arrays
+
+def create_snapshot(filename, m, n, single_precision, order, direct):
+	"""
+	Create (size) a snapshot file for an m x n solver and map it for
+	writing.
+
+	Returns (mm, header, arrays): the mapped file, the header (a record
+	view into mm; rho is to be filled in by the caller) and a dictionary
+	of array views into mm, which can be passed to pogs_extract_solver
+	directly. Call mm.flush() once they are written.
+	"""
+	shapes = _snapshot_layout(m, n, direct)
+	itemsize = 4 if single_precision else 8
+	offsets = zeros(len(SNAPSHOT_KEYS), dtype='<u8')
+	offset = _aligned(SNAPSHOT_HEADER.itemsize)
+	for idx, key in enumerate(SNAPSHOT_KEYS):
+		if shapes[key] is None:
+			continue
+		offsets[idx] = offset
+		size = 1
+		for dim in shapes[key]:
+			size *= dim
+		offset = _aligned(offset + max(1, size) * itemsize)
+
+	mm = memmap(filename, dtype=uint8, mode='w+', shape=(offset,))
+	header = mm[:SNAPSHOT_HEADER.itemsize].view(SNAPSHOT_HEADER)[0]
+	header['magic'] = SNAPSHOT_MAGIC
+	header['version'] = SNAPSHOT_VERSION
+	header['precision'] = 32 if single_precision else 64
+	header['order'] = order
+	header['direct'] = int(bool(direct))
+	header['m'] = m
+	header['n'] = n
+	header['rho'] = 1.
+	header['offsets'] = offsets
+	return mm, header, _snapshot_arrays(mm, header)
+
+def open_snapshot(filename):
+	"""
+	Map a snapshot file copy-on-write (the file itself is never modified).
+
+	Returns (mm, header, arrays), as create_snapshot(). Pages of the
+	arrays are only read from disk when first touched.
+	"""
+	mm = memmap(filename, dtype=uint8, mode='c')
+	if mm.size < SNAPSHOT_HEADER.itemsize:
+		raise ValueError('{} is not a POGS snapshot'.format(filename))
+	header = mm[:SNAPSHOT_HEADER.itemsize].view(SNAPSHOT_HEADER)[0]
+	if header['magic'] != SNAPSHOT_MAGIC:
+		raise ValueError('{} is not a POGS snapshot'.format(filename))
+	if header['version'] > SNAPSHOT_VERSION:
+		raise ValueError(
+				'snapshot version {} not supported (at most {})'.format(
+				header['version'], SNAPSHOT_VERSION))
+	if header['precision'] not in (32, 64):
+		raise ValueError('snapshot precision {} not recognized'.format(
+						 header['precision']))
+	if header['order'] not in (OKEnums.CblasRowMajor, OKEnums.CblasColMajor):
+		raise ValueError('snapshot layout {} not recognized'.format(
+						 header['order']))
+	return mm, header, _snapshot_arrays(mm, header)
@@ -1,3 +1,4 @@
+#include <pthread.h>
 #include "optkit_dense.h"
 
 #ifdef __cplusplus
@@ -24,6 +25,78 @@ inline void __matrix_set_colmajor(matrix * A, size_t i, size_t j, ok_float x)
 	A->data[i + j * A->ld] = x;
 }
 
+/*
+ * Cholesky backends, configured process-wide (see optkit_dense.h).
+ * The settings are read once per factorization, under cholesky_mutex,
+ * so a change affects only factorizations started afterwards.
+ */
+#ifndef OPTKIT_CHOLESKY_DEFAULT_BLOCK
+#define OPTKIT_CHOLESKY_DEFAULT_BLOCK 128
+#endif
+
+static OPTKIT_CHOLESKY_METHOD __cholesky_method = OkCholeskyAuto;
+static size_t __cholesky_blk_dim = OPTKIT_CHOLESKY_DEFAULT_BLOCK;
+static pthread_mutex_t cholesky_mutex = PTHREAD_MUTEX_INITIALIZER;
+
+#ifdef OPTKIT_LAPACK
+#ifndef FLOAT
+#define LAPACK(x) d ## x ## _
+#else
+#define LAPACK(x) s ## x ## _
+#endif
+void LAPACK(potrf)(const char * uplo, const int * n, ok_float * a,
+	const int * lda, int * info);
+#endif
+
+ok_status linalg_cholesky_lapack_available(int * available)
+{
+	if (!available)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+#ifdef OPTKIT_LAPACK
+	*available = 1;
+#else
+	*available = 0;
+#endif
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_cholesky_set_method(const OPTKIT_CHOLESKY_METHOD method)
+{
+	int lapack;
+	linalg_cholesky_lapack_available(&lapack);
+	if (method != OkCholeskyAuto && method != OkCholeskySerial &&
+		method != OkCholeskyTasks && method != OkCholeskyLapack)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+	if (method == OkCholeskyLapack && !lapack)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+	pthread_mutex_lock(&cholesky_mutex);
+	__cholesky_method = method;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+/* blk_dim = 0 restores the default block size */
+ok_status linalg_cholesky_set_block_size(const size_t blk_dim)
+{
+	pthread_mutex_lock(&cholesky_mutex);
+	__cholesky_blk_dim = blk_dim > 0 ?
+		blk_dim : OPTKIT_CHOLESKY_DEFAULT_BLOCK;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_cholesky_get_config(OPTKIT_CHOLESKY_METHOD * method,
+	size_t * blk_dim)
+{
+	if (!method || !blk_dim)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	pthread_mutex_lock(&cholesky_mutex);
+	*method = __cholesky_method;
+	*blk_dim = __cholesky_blk_dim;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
 /* Non-Block Cholesky. */
 static ok_status __linalg_cholesky_decomp_noblk(void * linalg_handle, matrix *A)
 {
@@ -64,32 +137,21 @@ static ok_status __linalg_cholesky_decomp_noblk(void * linalg_handle, matrix *A)
 }
 
 /*
- * Block Cholesky.
- *   l11 l11^ok_float = a11
+ * Serial right-looking block Cholesky.
+ *   l11 l11^T = a11
  *   l21 = a21 l11^(-T)
  *   a22 = a22 - l21 l21^T
- *
- * Stores result in Lower triangular part.
  */
-ok_status linalg_cholesky_decomp(void * linalg_handle, matrix * A)
+static ok_status __linalg_cholesky_decomp_serial(void * linalg_handle,
+	matrix * A, const size_t blk_dim)
 {
-	OK_CHECK_MATRIX(A);
-
 	matrix L11, L21, A22;
-	size_t n = A->size1, blk_dim, i, n11;
+	size_t n = A->size1, i, n11;
 
 	L11.data = OK_NULL;
 	L21.data = OK_NULL;
 	A22.data = OK_NULL;
 
-	/* block dimension borrowed from Eigen. */
-	blk_dim = ((n / 128) * 16) < 8 ? (n / 128) * 16 : 8;
-	blk_dim = blk_dim > 128 ? blk_dim : 128;
-
-	/* check A square */
-	if (A->size1 != A->size2)
-		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
-
 	for (i = 0; i < n; i += blk_dim) {
 		n11 = blk_dim < n - i ? blk_dim : n - i;
 
@@ -98,26 +160,239 @@ ok_status linalg_cholesky_decomp(void * linalg_handle, matrix * A)
 		OK_RETURNIF_ERR( __linalg_cholesky_decomp_noblk(linalg_handle,
 			&L11) );
 
-		if (i + blk_dim >= n)
+		if (i + n11 >= n)
 			break;
 
-                /* L21 = A21 L21^-ok_float */
+		/* L21 = A21 L11^-T */
 		OK_RETURNIF_ERR( matrix_submatrix(&L21, A, i + n11, i,
 			n - i - n11, n11) );
 		OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasRight,
 			CblasLower, CblasTrans, CblasNonUnit, kOne, &L11,
 			&L21) );
 
-		/* A22 -= L21*L21^ok_float */
-		OK_RETURNIF_ERR( matrix_submatrix(&A22, A, i + blk_dim,
-			i + blk_dim, n - i - blk_dim, n - i - blk_dim) );
-
+		/* A22 -= L21*L21^T */
+		OK_RETURNIF_ERR( matrix_submatrix(&A22, A, i + n11, i + n11,
+			n - i - n11, n - i - n11) );
 		OK_RETURNIF_ERR( blas_syrk(linalg_handle, CblasLower,
 			CblasNoTrans, -kOne, &L21, kOne, &A22) );
 	}
 	return OPTKIT_SUCCESS;
 }
 
+/*
+ * Task-parallel right-looking tiled Cholesky.
+ *
+ * A is split into nt x nt tiles of dimension blk_dim (the last row and
+ * column of tiles may be smaller). Step k factors tile (k, k), solves
+ * for the tiles (i, k) below it and updates the trailing tiles (i, j),
+ * k < j <= i, each as an OpenMP task. Tasks are ordered only by the
+ * tiles they read and write, so the updates of step k overlap with the
+ * panel factorization of step k + 1.
+ *
+ * The first error raised by any task is returned; tasks started after
+ * an error do no work. Tasks poll the shared error with atomic reads,
+ * and record theirs with an atomic write, serialized among writers.
+ */
+static ok_status __cholesky_task_err_get(const ok_status * err)
+{
+	ok_status e;
+	#ifdef _OPENMP
+	#pragma omp atomic read
+	#endif
+	e = *err;
+	return e;
+}
+
+static void __cholesky_task_err_set(ok_status * err, ok_status task_err)
+{
+	#ifdef _OPENMP
+	#pragma omp critical(optkit_cholesky_err)
+	#endif
+	{
+		if (!__cholesky_task_err_get(err)) {
+			#ifdef _OPENMP
+			#pragma omp atomic write
+			#endif
+			*err = task_err;
+		}
+	}
+}
+
+static ok_status __linalg_cholesky_tile(matrix * tile, matrix * A,
+	const size_t i, const size_t j, const size_t blk_dim)
+{
+	const size_t n = A->size1;
+	const size_t n1 = blk_dim < n - i * blk_dim ? blk_dim : n - i * blk_dim;
+	const size_t n2 = blk_dim < n - j * blk_dim ? blk_dim : n - j * blk_dim;
+	return matrix_submatrix(tile, A, i * blk_dim, j * blk_dim, n1, n2);
+}
+
+static ok_status __linalg_cholesky_decomp_tasks(void * linalg_handle,
+	matrix * A, const size_t blk_dim)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	const size_t nt = (A->size1 + blk_dim - 1) / blk_dim;
+	char * tiles = OK_NULL;
+	size_t i, j, k;
+
+	/* one dependence token per tile (lower triangle, row-major) */
+	ok_alloc(tiles, nt * nt * sizeof(*tiles));
+	if (!tiles)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	#ifdef _OPENMP
+	#pragma omp parallel
+	#pragma omp single
+	#endif
+	for (k = 0; k < nt; ++k) {
+		/* L_kk = chol(A_kk) */
+		#ifdef _OPENMP
+		#pragma omp task firstprivate(k) shared(err) \
+			depend(inout: tiles[k * nt + k])
+		#endif
+		{
+			ok_status task_err = OPTKIT_SUCCESS;
+			matrix Akk;
+			Akk.data = OK_NULL;
+			if (!__cholesky_task_err_get(&err)) {
+				OK_CHECK_ERR( task_err, __linalg_cholesky_tile(&Akk,
+					A, k, k, blk_dim) );
+				OK_CHECK_ERR( task_err,
+					__linalg_cholesky_decomp_noblk(
+						linalg_handle, &Akk) );
+			}
+			if (task_err)
+				__cholesky_task_err_set(&err, task_err);
+		}
+
+		/* L_ik = A_ik L_kk^-T */
+		for (i = k + 1; i < nt; ++i) {
+			#ifdef _OPENMP
+			#pragma omp task firstprivate(i, k) shared(err) \
+				depend(in: tiles[k * nt + k]) \
+				depend(inout: tiles[i * nt + k])
+			#endif
+			{
+				ok_status task_err = OPTKIT_SUCCESS;
+				matrix Lkk, Aik;
+				Lkk.data = OK_NULL;
+				Aik.data = OK_NULL;
+				if (!__cholesky_task_err_get(&err)) {
+					OK_CHECK_ERR( task_err, __linalg_cholesky_tile(
+						&Lkk, A, k, k, blk_dim) );
+					OK_CHECK_ERR( task_err, __linalg_cholesky_tile(
+						&Aik, A, i, k, blk_dim) );
+					OK_CHECK_ERR( task_err, blas_trsm(linalg_handle,
+						CblasRight, CblasLower, CblasTrans,
+						CblasNonUnit, kOne, &Lkk, &Aik) );
+				}
+				if (task_err)
+					__cholesky_task_err_set(&err, task_err);
+			}
+		}
+
+		/* A_ij -= L_ik L_jk^T, k < j <= i */
+		for (i = k + 1; i < nt; ++i)
+			for (j = k + 1; j <= i; ++j) {
+				#ifdef _OPENMP
+				#pragma omp task firstprivate(i, j, k) shared(err) \
+					depend(in: tiles[i * nt + k], tiles[j * nt + k]) \
+					depend(inout: tiles[i * nt + j])
+				#endif
+				{
+					ok_status task_err = OPTKIT_SUCCESS;
+					matrix Lik, Ljk, Aij;
+					Lik.data = OK_NULL;
+					Ljk.data = OK_NULL;
+					Aij.data = OK_NULL;
+					if (!__cholesky_task_err_get(&err)) {
+						OK_CHECK_ERR( task_err,
+							__linalg_cholesky_tile(&Lik, A,
+								i, k, blk_dim) );
+						OK_CHECK_ERR( task_err,
+							__linalg_cholesky_tile(&Aij, A,
+								i, j, blk_dim) );
+						if (i == j) {
+							OK_CHECK_ERR( task_err, blas_syrk(
+								linalg_handle, CblasLower,
+								CblasNoTrans, -kOne, &Lik,
+								kOne, &Aij) );
+						} else {
+							OK_CHECK_ERR( task_err,
+								__linalg_cholesky_tile(&Ljk,
+									A, j, k, blk_dim) );
+							OK_CHECK_ERR( task_err, blas_gemm(
+								linalg_handle, CblasNoTrans,
+								CblasTrans, -kOne, &Lik, &Ljk,
+								kOne, &Aij) );
+						}
+					}
+					if (task_err)
+						__cholesky_task_err_set(&err, task_err);
+				}
+			}
+	}
+
+	ok_free(tiles);
+	return err;
+}
+
+#ifdef OPTKIT_LAPACK
+/*
+ * LAPACK potrf. The lower triangle of a row-major matrix is the upper
+ * triangle of its (column-major) transpose.
+ */
+static ok_status __linalg_cholesky_decomp_lapack(matrix * A)
+{
+	const char uplo = (A->order == CblasColMajor) ? 'L' : 'U';
+	const int n = (int) A->size1, lda = (int) A->ld;
+	int info = 0;
+
+	LAPACK(potrf)(&uplo, &n, A->data, &lda, &info);
+	if (info > 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+	else if (info < 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR );
+	return OPTKIT_SUCCESS;
+}
+#endif
+
+/*
+ * Cholesky factorization A = LL^T, by the method and block size set
+ * with linalg_cholesky_set_method/_set_block_size:
+ *
+ *	OkCholeskyAuto:		LAPACK potrf if optkit was built with it,
+ *				the task-parallel tiled algorithm otherwise,
+ *	OkCholeskySerial:	serial right-looking block algorithm,
+ *	OkCholeskyTasks:	task-parallel tiled algorithm (OpenMP
+ *				tasks; serial without OpenMP),
+ *	OkCholeskyLapack:	LAPACK potrf.
+ *
+ * Stores result in Lower triangular part.
+ */
+ok_status linalg_cholesky_decomp(void * linalg_handle, matrix * A)
+{
+	OK_CHECK_MATRIX(A);
+	OPTKIT_CHOLESKY_METHOD method;
+	size_t blk_dim;
+	OK_RETURNIF_ERR( linalg_cholesky_get_config(&method, &blk_dim) );
+
+	/* check A square */
+	if (A->size1 != A->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	if (A->size1 == 0)
+		return OPTKIT_SUCCESS;
+
+#ifdef OPTKIT_LAPACK
+	if (method == OkCholeskyAuto || method == OkCholeskyLapack)
+		return __linalg_cholesky_decomp_lapack(A);
+#endif
+	if (method == OkCholeskySerial || A->size1 <= blk_dim)
+		return __linalg_cholesky_decomp_serial(linalg_handle, A,
+			blk_dim);
+	return __linalg_cholesky_decomp_tasks(linalg_handle, A, blk_dim);
+}
+
 /* Cholesky solve */
 ok_status linalg_cholesky_svx(void * linalg_handle, const matrix * L, vector * x)
 {
@@ -127,6 +402,252 @@ ok_status linalg_cholesky_svx(void * linalg_handle, const matrix * L, vector * x
 		x);
 }
 
+/*
+ * Rectangular full packed (RFP) storage, see optkit_dense.h.
+ *
+ * with n1 = n - n / 2 and n2 = n / 2, the symmetric matrix (or its lower
+ * Cholesky factor) is split into blocks
+ *
+ *	[ M11      ]
+ *	[ M21  M22 ],
+ *
+ * and stored in the (2 * n2 + 1) x n1 matrix R: the lower triangle of
+ * M11 and the upper triangle of M22 (of L22ᵀ, for a factor) share the
+ * first n2 + 1 rows, M21 fills the last n2 rows. All blocks are views of
+ * R, in the layout of R.
+ */
+ok_status linalg_rfp_size(const size_t n, size_t * size1, size_t * size2)
+{
+	OK_CHECK_PTR(size1);
+	OK_CHECK_PTR(size2);
+	*size1 = 2 * (n / 2) + 1;
+	*size2 = n - n / 2;
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_rfp_blocks(const matrix * R, matrix * L11, matrix * L21,
+	matrix * U22)
+{
+	OK_CHECK_MATRIX(R);
+	OK_CHECK_PTR(L11);
+	OK_CHECK_PTR(L21);
+	OK_CHECK_PTR(U22);
+	matrix * R_ = (matrix *) R;
+	const size_t n1 = R->size2, n2 = R->size1 / 2;
+
+	if (R->size1 % 2 != 1 || n1 < n2 || n1 > n2 + 1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( matrix_submatrix(L11, R_, n2 + 1 - n1, 0, n1, n1) );
+	OK_RETURNIF_ERR( matrix_submatrix(L21, R_, n2 + 1, 0, n2, n1) );
+	return OK_SCAN_ERR( matrix_submatrix(U22, R_, 0, n1 - n2, n2, n2) );
+}
+
+/* the transpose of A, viewed in place in the opposite layout */
+static void __matrix_transpose_view(matrix * At, const matrix * A)
+{
+	At->size1 = A->size2;
+	At->size2 = A->size1;
+	At->ld = A->ld;
+	At->data = A->data;
+	At->order = (A->order == CblasRowMajor) ? CblasColMajor : CblasRowMajor;
+}
+
+/*
+ * R = alpha * AᵀA + beta * R (transA == CblasTrans), or
+ * R = alpha * AAᵀ + beta * R (transA == CblasNoTrans), with R in RFP
+ * storage; one SYRK per diagonal block and one GEMM for M21.
+ */
+ok_status linalg_rfp_gram(void * linalg_handle,
+	const enum CBLAS_TRANSPOSE transA, const ok_float alpha,
+	const matrix * A, const ok_float beta, matrix * R)
+{
+	OK_CHECK_MATRIX(A);
+	OK_CHECK_MATRIX(R);
+
+	matrix M11, M21, M22, A1, A2;
+	matrix * A_ = (matrix *) A;
+	const size_t n = (transA == CblasTrans) ? A->size2 : A->size1;
+	const size_t k = (transA == CblasTrans) ? A->size1 : A->size2;
+	const size_t n1 = n - n / 2, n2 = n / 2;
+
+	if (R->size1 != 2 * n2 + 1 || R->size2 != n1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &M11, &M21, &M22) );
+	if (transA == CblasTrans) {
+		OK_RETURNIF_ERR( matrix_submatrix(&A1, A_, 0, 0, k, n1) );
+		OK_RETURNIF_ERR( matrix_submatrix(&A2, A_, 0, n1, k, n2) );
+	} else {
+		OK_RETURNIF_ERR( matrix_submatrix(&A1, A_, 0, 0, n1, k) );
+		OK_RETURNIF_ERR( matrix_submatrix(&A2, A_, n1, 0, n2, k) );
+	}
+
+	OK_RETURNIF_ERR( blas_syrk(linalg_handle, CblasLower, transA, alpha,
+		&A1, beta, &M11) );
+	if (!n2)
+		return OPTKIT_SUCCESS;
+	if (transA == CblasTrans)
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, alpha, &A2, &A1, beta, &M21) );
+	else
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasNoTrans,
+			CblasTrans, alpha, &A2, &A1, beta, &M21) );
+	return OK_SCAN_ERR( blas_syrk(linalg_handle, CblasUpper, transA,
+		alpha, &A2, beta, &M22) );
+}
+
+/*
+ * Cholesky factorization in RFP storage:
+ *	L11 = chol(M11),
+ *	L21 = M21 L11^-T,
+ *	M22 -= L21 L21ᵀ (upper triangle),
+ *	L22 = chol(M22), factored as the lower triangle of the transposed
+ *	view of the upper triangle, which leaves L22ᵀ in place.
+ */
+ok_status linalg_cholesky_decomp_rfp(void * linalg_handle, matrix * R)
+{
+	matrix L11, L21, U22, U22t;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	OK_RETURNIF_ERR( linalg_cholesky_decomp(linalg_handle, &L11) );
+	if (!U22.size1)
+		return OPTKIT_SUCCESS;
+
+	OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasRight, CblasLower,
+		CblasTrans, CblasNonUnit, kOne, &L11, &L21) );
+	OK_RETURNIF_ERR( blas_syrk(linalg_handle, CblasUpper, CblasNoTrans,
+		-kOne, &L21, kOne, &U22) );
+	__matrix_transpose_view(&U22t, &U22);
+	return OK_SCAN_ERR( linalg_cholesky_decomp(linalg_handle, &U22t) );
+}
+
+/* Cholesky solve, L in RFP storage */
+ok_status linalg_cholesky_svx_rfp(void * linalg_handle, const matrix * R,
+	vector * x)
+{
+	OK_CHECK_VECTOR(x);
+
+	matrix L11, L21, U22;
+	vector x1, x2;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	if (x->size != L11.size1 + U22.size1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( vector_subvector(&x1, x, 0, L11.size1) );
+	if (!U22.size1) {
+		OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasLower,
+			CblasNoTrans, CblasNonUnit, &L11, &x1) );
+		return OK_SCAN_ERR( blas_trsv(linalg_handle, CblasLower,
+			CblasTrans, CblasNonUnit, &L11, &x1) );
+	}
+	OK_RETURNIF_ERR( vector_subvector(&x2, x, L11.size1, U22.size1) );
+
+	/* Lx = b: x1 = L11^-1 b1; x2 = L22^-1 (b2 - L21 x1), L22 = U22ᵀ */
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasLower, CblasNoTrans,
+		CblasNonUnit, &L11, &x1) );
+	OK_RETURNIF_ERR( blas_gemv(linalg_handle, CblasNoTrans, -kOne, &L21,
+		&x1, kOne, &x2) );
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasUpper, CblasTrans,
+		CblasNonUnit, &U22, &x2) );
+
+	/* Lᵀx = b: x2 = L22^-T b2; x1 = L11^-T (b1 - L21ᵀ x2) */
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasUpper, CblasNoTrans,
+		CblasNonUnit, &U22, &x2) );
+	OK_RETURNIF_ERR( blas_gemv(linalg_handle, CblasTrans, -kOne, &L21,
+		&x2, kOne, &x1) );
+	return OK_SCAN_ERR( blas_trsv(linalg_handle, CblasLower, CblasTrans,
+		CblasNonUnit, &L11, &x1) );
+}
+
+/* Cholesky solve for the columns of X, L in RFP storage */
+ok_status linalg_cholesky_svx_rfp_batch(void * linalg_handle,
+	const matrix * R, matrix * X)
+{
+	OK_CHECK_MATRIX(X);
+
+	matrix L11, L21, U22, X1, X2;
+	const size_t k = X->size2;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	if (X->size1 != L11.size1 + U22.size1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( matrix_submatrix(&X1, X, 0, 0, L11.size1, k) );
+	OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasLower,
+		CblasNoTrans, CblasNonUnit, kOne, &L11, &X1) );
+	if (U22.size1) {
+		OK_RETURNIF_ERR( matrix_submatrix(&X2, X, L11.size1, 0,
+			U22.size1, k) );
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasNoTrans,
+			CblasNoTrans, -kOne, &L21, &X1, kOne, &X2) );
+		OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasUpper,
+			CblasTrans, CblasNonUnit, kOne, &U22, &X2) );
+		OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasUpper,
+			CblasNoTrans, CblasNonUnit, kOne, &U22, &X2) );
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, -kOne, &L21, &X2, kOne, &X1) );
+	}
+	return OK_SCAN_ERR( blas_trsm(linalg_handle, CblasLeft, CblasLower,
+		CblasTrans, CblasNonUnit, kOne, &L11, &X1) );
+}
+
+/*
+ * Cholesky rank-one update (downdate):
+ *
+ *	overwrite the lower triangular factor L of A = LL' with the factor
+ *	of A + xx' (of A - xx' if downdate is nonzero), in O(n^2).
+ *
+ * x is overwritten. A downdate that would leave the matrix indefinite
+ * fails with OPTKIT_ERROR_DOMAIN, after which L is no longer valid.
+ */
+ok_status linalg_cholesky_update(void * linalg_handle, matrix * L,
+	vector * x, const int downdate)
+{
+	OK_CHECK_MATRIX(L);
+	OK_CHECK_VECTOR(x);
+	if (L->size1 != L->size2 || L->size1 != x->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	const ok_float sign = downdate ? -kOne : kOne;
+	ok_float ljj, xj, r, c, s;
+	vector l, l21, x2;
+	size_t n = L->size1, j;
+
+	l.data = OK_NULL;
+	l21.data = OK_NULL;
+	x2.data = OK_NULL;
+
+	for (j = 0; j < n && !err; ++j) {
+		/* rotate (l_jj, x_j) into (r, 0) */
+		ljj = L->data[j + j * L->ld];
+		xj = x->data[j * x->stride];
+		r = ljj * ljj + sign * xj * xj;
+		if (r <= 0 || ljj == 0)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+		r = MATH(sqrt)(r);
+		c = r / ljj;
+		s = xj / ljj;
+		L->data[j + j * L->ld] = r;
+
+		if (j + 1 == n)
+			break;
+
+		/* l21 = (l21 +/- s * x2) / c; x2 = c * x2 - s * l21 */
+		OK_CHECK_ERR( err, matrix_column(&l, L, j) );
+		OK_CHECK_ERR( err, vector_subvector(&l21, &l, j + 1, n - j - 1) );
+		OK_CHECK_ERR( err, vector_subvector(&x2, x, j + 1, n - j - 1) );
+		OK_CHECK_ERR( err, blas_axpy(linalg_handle, sign * s, &x2, &l21) );
+		OK_CHECK_ERR( err, vector_scale(&l21, kOne / c) );
+		OK_CHECK_ERR( err, vector_scale(&x2, c) );
+		OK_CHECK_ERR( err, blas_axpy(linalg_handle, -s, &l21, &x2) );
+	}
+	return err;
+}
+
 /*
  * if t == CblasTrans, set
  *
@@ -221,6 +742,39 @@ ok_status linalg_matrix_broadcast_vector(matrix * A, const vector * v,
 	return OPTKIT_SUCCESS;
 }
 
+/*
+ * A = diag(d) * A * diag(e), in one pass over A in storage order: the
+ * (parallel) outer loop runs over the rows of a row-major A (columns of a
+ * column-major A), the inner loop over contiguous entries
+ */
+ok_status linalg_matrix_diag_scale(matrix * A, const vector * d,
+	const vector * e)
+{
+	OK_CHECK_MATRIX(A);
+	OK_CHECK_VECTOR(d);
+	OK_CHECK_VECTOR(e);
+
+	const int rowmajor = (A->order == CblasRowMajor);
+	const vector * outer = rowmajor ? d : e;
+	const vector * inner = rowmajor ? e : d;
+	size_t k;
+
+	if (d->size != A->size1 || e->size != A->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	#ifdef _OPENMP
+	#pragma omp parallel for
+	#endif
+	for (k = 0; k < outer->size; ++k) {
+		ok_float * a = A->data + k * A->ld;
+		const ok_float scal = outer->data[k * outer->stride];
+		size_t idx;
+		for (idx = 0; idx < inner->size; ++idx)
+			a[idx] *= scal * inner->data[idx * inner->stride];
+	}
+	return OPTKIT_SUCCESS;
+}
+
 ok_status linalg_matrix_reduce_indmin(indvector * indices, vector * minima,
 	const matrix * A, const enum CBLAS_SIDE side)
 {
@@ -1,3 +1,4 @@
+#include <pthread.h>
 #include "optkit_defs_gpu.h"
 #include "optkit_dense.h"
 
@@ -119,6 +120,54 @@ static __global__ void __block_trsv(ok_float * A, uint iter, uint n, uint ld,
 	__syncthreads();
 }
 
+/*
+ * Cholesky configuration: the GPU factorization always uses its tiled
+ * kernels (tile size kTileSize), the method and block size are recorded
+ * for linalg_cholesky_get_config only, under cholesky_mutex.
+ */
+static OPTKIT_CHOLESKY_METHOD __cholesky_method = OkCholeskyAuto;
+static size_t __cholesky_blk_dim = kTileSize;
+static pthread_mutex_t cholesky_mutex = PTHREAD_MUTEX_INITIALIZER;
+
+ok_status linalg_cholesky_lapack_available(int * available)
+{
+	if (!available)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	*available = 0;
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_cholesky_set_method(const OPTKIT_CHOLESKY_METHOD method)
+{
+	if (method != OkCholeskyAuto && method != OkCholeskySerial &&
+		method != OkCholeskyTasks)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+	pthread_mutex_lock(&cholesky_mutex);
+	__cholesky_method = method;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_cholesky_set_block_size(const size_t blk_dim)
+{
+	pthread_mutex_lock(&cholesky_mutex);
+	__cholesky_blk_dim = blk_dim > 0 ? blk_dim : kTileSize;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_cholesky_get_config(OPTKIT_CHOLESKY_METHOD * method,
+	size_t * blk_dim)
+{
+	if (!method || !blk_dim)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	pthread_mutex_lock(&cholesky_mutex);
+	*method = __cholesky_method;
+	*blk_dim = __cholesky_blk_dim;
+	pthread_mutex_unlock(&cholesky_mutex);
+	return OPTKIT_SUCCESS;
+}
+
 /*
  * Block Cholesky.
  *   l11 l11^T = a11
@@ -200,6 +249,238 @@ ok_status linalg_cholesky_svx(void * linalg_handle, const matrix * L,
 		CblasNonUnit, L, x) );
 }
 
+/* Rectangular full packed (RFP) storage, see optkit_dense.c */
+ok_status linalg_rfp_size(const size_t n, size_t * size1, size_t * size2)
+{
+	OK_CHECK_PTR(size1);
+	OK_CHECK_PTR(size2);
+	*size1 = 2 * (n / 2) + 1;
+	*size2 = n - n / 2;
+	return OPTKIT_SUCCESS;
+}
+
+ok_status linalg_rfp_blocks(const matrix * R, matrix * L11, matrix * L21,
+	matrix * U22)
+{
+	OK_CHECK_MATRIX(R);
+	OK_CHECK_PTR(L11);
+	OK_CHECK_PTR(L21);
+	OK_CHECK_PTR(U22);
+	matrix * R_ = (matrix *) R;
+	const size_t n1 = R->size2, n2 = R->size1 / 2;
+
+	if (R->size1 % 2 != 1 || n1 < n2 || n1 > n2 + 1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( matrix_submatrix(L11, R_, n2 + 1 - n1, 0, n1, n1) );
+	OK_RETURNIF_ERR( matrix_submatrix(L21, R_, n2 + 1, 0, n2, n1) );
+	return OK_SCAN_ERR( matrix_submatrix(U22, R_, 0, n1 - n2, n2, n2) );
+}
+
+/* the transpose of A, viewed in place in the opposite layout */
+static void __matrix_transpose_view(matrix * At, const matrix * A)
+{
+	At->size1 = A->size2;
+	At->size2 = A->size1;
+	At->ld = A->ld;
+	At->data = A->data;
+	At->order = (A->order == CblasRowMajor) ? CblasColMajor : CblasRowMajor;
+}
+
+/*
+ * R = alpha * AᵀA + beta * R (transA == CblasTrans), or
+ * R = alpha * AAᵀ + beta * R (transA == CblasNoTrans), with R in RFP
+ * storage; one SYRK per diagonal block and one GEMM for M21.
+ */
+ok_status linalg_rfp_gram(void * linalg_handle,
+	const enum CBLAS_TRANSPOSE transA, const ok_float alpha,
+	const matrix * A, const ok_float beta, matrix * R)
+{
+	OK_CHECK_MATRIX(A);
+	OK_CHECK_MATRIX(R);
+
+	matrix M11, M21, M22, A1, A2;
+	matrix * A_ = (matrix *) A;
+	const size_t n = (transA == CblasTrans) ? A->size2 : A->size1;
+	const size_t k = (transA == CblasTrans) ? A->size1 : A->size2;
+	const size_t n1 = n - n / 2, n2 = n / 2;
+
+	if (R->size1 != 2 * n2 + 1 || R->size2 != n1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &M11, &M21, &M22) );
+	if (transA == CblasTrans) {
+		OK_RETURNIF_ERR( matrix_submatrix(&A1, A_, 0, 0, k, n1) );
+		OK_RETURNIF_ERR( matrix_submatrix(&A2, A_, 0, n1, k, n2) );
+	} else {
+		OK_RETURNIF_ERR( matrix_submatrix(&A1, A_, 0, 0, n1, k) );
+		OK_RETURNIF_ERR( matrix_submatrix(&A2, A_, n1, 0, n2, k) );
+	}
+
+	OK_RETURNIF_ERR( blas_syrk(linalg_handle, CblasLower, transA, alpha,
+		&A1, beta, &M11) );
+	if (!n2)
+		return OPTKIT_SUCCESS;
+	if (transA == CblasTrans)
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, alpha, &A2, &A1, beta, &M21) );
+	else
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasNoTrans,
+			CblasTrans, alpha, &A2, &A1, beta, &M21) );
+	return OK_SCAN_ERR( blas_syrk(linalg_handle, CblasUpper, transA,
+		alpha, &A2, beta, &M22) );
+}
+
+/*
+ * Cholesky factorization in RFP storage:
+ *	L11 = chol(M11),
+ *	L21 = M21 L11^-T,
+ *	M22 -= L21 L21ᵀ (upper triangle),
+ *	L22 = chol(M22), factored as the lower triangle of the transposed
+ *	view of the upper triangle, which leaves L22ᵀ in place.
+ */
+ok_status linalg_cholesky_decomp_rfp(void * linalg_handle, matrix * R)
+{
+	matrix L11, L21, U22, U22t;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	OK_RETURNIF_ERR( linalg_cholesky_decomp(linalg_handle, &L11) );
+	if (!U22.size1)
+		return OPTKIT_SUCCESS;
+
+	OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasRight, CblasLower,
+		CblasTrans, CblasNonUnit, kOne, &L11, &L21) );
+	OK_RETURNIF_ERR( blas_syrk(linalg_handle, CblasUpper, CblasNoTrans,
+		-kOne, &L21, kOne, &U22) );
+	__matrix_transpose_view(&U22t, &U22);
+	return OK_SCAN_ERR( linalg_cholesky_decomp(linalg_handle, &U22t) );
+}
+
+/* Cholesky solve, L in RFP storage */
+ok_status linalg_cholesky_svx_rfp(void * linalg_handle, const matrix * R,
+	vector * x)
+{
+	OK_CHECK_VECTOR(x);
+
+	matrix L11, L21, U22;
+	vector x1, x2;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	if (x->size != L11.size1 + U22.size1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( vector_subvector(&x1, x, 0, L11.size1) );
+	if (!U22.size1) {
+		OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasLower,
+			CblasNoTrans, CblasNonUnit, &L11, &x1) );
+		return OK_SCAN_ERR( blas_trsv(linalg_handle, CblasLower,
+			CblasTrans, CblasNonUnit, &L11, &x1) );
+	}
+	OK_RETURNIF_ERR( vector_subvector(&x2, x, L11.size1, U22.size1) );
+
+	/* Lx = b: x1 = L11^-1 b1; x2 = L22^-1 (b2 - L21 x1), L22 = U22ᵀ */
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasLower, CblasNoTrans,
+		CblasNonUnit, &L11, &x1) );
+	OK_RETURNIF_ERR( blas_gemv(linalg_handle, CblasNoTrans, -kOne, &L21,
+		&x1, kOne, &x2) );
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasUpper, CblasTrans,
+		CblasNonUnit, &U22, &x2) );
+
+	/* Lᵀx = b: x2 = L22^-T b2; x1 = L11^-T (b1 - L21ᵀ x2) */
+	OK_RETURNIF_ERR( blas_trsv(linalg_handle, CblasUpper, CblasNoTrans,
+		CblasNonUnit, &U22, &x2) );
+	OK_RETURNIF_ERR( blas_gemv(linalg_handle, CblasTrans, -kOne, &L21,
+		&x2, kOne, &x1) );
+	return OK_SCAN_ERR( blas_trsv(linalg_handle, CblasLower, CblasTrans,
+		CblasNonUnit, &L11, &x1) );
+}
+
+/* Cholesky solve for the columns of X, L in RFP storage */
+ok_status linalg_cholesky_svx_rfp_batch(void * linalg_handle,
+	const matrix * R, matrix * X)
+{
+	OK_CHECK_MATRIX(X);
+
+	matrix L11, L21, U22, X1, X2;
+	const size_t k = X->size2;
+
+	OK_RETURNIF_ERR( linalg_rfp_blocks(R, &L11, &L21, &U22) );
+	if (X->size1 != L11.size1 + U22.size1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( matrix_submatrix(&X1, X, 0, 0, L11.size1, k) );
+	OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasLower,
+		CblasNoTrans, CblasNonUnit, kOne, &L11, &X1) );
+	if (U22.size1) {
+		OK_RETURNIF_ERR( matrix_submatrix(&X2, X, L11.size1, 0,
+			U22.size1, k) );
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasNoTrans,
+			CblasNoTrans, -kOne, &L21, &X1, kOne, &X2) );
+		OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasUpper,
+			CblasTrans, CblasNonUnit, kOne, &U22, &X2) );
+		OK_RETURNIF_ERR( blas_trsm(linalg_handle, CblasLeft, CblasUpper,
+			CblasNoTrans, CblasNonUnit, kOne, &U22, &X2) );
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, -kOne, &L21, &X2, kOne, &X1) );
+	}
+	return OK_SCAN_ERR( blas_trsm(linalg_handle, CblasLeft, CblasLower,
+		CblasTrans, CblasNonUnit, kOne, &L11, &X1) );
+}
+
+/*
+ * Cholesky rank-one update (downdate) of the factor L by x, see
+ * optkit_dense.c; the per-column rotations read and write the diagonal
+ * of L and the pivots of x through host copies.
+ */
+ok_status linalg_cholesky_update(void * linalg_handle, matrix * L,
+	vector * x, const int downdate)
+{
+	OK_CHECK_MATRIX(L);
+	OK_CHECK_VECTOR(x);
+	if (!linalg_handle)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (L->size1 != L->size2 || L->size1 != x->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	const ok_float sign = downdate ? -kOne : kOne;
+	ok_float ljj, xj, r, c, s;
+	vector l, l21, x2;
+	size_t n = L->size1, j;
+
+	l.data = OK_NULL;
+	l21.data = OK_NULL;
+	x2.data = OK_NULL;
+
+	for (j = 0; j < n && !err; ++j) {
+		OK_RETURNIF_ERR( ok_memcpy_gpu(&ljj, L->data + j + j * L->ld,
+			sizeof(ljj)) );
+		OK_RETURNIF_ERR( ok_memcpy_gpu(&xj, x->data + j * x->stride,
+			sizeof(xj)) );
+		r = ljj * ljj + sign * xj * xj;
+		if (r <= 0 || ljj == 0)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+		r = MATH(sqrt)(r);
+		c = r / ljj;
+		s = xj / ljj;
+		OK_RETURNIF_ERR( ok_memcpy_gpu(L->data + j + j * L->ld, &r,
+			sizeof(r)) );
+
+		if (j + 1 == n)
+			break;
+
+		OK_CHECK_ERR( err, matrix_column(&l, L, j) );
+		OK_CHECK_ERR( err, vector_subvector(&l21, &l, j + 1, n - j - 1) );
+		OK_CHECK_ERR( err, vector_subvector(&x2, x, j + 1, n - j - 1) );
+		OK_CHECK_ERR( err, blas_axpy(linalg_handle, sign * s, &x2, &l21) );
+		OK_CHECK_ERR( err, vector_scale(&l21, kOne / c) );
+		OK_CHECK_ERR( err, vector_scale(&x2, c) );
+		OK_CHECK_ERR( err, blas_axpy(linalg_handle, -s, &l21, &x2) );
+	}
+	return err;
+}
+
 #ifdef __cplusplus
 }
 #endif
@@ -865,6 +1146,45 @@ static ok_status __linalg_matrix_broadcast_vector(matrix_<T> * A,
 	return OK_STATUS_CUDA;
 }
 
+/* A = diag(d) * A * diag(e), one thread per entry in storage order */
+template <typename T>
+static __global__ void __diag_scale(T * A, size_t size1, size_t size2,
+	size_t ld, int rowmajor, const T * d, size_t stride_d, const T * e,
+	size_t stride_e)
+{
+	size_t grid_stride = blockDim.x * gridDim.x;
+	size_t i, j, idx, outer, inner;
+	size_t inner_dim = (rowmajor) ? size2 : size1;
+
+	for (idx = blockIdx.x * blockDim.x + threadIdx.x; idx < size1 * size2;
+		idx += grid_stride) {
+		outer = idx / inner_dim;
+		inner = idx % inner_dim;
+		i = (rowmajor) ? outer : inner;
+		j = (rowmajor) ? inner : outer;
+		A[outer * ld + inner] *= d[i * stride_d] * e[j * stride_e];
+	}
+}
+
+template<typename T>
+static ok_status __linalg_matrix_diag_scale(matrix_<T> * A,
+	const vector_<T> * d, const vector_<T> * e)
+{
+	OK_CHECK_MATRIX(A);
+	OK_CHECK_VECTOR(d);
+	OK_CHECK_VECTOR(e);
+
+	if (d->size != A->size1 || e->size != A->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	__diag_scale<T><<<calc_grid_dim(A->size1 * A->size2), kBlockSize>>>(
+		A->data, A->size1, A->size2, A->ld,
+		A->order == CblasRowMajor, d->data, d->stride, e->data,
+		e->stride);
+	cudaDeviceSynchronize();
+	return OK_STATUS_CUDA;
+}
+
 template<typename T>
 static ok_status __linalg_matrix_reduce_indmin(vector_<size_t> * indices,
 	vector_<T> * minima, const matrix_<T> * A, const enum CBLAS_SIDE side)
@@ -942,6 +1262,12 @@ ok_status linalg_matrix_broadcast_vector(matrix * A, const vector * v,
 		operation, side) );
 }
 
+ok_status linalg_matrix_diag_scale(matrix * A, const vector * d,
+	const vector * e)
+{
+	return OK_SCAN_ERR( __linalg_matrix_diag_scale<ok_float>(A, d, e) );
+}
+
 ok_status linalg_matrix_reduce_indmin(indvector * indices, vector * minima,
 	const matrix * A, const enum CBLAS_SIDE side)
 {
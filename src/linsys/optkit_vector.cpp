@@ -14,9 +14,7 @@ static ok_status ok_rand_u01(ok_float * x, const size_t size,
 	std::uniform_real_distribution<ok_float> dist(kZero, kOne);
 	uint i;
 
-	#ifdef _OPENMP
-	#pragma omp parallel for
-	#endif
+	/* serial: the generator state is not safe to share across threads */
 	for (i = 0; i < size; ++i)
 		x[i * stride] = dist(generator);
 	return OPTKIT_SUCCESS;
@@ -452,6 +450,90 @@ ok_status vector_exp(vector * v)
 	return OPTKIT_SUCCESS;
 }
 
+/*
+ * fused elementwise kernels: each makes a single pass over its operands,
+ * in place of a memcpy/set_all followed by one BLAS axpy per term
+ */
+
+/* z = alpha * x + beta * y */
+ok_status vector_axpby(vector * z, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y)
+{
+	size_t i;
+	OK_CHECK_VECTOR(z);
+	OK_CHECK_VECTOR(x);
+	OK_CHECK_VECTOR(y);
+	if (z->size != x->size || z->size != y->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	#ifdef _OPENMP
+	#pragma omp parallel for
+	#endif
+	for (i = 0; i < z->size; ++i)
+		z->data[i * z->stride] = alpha * x->data[i * x->stride] +
+			beta * y->data[i * y->stride];
+	return OPTKIT_SUCCESS;
+}
+
+/* w = alpha * x + beta * y + gamma * z */
+ok_status vector_axpbypcz(vector * w, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y, const ok_float gamma,
+	const vector * z)
+{
+	size_t i;
+	OK_CHECK_VECTOR(w);
+	OK_CHECK_VECTOR(x);
+	OK_CHECK_VECTOR(y);
+	OK_CHECK_VECTOR(z);
+	if (w->size != x->size || w->size != y->size || w->size != z->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	#ifdef _OPENMP
+	#pragma omp parallel for
+	#endif
+	for (i = 0; i < w->size; ++i)
+		w->data[i * w->stride] = alpha * x->data[i * x->stride] +
+			beta * y->data[i * y->stride] +
+			gamma * z->data[i * z->stride];
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * over-relaxed ADMM dual update, in one pass:
+ *
+ *	zt12 = z12 - z_prev + zt
+ *	zt   = zt + alpha * z12 + (1 - alpha) * z_prev - z
+ */
+ok_status vector_relaxed_dual_update(vector * zt12, vector * zt,
+	const vector * z12, const vector * z_prev, const vector * z,
+	const ok_float alpha)
+{
+	size_t i, n;
+	ok_float zt_i, z12_i, prev_i;
+	OK_CHECK_VECTOR(zt12);
+	OK_CHECK_VECTOR(zt);
+	OK_CHECK_VECTOR(z12);
+	OK_CHECK_VECTOR(z_prev);
+	OK_CHECK_VECTOR(z);
+	n = zt->size;
+	if (zt12->size != n || z12->size != n || z_prev->size != n ||
+		z->size != n)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	#ifdef _OPENMP
+	#pragma omp parallel for private(zt_i, z12_i, prev_i)
+	#endif
+	for (i = 0; i < n; ++i) {
+		zt_i = zt->data[i * zt->stride];
+		z12_i = z12->data[i * z12->stride];
+		prev_i = z_prev->data[i * z_prev->stride];
+		zt12->data[i * zt12->stride] = z12_i - prev_i + zt_i;
+		zt->data[i * zt->stride] = zt_i + alpha * z12_i +
+			(kOne - alpha) * prev_i - z->data[i * z->stride];
+	}
+	return OPTKIT_SUCCESS;
+}
+
 ok_status vector_indmin(const vector * v, size_t * idx)
 	{ return vector_indmin_<ok_float>(v, OK_FLOAT_MAX, idx); }
 
@@ -360,6 +360,102 @@ ok_status vector_exp(vector * v)
 	return OK_STATUS_CUDA;
 }
 
+template<typename T>
+static __global__ void __vector_axpbypcz(T * w, size_t stride_w, T alpha,
+	const T * x, size_t stride_x, T beta, const T * y, size_t stride_y,
+	T gamma, const T * z, size_t stride_z, size_t size)
+{
+	uint i, tid = blockIdx.x * blockDim.x + threadIdx.x;
+	for (i = tid; i < size; i += gridDim.x * blockDim.x)
+		w[i * stride_w] = alpha * x[i * stride_x] +
+			beta * y[i * stride_y] + gamma * z[i * stride_z];
+}
+
+template<typename T>
+static __global__ void __vector_relaxed_dual_update(T * zt12,
+	size_t stride_zt12, T * zt, size_t stride_zt, const T * z12,
+	size_t stride_z12, const T * z_prev, size_t stride_prev, const T * z,
+	size_t stride_z, T alpha, size_t size)
+{
+	uint i, tid = blockIdx.x * blockDim.x + threadIdx.x;
+	T zt_i, z12_i, prev_i;
+	for (i = tid; i < size; i += gridDim.x * blockDim.x) {
+		zt_i = zt[i * stride_zt];
+		z12_i = z12[i * stride_z12];
+		prev_i = z_prev[i * stride_prev];
+		zt12[i * stride_zt12] = z12_i - prev_i + zt_i;
+		zt[i * stride_zt] = zt_i + alpha * z12_i +
+			(static_cast<T>(1) - alpha) * prev_i - z[i * stride_z];
+	}
+}
+
+/* z = alpha * x + beta * y */
+ok_status vector_axpby(vector * z, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y)
+{
+	OK_CHECK_VECTOR(z);
+	OK_CHECK_VECTOR(x);
+	OK_CHECK_VECTOR(y);
+	if (z->size != x->size || z->size != y->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	uint grid_dim = calc_grid_dim(z->size);
+	__vector_axpbypcz<ok_float><<<grid_dim, kBlockSize>>>(z->data,
+		z->stride, alpha, x->data, x->stride, beta, y->data, y->stride,
+		kZero, y->data, y->stride, z->size);
+	cudaDeviceSynchronize();
+	return OK_STATUS_CUDA;
+}
+
+/* w = alpha * x + beta * y + gamma * z */
+ok_status vector_axpbypcz(vector * w, const ok_float alpha, const vector * x,
+	const ok_float beta, const vector * y, const ok_float gamma,
+	const vector * z)
+{
+	OK_CHECK_VECTOR(w);
+	OK_CHECK_VECTOR(x);
+	OK_CHECK_VECTOR(y);
+	OK_CHECK_VECTOR(z);
+	if (w->size != x->size || w->size != y->size || w->size != z->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	uint grid_dim = calc_grid_dim(w->size);
+	__vector_axpbypcz<ok_float><<<grid_dim, kBlockSize>>>(w->data,
+		w->stride, alpha, x->data, x->stride, beta, y->data, y->stride,
+		gamma, z->data, z->stride, w->size);
+	cudaDeviceSynchronize();
+	return OK_STATUS_CUDA;
+}
+
+/*
+ * over-relaxed ADMM dual update, in one pass:
+ *
+ *	zt12 = z12 - z_prev + zt
+ *	zt   = zt + alpha * z12 + (1 - alpha) * z_prev - z
+ */
+ok_status vector_relaxed_dual_update(vector * zt12, vector * zt,
+	const vector * z12, const vector * z_prev, const vector * z,
+	const ok_float alpha)
+{
+	OK_CHECK_VECTOR(zt12);
+	OK_CHECK_VECTOR(zt);
+	OK_CHECK_VECTOR(z12);
+	OK_CHECK_VECTOR(z_prev);
+	OK_CHECK_VECTOR(z);
+	size_t n = zt->size;
+	if (zt12->size != n || z12->size != n || z_prev->size != n ||
+		z->size != n)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	uint grid_dim = calc_grid_dim(n);
+	__vector_relaxed_dual_update<ok_float><<<grid_dim, kBlockSize>>>(
+		zt12->data, zt12->stride, zt->data, zt->stride, z12->data,
+		z12->stride, z_prev->data, z_prev->stride, z->data, z->stride,
+		alpha, n);
+	cudaDeviceSynchronize();
+	return OK_STATUS_CUDA;
+}
+
 ok_status vector_indmin(const vector * v, size_t * idx)
 	{ return vector_indmin_<ok_float>(v, (ok_float) OK_FLOAT_MAX, idx); }
 
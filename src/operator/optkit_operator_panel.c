@@ -0,0 +1,365 @@
+#include "optkit_operator_panel.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* PANEL (STREAMED DENSE) LINEAR OPERATOR */
+static ok_status panel_operator_drop_gram(panel_operator_data * op_data);
+
+void * panel_operator_data_alloc(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	panel_operator_data * op_data = OK_NULL;
+
+	if (!A)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	else if (m == 0 || n == 0 || panel_rows == 0)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	if (!err) {
+		ok_alloc(op_data, sizeof(*op_data));
+		op_data->A = A;
+		op_data->panel_rows = panel_rows < m ? panel_rows : m;
+		op_data->scaling = kOne;
+		ok_alloc(op_data->panel, sizeof(*op_data->panel));
+		ok_alloc(op_data->d, sizeof(*op_data->d));
+		ok_alloc(op_data->e, sizeof(*op_data->e));
+		ok_alloc(op_data->v, sizeof(*op_data->v));
+		OK_CHECK_ERR( err, matrix_calloc(op_data->panel,
+			op_data->panel_rows, n, CblasRowMajor) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->d, m) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->e, n) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->v, n) );
+		OK_CHECK_ERR( err, vector_set_all(op_data->d, kOne) );
+		OK_CHECK_ERR( err, vector_set_all(op_data->e, kOne) );
+		OK_CHECK_ERR( err, blas_make_handle(&(op_data->dense_handle)) );
+		if (err) {
+			panel_operator_data_free(op_data);
+			op_data = OK_NULL;
+		}
+	}
+	return (void *) op_data;
+}
+
+ok_status panel_operator_data_free(void * data)
+{
+	panel_operator_data * op_data = (panel_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	ok_status err = OPTKIT_SUCCESS;
+	if (op_data->dense_handle)
+		err = OK_SCAN_ERR( blas_destroy_handle(op_data->dense_handle) );
+	if (op_data->panel && op_data->panel->data)
+		OK_MAX_ERR( err, matrix_free(op_data->panel) );
+	if (op_data->d && op_data->d->data)
+		OK_MAX_ERR( err, vector_free(op_data->d) );
+	if (op_data->e && op_data->e->data)
+		OK_MAX_ERR( err, vector_free(op_data->e) );
+	if (op_data->v && op_data->v->data)
+		OK_MAX_ERR( err, vector_free(op_data->v) );
+	OK_MAX_ERR( err, panel_operator_drop_gram(op_data) );
+	ok_free(op_data->panel);
+	ok_free(op_data->d);
+	ok_free(op_data->e);
+	ok_free(op_data->v);
+	ok_free(op_data);
+	return err;
+}
+
+/*
+ * load rows i, ..., i + k - 1 of A into the (first k rows of the) panel,
+ * scaled as DA, or as s * DAE if scale_columns is set
+ */
+static ok_status panel_operator_load(panel_operator_data * op_data, size_t i,
+	size_t k, matrix * panel, int scale_columns)
+{
+	vector d_sub;
+	size_t n = op_data->panel->size2;
+
+	OK_RETURNIF_ERR( matrix_submatrix(panel, op_data->panel, 0, 0, k, n) );
+	OK_RETURNIF_ERR( matrix_memcpy_ma(panel, op_data->A + i * n,
+		CblasRowMajor) );
+	OK_RETURNIF_ERR( vector_subvector(&d_sub, op_data->d, i, k) );
+	OK_RETURNIF_ERR( matrix_scale_left(panel, &d_sub) );
+	if (scale_columns) {
+		OK_RETURNIF_ERR( matrix_scale_right(panel, op_data->e) );
+		OK_RETURNIF_ERR( matrix_scale(panel, op_data->scaling) );
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/* output = alpha * s * DAE * input + beta * output, in one pass over A */
+ok_status panel_operator_mul_fused(void * data, ok_float alpha, vector * input,
+	ok_float beta, vector * output)
+{
+	panel_operator_data * op_data = (panel_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	OK_CHECK_VECTOR(input);
+	OK_CHECK_VECTOR(output);
+
+	ok_status err = OPTKIT_SUCCESS;
+	matrix panel;
+	vector out_sub;
+	size_t i, k, m = op_data->d->size;
+
+	if (output->size != m)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	/* v = s * E * input, so each panel only needs its row scaling */
+	OK_RETURNIF_ERR( blas_diagmv(op_data->dense_handle, op_data->scaling,
+		op_data->e, input, kZero, op_data->v) );
+
+	for (i = 0; i < m && !err; i += op_data->panel_rows) {
+		k = (m - i < op_data->panel_rows) ? m - i : op_data->panel_rows;
+		OK_CHECK_ERR( err, panel_operator_load(op_data, i, k, &panel, 0) );
+		OK_CHECK_ERR( err, vector_subvector(&out_sub, output, i, k) );
+		OK_CHECK_ERR( err, blas_gemv(op_data->dense_handle, CblasNoTrans,
+			alpha, &panel, op_data->v, beta, &out_sub) );
+	}
+	op_data->passes++;
+	return err;
+}
+
+/* output = alpha * s * (DAE)ᵀ * input + beta * output, in one pass over A */
+ok_status panel_operator_mul_t_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output)
+{
+	panel_operator_data * op_data = (panel_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	OK_CHECK_VECTOR(input);
+	OK_CHECK_VECTOR(output);
+
+	ok_status err = OPTKIT_SUCCESS;
+	matrix panel;
+	vector in_sub;
+	size_t i, k, m = op_data->d->size;
+
+	if (input->size != m)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	/* v = (DA)ᵀ * input, accumulated panel by panel */
+	for (i = 0; i < m && !err; i += op_data->panel_rows) {
+		k = (m - i < op_data->panel_rows) ? m - i : op_data->panel_rows;
+		OK_CHECK_ERR( err, panel_operator_load(op_data, i, k, &panel, 0) );
+		OK_CHECK_ERR( err, vector_subvector(&in_sub, input, i, k) );
+		OK_CHECK_ERR( err, blas_gemv(op_data->dense_handle, CblasTrans,
+			kOne, &panel, &in_sub, i == 0 ? kZero : kOne,
+			op_data->v) );
+	}
+	op_data->passes++;
+	OK_CHECK_ERR( err, blas_diagmv(op_data->dense_handle,
+		alpha * op_data->scaling, op_data->e, op_data->v, beta, output) );
+	return err;
+}
+
+ok_status panel_operator_mul(void * data, vector * input, vector * output)
+{
+	return panel_operator_mul_fused(data, kOne, input, kZero, output);
+}
+
+ok_status panel_operator_mul_t(void * data, vector * input, vector * output)
+{
+	return panel_operator_mul_t_fused(data, kOne, input, kZero, output);
+}
+
+operator * panel_operator_alloc(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows)
+{
+	operator * o = OK_NULL;
+	void * data = OK_NULL;
+	if (A) {
+		data = panel_operator_data_alloc(A, m, n, panel_rows);
+		if (data) {
+			ok_alloc(o, sizeof(*o));
+			o->kind = OkOperatorPanel;
+			o->size1 = m;
+			o->size2 = n;
+			o->data = data;
+			o->apply = panel_operator_mul;
+			o->adjoint = panel_operator_mul_t;
+			o->fused_apply = panel_operator_mul_fused;
+			o->fused_adjoint = panel_operator_mul_t_fused;
+			o->free = panel_operator_data_free;
+		}
+	}
+	return o;
+}
+
+static ok_status panel_operator_typecheck(operator * A, const char * caller)
+{
+	OK_CHECK_OPERATOR(A);
+	if (A->kind != OkOperatorPanel) {
+		printf("panel_operator_%s() %s %s\n", caller, "undefined for",
+			optkit_op2str(A->kind));
+		return OPTKIT_ERROR;
+	} else {
+		return OPTKIT_SUCCESS;
+	}
+}
+
+/* release the Gram matrix, e.g., once it is invalidated or handed off */
+static ok_status panel_operator_drop_gram(panel_operator_data * op_data)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	if (op_data->gram) {
+		err = matrix_free(op_data->gram);
+		ok_free(op_data->gram);
+	}
+	return err;
+}
+
+/* s <- s * scaling; a Gram matrix held by the operator scales as s² */
+ok_status panel_operator_scale(operator * A, const ok_float scaling)
+{
+	OK_RETURNIF_ERR( panel_operator_typecheck(A, "scale") );
+	panel_operator_data * op_data = (panel_operator_data *) A->data;
+	op_data->scaling *= scaling;
+	if (op_data->gram)
+		return matrix_scale(op_data->gram, scaling * scaling);
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * equilibrate the operator as D_new * (s * DAE) * E_new, in one pass over
+ * A: each panel is loaded, its rows are scaled to unit p-norm (p = 1 if
+ * pnorm == 1, p = 2 otherwise) and, if the operator is set to form its
+ * Gram matrix, accumulated into G = (D_new * s * DAE)ᵀ(D_new * s * DAE)
+ * with SYRK; otherwise only the column sums of squares are accumulated.
+ * the columns are then scaled to unit 2-norm, E_new = diag(G)^-1/2, and G
+ * is updated as E_new * G * E_new. all-zero rows or columns are left
+ * unscaled.
+ *
+ * on return d = diag(D_new) and e = diag(E_new), and the operator holds G
+ * (if formed) for panel_operator_gram().
+ */
+ok_status panel_operator_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const ok_float pnorm)
+{
+	OK_RETURNIF_ERR( panel_operator_typecheck(A, "equilibrate") );
+	OK_CHECK_VECTOR(d);
+	OK_CHECK_VECTOR(e);
+	if (d->size != A->size1 || e->size != A->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	panel_operator_data * op_data = (panel_operator_data *) A->data;
+	size_t i, j, k, m = A->size1, n = A->size2;
+	size_t buflen = op_data->panel_rows > n ? op_data->panel_rows : n;
+	ok_float * norms = OK_NULL;
+	matrix panel;
+	vector row, d_sub, diag, colsq;
+
+	OK_RETURNIF_ERR( panel_operator_drop_gram(op_data) );
+	colsq.data = OK_NULL;
+	if (op_data->form_gram) {
+		ok_alloc(op_data->gram, sizeof(*op_data->gram));
+		OK_CHECK_ERR( err, matrix_calloc(op_data->gram, n, n,
+			CblasRowMajor) );
+	} else {
+		OK_CHECK_ERR( err, vector_calloc(&colsq, n) );
+	}
+	ok_alloc(norms, buflen * sizeof(*norms));
+
+	for (i = 0; i < m && !err; i += op_data->panel_rows) {
+		k = (m - i < op_data->panel_rows) ? m - i : op_data->panel_rows;
+		OK_CHECK_ERR( err, panel_operator_load(op_data, i, k, &panel, 1) );
+		for (j = 0; j < k && !err; ++j) {
+			OK_CHECK_ERR( err, matrix_row(&row, &panel, j) );
+			if (pnorm == kOne)
+				OK_CHECK_ERR( err, blas_asum(op_data->dense_handle,
+					&row, norms + j) );
+			else
+				OK_CHECK_ERR( err, blas_nrm2(op_data->dense_handle,
+					&row, norms + j) );
+			norms[j] = norms[j] > 0 ? kOne / norms[j] : kOne;
+		}
+		OK_CHECK_ERR( err, vector_subvector(&d_sub, d, i, k) );
+		OK_CHECK_ERR( err, vector_memcpy_va(&d_sub, norms, 1) );
+		OK_CHECK_ERR( err, matrix_scale_left(&panel, &d_sub) );
+		if (op_data->gram) {
+			OK_CHECK_ERR( err, blas_syrk(op_data->dense_handle,
+				CblasLower, CblasTrans, kOne, &panel,
+				i == 0 ? kZero : kOne, op_data->gram) );
+		} else {
+			OK_CHECK_ERR( err, linalg_matrix_row_squares(CblasTrans,
+				&panel, &colsq) );
+			if (i == 0)
+				OK_CHECK_ERR( err, vector_memcpy_vv(op_data->v, &colsq) );
+			else
+				OK_CHECK_ERR( err, vector_add(op_data->v, &colsq) );
+		}
+	}
+	op_data->passes++;
+
+	if (op_data->gram) {
+		OK_CHECK_ERR( err, matrix_diagonal(&diag, op_data->gram) );
+		OK_CHECK_ERR( err, vector_memcpy_av(norms, &diag, 1) );
+	} else {
+		OK_CHECK_ERR( err, vector_memcpy_av(norms, op_data->v, 1) );
+	}
+	for (j = 0; j < n && !err; ++j)
+		norms[j] = norms[j] > 0 ? kOne / MATH(sqrt)(norms[j]) : kOne;
+	OK_CHECK_ERR( err, vector_memcpy_va(e, norms, 1) );
+	if (op_data->gram) {
+		OK_CHECK_ERR( err, matrix_scale_left(op_data->gram, e) );
+		OK_CHECK_ERR( err, matrix_scale_right(op_data->gram, e) );
+	}
+
+	OK_CHECK_ERR( err, vector_mul(op_data->d, d) );
+	OK_CHECK_ERR( err, vector_mul(op_data->e, e) );
+	ok_free(norms);
+	if (colsq.data)
+		OK_MAX_ERR( err, vector_free(&colsq) );
+
+	if (err)
+		OK_MAX_ERR( err, panel_operator_drop_gram(op_data) );
+	return err;
+}
+
+/*
+ * copy (the lower triangle of) the n x n Gram matrix (s * DAE)ᵀ(s * DAE)
+ * to G. a Gram matrix accumulated by panel_operator_equilibrate() is
+ * handed off, i.e., released by the operator; otherwise it is formed in
+ * G with one pass over A.
+ */
+ok_status panel_operator_gram(operator * A, matrix * G)
+{
+	OK_RETURNIF_ERR( panel_operator_typecheck(A, "gram") );
+	OK_CHECK_MATRIX(G);
+	if (G->size1 != A->size2 || G->size2 != A->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	panel_operator_data * op_data = (panel_operator_data *) A->data;
+	size_t i, k, m = A->size1;
+	matrix panel;
+
+	if (op_data->gram) {
+		OK_CHECK_ERR( err, matrix_memcpy_mm(G, op_data->gram) );
+		OK_MAX_ERR( err, panel_operator_drop_gram(op_data) );
+		return err;
+	}
+
+	for (i = 0; i < m && !err; i += op_data->panel_rows) {
+		k = (m - i < op_data->panel_rows) ? m - i : op_data->panel_rows;
+		OK_CHECK_ERR( err, panel_operator_load(op_data, i, k, &panel, 1) );
+		OK_CHECK_ERR( err, blas_syrk(op_data->dense_handle, CblasLower,
+			CblasTrans, kOne, &panel, i == 0 ? kZero : kOne, G) );
+	}
+	op_data->passes++;
+	return err;
+}
+
+/* number of passes over A made by the operator so far */
+ok_status panel_operator_passes(operator * A, size_t * passes)
+{
+	OK_RETURNIF_ERR( panel_operator_typecheck(A, "passes") );
+	OK_CHECK_PTR(passes);
+	*passes = ((panel_operator_data *) A->data)->passes;
+	return OPTKIT_SUCCESS;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,184 @@
+#include "optkit_operator_scaled.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* SCALED LINEAR OPERATOR */
+void * scaled_operator_data_alloc(operator * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	scaled_operator_data * op_data = OK_NULL;
+
+	if (!A || !A->data)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	if (!err) {
+		ok_alloc(op_data, sizeof(*op_data));
+		op_data->A = A;
+		op_data->scaling = kOne;
+		ok_alloc(op_data->d, sizeof(*op_data->d));
+		ok_alloc(op_data->e, sizeof(*op_data->e));
+		ok_alloc(op_data->u, sizeof(*op_data->u));
+		ok_alloc(op_data->v, sizeof(*op_data->v));
+		OK_CHECK_ERR( err, vector_calloc(op_data->d, A->size1) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->e, A->size2) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->u, A->size2) );
+		OK_CHECK_ERR( err, vector_calloc(op_data->v, A->size1) );
+		OK_CHECK_ERR( err, vector_set_all(op_data->d, kOne) );
+		OK_CHECK_ERR( err, vector_set_all(op_data->e, kOne) );
+		OK_CHECK_ERR( err, blas_make_handle(&(op_data->dense_handle)) );
+		if (err) {
+			scaled_operator_data_free(op_data);
+			op_data = OK_NULL;
+		}
+	}
+	return (void *) op_data;
+}
+
+ok_status scaled_operator_data_free(void * data)
+{
+	scaled_operator_data * op_data = (scaled_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	ok_status err = OPTKIT_SUCCESS;
+
+	if (op_data->dense_handle)
+		OK_MAX_ERR( err, blas_destroy_handle(op_data->dense_handle) );
+	if (op_data->d && op_data->d->data)
+		OK_MAX_ERR( err, vector_free(op_data->d) );
+	if (op_data->e && op_data->e->data)
+		OK_MAX_ERR( err, vector_free(op_data->e) );
+	if (op_data->u && op_data->u->data)
+		OK_MAX_ERR( err, vector_free(op_data->u) );
+	if (op_data->v && op_data->v->data)
+		OK_MAX_ERR( err, vector_free(op_data->v) );
+	ok_free(op_data->d);
+	ok_free(op_data->e);
+	ok_free(op_data->u);
+	ok_free(op_data->v);
+	ok_free(op_data);
+	return OK_SCAN_ERR( err );
+}
+
+/* output = alpha * x + beta * output, with output not read if beta = 0 */
+static ok_status scaled_operator_accumulate(ok_float alpha, vector * x,
+	ok_float beta, vector * output)
+{
+	if (beta == kZero) {
+		OK_RETURNIF_ERR( vector_memcpy_vv(output, x) );
+		return OK_SCAN_ERR( vector_scale(output, alpha) );
+	}
+	return OK_SCAN_ERR( vector_axpby(output, alpha, x, beta, output) );
+}
+
+/* output = alpha * s * DAE * input + beta * output */
+ok_status scaled_operator_mul_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output)
+{
+	scaled_operator_data * op_data = (scaled_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	OK_CHECK_VECTOR(input);
+	OK_CHECK_VECTOR(output);
+	if (input->size != op_data->u->size ||
+		output->size != op_data->v->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(op_data->u, input) );
+	OK_RETURNIF_ERR( vector_mul(op_data->u, op_data->e) );
+	OK_RETURNIF_ERR( op_data->A->apply(op_data->A->data, op_data->u,
+		op_data->v) );
+	OK_RETURNIF_ERR( vector_mul(op_data->v, op_data->d) );
+	return scaled_operator_accumulate(alpha * op_data->scaling,
+		op_data->v, beta, output);
+}
+
+/* output = alpha * s * (DAE)ᵀ * input + beta * output */
+ok_status scaled_operator_mul_t_fused(void * data, ok_float alpha,
+	vector * input, ok_float beta, vector * output)
+{
+	scaled_operator_data * op_data = (scaled_operator_data *) data;
+	OK_CHECK_PTR(op_data);
+	OK_CHECK_VECTOR(input);
+	OK_CHECK_VECTOR(output);
+	if (input->size != op_data->v->size ||
+		output->size != op_data->u->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(op_data->v, input) );
+	OK_RETURNIF_ERR( vector_mul(op_data->v, op_data->d) );
+	OK_RETURNIF_ERR( op_data->A->adjoint(op_data->A->data, op_data->v,
+		op_data->u) );
+	OK_RETURNIF_ERR( vector_mul(op_data->u, op_data->e) );
+	return scaled_operator_accumulate(alpha * op_data->scaling,
+		op_data->u, beta, output);
+}
+
+ok_status scaled_operator_mul(void * data, vector * input, vector * output)
+{
+	return scaled_operator_mul_fused(data, kOne, input, kZero, output);
+}
+
+ok_status scaled_operator_mul_t(void * data, vector * input, vector * output)
+{
+	return scaled_operator_mul_t_fused(data, kOne, input, kZero, output);
+}
+
+operator * scaled_operator_alloc(operator * A)
+{
+	operator * o = OK_NULL;
+	void * data;
+
+	if (A && A->data) {
+		data = scaled_operator_data_alloc(A);
+		if (data) {
+			ok_alloc(o, sizeof(*o));
+			o->kind = OkOperatorScaled;
+			o->size1 = A->size1;
+			o->size2 = A->size2;
+			o->data = data;
+			o->apply = scaled_operator_mul;
+			o->adjoint = scaled_operator_mul_t;
+			o->fused_apply = scaled_operator_mul_fused;
+			o->fused_adjoint = scaled_operator_mul_t_fused;
+			o->free = scaled_operator_data_free;
+		}
+	}
+	return o;
+}
+
+static ok_status scaled_operator_typecheck(operator * A, const char * caller)
+{
+	OK_CHECK_OPERATOR(A);
+	if (A->kind != OkOperatorScaled) {
+		printf("scaled_operator_%s() %s %s\n", caller, "undefined for",
+			optkit_op2str(A->kind));
+		return OPTKIT_ERROR;
+	} else {
+		return OPTKIT_SUCCESS;
+	}
+}
+
+ok_status scaled_operator_scale(operator * A, const ok_float scaling)
+{
+	OK_RETURNIF_ERR( scaled_operator_typecheck(A, "scale") );
+	((scaled_operator_data *) A->data)->scaling *= scaling;
+	return OPTKIT_SUCCESS;
+}
+
+ok_status scaled_operator_scale_left(operator * A, const vector * v)
+{
+	OK_RETURNIF_ERR( scaled_operator_typecheck(A, "scale_left") );
+	return OK_SCAN_ERR( vector_mul(((scaled_operator_data *) A->data)->d,
+		v) );
+}
+
+ok_status scaled_operator_scale_right(operator * A, const vector * v)
+{
+	OK_RETURNIF_ERR( scaled_operator_typecheck(A, "scale_right") );
+	return OK_SCAN_ERR( vector_mul(((scaled_operator_data *) A->data)->e,
+		v) );
+}
+
+#ifdef __cplusplus
+}
+#endif
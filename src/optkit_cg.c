@@ -210,8 +210,13 @@ ok_status cgls_nonallocating(cgls_helper * helper,
 	h->gamma = h->norm_s0 * h->norm_s0;
 	h->xmax = h->norm_x;
 
+	/* stopping tests are relative to norm_ref, if set */
+	if (h->norm_ref > 0)
+		h->norm_s0 = h->norm_ref;
+
+	/* flag = 1: x solves the problem, or a warm start already meets tol */
 	*flag = 0;
-	if (h->norm_s < kEps)
+	if (h->norm_s < kEps || h->norm_s < tol * h->norm_ref)
 		*flag = 1;
 
 	if (!quiet && !*flag)
@@ -270,6 +275,7 @@ ok_status cgls_nonallocating(cgls_helper * helper,
 	}
 
 	/* determine exit status */
+	h->iters = (*flag == 1) ? 0 : (k < maxiter ? k + 1 : k);
 	h->shrink = h->norm_x / h->xmax;
 	if (k == maxiter)
 		*flag = 2;
@@ -4,97 +4,265 @@
 extern "C" {
 #endif
 
-ok_status regularized_sinkhorn_knopp(void * linalg_handle, ok_float * A_in,
-	matrix * A_out, vector * d, vector * e, enum CBLAS_ORDER ord)
+ok_status equilibration_default_settings(equilibration_settings * settings)
 {
-	OK_CHECK_PTR(A_in);
-	OK_CHECK_MATRIX(A_out);
-	OK_CHECK_VECTOR(d);
-	OK_CHECK_VECTOR(e);
-
-	ok_status err = OPTKIT_SUCCESS;
-	const ok_float kSinkhornConst = (ok_float) 1e-4;
-	const ok_float kEps = (ok_float) 1e-2;
-	const size_t kMaxIter = 300;
-	ok_float norm_d, norm_e;
-	size_t i;
+	OK_CHECK_PTR(settings);
+	settings->method = OkEquilSinkhorn;
+	settings->maxiter = kEQUILMAXITER;
+	settings->tol = kEQUILTOL;
+	settings->probes = kEQUILPROBES;
+	return OPTKIT_SUCCESS;
+}
 
-	vector a, d_diff, e_diff;
-	a.data = OK_NULL;
-	d_diff.data = OK_NULL;
-	e_diff.data = OK_NULL;
+ok_status equilibration_randomized_settings(equilibration_settings * settings)
+{
+	OK_CHECK_PTR(settings);
+	settings->method = OkEquilRandomized;
+	settings->maxiter = kEQUILPASSES;
+	settings->tol = kEQUILTOL;
+	settings->probes = kEQUILPROBES;
+	return OPTKIT_SUCCESS;
+}
 
-	if (A_out->size1 != d->size || A_out->size2 != e->size)
-		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+int equilibration_settings_are_default(const equilibration_settings * settings)
+{
+	return (settings == OK_NULL) || (settings->method == OkEquilSinkhorn &&
+		settings->maxiter == kEQUILMAXITER &&
+		settings->tol == kEQUILTOL &&
+		settings->probes == kEQUILPROBES);
+}
 
-	vector_calloc(&d_diff, A_out->size1);
-	vector_calloc(&e_diff, A_out->size2);
+/*
+ * max(v) / min(v) over the nonzero entries of v (v >= 0, overwritten):
+ * the largest entry of 1 / v is 1 / min
+ */
+static ok_status __norm_spread(vector * v, ok_float * spread)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float vmax = kZero, inv_vmin = kZero;
+	OK_CHECK_ERR( err, vector_max(v, &vmax) );
+	OK_CHECK_ERR( err, vector_safe_recip(v) );
+	OK_CHECK_ERR( err, vector_max(v, &inv_vmin) );
+	*spread = vmax * inv_vmin;
+	return err;
+}
 
-	norm_d = norm_e = 1;
+/*
+ * row and column norm spreads of W = |D * A * E|, 1-norms for Sinkhorn,
+ * inf-norms for Ruiz, ignoring empty rows and columns; r and c are
+ * workspace of size m and n
+ */
+static ok_status __equilibration_spread(void * linalg_handle,
+	const matrix * W, vector * r, vector * c, const uint method,
+	equilibration_info * info)
+{
+	ok_status err = OPTKIT_SUCCESS;
 
-	OK_CHECK_ERR( err, matrix_memcpy_ma(A_out, A_in, ord) );
-	OK_CHECK_ERR( err, matrix_abs(A_out) );
-	OK_CHECK_ERR( err, vector_set_all(d, kOne) );
-	OK_CHECK_ERR( err, vector_scale(e, kZero) );
+	if (method == OkEquilRuiz) {
+		OK_CHECK_ERR( err, linalg_matrix_reduce_max(r, W, CblasRight) );
+	} else {
+		OK_CHECK_ERR( err, vector_set_all(c, kOne) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasNoTrans, kOne,
+			W, c, kZero, r) );
+	}
+	OK_CHECK_ERR( err, __norm_spread(r, &info->row_spread) );
 
-	/* optional argument ok_float pnorm? */
-	/*
-	if (pnorm != 1) {
-		matrix_pow(A, pnorm)
+	if (method == OkEquilRuiz) {
+		OK_CHECK_ERR( err, linalg_matrix_reduce_max(c, W, CblasLeft) );
+	} else {
+		OK_CHECK_ERR( err, vector_set_all(r, kOne) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasTrans, kOne,
+			W, r, kZero, c) );
 	}
-	*/
+	OK_CHECK_ERR( err, __norm_spread(c, &info->col_spread) );
+	return err;
+}
 
-	for (i = 0; i < kMaxIter && !err; ++i){
-		blas_gemv(linalg_handle, CblasTrans, kOne, A_out, d, kZero, e);
+/*
+ * Sinkhorn-Knopp iteration on W = |A|, leaving W as is; r and c are
+ * workspace of size m and n
+ */
+static ok_status __sinkhorn_knopp(void * linalg_handle, const matrix * W,
+	vector * d, vector * e, vector * r, vector * c,
+	const equilibration_settings * settings, uint * iterations)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	const ok_float kSinkhornConst = (ok_float) 1e-4;
+	ok_float norm_d = kOne, norm_e = kOne;
+	uint k;
+
+	OK_CHECK_ERR( err, vector_scale(r, kZero) );
+	OK_CHECK_ERR( err, vector_scale(c, kZero) );
+
+	for (k = 0; k < settings->maxiter && !err; ++k){
+		blas_gemv(linalg_handle, CblasTrans, kOne, W, d, kZero, e);
 		vector_add_constant(e, kSinkhornConst / (ok_float) e->size);
 		vector_recip(e);
 		vector_scale(e, (ok_float) d->size);
 
-		blas_gemv(linalg_handle, CblasNoTrans, kOne, A_out, e, kZero,
-			d);
+		blas_gemv(linalg_handle, CblasNoTrans, kOne, W, e, kZero, d);
 		vector_add_constant(d, kSinkhornConst / (ok_float) d->size);
 		vector_recip(d);
 		vector_scale(d, (ok_float) e->size);
 
-		blas_axpy(linalg_handle, -kOne, d, &d_diff);
-		blas_axpy(linalg_handle, -kOne, e, &e_diff);
+		blas_axpy(linalg_handle, -kOne, d, r);
+		blas_axpy(linalg_handle, -kOne, e, c);
 
-		blas_nrm2(linalg_handle, &d_diff, &norm_d);
-		blas_nrm2(linalg_handle, &e_diff, &norm_e);
+		blas_nrm2(linalg_handle, r, &norm_d);
+		blas_nrm2(linalg_handle, c, &norm_e);
 
-		if ((norm_d < kEps) && (norm_e < kEps))
+		if ((norm_d < settings->tol) && (norm_e < settings->tol)) {
+			++k;
 			break;
+		}
 
-		vector_memcpy_vv(&d_diff, d);
-		vector_memcpy_vv(&e_diff, e);
+		vector_memcpy_vv(r, d);
+		vector_memcpy_vv(c, e);
 	}
+	*iterations = k;
+	return err;
+}
 
-	/* optional argument ok_float pnorm? */
-	/*
-	if (pnorm != 1) {
-		vector_pow(d, kOne / pnorm)
-		vector_pow(e, kOne / pnorm)
+/*
+ * Ruiz iteration on W = |A|, overwriting W with |D * A * E|: each pass
+ * scales every row and column by the inverse square root of its inf-norm.
+ * empty rows (columns) keep a unit scaling. r, c, r_empty, c_empty are
+ * workspace of size m, n, m, n
+ */
+static ok_status __ruiz(matrix * W, vector * d, vector * e, vector * r,
+	vector * c, vector * r_empty, vector * c_empty,
+	const equilibration_settings * settings, uint * iterations)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float rmin, rmax, cmin, cmax, dev;
+	uint k;
+
+	for (k = 0; k < settings->maxiter && !err; ++k) {
+		OK_CHECK_ERR( err, linalg_matrix_reduce_max(r, W, CblasRight) );
+		OK_CHECK_ERR( err, linalg_matrix_reduce_max(c, W, CblasLeft) );
+
+		/* indicators of empty rows/columns, 1 - (1 / x) * x */
+		if (k == 0 && !err) {
+			OK_CHECK_ERR( err, vector_memcpy_vv(r_empty, r) );
+			OK_CHECK_ERR( err, vector_safe_recip(r_empty) );
+			OK_CHECK_ERR( err, vector_mul(r_empty, r) );
+			OK_CHECK_ERR( err, vector_scale(r_empty, -kOne) );
+			OK_CHECK_ERR( err, vector_add_constant(r_empty, kOne) );
+			OK_CHECK_ERR( err, vector_memcpy_vv(c_empty, c) );
+			OK_CHECK_ERR( err, vector_safe_recip(c_empty) );
+			OK_CHECK_ERR( err, vector_mul(c_empty, c) );
+			OK_CHECK_ERR( err, vector_scale(c_empty, -kOne) );
+			OK_CHECK_ERR( err, vector_add_constant(c_empty, kOne) );
+		}
+		OK_CHECK_ERR( err, vector_add(r, r_empty) );
+		OK_CHECK_ERR( err, vector_add(c, c_empty) );
+
+		OK_CHECK_ERR( err, vector_min(r, &rmin) );
+		OK_CHECK_ERR( err, vector_max(r, &rmax) );
+		OK_CHECK_ERR( err, vector_min(c, &cmin) );
+		OK_CHECK_ERR( err, vector_max(c, &cmax) );
+		dev = MATH(fmax)(MATH(fmax)(rmax - kOne, kOne - rmin),
+			MATH(fmax)(cmax - kOne, kOne - cmin));
+		if (err || dev <= settings->tol)
+			break;
+
+		OK_CHECK_ERR( err, vector_sqrt(r) );
+		OK_CHECK_ERR( err, vector_recip(r) );
+		OK_CHECK_ERR( err, vector_sqrt(c) );
+		OK_CHECK_ERR( err, vector_recip(c) );
+		OK_CHECK_ERR( err, linalg_matrix_diag_scale(W, r, c) );
+		OK_CHECK_ERR( err, vector_mul(d, r) );
+		OK_CHECK_ERR( err, vector_mul(e, c) );
+	}
+	*iterations = k;
+	return err;
+}
+
+/*
+ * equilibrate A_in (layout ord) as A_out = D * A_in * E, with the method,
+ * iteration cap and tolerance in settings (NULL: defaults). the final
+ * scaling is applied in a single pass over A_out. if info is not NULL,
+ * it receives the iterations taken and the spread of the row and column
+ * norms of A_out.
+ */
+ok_status matrix_equilibrate(void * linalg_handle, ok_float * A_in,
+	matrix * A_out, vector * d, vector * e, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings, equilibration_info * info)
+{
+	OK_CHECK_PTR(A_in);
+	OK_CHECK_MATRIX(A_out);
+	OK_CHECK_VECTOR(d);
+	OK_CHECK_VECTOR(e);
+
+	ok_status err = OPTKIT_SUCCESS;
+	equilibration_settings defaults;
+	equilibration_info stats;
+	vector r, c, r_empty, c_empty;
+	r.data = OK_NULL;
+	c.data = OK_NULL;
+	r_empty.data = OK_NULL;
+	c_empty.data = OK_NULL;
+
+	if (A_out->size1 != d->size || A_out->size2 != e->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	if (!settings) {
+		OK_RETURNIF_ERR( equilibration_default_settings(&defaults) );
+		settings = &defaults;
+	}
+	if ((settings->method != OkEquilSinkhorn &&
+		settings->method != OkEquilRuiz) || settings->tol < 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	OK_CHECK_ERR( err, vector_calloc(&r, A_out->size1) );
+	OK_CHECK_ERR( err, vector_calloc(&c, A_out->size2) );
+	if (settings->method == OkEquilRuiz) {
+		OK_CHECK_ERR( err, vector_calloc(&r_empty, A_out->size1) );
+		OK_CHECK_ERR( err, vector_calloc(&c_empty, A_out->size2) );
 	}
-	*/
 
 	OK_CHECK_ERR( err, matrix_memcpy_ma(A_out, A_in, ord) );
-	if (!err) {
-		for (i = 0; i < A_out->size1; ++i) {
-			matrix_row(&a, A_out, i);
-			vector_mul(&a, e);
-		}
-		for (i = 0; i < A_out->size2; ++i) {
-			matrix_column(&a, A_out, i);
-			vector_mul(&a, d);
-		}
+	OK_CHECK_ERR( err, matrix_abs(A_out) );
+	OK_CHECK_ERR( err, vector_set_all(d, kOne) );
+	OK_CHECK_ERR( err, vector_set_all(e, kOne) );
+
+	if (settings->method == OkEquilRuiz) {
+		OK_CHECK_ERR( err, __ruiz(A_out, d, e, &r, &c, &r_empty,
+			&c_empty, settings, &stats.iterations) );
+	} else {
+		OK_CHECK_ERR( err, __sinkhorn_knopp(linalg_handle, A_out, d, e,
+			&r, &c, settings, &stats.iterations) );
+		if (info)
+			OK_CHECK_ERR( err, linalg_matrix_diag_scale(A_out, d,
+				e) );
 	}
 
-	vector_free(&d_diff);
-	vector_free(&e_diff);
+	if (info) {
+		OK_CHECK_ERR( err, __equilibration_spread(linalg_handle, A_out,
+			&r, &c, settings->method, &stats) );
+		if (!err)
+			*info = stats;
+	}
 
+	OK_CHECK_ERR( err, matrix_memcpy_ma(A_out, A_in, ord) );
+	OK_CHECK_ERR( err, linalg_matrix_diag_scale(A_out, d, e) );
+
+	vector_free(&r);
+	vector_free(&c);
+	if (settings->method == OkEquilRuiz) {
+		vector_free(&r_empty);
+		vector_free(&c_empty);
+	}
 	return err;
 }
 
+ok_status regularized_sinkhorn_knopp(void * linalg_handle, ok_float * A_in,
+	matrix * A_out, vector * d, vector * e, enum CBLAS_ORDER ord)
+{
+	return matrix_equilibrate(linalg_handle, A_in, A_out, d, e, ord,
+		OK_NULL, OK_NULL);
+}
+
 #ifndef OPTKIT_NO_OPERATOR_EQUIL
 ok_status operator_regularized_sinkhorn(void * linalg_handle, operator * A,
 	vector * d, vector * e, const ok_float pnorm)
@@ -198,63 +366,556 @@ ok_status operator_regularized_sinkhorn(void * linalg_handle, operator * A,
 	return err;
 }
 
-/* STUB */
-ok_status operator_equilibrate(void * linalg_handle, operator * A,
-	vector * d, vector * e, const ok_float pnorm)
+/*
+ * fill x with random signs, x / |x| for x uniform on [-1, 1]; s is
+ * workspace of the same size
+ */
+static ok_status __rademacher(vector * x, vector * s)
 {
-	return OPTKIT_ERROR;
+	ok_status err = OPTKIT_SUCCESS;
+	OK_CHECK_ERR( err, vector_uniform_rand(x, -kOne, kOne) );
+	OK_CHECK_ERR( err, vector_memcpy_vv(s, x) );
+	OK_CHECK_ERR( err, vector_abs(s) );
+	OK_CHECK_ERR( err, vector_safe_recip(s) );
+	OK_CHECK_ERR( err, vector_mul(x, s) );
+	return err;
 }
 
 /*
- * given linear operator A, estimate the operator norm of A as
+ * estimate the squared 2-norms of the rows of L * op * R from probes
+ * random sign vectors x_k: E[(L * op * R * x)_i^2] is the squared norm
+ * of row i, so
  *
- *	||A|| ~ ||(A'A)^n x|| / ||A(A'A)^(n-1)x||
+ *	norms = (1 / probes) * sum_k (L * op * R * x_k)^2.
  *
- * where x is a random vector and n <= kNormIter is a
- * given number of iterations.
+ * x, s are workspace of the size of the input of op, y of its output
  */
-ok_status operator_estimate_norm(void * linalg_handle, operator * A,
-	ok_float * norm_est)
+static ok_status __probe_norms(ok_status (* op)(void *, vector *, vector *),
+	void * data, const vector * left, const vector * right, vector * norms,
+	vector * x, vector * s, vector * y, const uint probes)
 {
-	OK_CHECK_OPERATOR(A);
-	OK_CHECK_PTR(norm_est);
+	ok_status err = OPTKIT_SUCCESS;
+	uint k;
+
+	OK_CHECK_ERR( err, vector_set_all(norms, kZero) );
+	for (k = 0; k < probes && !err; ++k) {
+		OK_CHECK_ERR( err, __rademacher(x, s) );
+		OK_CHECK_ERR( err, vector_mul(x, right) );
+		OK_CHECK_ERR( err, op(data, x, y) );
+		OK_CHECK_ERR( err, vector_mul(y, left) );
+		OK_CHECK_ERR( err, vector_mul(y, y) );
+		OK_CHECK_ERR( err, vector_add(norms, y) );
+	}
+	OK_CHECK_ERR( err, vector_scale(norms, kOne / (ok_float) probes) );
+	return err;
+}
 
-	const ok_float kNormTol = (ok_float) 1e-5;
-	const uint kNormIter = 50u;
+/*
+ * norms = sqrt(norms / size), so that a matrix of ones has unit norms,
+ * with estimated empty rows (columns) set to 1; dev is the largest
+ * deviation of norms from 1, spread (if not NULL) the spread of the
+ * nonzero norms. s is workspace of the size of norms
+ */
+static ok_status __normalize_norms(vector * norms, vector * s,
+	const size_t size, ok_float * dev, ok_float * spread)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float nmin = kZero, nmax = kZero;
+
+	OK_CHECK_ERR( err, vector_scale(norms, kOne / (ok_float) size) );
+	OK_CHECK_ERR( err, vector_sqrt(norms) );
+	if (spread) {
+		OK_CHECK_ERR( err, vector_memcpy_vv(s, norms) );
+		OK_CHECK_ERR( err, __norm_spread(s, spread) );
+	}
+
+	/* norms += 1 - (1 / norms) * norms */
+	OK_CHECK_ERR( err, vector_memcpy_vv(s, norms) );
+	OK_CHECK_ERR( err, vector_safe_recip(s) );
+	OK_CHECK_ERR( err, vector_mul(s, norms) );
+	OK_CHECK_ERR( err, vector_scale(s, -kOne) );
+	OK_CHECK_ERR( err, vector_add_constant(s, kOne) );
+	OK_CHECK_ERR( err, vector_add(norms, s) );
+
+	OK_CHECK_ERR( err, vector_min(norms, &nmin) );
+	OK_CHECK_ERR( err, vector_max(norms, &nmax) );
+	*dev = (nmax - kOne > kOne - nmin) ? nmax - kOne : kOne - nmin;
+	return err;
+}
 
-	ok_float norm_est_prev, norm_x;
-	vector x, Ax;
-	uint i;
+/*
+ * randomized equilibration of an operator A of any kind, using only
+ * A->apply and A->adjoint: each pass estimates the row and column
+ * 2-norms of D * A * E from settings->probes random sign vectors and
+ * scales each row (column) by the inverse square root of its normalized
+ * norm. more probes per pass give less noisy estimates, and so a more
+ * even scaling, at the cost of 2 * probes products with A per pass.
+ *
+ * sets d and e only, A is not modified. settings = NULL uses
+ * equilibration_randomized_settings()
+ */
+ok_status operator_randomized_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info)
+{
+	OK_CHECK_OPERATOR(A);
+	OK_CHECK_VECTOR(d);
+	OK_CHECK_VECTOR(e);
 
+	ok_status err = OPTKIT_SUCCESS;
+	equilibration_settings defaults;
+	equilibration_info stats = {0u, kZero, kZero};
+	ok_float dev_r = kZero, dev_c = kZero;
+	ok_float * row_spread = info ? &stats.row_spread : OK_NULL;
+	ok_float * col_spread = info ? &stats.col_spread : OK_NULL;
+	vector r, c, x, y, sx, sy;
+	uint k;
+
+	r.data = OK_NULL;
+	c.data = OK_NULL;
 	x.data = OK_NULL;
-	Ax.data = OK_NULL;
-	*norm_est = kZero;
+	y.data = OK_NULL;
+	sx.data = OK_NULL;
+	sy.data = OK_NULL;
 
-	vector_calloc(&x, A->size2);
-	vector_calloc(&Ax, A->size1);
+	if (A->size1 != d->size || A->size2 != e->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	if (!settings) {
+		OK_RETURNIF_ERR( equilibration_randomized_settings(&defaults) );
+		settings = &defaults;
+	}
+	if (settings->probes == 0 || settings->tol < 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	OK_CHECK_ERR( err, vector_calloc(&r, A->size1) );
+	OK_CHECK_ERR( err, vector_calloc(&y, A->size1) );
+	OK_CHECK_ERR( err, vector_calloc(&sy, A->size1) );
+	OK_CHECK_ERR( err, vector_calloc(&c, A->size2) );
+	OK_CHECK_ERR( err, vector_calloc(&x, A->size2) );
+	OK_CHECK_ERR( err, vector_calloc(&sx, A->size2) );
+	OK_CHECK_ERR( err, vector_set_all(d, kOne) );
+	OK_CHECK_ERR( err, vector_set_all(e, kOne) );
+
+	for (k = 0; k < settings->maxiter && !err; ++k) {
+		OK_CHECK_ERR( err, __probe_norms(A->apply, A->data, d, e, &r,
+			&x, &sx, &y, settings->probes) );
+		OK_CHECK_ERR( err, __probe_norms(A->adjoint, A->data, e, d, &c,
+			&y, &sy, &x, settings->probes) );
+		OK_CHECK_ERR( err, __normalize_norms(&r, &sy, A->size2, &dev_r,
+			row_spread) );
+		OK_CHECK_ERR( err, __normalize_norms(&c, &sx, A->size1, &dev_c,
+			col_spread) );
+
+		if (!err && dev_r <= settings->tol && dev_c <= settings->tol) {
+			++k;
+			break;
+		}
+
+		OK_CHECK_ERR( err, vector_sqrt(&r) );
+		OK_CHECK_ERR( err, vector_recip(&r) );
+		OK_CHECK_ERR( err, vector_mul(d, &r) );
+		OK_CHECK_ERR( err, vector_sqrt(&c) );
+		OK_CHECK_ERR( err, vector_recip(&c) );
+		OK_CHECK_ERR( err, vector_mul(e, &c) );
+	}
+	stats.iterations = k;
+	if (info)
+		*info = stats;
+
+	vector_free(&r);
+	vector_free(&y);
+	vector_free(&sy);
+	vector_free(&c);
+	vector_free(&x);
+	vector_free(&sx);
+	return err;
+}
+
+/*
+ * randomized equilibration (operator_randomized_equilibrate), followed
+ * by scaling A <- D * A * E in place; defined for dense, sparse and
+ * scaled operators
+ */
+ok_status operator_equilibrate_settings(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info)
+{
+	OK_CHECK_OPERATOR(A);
+
+	transformable_operator * transform = OK_NULL;
+	ok_status err = OPTKIT_SUCCESS;
+
+	if (A->kind == OkOperatorDense) {
+		transform = dense_operator_to_transformable(A);
+	} else if (A->kind == OkOperatorSparseCSC ||
+		   A->kind == OkOperatorSparseCSR) {
+		transform = sparse_operator_to_transformable(A);
+	} else if (A->kind != OkOperatorScaled) {
+		printf("\n%s", "ERROR: operator_equilibrate only defined for ");
+		printf("%s\n", "dense, sparse and scaled operators");
+		return OPTKIT_ERROR;
+	}
 
-	vector_uniform_rand(&x, kZero, kOne);
+	OK_CHECK_ERR( err, operator_randomized_equilibrate(linalg_handle, A, d,
+		e, settings, info) );
 
-	for (i = 0; i < kNormIter; ++i) {
-		norm_est_prev = *norm_est;
-		A->apply(A->data, &x, &Ax);
-		A->adjoint(A->data, &Ax, &x);
-		blas_nrm2(linalg_handle, &x, &norm_x);
-		blas_nrm2(linalg_handle, &Ax, norm_est);
+	if (transform) {
+		OK_CHECK_ERR( err, transform->scale_left(A, d) );
+		OK_CHECK_ERR( err, transform->scale_right(A, e) );
+		ok_free(transform);
+	} else {
+		OK_CHECK_ERR( err, scaled_operator_scale_left(A, d) );
+		OK_CHECK_ERR( err, scaled_operator_scale_right(A, e) );
+	}
+	return err;
+}
 
-		if (norm_x == 0 || *norm_est == 0)
-			return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+/* randomized equilibration in the 2-norm (pnorm is not used) */
+ok_status operator_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const ok_float pnorm)
+{
+	return operator_equilibrate_settings(linalg_handle, A, d, e, OK_NULL,
+		OK_NULL);
+}
 
-		*norm_est = norm_x / *norm_est;
-		vector_scale(&x, 1 / norm_x);
-		if (MATH(fabs)(norm_est_prev - *norm_est) <=
-			kNormTol * *norm_est)
+/*
+ * eigenvalues w and eigenvectors (columns of V) of the symmetric n x n
+ * matrix S (host, column-major, overwritten) by cyclic Jacobi rotations;
+ * n is the (small) dimension of a Lanczos projection
+ */
+static void __symmetric_eig(ok_float * S, ok_float * V, ok_float * w,
+	const size_t n)
+{
+	const uint kMaxSweeps = 50u;
+	ok_float off, total, theta, t, c, s, x, y;
+	size_t i, j, k;
+	uint sweep;
+
+	for (i = 0; i < n * n; ++i)
+		V[i] = kZero;
+	for (i = 0; i < n; ++i)
+		V[i + i * n] = kOne;
+
+	for (sweep = 0; sweep < kMaxSweeps; ++sweep) {
+		off = total = kZero;
+		for (j = 0; j < n; ++j)
+			for (i = 0; i < n; ++i) {
+				total += S[i + j * n] * S[i + j * n];
+				if (i != j)
+					off += S[i + j * n] * S[i + j * n];
+			}
+		if (off <= MACHINETOL * MACHINETOL * total)
 			break;
+
+		for (i = 0; i < n; ++i)
+			for (j = i + 1; j < n; ++j) {
+				if (S[i + j * n] == kZero)
+					continue;
+				/* rotation annihilating S_ij */
+				theta = (S[j + j * n] - S[i + i * n]) /
+					(2 * S[i + j * n]);
+				t = (theta >= 0 ? kOne : -kOne) /
+					(MATH(fabs)(theta) +
+					 MATH(sqrt)(theta * theta + kOne));
+				c = kOne / MATH(sqrt)(t * t + kOne);
+				s = t * c;
+				for (k = 0; k < n; ++k) {
+					x = S[k + i * n];
+					y = S[k + j * n];
+					S[k + i * n] = c * x - s * y;
+					S[k + j * n] = s * x + c * y;
+				}
+				for (k = 0; k < n; ++k) {
+					x = S[i + k * n];
+					y = S[j + k * n];
+					S[i + k * n] = c * x - s * y;
+					S[j + k * n] = s * x + c * y;
+				}
+				for (k = 0; k < n; ++k) {
+					x = V[k + i * n];
+					y = V[k + j * n];
+					V[k + i * n] = c * x - s * y;
+					V[k + j * n] = s * x + c * y;
+				}
+			}
 	}
-	vector_free(&x);
-	vector_free(&Ax);
+	for (i = 0; i < n; ++i)
+		w[i] = S[i + i * n];
+}
+
+/*
+ * orthonormalize the columns of the n x b block W against the n x p
+ * basis Q (p may be 0), and then among themselves (block classical
+ * Gram-Schmidt, twice, then modified Gram-Schmidt, twice):
+ *
+ *	W_in = Q * coef + W_out * R,
+ *
+ * with coef (p x b, column-major, ld p) and R (b x b, upper triangular,
+ * column-major) on the host. columns that vanish are set to zero, with a
+ * zero diagonal in R. C is device workspace of size >= p x b.
+ */
+static ok_status __block_orthonormalize(void * linalg_handle, matrix * Q,
+	matrix * W, matrix * C, ok_float * coef, ok_float * coef_pass,
+	ok_float * R)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	size_t p = Q ? Q->size2 : 0, b = W->size2, i, k;
+	uint pass;
+	ok_float r, nrm_in;
+	vector wi, wk;
+	matrix C_sub;
+
+	for (i = 0; i < p * b; ++i)
+		coef[i] = kZero;
+	for (i = 0; i < b * b; ++i)
+		R[i] = kZero;
+
+	for (pass = 0; pass < 2 && p > 0 && !err; ++pass) {
+		OK_CHECK_ERR( err, matrix_submatrix(&C_sub, C, 0, 0, p, b) );
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, kOne, Q, W, kZero, &C_sub) );
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasNoTrans,
+			CblasNoTrans, -kOne, Q, &C_sub, kOne, W) );
+		OK_CHECK_ERR( err, matrix_memcpy_am(coef_pass, &C_sub,
+			CblasColMajor) );
+		for (i = 0; i < p * b && !err; ++i)
+			coef[i] += coef_pass[i];
+	}
+
+	for (i = 0; i < b && !err; ++i) {
+		OK_CHECK_ERR( err, matrix_column(&wi, W, i) );
+		OK_CHECK_ERR( err, blas_nrm2(linalg_handle, &wi, &nrm_in) );
+		for (pass = 0; pass < 2 && !err; ++pass)
+			for (k = 0; k < i && !err; ++k) {
+				OK_CHECK_ERR( err, matrix_column(&wk, W, k) );
+				OK_CHECK_ERR( err, blas_dot(linalg_handle, &wk, &wi,
+					&r) );
+				OK_CHECK_ERR( err, blas_axpy(linalg_handle, -r, &wk,
+					&wi) );
+				R[k + i * b] += r;
+			}
+		OK_CHECK_ERR( err, blas_nrm2(linalg_handle, &wi, &r) );
+		if (r <= MACHINETOL * nrm_in || r == kZero) {
+			OK_CHECK_ERR( err, vector_set_all(&wi, kZero) );
+		} else {
+			R[i + i * b] = r;
+			OK_CHECK_ERR( err, vector_scale(&wi, kOne / r) );
+		}
+	}
+	return err;
+}
+
+ok_status operator_norm_estimate_free(operator_norm_estimate * est)
+{
+	OK_CHECK_PTR(est);
+	ok_free(est->V);
+	est->size2 = 0;
 	return OPTKIT_SUCCESS;
 }
+
+/*
+ * block Lanczos estimate of ||A||_2, as the square root of the largest
+ * Ritz value of AᵀA on the Krylov space of a starting block of
+ * est->block (default kNORMESTBLOCK) vectors, with full
+ * reorthogonalization. each step costs block apply and block adjoint
+ * calls; the iteration stops after maxiter steps, or once the residual
+ * of the leading Ritz pair certifies relative accuracy rtol (for
+ * the estimate of ||A||_2^2, and so rtol / 2 for ||A||_2).
+ *
+ * if est->V is set (size2 x block, column-major, host) the iteration
+ * starts from it, e.g., the subspace returned by an earlier call on an
+ * operator with the same shape and updated values; on return est->V
+ * holds the leading block Ritz vectors (allocated if NULL, free with
+ * operator_norm_estimate_free).
+ */
+ok_status operator_estimate_norm_lanczos(void * linalg_handle, operator * A,
+	const ok_float rtol, const uint maxiter, operator_norm_estimate * est)
+{
+	OK_CHECK_OPERATOR(A);
+	OK_CHECK_PTR(est);
+
+	ok_status err = OPTKIT_SUCCESS;
+	size_t n = A->size2, b, steps, dim, N, i, j, k, l;
+	ok_float theta = kZero, resid, x;
+	ok_float * T = OK_NULL, * S = OK_NULL, * evecs = OK_NULL;
+	ok_float * evals = OK_NULL, * coef = OK_NULL, * coef_pass = OK_NULL;
+	ok_float * R = OK_NULL, * Y = OK_NULL;
+	int warm, blas_handle_provided = (linalg_handle != OK_NULL);
+	size_t * order = OK_NULL;
+	matrix Q, C, Q_basis, Q_j, W, Y_dev;
+	vector q, w, y, noise;
+
+	Q.data = OK_NULL;
+	C.data = OK_NULL;
+	y.data = OK_NULL;
+	noise.data = OK_NULL;
+
+	if (rtol <= 0 || maxiter == 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	b = est->block ? est->block : kNORMESTBLOCK;
+	b = b < n ? b : n;
+	warm = (est->V != OK_NULL && est->size2 == n && est->block == b);
+	if (est->V && !warm)
+		OK_RETURNIF_ERR( operator_norm_estimate_free(est) );
+	est->block = b;
+	est->size2 = n;
+	est->iterations = 0;
+	est->products = 0;
+
+	/* the Krylov space has dimension at most n */
+	steps = (n + b - 1) / b;
+	steps = maxiter < steps ? maxiter : steps;
+	dim = (steps + 1) * b;
+
+	if (!blas_handle_provided)
+		OK_RETURNIF_ERR( blas_make_handle(&linalg_handle) );
+
+	OK_CHECK_ERR( err, matrix_calloc(&Q, n, dim, CblasColMajor) );
+	OK_CHECK_ERR( err, matrix_calloc(&C, dim, b, CblasColMajor) );
+	OK_CHECK_ERR( err, vector_calloc(&y, A->size1) );
+	OK_CHECK_ERR( err, vector_calloc(&noise, n) );
+	ok_alloc(T, dim * dim * sizeof(*T));
+	ok_alloc(S, dim * dim * sizeof(*S));
+	ok_alloc(evecs, dim * dim * sizeof(*evecs));
+	ok_alloc(evals, dim * sizeof(*evals));
+	ok_alloc(order, dim * sizeof(*order));
+	ok_alloc(coef, dim * b * sizeof(*coef));
+	ok_alloc(coef_pass, dim * b * sizeof(*coef_pass));
+	ok_alloc(R, b * b * sizeof(*R));
+	ok_alloc(Y, dim * b * sizeof(*Y));
+
+	/* starting block: previous subspace (perturbed), or random */
+	OK_CHECK_ERR( err, matrix_submatrix(&Q_j, &Q, 0, 0, n, b) );
+	if (warm)
+		OK_CHECK_ERR( err, matrix_memcpy_ma(&Q_j, est->V,
+			CblasColMajor) );
+	for (i = 0; i < b && !err; ++i) {
+		OK_CHECK_ERR( err, matrix_column(&q, &Q_j, i) );
+		OK_CHECK_ERR( err, vector_uniform_rand(&noise, -kOne, kOne) );
+		if (warm)
+			OK_CHECK_ERR( err, vector_scale(&noise, (ok_float) 1e-2 /
+				MATH(sqrt)((ok_float) n)) );
+		OK_CHECK_ERR( err, vector_add(&q, &noise) );
+	}
+	OK_CHECK_ERR( err, __block_orthonormalize(linalg_handle, OK_NULL, &Q_j,
+		&C, coef, coef_pass, R) );
+
+	for (j = 0; j < steps && !err; ++j) {
+		N = (j + 1) * b;
+		OK_CHECK_ERR( err, matrix_submatrix(&Q_j, &Q, 0, j * b, n, b) );
+		OK_CHECK_ERR( err, matrix_submatrix(&W, &Q, 0, N, n, b) );
+		OK_CHECK_ERR( err, matrix_submatrix(&Q_basis, &Q, 0, 0, n, N) );
+
+		/* W = AᵀA * Q_j */
+		for (i = 0; i < b && !err; ++i) {
+			OK_CHECK_ERR( err, matrix_column(&q, &Q_j, i) );
+			OK_CHECK_ERR( err, matrix_column(&w, &W, i) );
+			OK_CHECK_ERR( err, A->apply(A->data, &q, &y) );
+			OK_CHECK_ERR( err, A->adjoint(A->data, &y, &w) );
+			est->products += 2;
+		}
+
+		/* column block j of T = Q_basisᵀ * AᵀA * Q_basis */
+		OK_CHECK_ERR( err, __block_orthonormalize(linalg_handle,
+			&Q_basis, &W, &C, coef, coef_pass, R) );
+		for (l = 0; l < b && !err; ++l)
+			for (k = 0; k < N; ++k) {
+				T[k + (j * b + l) * dim] = coef[k + l * N];
+				T[(j * b + l) + k * dim] = coef[k + l * N];
+			}
+		est->iterations = (uint) (j + 1);
+		if (err)
+			break;
+
+		/* Ritz values: eigenvalues of the leading N x N block of T */
+		for (l = 0; l < N; ++l)
+			for (k = 0; k < N; ++k)
+				S[k + l * N] = T[k + l * dim];
+		__symmetric_eig(S, evecs, evals, N);
+		for (k = 0; k < N; ++k)
+			order[k] = k;
+		for (k = 0; k < N; ++k)
+			for (l = k + 1; l < N; ++l)
+				if (evals[order[l]] > evals[order[k]]) {
+					i = order[k];
+					order[k] = order[l];
+					order[l] = i;
+				}
+		theta = evals[order[0]];
+
+		/* ||AᵀA * Q_basis * s - theta * Q_basis * s|| = ||R * s_j|| */
+		resid = kZero;
+		for (k = 0; k < b; ++k) {
+			x = kZero;
+			for (l = k; l < b; ++l)
+				x += R[k + l * b] *
+					evecs[j * b + l + order[0] * N];
+			resid += x * x;
+		}
+		resid = MATH(sqrt)(resid);
+		if (resid <= rtol * theta)
+			break;
+	}
+	if (j == steps)
+		--j;
+
+	/* leading block Ritz vectors, Q_basis * evecs[:, order[:b]] */
+	if (!err) {
+		N = (j + 1) * b;
+		for (l = 0; l < b; ++l)
+			for (k = 0; k < N; ++k)
+				Y[k + l * N] = evecs[k + order[l] * N];
+		OK_CHECK_ERR( err, matrix_submatrix(&Y_dev, &C, 0, 0, N, b) );
+		OK_CHECK_ERR( err, matrix_memcpy_ma(&Y_dev, Y, CblasColMajor) );
+		OK_CHECK_ERR( err, matrix_submatrix(&Q_basis, &Q, 0, 0, n, N) );
+		OK_CHECK_ERR( err, matrix_submatrix(&W, &Q, 0, N, n, b) );
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasNoTrans,
+			CblasNoTrans, kOne, &Q_basis, &Y_dev, kZero, &W) );
+		if (!est->V)
+			ok_alloc(est->V, n * b * sizeof(*est->V));
+		OK_CHECK_ERR( err, matrix_memcpy_am(est->V, &W, CblasColMajor) );
+	}
+	est->norm = theta > 0 ? MATH(sqrt)(theta) : kZero;
+
+	OK_MAX_ERR( err, matrix_free(&Q) );
+	OK_MAX_ERR( err, matrix_free(&C) );
+	OK_MAX_ERR( err, vector_free(&y) );
+	OK_MAX_ERR( err, vector_free(&noise) );
+	ok_free(T);
+	ok_free(S);
+	ok_free(evecs);
+	ok_free(evals);
+	ok_free(order);
+	ok_free(coef);
+	ok_free(coef_pass);
+	ok_free(R);
+	ok_free(Y);
+	if (!blas_handle_provided)
+		OK_MAX_ERR( err, blas_destroy_handle(linalg_handle) );
+	return err;
+}
+
+/* ||A||_2 to relative accuracy kNORMESTTOL, from a random start */
+ok_status operator_estimate_norm(void * linalg_handle, operator * A,
+	ok_float * norm_est)
+{
+	OK_CHECK_OPERATOR(A);
+	OK_CHECK_PTR(norm_est);
+
+	ok_status err = OPTKIT_SUCCESS;
+	operator_norm_estimate est = {kZero, 0, 0, OK_NULL, 0, 0};
+
+	*norm_est = kZero;
+	OK_CHECK_ERR( err, operator_estimate_norm_lanczos(linalg_handle, A,
+		kNORMESTTOL, kNORMESTMAXITER, &est) );
+	OK_MAX_ERR( err, operator_norm_estimate_free(&est) );
+	if (!err && est.norm == kZero)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+	if (!err)
+		*norm_est = est.norm;
+	return err;
+}
 #else
 ok_status operator_regularized_sinkhorn(void * linalg_handle, operator * A,
 	vector * d, vector * e, const ok_float pnorm)
@@ -262,12 +923,37 @@ ok_status operator_regularized_sinkhorn(void * linalg_handle, operator * A,
 	return OPTKIT_ERROR;
 }
 
+ok_status operator_randomized_equilibrate(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info)
+{
+	return OPTKIT_ERROR;
+}
+
+ok_status operator_equilibrate_settings(void * linalg_handle, operator * A,
+	vector * d, vector * e, const equilibration_settings * settings,
+	equilibration_info * info)
+{
+	return OPTKIT_ERROR;
+}
+
 ok_status operator_equilibrate(void * linalg_handle, operator * A,
 	vector * d, vector * e, const ok_float pnorm)
 {
 	return OPTKIT_ERROR;
 }
 
+ok_status operator_norm_estimate_free(operator_norm_estimate * est)
+{
+	return OPTKIT_ERROR;
+}
+
+ok_status operator_estimate_norm_lanczos(void * linalg_handle, operator * A,
+	const ok_float rtol, const uint maxiter, operator_norm_estimate * est)
+{
+	return OPTKIT_ERROR;
+}
+
 ok_status operator_estimate_norm(void * linalg_handle, operator * A,
 	ok_float * norm_est)
 {
@@ -14,14 +14,26 @@ ok_status projector_normalization(projector * P, int * normalized)
 
 	ok_status err = OPTKIT_SUCCESS;
 	dense_direct_projector * Pdd = OK_NULL;
+	sparse_direct_projector * Psd = OK_NULL;
 	indirect_projector_generic * Pi = OK_NULL;
+	panel_direct_projector * Ppd = OK_NULL;
+	pcg_projector * Ppcg = OK_NULL;
 
 	if (P->kind == OkProjectorDenseDirect) {
 		Pdd = (dense_direct_projector *) P->data;
 		*normalized =  Pdd->normalized;
+	} else if (P->kind == OkProjectorSparseDirect) {
+		Psd = (sparse_direct_projector *) P->data;
+		*normalized = Psd->normalized;
 	} else if (P->kind == OkProjectorIndirect) {
 		Pi = (indirect_projector_generic *) P->data;
 		*normalized = Pi->normalized;
+	} else if (P->kind == OkProjectorPanelDirect) {
+		Ppd = (panel_direct_projector *) P->data;
+		*normalized = Ppd->normalized;
+	} else if (P->kind == OkProjectorIndirectPCG) {
+		Ppcg = (pcg_projector *) P->data;
+		*normalized = Ppcg->normalized;
 	} else {
 		printf("%s", "projector normalizetion status unretrievable ");
 		printf("%s\n", "setting *normalized = 1");
@@ -38,14 +50,26 @@ ok_status projector_get_norm(projector * P, ok_float * norm)
 
 	ok_status err = OPTKIT_SUCCESS;
 	dense_direct_projector * Pdd = OK_NULL;
+	sparse_direct_projector * Psd = OK_NULL;
 	indirect_projector_generic * Pi = OK_NULL;
+	panel_direct_projector * Ppd = OK_NULL;
+	pcg_projector * Ppcg = OK_NULL;
 
 	if (P->kind == OkProjectorDenseDirect) {
 		Pdd = (dense_direct_projector *) P->data;
 		*norm = Pdd->normA;
+	} else if (P->kind == OkProjectorSparseDirect) {
+		Psd = (sparse_direct_projector *) P->data;
+		*norm = Psd->normA;
 	} else if (P->kind == OkProjectorIndirect) {
 		Pi = (indirect_projector_generic *) P->data;
 		*norm =  Pi->normA;
+	} else if (P->kind == OkProjectorPanelDirect) {
+		Ppd = (panel_direct_projector *) P->data;
+		*norm = Ppd->normA;
+	} else if (P->kind == OkProjectorIndirectPCG) {
+		Ppcg = (pcg_projector *) P->data;
+		*norm = Ppcg->normA;
 	} else {
 		printf("%s", "projector norm unretrievable, ");
 		printf("%s\n", "setting *norm = 1.0");
@@ -55,6 +79,94 @@ ok_status projector_get_norm(projector * P, ok_float * norm)
 	return err;
 }
 
+/*
+ * bytes held by the projector's factorization: the dense (or panel)
+ * Cholesky factor L, or the sparse LDLᵀ factor (L, D and ordering), or the
+ * block-Jacobi factors of a PCG projector; 0 for other indirect projectors
+ */
+ok_status projector_get_factor_memory(projector * P, size_t * bytes)
+{
+	OK_CHECK_PROJECTOR(P);
+	OK_CHECK_PTR(bytes);
+
+	dense_direct_projector * Pdd = OK_NULL;
+
+	*bytes = 0;
+	if (P->kind == OkProjectorDenseDirect) {
+		Pdd = (dense_direct_projector *) P->data;
+		if (Pdd->L32)
+			*bytes = Pdd->rhs->size * Pdd->rhs->size * sizeof(float);
+		else
+			*bytes = Pdd->L->size1 * Pdd->L->size2 * sizeof(ok_float);
+	}
+	else if (P->kind == OkProjectorPanelDirect)
+		*bytes = ((panel_direct_projector *) P->data)->L->size1 *
+			((panel_direct_projector *) P->data)->L->size2 *
+			sizeof(ok_float);
+	#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+	else if (P->kind == OkProjectorSparseDirect)
+		return OK_SCAN_ERR( sparse_ldl_memory(
+			&((sparse_direct_projector *) P->data)->F, bytes) );
+	else if (P->kind == OkProjectorIndirectPCG &&
+		((pcg_projector *) P->data)->L)
+		*bytes = ((pcg_projector *) P->data)->L->size1 *
+			((pcg_projector *) P->data)->L->size2 * sizeof(ok_float);
+	#endif
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * relative residual of the linear system solve in the last projection by
+ * a mixed precision dense direct projector; 0 for other projectors
+ */
+ok_status projector_get_refinement_residual(projector * P,
+	ok_float * residual)
+{
+	OK_CHECK_PROJECTOR(P);
+	OK_CHECK_PTR(residual);
+
+	*residual = kZero;
+	if (P->kind == OkProjectorDenseDirect)
+		*residual = ((dense_direct_projector *) P->data)->refinement_residual;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * drop the warm start of an indirect projector, so that the next
+ * projection starts CGLS from zero; no-op for other projectors
+ */
+ok_status projector_clear_warm_start(projector * P)
+{
+	OK_CHECK_PROJECTOR(P);
+	#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+	if (P->kind == OkProjectorIndirect)
+		return OK_SCAN_ERR( vector_set_all(
+			((indirect_projector_generic *) P->data)->dx, kZero) );
+	else if (P->kind == OkProjectorIndirectPCG)
+		((pcg_helper *) ((pcg_projector *) P->data)->pcg_work)->never_solved
+			= 1;
+	#endif
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * CGLS (PCG) iterations taken by all projections of an indirect (PCG)
+ * projector since its allocation; 0 for other projectors
+ */
+ok_status projector_get_cg_iterations(projector * P, uint * iterations)
+{
+	OK_CHECK_PROJECTOR(P);
+	OK_CHECK_PTR(iterations);
+
+	*iterations = 0;
+	#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+	if (P->kind == OkProjectorIndirect)
+		*iterations = ((indirect_projector_generic *) P->data)->iterations;
+	else if (P->kind == OkProjectorIndirectPCG)
+		*iterations = ((pcg_projector *) P->data)->iterations;
+	#endif
+	return OPTKIT_SUCCESS;
+}
 
 /* Direct Projector methods */
 ok_status direct_projector_alloc(direct_projector * P, matrix * A)
@@ -165,7 +277,129 @@ ok_status direct_projector_project(void * linalg_handle, direct_projector * P,
 	}
 }
 
+/*
+ * project the K columns of (X_in, Y_in) onto the graph {(x, y) : y = Ax},
+ * with one pair of triangular solves against the cached factor L:
+ *
+ *	skinny: X_out = (I + A'A)^{-1} (X_in + A'Y_in),  Y_out = A * X_out
+ *	fat:	Y_out = Y_in + (I + AA')^{-1} (A * X_in - Y_in),
+ *		X_out = X_in - A' (Y_out - Y_in)
+ */
+ok_status direct_projector_project_batch(void * linalg_handle,
+	direct_projector * P, matrix * X_in, matrix * Y_in, matrix * X_out,
+	matrix * Y_out)
+{
+	if (!P || !P->A || !P->L)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_CHECK_MATRIX(X_in);
+	OK_CHECK_MATRIX(Y_in);
+	OK_CHECK_MATRIX(X_out);
+	OK_CHECK_MATRIX(Y_out);
+
+	ok_status err = OPTKIT_SUCCESS;
+	vector y_in, y_out;
+	size_t j;
+
+	if (X_in->size2 != Y_in->size2 || X_out->size2 != X_in->size2 ||
+		Y_out->size2 != X_in->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	if (P->skinny) {
+		OK_RETURNIF_ERR(
+			matrix_memcpy_mm(X_out, X_in) );
+		OK_RETURNIF_ERR(
+			blas_gemm(linalg_handle, CblasTrans, CblasNoTrans, kOne,
+				P->A, Y_in, kOne, X_out) );
+		OK_RETURNIF_ERR(
+			blas_trsm(linalg_handle, CblasLeft, CblasLower,
+				CblasNoTrans, CblasNonUnit, kOne, P->L, X_out) );
+		OK_RETURNIF_ERR(
+			blas_trsm(linalg_handle, CblasLeft, CblasLower,
+				CblasTrans, CblasNonUnit, kOne, P->L, X_out) );
+		return OK_SCAN_ERR(
+			blas_gemm(linalg_handle, CblasNoTrans, CblasNoTrans,
+				kOne, P->A, X_out, kZero, Y_out) );
+	} else {
+		OK_RETURNIF_ERR(
+			matrix_memcpy_mm(Y_out, Y_in) );
+		OK_RETURNIF_ERR(
+			blas_gemm(linalg_handle, CblasNoTrans, CblasNoTrans,
+				kOne, P->A, X_in, -kOne, Y_out) );
+		OK_RETURNIF_ERR(
+			blas_trsm(linalg_handle, CblasLeft, CblasLower,
+				CblasNoTrans, CblasNonUnit, kOne, P->L, Y_out) );
+		OK_RETURNIF_ERR(
+			blas_trsm(linalg_handle, CblasLeft, CblasLower,
+				CblasTrans, CblasNonUnit, kOne, P->L, Y_out) );
+		OK_RETURNIF_ERR(
+			matrix_memcpy_mm(X_out, X_in) );
+		OK_RETURNIF_ERR(
+			blas_gemm(linalg_handle, CblasTrans, CblasNoTrans, -kOne,
+				P->A, Y_out, kOne, X_out) );
+		for (j = 0; j < Y_out->size2 && !err; ++j) {
+			OK_CHECK_ERR( err, matrix_column(&y_in, Y_in, j) );
+			OK_CHECK_ERR( err, matrix_column(&y_out, Y_out, j) );
+			OK_CHECK_ERR( err,
+				blas_axpy(linalg_handle, kOne, &y_in, &y_out) );
+		}
+		return err;
+	}
+}
+
 #ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+/*
+ * x_out = x_in + dx, y_out = Ax_out, with dx updated in place by CGLS to
+ *
+ *	argmin_dx || A dx - (y_in - Ax_in) ||^2 + ||dx||^2,
+ *
+ * warm-started from the dx of the previous projection. the CGLS stopping
+ * test is taken relative to ||Aᵀ(y_in - Ax_in)||, as for a cold start,
+ * so a good warm start saves iterations at the same accuracy.
+ */
+static ok_status indirect_projector_solve(void * linalg_handle,
+	operator * A, void * cgls_work, vector * dx, vector * x_in,
+	vector * y_in, vector * x_out, vector * y_out, const ok_float tol,
+	const size_t maxiter, uint * flag, uint * iterations)
+{
+	cgls_helper * h = (cgls_helper *) cgls_work;
+
+	OK_CHECK_VECTOR(x_in);
+	OK_CHECK_VECTOR(y_in);
+	OK_CHECK_VECTOR(x_out);
+	OK_CHECK_VECTOR(y_out);
+	if (x_in->size != dx->size || x_out->size != dx->size ||
+		y_in->size != A->size1 || y_out->size != A->size1)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	/* y_out = y_in - Ax_in */
+	OK_RETURNIF_ERR(
+		vector_memcpy_vv(y_out, y_in) );
+	OK_RETURNIF_ERR(
+		A->fused_apply(A->data, -kOne, x_in, kOne, y_out) );
+
+	/* reference norm ||Aᵀ(y_in - Ax_in)||, with x_out as workspace */
+	OK_RETURNIF_ERR(
+		A->adjoint(A->data, y_out, x_out) );
+	OK_RETURNIF_ERR(
+		blas_nrm2(linalg_handle, x_out, &h->norm_ref) );
+
+	/* Minimize ||A dx - (y_in - Ax_in) ||_2 + ||dx||_2 */
+	OK_RETURNIF_ERR(
+		cgls_solve(cgls_work, A, y_out, dx, kOne, tol, maxiter,
+			kQuietCG, flag) );
+	*iterations += h->iters;
+
+	/* x_out = x_in + dx */
+	OK_RETURNIF_ERR(
+		vector_memcpy_vv(x_out, x_in) );
+	OK_RETURNIF_ERR(
+		blas_axpy(linalg_handle, kOne, dx, x_out) );
+
+	/* y_out = Ax_out */
+	return OK_SCAN_ERR(
+		A->apply(A->data, x_out, y_out) );
+}
+
 /* Indirect Projector methods */
 ok_status indirect_projector_alloc(indirect_projector * P, operator * A)
 {
@@ -177,11 +411,14 @@ ok_status indirect_projector_alloc(indirect_projector * P, operator * A)
 		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
 
 	P->A = A;
+	P->iterations = 0;
 	P->cgls_work = cgls_init(A->size1, A->size2);
-	if (!P->A || !P->cgls_work) {
+	ok_alloc(P->dx, sizeof(*P->dx));
+	OK_CHECK_ERR( err, vector_calloc(P->dx, A->size2) );
+	if (!err && !P->cgls_work)
 		err = OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (err)
 		OK_MAX_ERR( err, indirect_projector_free(P) );
-	}
 	return err;
 }
 
@@ -230,67 +467,100 @@ ok_status indirect_projector_project(void * linalg_handle,
 	vector * y_out)
 {
 	OK_CHECK_PTR(P);
-	OK_CHECK_VECTOR(x_in);
-	OK_CHECK_VECTOR(y_in);
-	OK_CHECK_VECTOR(x_out);
-	OK_CHECK_VECTOR(y_out);
-
-	/* y_out = y_in - Ax_in */
-	OK_RETURNIF_ERR(
-		vector_memcpy_vv(y_out, y_in) );
-
-	OK_RETURNIF_ERR(
-		P->A->fused_apply(P->A->data, -kOne, x_in, kOne, y_out) );
-
-	/* Minimize ||Ax_out - (y_in - Ax_in) ||_2 + ||x_out||_2*/
-	OK_RETURNIF_ERR(
-		cgls_solve(P->cgls_work, P->A, y_out, x_out, kOne,
-			(ok_float) 1e-12, 100, 1, &P->flag) );
-
-	/* x_out += x0 */
-	OK_RETURNIF_ERR(
-		blas_axpy(linalg_handle, kOne, x_in, x_out) );
+	if (!P->A || !P->cgls_work || !P->dx)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
-	/* y_out = Ax_out */
-	return OK_SCAN_ERR(
-		P->A->apply(P->A->data, x_out, y_out) );
+	return indirect_projector_solve(linalg_handle, P->A, P->cgls_work,
+		P->dx, x_in, y_in, x_out, y_out, (ok_float) 1e-12, kItersCG,
+		&P->flag, &P->iterations);
 }
 
 ok_status indirect_projector_free(indirect_projector * P)
 {
 	OK_CHECK_PTR(P);
-	ok_status err = OK_SCAN_ERR( cgls_finish(P->cgls_work) );
+	ok_status err = OPTKIT_SUCCESS;
+	if (P->cgls_work)
+		err = OK_SCAN_ERR( cgls_finish(P->cgls_work) );
+	if (P->dx && P->dx->data)
+		OK_MAX_ERR( err, vector_free(P->dx) );
+	ok_free(P->dx);
 	P->cgls_work = OK_NULL;
 	P->A = OK_NULL;
 	return err;
 }
 #endif /* ndef OPTKIT_NO_INDIRECT_PROJECTOR */
 
-void * dense_direct_projector_data_alloc(matrix * A)
+static const uint kRefinementSteps = 2;
+static const size_t kPanel32 = 256;
+
+static ok_status __dense_direct_projector_data_alloc(matrix * A,
+	dense_direct_projector ** P_out, const OPTKIT_DIRECT_FACTOR factor)
 {
 	ok_status err = OPTKIT_SUCCESS;
-	size_t mindim;
+	size_t mindim, size1, size2;
 	dense_direct_projector * P = OK_NULL;
-	if (A && A->data) {
-		mindim = (A->size1 < A->size2) ? A->size1 : A->size2;
 
-		ok_alloc(P, sizeof(*P));
-		P->A = A;
+	*P_out = OK_NULL;
+	OK_CHECK_MATRIX(A);
+	mindim = (A->size1 < A->size2) ? A->size1 : A->size2;
+
+	ok_alloc(P, sizeof(*P));
+	P->A = A;
+	P->normA = kOne;
+	P->skinny = (uint) mindim == A->size2;
+	P->normalized = 0;
+	P->packed = factor == OkDirectPacked;
 
+	if (factor == OkDirectMixed) {
+		ok_alloc(P->L32, mindim * mindim * sizeof(*P->L32));
+		ok_alloc(P->w32, mindim * sizeof(*P->w32));
+		ok_alloc(P->w, mindim * sizeof(*P->w));
+		ok_alloc(P->rhs, sizeof(*P->rhs));
+		ok_alloc(P->r, sizeof(*P->r));
+		OK_CHECK_ERR( err, vector_calloc(P->rhs, mindim) );
+		OK_CHECK_ERR( err, vector_calloc(P->r, mindim) );
+		P->refinement_steps = kRefinementSteps;
+	} else if (P->packed) {
 		ok_alloc(P->L, sizeof(*P->L));
+		OK_CHECK_ERR( err, linalg_rfp_size(mindim, &size1, &size2) );
 		OK_CHECK_ERR( err,
-			matrix_calloc(P->L, mindim, mindim, A->order) );
-		P->normA = kOne;
-		P->skinny = (uint) mindim == A->size2;
-		P->normalized = 0;
+			matrix_calloc(P->L, size1, size2, A->order) );
+	} else {
+		ok_alloc(P->L, sizeof(*P->L));
 		OK_CHECK_ERR( err,
-			blas_make_handle(&(P->linalg_handle)) );
-		if (err) {
-			OK_MAX_ERR( err,
-				dense_direct_projector_data_free((void *) P) );
-			P = OK_NULL;
-		}
+			matrix_calloc(P->L, mindim, mindim, A->order) );
 	}
+	OK_CHECK_ERR( err,
+		blas_make_handle(&(P->linalg_handle)) );
+	if (err)
+		OK_MAX_ERR( err,
+			dense_direct_projector_data_free((void *) P) );
+	else
+		*P_out = P;
+	return err;
+}
+
+void * dense_direct_projector_data_alloc(matrix * A)
+{
+	dense_direct_projector * P = OK_NULL;
+	if (A && A->data)
+		__dense_direct_projector_data_alloc(A, &P, OkDirectFull);
+	return (void *) P;
+}
+
+void * dense_direct_projector_data_alloc_mixed(matrix * A)
+{
+	dense_direct_projector * P = OK_NULL;
+	if (A && A->data)
+		__dense_direct_projector_data_alloc(A, &P, OkDirectMixed);
+	return (void *) P;
+}
+
+void * dense_direct_projector_data_alloc_packed(matrix * A)
+{
+	dense_direct_projector * P = OK_NULL;
+	if (A && A->data)
+		__dense_direct_projector_data_alloc(A, &P, OkDirectPacked);
 	return (void *) P;
 }
 
@@ -299,135 +569,771 @@ ok_status dense_direct_projector_data_free(void * data)
 	OK_CHECK_PTR(data);
 
 	dense_direct_projector * P = (dense_direct_projector *) data;
-	ok_status err = OK_SCAN_ERR( blas_destroy_handle(P->linalg_handle) );
-	OK_MAX_ERR( err, matrix_free(P->L) );
+	ok_status err = OPTKIT_SUCCESS;
+	if (P->linalg_handle)
+		err = OK_SCAN_ERR( blas_destroy_handle(P->linalg_handle) );
+	if (P->L)
+		OK_MAX_ERR( err, matrix_free(P->L) );
+	if (P->rhs)
+		OK_MAX_ERR( err, vector_free(P->rhs) );
+	if (P->r)
+		OK_MAX_ERR( err, vector_free(P->r) );
 	ok_free(P->L);
+	ok_free(P->L32);
+	ok_free(P->w32);
+	ok_free(P->w);
+	ok_free(P->rhs);
+	ok_free(P->r);
 	ok_free(P);
 	return err;
 }
 
-ok_status dense_direct_projector_initialize(void * data, int normalize)
+/* entry (i, j) of the mindim x mindim single precision factor */
+static float * __dense_direct_projector_L32(dense_direct_projector * P,
+	size_t i, size_t j)
+{
+	size_t ld = P->rhs->size;
+	return (P->A->order == CblasRowMajor) ? P->L32 + i * ld + j :
+		P->L32 + i + j * ld;
+}
+
+/*
+ * form the lower triangle of AᵀA (skinny) or AAᵀ (fat) in L32, from
+ * panels of kPanel32 rows (resp. columns) of A rounded to single
+ * precision; set mean_diag to the mean of its diagonal
+ */
+static ok_status __dense_direct_projector_gram32(dense_direct_projector * P,
+	ok_float * mean_diag)
 {
-	dense_direct_projector * P = (dense_direct_projector *) data;
-	direct_projector DP;
 	ok_status err = OPTKIT_SUCCESS;
+	const enum CBLAS_ORDER order = P->A->order;
+	const size_t mindim = P->rhs->size;
+	const size_t maxdim = P->skinny ? P->A->size1 : P->A->size2;
+	size_t blk = kPanel32 < maxdim ? kPanel32 : maxdim;
+	size_t i, k, nb;
+	int ld;
+	ok_float * panel = OK_NULL;
+	float * panel32 = OK_NULL;
+	ok_float diag = kZero;
+	matrix A_panel;
 
-	if (!P || !P->A || !P->L)
-		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	A_panel.data = OK_NULL;
+	ok_alloc(panel, blk * mindim * sizeof(*panel));
+	ok_alloc(panel32, blk * mindim * sizeof(*panel32));
 
-	DP.A = P->A;
-	DP.L = P->L;
-	DP.normA = P->normA;
-	DP.skinny = P->skinny;
-	DP.normalized = P->normalized;
-	err = OK_SCAN_ERR(
-		direct_projector_initialize(P->linalg_handle, &DP, normalize) );
-	P->normalized = DP.normalized;
-	P->normA = DP.normA;
+	for (i = 0; i < maxdim && !err; i += blk) {
+		nb = blk < maxdim - i ? blk : maxdim - i;
+		if (P->skinny)
+			OK_CHECK_ERR( err, matrix_submatrix(&A_panel, P->A, i, 0,
+				nb, mindim) );
+		else
+			OK_CHECK_ERR( err, matrix_submatrix(&A_panel, P->A, 0, i,
+				mindim, nb) );
+		OK_CHECK_ERR( err, matrix_memcpy_am(panel, &A_panel, order) );
+		if (err)
+			break;
+
+		for (k = 0; k < nb * mindim; ++k)
+			panel32[k] = (float) panel[k];
+
+		/* skinny: L32 += panelᵀpanel; fat: L32 += panel * panelᵀ */
+		if (P->skinny) {
+			ld = (int) ((order == CblasRowMajor) ? mindim : nb);
+			cblas_ssyrk(order, CblasLower, CblasTrans, (int) mindim,
+				(int) nb, 1.f, panel32, ld, i ? 1.f : 0.f, P->L32,
+				(int) mindim);
+		} else {
+			ld = (int) ((order == CblasRowMajor) ? nb : mindim);
+			cblas_ssyrk(order, CblasLower, CblasNoTrans,
+				(int) mindim, (int) nb, 1.f, panel32, ld,
+				i ? 1.f : 0.f, P->L32, (int) mindim);
+		}
+	}
+
+	for (k = 0; k < mindim; ++k)
+		diag += (ok_float) P->L32[k * (mindim + 1)];
+	*mean_diag = diag / (ok_float) mindim;
+
+	ok_free(panel);
+	ok_free(panel32);
 	return err;
 }
 
-ok_status dense_direct_projector_project(void * data, vector * x_in, vector * y_in,
-	vector * x_out, vector * y_out, ok_float tol)
+/*
+ * add the identity to L32 and overwrite its lower triangle with the
+ * Cholesky factor, by the blocked algorithm of linalg_cholesky_decomp
+ */
+static ok_status __dense_direct_projector_cholesky32(
+	dense_direct_projector * P)
 {
-	dense_direct_projector * P = (dense_direct_projector *) data;
-	direct_projector DP;
+	const enum CBLAS_ORDER order = P->A->order;
+	const size_t n = P->rhs->size;
+	const int ld = (int) n;
+	const int stride = (order == CblasRowMajor) ? ld : 1;
+	size_t i, j, n11, n21, blk_dim = 128;
+	float l11;
 
-	if (!P || !P->A || !P->L)
-		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	for (j = 0; j < n; ++j)
+		*__dense_direct_projector_L32(P, j, j) += 1.f;
 
-	DP.A = P->A;
-	DP.L = P->L;
-	DP.normA = P->normA;
-	DP.skinny = P->skinny;
-	DP.normalized = P->normalized;
-	return OK_SCAN_ERR(
-		direct_projector_project(P->linalg_handle, &DP, x_in, y_in,
-			x_out, y_out) );
-}
+	for (i = 0; i < n; i += blk_dim) {
+		n11 = blk_dim < n - i ? blk_dim : n - i;
+		n21 = n - i - n11;
 
-projector * dense_direct_projector_alloc(matrix * A)
-{
-	projector * P = OK_NULL;
-	P = malloc(sizeof(*P));
-	P->kind = OkProjectorDenseDirect;
-	P->size1 = A->size1;
-	P->size2 = A->size2;
-	P->data = dense_direct_projector_data_alloc(A);
-	P->initialize = dense_direct_projector_initialize;
-	P->project = dense_direct_projector_project;
-	P->free = dense_direct_projector_data_free;
-	if (!P->data)
-		ok_free(P);
-	return P;
+		/* L11 = chol(A11) */
+		for (j = i; j < i + n11; ++j) {
+			l11 = *__dense_direct_projector_L32(P, j, j);
+			if (l11 < 0)
+				return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+			else if (l11 == 0)
+				return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+
+			l11 = sqrtf(l11);
+			*__dense_direct_projector_L32(P, j, j) = l11;
+			if (j + 1 == i + n11)
+				break;
+
+			cblas_sscal((int) (i + n11 - j - 1), 1.f / l11,
+				__dense_direct_projector_L32(P, j + 1, j), stride);
+			cblas_ssyr(order, CblasLower, (int) (i + n11 - j - 1),
+				-1.f, __dense_direct_projector_L32(P, j + 1, j),
+				stride, __dense_direct_projector_L32(P, j + 1, j + 1),
+				ld);
+		}
+
+		if (!n21)
+			break;
+
+		/* L21 = A21 L11^-T; A22 -= L21 * L21ᵀ */
+		cblas_strsm(order, CblasRight, CblasLower, CblasTrans,
+			CblasNonUnit, (int) n21, (int) n11, 1.f,
+			__dense_direct_projector_L32(P, i, i), ld,
+			__dense_direct_projector_L32(P, i + n11, i), ld);
+		cblas_ssyrk(order, CblasLower, CblasNoTrans, (int) n21,
+			(int) n11, -1.f, __dense_direct_projector_L32(P, i + n11, i),
+			ld, 1.f, __dense_direct_projector_L32(P, i + n11, i + n11),
+			ld);
+	}
+	return OPTKIT_SUCCESS;
 }
 
-#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
-void * indirect_projector_data_alloc(operator * A)
+/* v = (L32 L32ᵀ)⁻¹ v, with the solve in single precision */
+static ok_status __dense_direct_projector_svx32(dense_direct_projector * P,
+	vector * v)
 {
-	ok_status err = OPTKIT_SUCCESS;
-	indirect_projector_generic * P = OK_NULL;
-	ok_alloc(P, sizeof(*P));
-	P->A = A;
-	P->cgls_work = cgls_init(A->size1, A->size2);
-	P->normA = kOne;
-	P->normalized = 0;
-	err = blas_make_handle(&(P->linalg_handle));
-	if (err || !P->A || !P->cgls_work) {
-		OK_MAX_ERR( err,
-			indirect_projector_data_free((void *) P) );
-		P = OK_NULL;
-	}
+	const int n = (int) P->rhs->size;
+	size_t k;
 
-	return (void *) P;
+	OK_RETURNIF_ERR( vector_memcpy_av(P->w, v, 1) );
+	for (k = 0; k < v->size; ++k)
+		P->w32[k] = (float) P->w[k];
+	cblas_strsv(P->A->order, CblasLower, CblasNoTrans, CblasNonUnit, n,
+		P->L32, n, P->w32, 1);
+	cblas_strsv(P->A->order, CblasLower, CblasTrans, CblasNonUnit, n,
+		P->L32, n, P->w32, 1);
+	for (k = 0; k < v->size; ++k)
+		P->w[k] = (ok_float) P->w32[k];
+	return OK_SCAN_ERR( vector_memcpy_va(v, P->w, 1) );
 }
 
-ok_status indirect_projector_data_free(void * data)
+/*
+ * form AᵀA (skinny) or AAᵀ (fat) in RFP storage in L; set mean_diag to
+ * the mean of its diagonal
+ */
+static ok_status __dense_direct_projector_gram_packed(
+	dense_direct_projector * P, ok_float * mean_diag)
 {
-	OK_CHECK_PTR(data);
+	ok_status err = OPTKIT_SUCCESS;
+	matrix L11, L21, U22;
+	vector diag;
+	ok_float sum11 = kZero, sum22 = kZero;
 
-	indirect_projector_generic * P = (indirect_projector_generic *) data;
-	ok_status err = OK_SCAN_ERR( cgls_finish(P->cgls_work) );
-	OK_MAX_ERR( err, blas_destroy_handle(P->linalg_handle) );
-	ok_free(P);
+	diag.data = OK_NULL;
+	OK_CHECK_ERR( err, linalg_rfp_gram(P->linalg_handle,
+		P->skinny ? CblasTrans : CblasNoTrans, kOne, P->A, kZero,
+		P->L) );
+	OK_CHECK_ERR( err, linalg_rfp_blocks(P->L, &L11, &L21, &U22) );
+	OK_CHECK_ERR( err, matrix_diagonal(&diag, &L11) );
+	OK_CHECK_ERR( err, blas_asum(P->linalg_handle, &diag, &sum11) );
+	if (!err && U22.size1) {
+		OK_CHECK_ERR( err, matrix_diagonal(&diag, &U22) );
+		OK_CHECK_ERR( err, blas_asum(P->linalg_handle, &diag, &sum22) );
+	}
+	*mean_diag = (sum11 + sum22) / (ok_float) (L11.size1 + U22.size1);
 	return err;
 }
 
-/* STUB??? or ok as no-op? */
-ok_status indirect_projector_g_initialize(void * data, int normalize)
+/* add the identity to L, in RFP storage, and factor it in place */
+static ok_status __dense_direct_projector_cholesky_packed(
+	dense_direct_projector * P)
 {
-	/* estimate norm */
-	/* normalize */
-	OK_CHECK_PTR(data);
-	return OPTKIT_SUCCESS;
+	ok_status err = OPTKIT_SUCCESS;
+	matrix L11, L21, U22;
+	vector diag;
 
+	diag.data = OK_NULL;
+	OK_CHECK_ERR( err, linalg_rfp_blocks(P->L, &L11, &L21, &U22) );
+	OK_CHECK_ERR( err, matrix_diagonal(&diag, &L11) );
+	OK_CHECK_ERR( err, vector_add_constant(&diag, kOne) );
+	if (!err && U22.size1) {
+		OK_CHECK_ERR( err, matrix_diagonal(&diag, &U22) );
+		OK_CHECK_ERR( err, vector_add_constant(&diag, kOne) );
+	}
+	OK_CHECK_ERR( err,
+		linalg_cholesky_decomp_rfp(P->linalg_handle, P->L) );
+	return err;
 }
 
-ok_status indirect_projector_g_project(void * data, vector * x_in, vector * y_in,
-	vector * x_out, vector * y_out, ok_float tol)
+/*
+ * (re)form and factor I + AᵀA (or I + AAᵀ) from the current values of A,
+ * without normalizing A or changing normA
+ */
+ok_status dense_direct_projector_factor(void * data)
 {
-	indirect_projector_generic * P = (indirect_projector_generic *) data;
-	OK_CHECK_PTR(P);
+	dense_direct_projector * P = (dense_direct_projector *) data;
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float mean_diag;
+	vector diag;
 
-	/* y_out = y_in - Ax_in */
-	OK_RETURNIF_ERR(
-		vector_memcpy_vv(y_out, y_in) );
+	if (!P || !P->A || !(P->L || P->L32))
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
-	OK_RETURNIF_ERR(
-		P->A->fused_apply(P->A->data, -kOne, x_in, kOne, y_out) );
+	if (P->L32) {
+		OK_CHECK_ERR( err,
+			__dense_direct_projector_gram32(P, &mean_diag) );
+		OK_CHECK_ERR( err,
+			__dense_direct_projector_cholesky32(P) );
+		return err;
+	}
 
-	/* Minimize ||Ax_out - (y_in - Ax_in) ||_2 + ||x_out||_2*/
-	OK_RETURNIF_ERR(
-		cgls_solve(P->cgls_work, P->A, y_out, x_out, kOne, tol,
-			kItersCG, kQuietCG, &P->flag) );
+	if (P->packed) {
+		OK_CHECK_ERR( err,
+			__dense_direct_projector_gram_packed(P, &mean_diag) );
+		OK_CHECK_ERR( err,
+			__dense_direct_projector_cholesky_packed(P) );
+		return err;
+	}
 
-	/* x_out += x0 */
-	OK_RETURNIF_ERR(
-		blas_axpy(P->linalg_handle, kOne, x_in, x_out) );
+	diag.data = OK_NULL;
+	if (P->skinny)
+		OK_CHECK_ERR( err, blas_gemm(P->linalg_handle, CblasTrans,
+			CblasNoTrans, kOne, P->A, P->A, kZero, P->L) );
+	else
+		OK_CHECK_ERR( err, blas_gemm(P->linalg_handle, CblasNoTrans,
+			CblasTrans, kOne, P->A, P->A, kZero, P->L) );
+	OK_CHECK_ERR( err, matrix_diagonal(&diag, P->L) );
+	OK_CHECK_ERR( err, vector_add_constant(&diag, kOne) );
+	OK_CHECK_ERR( err,
+		linalg_cholesky_decomp(P->linalg_handle, P->L) );
+	return err;
+}
+
+ok_status dense_direct_projector_initialize(void * data, int normalize)
+{
+	dense_direct_projector * P = (dense_direct_projector *) data;
+	direct_projector DP;
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float mean_diag = kZero;
+
+	if (!P || !P->A || !(P->L || P->L32))
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	if (P->L32) {
+		OK_RETURNIF_ERR(
+			__dense_direct_projector_gram32(P, &mean_diag) );
+		if (mean_diag == 0)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+		P->normA = MATH(sqrt)(mean_diag);
+
+		if (normalize) {
+			cblas_sscal((int) (P->rhs->size * P->rhs->size),
+				(float) (kOne / mean_diag), P->L32, 1);
+			OK_RETURNIF_ERR(
+				matrix_scale(P->A, kOne / P->normA) );
+		}
+		P->normalized = normalize;
+		return OK_SCAN_ERR( __dense_direct_projector_cholesky32(P) );
+	}
+
+	if (P->packed) {
+		OK_RETURNIF_ERR(
+			__dense_direct_projector_gram_packed(P, &mean_diag) );
+		if (mean_diag == 0)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+		P->normA = MATH(sqrt)(mean_diag);
+
+		if (normalize) {
+			OK_RETURNIF_ERR(
+				matrix_scale(P->L, kOne / mean_diag) );
+			OK_RETURNIF_ERR(
+				matrix_scale(P->A, kOne / P->normA) );
+		}
+		P->normalized = normalize;
+		return OK_SCAN_ERR( __dense_direct_projector_cholesky_packed(P) );
+	}
+
+	DP.A = P->A;
+	DP.L = P->L;
+	DP.normA = P->normA;
+	DP.skinny = P->skinny;
+	DP.normalized = P->normalized;
+	err = OK_SCAN_ERR(
+		direct_projector_initialize(P->linalg_handle, &DP, normalize) );
+	P->normalized = DP.normalized;
+	P->normA = DP.normA;
+	return err;
+}
+
+/*
+ * mixed precision projection: with M = I + AᵀA (skinny) or I + AAᵀ
+ * (fat), solve Mu = b with the single precision factor, then refine
+ *
+ *	r = b - Mu,	u += M⁻¹r,
+ *
+ * forming r with A in full precision, until ||r|| / ||b|| <= tol or
+ * refinement_steps corrections have been applied. the unknown u is x_out
+ * (skinny) or y_out - y_in (fat), as in direct_projector_project.
+ */
+static ok_status __dense_direct_projector_project_mixed(
+	dense_direct_projector * P, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out, ok_float tol)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	void * hdl = P->linalg_handle;
+	vector * u = P->skinny ? x_out : y_out;
+	vector * Au = P->skinny ? y_out : x_out;
+	enum CBLAS_TRANSPOSE t_apply = P->skinny ? CblasNoTrans : CblasTrans;
+	enum CBLAS_TRANSPOSE t_adjoint = P->skinny ? CblasTrans : CblasNoTrans;
+	ok_float norm_b = kZero, norm_r = kZero;
+	uint i;
+
+	/* skinny: b = x_in + Aᵀy_in; fat: b = Ax_in - y_in */
+	if (P->skinny) {
+		OK_CHECK_ERR( err, vector_memcpy_vv(P->rhs, x_in) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasTrans, kOne, P->A, y_in,
+			kOne, P->rhs) );
+	} else {
+		OK_CHECK_ERR( err, vector_memcpy_vv(P->rhs, y_in) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasNoTrans, kOne, P->A,
+			x_in, -kOne, P->rhs) );
+	}
+	OK_CHECK_ERR( err, blas_nrm2(hdl, P->rhs, &norm_b) );
+	OK_CHECK_ERR( err, vector_memcpy_vv(u, P->rhs) );
+	OK_CHECK_ERR( err, __dense_direct_projector_svx32(P, u) );
+
+	for (i = 0; !err; ++i) {
+		/* r = b - u - Aᵀ(Au) (skinny), b - u - A(Aᵀu) (fat) */
+		OK_CHECK_ERR( err, blas_gemv(hdl, t_apply, kOne, P->A, u, kZero,
+			Au) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(P->r, P->rhs) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, -kOne, u, P->r) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, t_adjoint, -kOne, P->A, Au,
+			kOne, P->r) );
+		OK_CHECK_ERR( err, blas_nrm2(hdl, P->r, &norm_r) );
+		if (norm_b > 0)
+			norm_r /= norm_b;
+		if (err || norm_r <= tol || i == P->refinement_steps)
+			break;
 
-	/* y_out = Ax_ouy */
+		OK_CHECK_ERR( err, __dense_direct_projector_svx32(P, P->r) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, kOne, P->r, u) );
+	}
+	P->refinement_residual = norm_r;
+
+	/* skinny: y_out = Ax_out (held in Au); fat: x_out = x_in - Aᵀu */
+	if (!P->skinny) {
+		OK_CHECK_ERR( err, blas_scal(hdl, -kOne, x_out) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, kOne, x_in, x_out) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, kOne, y_in, y_out) );
+	}
+	return err;
+}
+
+/* projection with the factor in RFP storage, as direct_projector_project */
+static ok_status __dense_direct_projector_project_packed(
+	dense_direct_projector * P, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	void * hdl = P->linalg_handle;
+
+	if (P->skinny) {
+		OK_CHECK_ERR( err, vector_memcpy_vv(x_out, x_in) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasTrans, kOne, P->A, y_in,
+			kOne, x_out) );
+		OK_CHECK_ERR( err, linalg_cholesky_svx_rfp(hdl, P->L, x_out) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasNoTrans, kOne, P->A,
+			x_out, kZero, y_out) );
+	} else {
+		OK_CHECK_ERR( err, vector_memcpy_vv(y_out, y_in) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasNoTrans, kOne, P->A,
+			x_in, -kOne, y_out) );
+		OK_CHECK_ERR( err, linalg_cholesky_svx_rfp(hdl, P->L, y_out) );
+		OK_CHECK_ERR( err, blas_gemv(hdl, CblasTrans, -kOne, P->A,
+			y_out, kZero, x_out) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, kOne, y_in, y_out) );
+		OK_CHECK_ERR( err, blas_axpy(hdl, kOne, x_in, x_out) );
+	}
+	return err;
+}
+
+ok_status dense_direct_projector_project(void * data, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out, ok_float tol)
+{
+	dense_direct_projector * P = (dense_direct_projector *) data;
+	direct_projector DP;
+
+	if (!P || !P->A || !(P->L || P->L32))
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	if (P->L32) {
+		OK_CHECK_VECTOR(x_in);
+		OK_CHECK_VECTOR(y_in);
+		OK_CHECK_VECTOR(x_out);
+		OK_CHECK_VECTOR(y_out);
+		return OK_SCAN_ERR( __dense_direct_projector_project_mixed(P,
+			x_in, y_in, x_out, y_out, tol) );
+	}
+
+	if (P->packed) {
+		OK_CHECK_VECTOR(x_in);
+		OK_CHECK_VECTOR(y_in);
+		OK_CHECK_VECTOR(x_out);
+		OK_CHECK_VECTOR(y_out);
+		return OK_SCAN_ERR( __dense_direct_projector_project_packed(P,
+			x_in, y_in, x_out, y_out) );
+	}
+
+	DP.A = P->A;
+	DP.L = P->L;
+	DP.normA = P->normA;
+	DP.skinny = P->skinny;
+	DP.normalized = P->normalized;
 	return OK_SCAN_ERR(
-		P->A->apply(P->A->data, x_out, y_out) );
+		direct_projector_project(P->linalg_handle, &DP, x_in, y_in,
+			x_out, y_out) );
+}
+
+static projector * __dense_direct_projector_alloc(matrix * A,
+	const OPTKIT_DIRECT_FACTOR factor)
+{
+	projector * P = OK_NULL;
+	P = malloc(sizeof(*P));
+	P->kind = OkProjectorDenseDirect;
+	P->size1 = A->size1;
+	P->size2 = A->size2;
+	if (factor == OkDirectMixed)
+		P->data = dense_direct_projector_data_alloc_mixed(A);
+	else if (factor == OkDirectPacked)
+		P->data = dense_direct_projector_data_alloc_packed(A);
+	else
+		P->data = dense_direct_projector_data_alloc(A);
+	P->initialize = dense_direct_projector_initialize;
+	P->project = dense_direct_projector_project;
+	P->free = dense_direct_projector_data_free;
+	if (!P->data)
+		ok_free(P);
+	return P;
+}
+
+projector * dense_direct_projector_alloc(matrix * A)
+{
+	return __dense_direct_projector_alloc(A, OkDirectFull);
+}
+
+/*
+ * dense direct projector with a single precision factor and iterative
+ * refinement (see dense_direct_projector)
+ */
+projector * dense_direct_projector_alloc_mixed(matrix * A)
+{
+	return __dense_direct_projector_alloc(A, OkDirectMixed);
+}
+
+/*
+ * dense direct projector with the factor in rectangular full packed
+ * storage (see dense_direct_projector)
+ */
+projector * dense_direct_projector_alloc_packed(matrix * A)
+{
+	return __dense_direct_projector_alloc(A, OkDirectPacked);
+}
+
+#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+/*
+ * assemble the pattern of K = [I Aᵀ; A -I] (both triangles, CSC) from the
+ * host copy of A; K_map[2q], K_map[2q + 1] record where the q-th stored
+ * entry of A lands in K, so that refreshing the values of K is a scatter
+ */
+static ok_status sparse_direct_projector_assemble(sparse_direct_projector * P)
+{
+	size_t q, i, j, major, minor, pos, m = P->m, n = P->n;
+	size_t nmajor = P->A->ptrlen - 1;
+	int rowmajor = P->A->order == CblasRowMajor;
+	size_t * fill = OK_NULL;
+
+	ok_alloc(fill, (m + n) * sizeof(*fill));
+	OK_CHECK_PTR(fill);
+
+	/* off-diagonal counts: column j of A in K[:, j], row i in K[:, n + i] */
+	for (major = 0; major < nmajor; ++major)
+		for (q = (size_t) P->A_ptr[major];
+			q < (size_t) P->A_ptr[major + 1]; ++q) {
+			minor = (size_t) P->A_ind[q];
+			fill[rowmajor ? minor : major] += 1;
+			fill[n + (rowmajor ? major : minor)] += 1;
+		}
+
+	P->K_ptr[0] = 0;
+	for (j = 0; j < m + n; ++j) {
+		P->K_ptr[j + 1] = P->K_ptr[j] + (ok_int) fill[j] + 1;
+		pos = (size_t) P->K_ptr[j];
+		P->K_ind[pos] = (ok_int) j;
+		P->K_val[pos] = j < n ? kOne : -kOne;
+		fill[j] = pos + 1;
+	}
+
+	for (major = 0; major < nmajor; ++major)
+		for (q = (size_t) P->A_ptr[major];
+			q < (size_t) P->A_ptr[major + 1]; ++q) {
+			minor = (size_t) P->A_ind[q];
+			i = rowmajor ? major : minor;
+			j = rowmajor ? minor : major;
+
+			/* K[n + i, j] = A_ij */
+			pos = fill[j]++;
+			P->K_ind[pos] = (ok_int) (n + i);
+			P->K_map[2 * q] = pos;
+
+			/* K[j, n + i] = A_ij */
+			pos = fill[n + i]++;
+			P->K_ind[pos] = (ok_int) j;
+			P->K_map[2 * q + 1] = pos;
+		}
+
+	ok_free(fill);
+	return OPTKIT_SUCCESS;
+}
+
+void * sparse_direct_projector_data_alloc(sp_matrix * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	sparse_direct_projector * P = OK_NULL;
+	size_t dim, K_nnz;
+
+	if (!A || !A->val || !A->ind || !A->ptr)
+		return OK_NULL;
+
+	ok_alloc(P, sizeof(*P));
+	P->A = A;
+	P->m = A->size1;
+	P->n = A->size2;
+	P->normA = kOne;
+	P->normalized = 0;
+	dim = P->m + P->n;
+	K_nnz = dim + 2 * A->nnz;
+
+	ok_alloc(P->A_val, A->nnz * sizeof(*P->A_val));
+	ok_alloc(P->A_ind, A->nnz * sizeof(*P->A_ind));
+	ok_alloc(P->A_ptr, A->ptrlen * sizeof(*P->A_ptr));
+	ok_alloc(P->K_ptr, (dim + 1) * sizeof(*P->K_ptr));
+	ok_alloc(P->K_ind, K_nnz * sizeof(*P->K_ind));
+	ok_alloc(P->K_val, K_nnz * sizeof(*P->K_val));
+	ok_alloc(P->K_map, 2 * A->nnz * sizeof(*P->K_map));
+	ok_alloc(P->rhs, dim * sizeof(*P->rhs));
+	ok_alloc(P->y_in, P->m * sizeof(*P->y_in));
+
+	OK_CHECK_ERR( err, sparse_ldl_alloc(&P->F, dim) );
+	OK_CHECK_ERR( err,
+		sp_matrix_memcpy_am(P->A_val, P->A_ind, P->A_ptr, A) );
+	OK_CHECK_ERR( err, sparse_direct_projector_assemble(P) );
+	if (err) {
+		OK_MAX_ERR( err, sparse_direct_projector_data_free((void *) P) );
+		P = OK_NULL;
+	}
+	return (void *) P;
+}
+
+ok_status sparse_direct_projector_data_free(void * data)
+{
+	OK_CHECK_PTR(data);
+
+	sparse_direct_projector * P = (sparse_direct_projector *) data;
+	ok_status err = OK_SCAN_ERR( sparse_ldl_free(&P->F) );
+	ok_free(P->A_val);
+	ok_free(P->A_ind);
+	ok_free(P->A_ptr);
+	ok_free(P->K_ptr);
+	ok_free(P->K_ind);
+	ok_free(P->K_val);
+	ok_free(P->K_map);
+	ok_free(P->rhs);
+	ok_free(P->y_in);
+	ok_free(P);
+	return err;
+}
+
+/*
+ * (re)factor K for the current values of A. the ordering and symbolic
+ * analysis are performed on the first call only.
+ */
+ok_status sparse_direct_projector_factor(void * data)
+{
+	sparse_direct_projector * P = (sparse_direct_projector *) data;
+	size_t q;
+
+	if (!P || !P->A || !P->K_val)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	OK_RETURNIF_ERR( sp_matrix_memcpy_vals_am(P->A_val, P->A) );
+	for (q = 0; q < P->A->nnz; ++q) {
+		P->K_val[P->K_map[2 * q]] = P->A_val[q];
+		P->K_val[P->K_map[2 * q + 1]] = P->A_val[q];
+	}
+
+	if (!P->F.analyzed)
+		OK_RETURNIF_ERR(
+			sparse_ldl_analyze(&P->F, P->K_ptr, P->K_ind) );
+	return OK_SCAN_ERR(
+		sparse_ldl_factor(&P->F, P->K_ptr, P->K_ind, P->K_val) );
+}
+
+/*
+ * set normA = ||A||_F / sqrt(min(m, n)), as for the dense direct
+ * projector; if normalize, scale A by 1 / normA. then factor K.
+ */
+ok_status sparse_direct_projector_initialize(void * data, int normalize)
+{
+	sparse_direct_projector * P = (sparse_direct_projector *) data;
+	ok_float sum_squares = kZero;
+	size_t q, mindim;
+
+	if (!P || !P->A)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	mindim = P->m < P->n ? P->m : P->n;
+	OK_RETURNIF_ERR( sp_matrix_memcpy_vals_am(P->A_val, P->A) );
+	for (q = 0; q < P->A->nnz; ++q)
+		sum_squares += P->A_val[q] * P->A_val[q];
+	P->normA = MATH(sqrt)(sum_squares / (ok_float) mindim);
+
+	if (P->normA == 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+
+	if (normalize)
+		OK_RETURNIF_ERR( sp_matrix_scale(P->A, kOne / P->normA) );
+	P->normalized = normalize;
+
+	return OK_SCAN_ERR( sparse_direct_projector_factor(data) );
+}
+
+ok_status sparse_direct_projector_project(void * data, vector * x_in,
+	vector * y_in, vector * x_out, vector * y_out, ok_float tol)
+{
+	sparse_direct_projector * P = (sparse_direct_projector *) data;
+	size_t i;
+
+	if (!P || !P->rhs)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_CHECK_VECTOR(x_in);
+	OK_CHECK_VECTOR(y_in);
+	OK_CHECK_VECTOR(x_out);
+	OK_CHECK_VECTOR(y_out);
+	if (x_in->size != P->n || y_in->size != P->m ||
+		x_out->size != P->n || y_out->size != P->m)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	/* [x; s] = K^{-1} [x_in; y_in] */
+	OK_RETURNIF_ERR( vector_memcpy_av(P->rhs, x_in, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_av(P->y_in, y_in, 1) );
+	memcpy(P->rhs + P->n, P->y_in, P->m * sizeof(*P->rhs));
+	OK_RETURNIF_ERR( sparse_ldl_solve(&P->F, P->rhs) );
+
+	/* y = s + y_in */
+	for (i = 0; i < P->m; ++i)
+		P->rhs[P->n + i] += P->y_in[i];
+
+	OK_RETURNIF_ERR( vector_memcpy_va(x_out, P->rhs, 1) );
+	return OK_SCAN_ERR( vector_memcpy_va(y_out, P->rhs + P->n, 1) );
+}
+
+projector * sparse_direct_projector_alloc(sp_matrix * A)
+{
+	projector * P = OK_NULL;
+	if (!A)
+		return OK_NULL;
+	ok_alloc(P, sizeof(*P));
+	P->kind = OkProjectorSparseDirect;
+	P->size1 = A->size1;
+	P->size2 = A->size2;
+	P->data = sparse_direct_projector_data_alloc(A);
+	P->initialize = sparse_direct_projector_initialize;
+	P->project = sparse_direct_projector_project;
+	P->free = sparse_direct_projector_data_free;
+	if (!P->data)
+		ok_free(P);
+	return P;
+}
+#endif /* ndef OPTKIT_NO_INDIRECT_PROJECTOR */
+
+#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+void * indirect_projector_data_alloc(operator * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	indirect_projector_generic * P = OK_NULL;
+	ok_alloc(P, sizeof(*P));
+	P->A = A;
+	P->cgls_work = cgls_init(A->size1, A->size2);
+	P->normA = kOne;
+	P->normalized = 0;
+	ok_alloc(P->dx, sizeof(*P->dx));
+	OK_CHECK_ERR( err, vector_calloc(P->dx, A->size2) );
+	OK_CHECK_ERR( err, blas_make_handle(&(P->linalg_handle)) );
+	if (err || !P->A || !P->cgls_work) {
+		OK_MAX_ERR( err,
+			indirect_projector_data_free((void *) P) );
+		P = OK_NULL;
+	}
+
+	return (void *) P;
+}
+
+ok_status indirect_projector_data_free(void * data)
+{
+	OK_CHECK_PTR(data);
+
+	indirect_projector_generic * P = (indirect_projector_generic *) data;
+	ok_status err = OPTKIT_SUCCESS;
+	if (P->cgls_work)
+		err = OK_SCAN_ERR( cgls_finish(P->cgls_work) );
+	if (P->linalg_handle)
+		OK_MAX_ERR( err, blas_destroy_handle(P->linalg_handle) );
+	if (P->dx && P->dx->data)
+		OK_MAX_ERR( err, vector_free(P->dx) );
+	ok_free(P->dx);
+	ok_free(P);
+	return err;
+}
+
+/* STUB??? or ok as no-op? */
+ok_status indirect_projector_g_initialize(void * data, int normalize)
+{
+	/* estimate norm */
+	/* normalize */
+	OK_CHECK_PTR(data);
+	return OPTKIT_SUCCESS;
+
+}
+
+ok_status indirect_projector_g_project(void * data, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out, ok_float tol)
+{
+	indirect_projector_generic * P = (indirect_projector_generic *) data;
+	OK_CHECK_PTR(P);
+
+	return indirect_projector_solve(P->linalg_handle, P->A, P->cgls_work,
+		P->dx, x_in, y_in, x_out, y_out, tol, kItersCG, &P->flag,
+		&P->iterations);
 }
 
 projector * indirect_projector_generic_alloc(operator * A)
@@ -447,6 +1353,535 @@ projector * indirect_projector_generic_alloc(operator * A)
 }
 #endif /* ndef OPTKIT_NO_INDIRECT_PROJECTOR */
 
+#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+/* output = M * input, for the Jacobi or block-Jacobi preconditioner M */
+static ok_status pcg_projector_precondition(void * data, vector * input,
+	vector * output)
+{
+	pcg_projector * P = (pcg_projector *) data;
+	OK_CHECK_PTR(P);
+	OK_CHECK_VECTOR(input);
+	OK_CHECK_VECTOR(output);
+
+	size_t j, bj, n = output->size;
+	matrix L_j;
+	vector out_j;
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(output, input) );
+	if (P->precond == OkPrecondJacobi)
+		return OK_SCAN_ERR( vector_mul(output, P->d) );
+
+	for (j = 0; j < n; j += P->block) {
+		bj = (n - j < P->block) ? n - j : P->block;
+		OK_RETURNIF_ERR( matrix_submatrix(&L_j, P->L, 0, j, bj, bj) );
+		OK_RETURNIF_ERR( vector_subvector(&out_j, output, j, bj) );
+		OK_RETURNIF_ERR(
+			linalg_cholesky_svx(P->linalg_handle, &L_j, &out_j) );
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/* the preconditioner of dense and sparse operators is read from entries */
+static int pcg_projector_reads_entries(const operator * A)
+{
+	return A->kind == OkOperatorDense || A->kind == OkOperatorSparseCSR ||
+		A->kind == OkOperatorSparseCSC;
+}
+
+void * pcg_projector_data_alloc(operator * A,
+	const OPTKIT_PRECONDITIONER precond, const size_t block)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	pcg_projector * P = OK_NULL;
+	size_t m, n;
+
+	if (!A || !A->data || (precond != OkPrecondJacobi &&
+		precond != OkPrecondBlockJacobi))
+		return OK_NULL;
+
+	m = A->size1;
+	n = A->size2;
+	ok_alloc(P, sizeof(*P));
+	P->A = A;
+	P->precond = precond;
+	P->block = (precond == OkPrecondJacobi) ? 1 :
+		(block == 0 ? kPRECONDBLOCK : block);
+	P->block = (P->block < n) ? P->block : n;
+	P->normA = kOne;
+	P->normalized = 0;
+	P->pcg_work = pcg_init(m, n);
+
+	ok_alloc(P->rhs, sizeof(*P->rhs));
+	ok_alloc(P->a, sizeof(*P->a));
+	OK_CHECK_ERR( err, vector_calloc(P->rhs, n) );
+	OK_CHECK_ERR( err, vector_calloc(P->a, m) );
+	if (precond == OkPrecondJacobi) {
+		ok_alloc(P->d, sizeof(*P->d));
+		OK_CHECK_ERR( err, vector_calloc(P->d, n) );
+	} else {
+		ok_alloc(P->L, sizeof(*P->L));
+		OK_CHECK_ERR( err,
+			matrix_calloc(P->L, P->block, n, CblasColMajor) );
+		if (!pcg_projector_reads_entries(A)) {
+			ok_alloc(P->C, sizeof(*P->C));
+			OK_CHECK_ERR( err,
+				matrix_calloc(P->C, m, P->block, CblasColMajor) );
+		}
+	}
+	OK_CHECK_ERR( err, blas_make_handle(&(P->linalg_handle)) );
+
+	/* preconditioner, as an operator for pcg() */
+	ok_alloc(P->M, sizeof(*P->M));
+	P->M->kind = OkOperatorOther;
+	P->M->size1 = n;
+	P->M->size2 = n;
+	P->M->data = (void *) P;
+	P->M->apply = pcg_projector_precondition;
+	P->M->adjoint = pcg_projector_precondition;
+
+	if (err || !P->pcg_work) {
+		OK_MAX_ERR( err, pcg_projector_data_free((void *) P) );
+		P = OK_NULL;
+	}
+	return (void *) P;
+}
+
+ok_status pcg_projector_data_free(void * data)
+{
+	OK_CHECK_PTR(data);
+
+	pcg_projector * P = (pcg_projector *) data;
+	ok_status err = OPTKIT_SUCCESS;
+	if (P->pcg_work)
+		err = OK_SCAN_ERR( pcg_finish(P->pcg_work) );
+	if (P->linalg_handle)
+		OK_MAX_ERR( err, blas_destroy_handle(P->linalg_handle) );
+	if (P->rhs && P->rhs->data)
+		OK_MAX_ERR( err, vector_free(P->rhs) );
+	if (P->a && P->a->data)
+		OK_MAX_ERR( err, vector_free(P->a) );
+	if (P->d && P->d->data)
+		OK_MAX_ERR( err, vector_free(P->d) );
+	if (P->L && P->L->data)
+		OK_MAX_ERR( err, matrix_free(P->L) );
+	if (P->C && P->C->data)
+		OK_MAX_ERR( err, matrix_free(P->C) );
+	ok_free(P->rhs);
+	ok_free(P->a);
+	ok_free(P->d);
+	ok_free(P->L);
+	ok_free(P->C);
+	ok_free(P->M);
+	ok_free(P);
+	return err;
+}
+
+/*
+ * squared column norms of A (Jacobi), or the diagonal blocks C_jᵀC_j of
+ * AᵀA (block-Jacobi), from the stored entries of a dense operator
+ */
+static ok_status pcg_projector_gram_dense(pcg_projector * P,
+	const matrix * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	size_t j, bj, m = A->size1, n = A->size2;
+	int rowmajor = A->order == CblasRowMajor;
+	matrix C_j, L_j;
+
+	if (P->precond == OkPrecondJacobi)
+		return OK_SCAN_ERR(
+			linalg_matrix_row_squares(CblasTrans, A, P->d) );
+
+	/* column-major view of C_j (row-major A: of C_jᵀ), as L */
+	C_j.order = CblasColMajor;
+	C_j.ld = A->ld;
+	for (j = 0; j < n && !err; j += P->block) {
+		bj = (n - j < P->block) ? n - j : P->block;
+		C_j.size1 = rowmajor ? bj : m;
+		C_j.size2 = rowmajor ? m : bj;
+		C_j.data = A->data + (rowmajor ? j : j * A->ld);
+		OK_CHECK_ERR( err,
+			matrix_submatrix(&L_j, P->L, 0, j, bj, bj) );
+		OK_CHECK_ERR( err, blas_gemm(P->linalg_handle,
+			rowmajor ? CblasNoTrans : CblasTrans,
+			rowmajor ? CblasTrans : CblasNoTrans, kOne, &C_j, &C_j,
+			kZero, &L_j) );
+	}
+	return err;
+}
+
+/*
+ * as pcg_projector_gram_dense, from the stored entries of a sparse
+ * operator, in O(nnz * block) work on a host copy of A: for each block,
+ * the columns C_j are scattered into the m x block (row-major) array W,
+ * and entry (c', c) of C_jᵀC_j is the dot product of column c with
+ * column c' <= c of W. duplicate entries are summed, as by A->apply.
+ */
+static ok_status pcg_projector_gram_sparse(pcg_projector * P,
+	const sp_matrix * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	size_t m = A->size1, n = A->size2, nnz = A->nnz;
+	size_t nmajor = A->ptrlen - 1, block = P->block;
+	size_t p, q, i, j, c, cc, bj, major, minor;
+	int rowmajor = A->order == CblasRowMajor;
+	ok_float * val = OK_NULL, * csc_val = OK_NULL, * G = OK_NULL;
+	ok_float * W = OK_NULL;
+	ok_int * ind = OK_NULL, * ptr = OK_NULL;
+	size_t * csc_ptr = OK_NULL, * csc_row = OK_NULL, * fill = OK_NULL;
+
+	ok_alloc(val, nnz * sizeof(*val));
+	ok_alloc(ind, nnz * sizeof(*ind));
+	ok_alloc(ptr, A->ptrlen * sizeof(*ptr));
+	OK_CHECK_ERR( err, sp_matrix_memcpy_am(val, ind, ptr, A) );
+
+	if (!err && P->precond == OkPrecondJacobi) {
+		ok_alloc(G, n * sizeof(*G));
+		for (major = 0; major < nmajor; ++major)
+			for (p = (size_t) ptr[major]; p < (size_t) ptr[major + 1];
+				++p) {
+				j = rowmajor ? (size_t) ind[p] : major;
+				G[j] += val[p] * val[p];
+			}
+		OK_CHECK_ERR( err, vector_memcpy_va(P->d, G, 1) );
+	} else if (!err) {
+		/* host CSC copy of A */
+		ok_alloc(csc_ptr, (n + 1) * sizeof(*csc_ptr));
+		ok_alloc(csc_row, nnz * sizeof(*csc_row));
+		ok_alloc(csc_val, nnz * sizeof(*csc_val));
+		ok_alloc(fill, n * sizeof(*fill));
+		for (major = 0; major < nmajor; ++major)
+			for (p = (size_t) ptr[major]; p < (size_t) ptr[major + 1];
+				++p)
+				csc_ptr[(rowmajor ? (size_t) ind[p] : major) + 1] += 1;
+		for (j = 0; j < n; ++j) {
+			csc_ptr[j + 1] += csc_ptr[j];
+			fill[j] = csc_ptr[j];
+		}
+		for (major = 0; major < nmajor; ++major)
+			for (p = (size_t) ptr[major]; p < (size_t) ptr[major + 1];
+				++p) {
+				minor = (size_t) ind[p];
+				q = fill[rowmajor ? minor : major]++;
+				csc_row[q] = rowmajor ? major : minor;
+				csc_val[q] = val[p];
+			}
+
+		/* diagonal blocks, in the block x n layout of P->L */
+		ok_alloc(G, block * n * sizeof(*G));
+		ok_alloc(W, m * block * sizeof(*W));
+		for (j = 0; j < n; j += block) {
+			bj = (n - j < block) ? n - j : block;
+			for (c = 0; c < bj; ++c) {
+				for (p = csc_ptr[j + c]; p < csc_ptr[j + c + 1]; ++p)
+					W[csc_row[p] * block + c] += csc_val[p];
+				for (cc = 0; cc <= c; ++cc) {
+					for (p = csc_ptr[j + c]; p < csc_ptr[j + c + 1];
+						++p) {
+						i = csc_row[p];
+						G[cc + (j + c) * block] +=
+							csc_val[p] * W[i * block + cc];
+					}
+					G[c + (j + cc) * block] = G[cc + (j + c) * block];
+				}
+			}
+			for (p = csc_ptr[j]; p < csc_ptr[j + bj]; ++p)
+				for (c = 0; c < bj; ++c)
+					W[csc_row[p] * block + c] = kZero;
+		}
+		OK_CHECK_ERR( err, matrix_memcpy_ma(P->L, G, CblasColMajor) );
+	}
+
+	ok_free(val);
+	ok_free(ind);
+	ok_free(ptr);
+	ok_free(csc_ptr);
+	ok_free(csc_row);
+	ok_free(csc_val);
+	ok_free(fill);
+	ok_free(G);
+	ok_free(W);
+	return err;
+}
+
+/*
+ * as pcg_projector_gram_dense, from the columns A * e_i of an operator of
+ * any other kind, one product each
+ */
+static ok_status pcg_projector_gram_probe(pcg_projector * P)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	size_t i, j, bj, m = P->A->size1, n = P->A->size2;
+	ok_float norm_sq;
+	vector ej, e_sub, d_sub, col;
+	matrix C_j, L_j;
+
+	ej.data = OK_NULL;
+	OK_CHECK_ERR( err, vector_calloc(&ej, n) );
+
+	for (j = 0; j < n && !err; j += P->block) {
+		bj = (n - j < P->block) ? n - j : P->block;
+		for (i = 0; i < bj && !err; ++i) {
+			/* a = A * e_{j + i} */
+			OK_CHECK_ERR( err, vector_subvector(&e_sub, &ej, j + i, 1) );
+			OK_CHECK_ERR( err, vector_set_all(&e_sub, kOne) );
+			OK_CHECK_ERR( err, P->A->apply(P->A->data, &ej, P->a) );
+			OK_CHECK_ERR( err, vector_set_all(&e_sub, kZero) );
+
+			if (P->precond == OkPrecondJacobi) {
+				OK_CHECK_ERR( err, blas_dot(P->linalg_handle, P->a,
+					P->a, &norm_sq) );
+				OK_CHECK_ERR( err,
+					vector_subvector(&d_sub, P->d, j + i, 1) );
+				OK_CHECK_ERR( err, vector_set_all(&d_sub, norm_sq) );
+			} else {
+				OK_CHECK_ERR( err, matrix_column(&col, P->C, i) );
+				OK_CHECK_ERR( err, vector_memcpy_vv(&col, P->a) );
+			}
+		}
+		if (P->precond == OkPrecondBlockJacobi) {
+			OK_CHECK_ERR( err,
+				matrix_submatrix(&C_j, P->C, 0, 0, m, bj) );
+			OK_CHECK_ERR( err,
+				matrix_submatrix(&L_j, P->L, 0, j, bj, bj) );
+			OK_CHECK_ERR( err, blas_gemm(P->linalg_handle, CblasTrans,
+				CblasNoTrans, kOne, &C_j, &C_j, kZero, &L_j) );
+		}
+	}
+
+	if (ej.data)
+		OK_MAX_ERR( err, vector_free(&ej) );
+	return err;
+}
+
+/*
+ * form the preconditioner of I + AᵀA: the inverse diagonal
+ * 1 / (1 + ||A * e_i||^2), or the Cholesky factor of I + C_jᵀC_j for the
+ * columns C_j of A in each diagonal block.
+ *
+ * A is left as given (normalize is ignored): the abstract POGS solver
+ * initializes indirect projectors after normalizing A.
+ */
+ok_status pcg_projector_initialize(void * data, const int normalize)
+{
+	pcg_projector * P = (pcg_projector *) data;
+	OK_CHECK_PTR(P);
+
+	ok_status err = OPTKIT_SUCCESS;
+	size_t j, bj, n = P->A->size2;
+	vector diag;
+	matrix L_j;
+
+	P->initialized = 0;
+	if (P->A->kind == OkOperatorDense)
+		OK_CHECK_ERR( err, pcg_projector_gram_dense(P,
+			((dense_operator_data *) P->A->data)->A) );
+	else if (P->A->kind == OkOperatorSparseCSR ||
+		P->A->kind == OkOperatorSparseCSC)
+		OK_CHECK_ERR( err, pcg_projector_gram_sparse(P,
+			((sparse_operator_data *) P->A->data)->A) );
+	else
+		OK_CHECK_ERR( err, pcg_projector_gram_probe(P) );
+
+	if (P->precond == OkPrecondJacobi) {
+		OK_CHECK_ERR( err, vector_add_constant(P->d, kOne) );
+		OK_CHECK_ERR( err, vector_recip(P->d) );
+	} else {
+		/* L_j = chol(I + C_jᵀC_j) */
+		for (j = 0; j < n && !err; j += P->block) {
+			bj = (n - j < P->block) ? n - j : P->block;
+			OK_CHECK_ERR( err,
+				matrix_submatrix(&L_j, P->L, 0, j, bj, bj) );
+			OK_CHECK_ERR( err, matrix_diagonal(&diag, &L_j) );
+			OK_CHECK_ERR( err, vector_add_constant(&diag, kOne) );
+			OK_CHECK_ERR( err,
+				linalg_cholesky_decomp(P->linalg_handle, &L_j) );
+		}
+	}
+
+	P->initialized = !err;
+	return err;
+}
+
+/*
+ * solve (I + AᵀA)x_out = x_in + Aᵀy_in with PCG, until the residual is
+ * at most tol * ||x_in + Aᵀy_in||; set y_out = Ax_out
+ */
+ok_status pcg_projector_project(void * data, vector * x_in, vector * y_in,
+	vector * x_out, vector * y_out, ok_float tol)
+{
+	pcg_projector * P = (pcg_projector *) data;
+	OK_CHECK_PTR(P);
+	OK_CHECK_VECTOR(x_in);
+	OK_CHECK_VECTOR(y_in);
+	OK_CHECK_VECTOR(x_out);
+	OK_CHECK_VECTOR(y_out);
+
+	ok_float norm_rhs;
+	uint iters = 0;
+
+	if (!P->initialized)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (x_in->size != P->rhs->size || x_out->size != P->rhs->size ||
+		y_in->size != P->a->size || y_out->size != P->a->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	/* rhs = x_in + Aᵀy_in */
+	OK_RETURNIF_ERR(
+		vector_memcpy_vv(P->rhs, x_in) );
+	OK_RETURNIF_ERR(
+		P->A->fused_adjoint(P->A->data, kOne, y_in, kOne, P->rhs) );
+	OK_RETURNIF_ERR(
+		blas_nrm2(P->linalg_handle, P->rhs, &norm_rhs) );
+
+	OK_RETURNIF_ERR(
+		pcg_solve(P->pcg_work, P->A, P->M, P->rhs, x_out, kOne,
+			tol * norm_rhs, kItersCG, kQuietCG, &iters) );
+	P->iterations += iters;
+
+	/* y_out = Ax_out */
+	return OK_SCAN_ERR(
+		P->A->apply(P->A->data, x_out, y_out) );
+}
+
+projector * pcg_projector_alloc(operator * A,
+	const OPTKIT_PRECONDITIONER precond, const size_t block)
+{
+	projector * P = OK_NULL;
+	if (!A)
+		return OK_NULL;
+	ok_alloc(P, sizeof(*P));
+	P->kind = OkProjectorIndirectPCG;
+	P->size1 = A->size1;
+	P->size2 = A->size2;
+	P->data = pcg_projector_data_alloc(A, precond, block);
+	P->initialize = pcg_projector_initialize;
+	P->project = pcg_projector_project;
+	P->free = pcg_projector_data_free;
+	if (!P->data)
+		ok_free(P);
+	return P;
+}
+#endif /* ndef OPTKIT_NO_INDIRECT_PROJECTOR */
+
+#ifndef OPTKIT_NO_INDIRECT_PROJECTOR
+void * panel_direct_projector_data_alloc(operator * A)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	panel_direct_projector * P = OK_NULL;
+
+	if (!A || A->kind != OkOperatorPanel || A->size1 < A->size2)
+		return OK_NULL;
+
+	ok_alloc(P, sizeof(*P));
+	P->A = A;
+	P->normA = kOne;
+	P->normalized = 0;
+	((panel_operator_data *) A->data)->form_gram = 1;
+	ok_alloc(P->L, sizeof(*P->L));
+	OK_CHECK_ERR( err,
+		matrix_calloc(P->L, A->size2, A->size2, CblasRowMajor) );
+	OK_CHECK_ERR( err, blas_make_handle(&(P->linalg_handle)) );
+	if (err) {
+		OK_MAX_ERR( err,
+			panel_direct_projector_data_free((void *) P) );
+		P = OK_NULL;
+	}
+	return (void *) P;
+}
+
+ok_status panel_direct_projector_data_free(void * data)
+{
+	OK_CHECK_PTR(data);
+
+	panel_direct_projector * P = (panel_direct_projector *) data;
+	ok_status err = OPTKIT_SUCCESS;
+	if (P->linalg_handle)
+		err = OK_SCAN_ERR( blas_destroy_handle(P->linalg_handle) );
+	if (P->L && P->L->data)
+		OK_MAX_ERR( err, matrix_free(P->L) );
+	ok_free(P->L);
+	ok_free(P);
+	return err;
+}
+
+/*
+ * factor I + AᵀA from the Gram matrix of the panel operator: the one
+ * accumulated while equilibrating A, if any, else one formed with a pass
+ * over A. when normalizing, A is scaled (as an operator) by 1 / normA,
+ * with normA = sqrt(mean(diag(AᵀA))), as for the dense direct projector.
+ */
+ok_status panel_direct_projector_initialize(void * data, const int normalize)
+{
+	panel_direct_projector * P = (panel_direct_projector *) data;
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float mean_diag = kZero;
+	vector diag;
+
+	if (!P || !P->A || !P->L)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	diag.data = OK_NULL;
+	OK_CHECK_ERR( err, panel_operator_gram(P->A, P->L) );
+	OK_CHECK_ERR( err, matrix_diagonal(&diag, P->L) );
+	OK_CHECK_ERR( err, blas_asum(P->linalg_handle, &diag, &mean_diag) );
+	mean_diag /= (ok_float) P->L->size1;
+	if (!err && mean_diag == 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+	P->normA = MATH(sqrt)(mean_diag);
+
+	if (normalize) {
+		OK_CHECK_ERR( err, matrix_scale(P->L, kOne / mean_diag) );
+		OK_CHECK_ERR( err, panel_operator_scale(P->A, kOne / P->normA) );
+	}
+	P->normalized = normalize;
+
+	OK_CHECK_ERR( err, vector_add_constant(&diag, kOne) );
+	OK_CHECK_ERR( err,
+		linalg_cholesky_decomp(P->linalg_handle, P->L) );
+	return err;
+}
+
+/*
+ * x_out = (I + AᵀA)⁻¹(x_in + Aᵀy_in), y_out = Ax_out: two passes over A
+ */
+ok_status panel_direct_projector_project(void * data, vector * x_in,
+	vector * y_in, vector * x_out, vector * y_out, ok_float tol)
+{
+	panel_direct_projector * P = (panel_direct_projector *) data;
+	OK_CHECK_PTR(P);
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(x_out, x_in) );
+	OK_RETURNIF_ERR(
+		P->A->fused_adjoint(P->A->data, kOne, y_in, kOne, x_out) );
+	OK_RETURNIF_ERR(
+		linalg_cholesky_svx(P->linalg_handle, P->L, x_out) );
+	return OK_SCAN_ERR( P->A->apply(P->A->data, x_out, y_out) );
+}
+
+/*
+ * direct projector for tall (m >= n) panel operators; holds only the
+ * n x n factor of I + AᵀA
+ */
+projector * panel_direct_projector_alloc(operator * A)
+{
+	projector * P = OK_NULL;
+	if (!A)
+		return OK_NULL;
+	ok_alloc(P, sizeof(*P));
+	P->kind = OkProjectorPanelDirect;
+	P->size1 = A->size1;
+	P->size2 = A->size2;
+	P->data = panel_direct_projector_data_alloc(A);
+	P->initialize = panel_direct_projector_initialize;
+	P->project = panel_direct_projector_project;
+	P->free = panel_direct_projector_data_free;
+	if (!P->data)
+		ok_free(P);
+	return P;
+}
+#endif /* ndef OPTKIT_NO_INDIRECT_PROJECTOR */
+
 
 #ifdef __cplusplus
 }
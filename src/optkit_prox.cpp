@@ -115,6 +115,84 @@ ok_status function_vector_div_(function_vector_<T> * f, const vector_<T> * v)
 	return OK_SCAN_ERR( vector_div(&el, v) );
 }
 
+/* indices must be < f->size */
+template<typename T>
+static ok_status function_vector_check_indices(const function_vector_<T> * f,
+	const size_t * indices, size_t count)
+{
+	size_t k;
+	if (count > 0 && !indices)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	for (k = 0; k < count; ++k)
+		if (indices[k] >= f->size)
+			return OK_SCAN_ERR( OPTKIT_ERROR_OUT_OF_BOUNDS );
+	return OPTKIT_SUCCESS;
+}
+
+/* f[indices[k]] <- h[k], k = 0, ..., count - 1 */
+template<typename T>
+ok_status function_vector_scatter_va_(function_vector_<T> * f,
+	const function_t_<T> * h, const size_t * indices, size_t count)
+{
+	OK_CHECK_FNVECTOR(f);
+	if (count > 0 && !h)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_RETURNIF_ERR( function_vector_check_indices<T>(f, indices, count) );
+
+	size_t k;
+	for (k = 0; k < count; ++k)
+		f->objectives[indices[k]] = h[k];
+	return OPTKIT_SUCCESS;
+}
+
+/* function_vector_mul, restricted to the entries indices[0:count] */
+template<typename T>
+ok_status function_vector_mul_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count)
+{
+	OK_CHECK_FNVECTOR(f);
+	OK_CHECK_VECTOR(v);
+	if (f->size != v->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	OK_RETURNIF_ERR( function_vector_check_indices<T>(f, indices, count) );
+
+	size_t k;
+	T scal;
+	function_t_<T> * fk;
+	for (k = 0; k < count; ++k) {
+		fk = f->objectives + indices[k];
+		scal = v->data[indices[k] * v->stride];
+		fk->a *= scal;
+		fk->d *= scal;
+		fk->e *= scal;
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/* function_vector_div, restricted to the entries indices[0:count] */
+template<typename T>
+ok_status function_vector_div_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count)
+{
+	OK_CHECK_FNVECTOR(f);
+	OK_CHECK_VECTOR(v);
+	if (f->size != v->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	OK_RETURNIF_ERR( function_vector_check_indices<T>(f, indices, count) );
+
+	size_t k;
+	T scal;
+	function_t_<T> * fk;
+	for (k = 0; k < count; ++k) {
+		fk = f->objectives + indices[k];
+		scal = v->data[indices[k] * v->stride];
+		fk->a /= scal;
+		fk->d /= scal;
+		fk->e /= scal;
+	}
+	return OPTKIT_SUCCESS;
+}
+
 template<typename T>
 ok_status function_vector_print_(function_vector_<T> * f)
 {
@@ -203,6 +281,18 @@ ok_status function_vector_mul(function_vector * f, const vector * v)
 ok_status function_vector_div(function_vector * f, const vector * v)
 	{ return function_vector_div_<ok_float>(f, v); }
 
+ok_status function_vector_scatter_va(function_vector * f, const function_t * h,
+	const size_t * indices, size_t count)
+	{ return function_vector_scatter_va_<ok_float>(f, h, indices, count); }
+
+ok_status function_vector_mul_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count)
+	{ return function_vector_mul_indexed_<ok_float>(f, v, indices, count); }
+
+ok_status function_vector_div_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count)
+	{ return function_vector_div_indexed_<ok_float>(f, v, indices, count); }
+
 ok_status function_vector_print(function_vector *f)
 	{ return function_vector_print_<ok_float>(f); }
 
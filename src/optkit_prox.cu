@@ -187,6 +187,84 @@ ok_status function_vector_div_(function_vector_<T> * f, const vector_<T> * v)
 	return OK_SCAN_ERR( vector_div(&el, v) );
 }
 
+/* indices must be < f->size */
+template<typename T>
+static ok_status function_vector_check_indices(const function_vector_<T> * f,
+	const size_t * indices, size_t count)
+{
+	size_t k;
+	if (count > 0 && !indices)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	for (k = 0; k < count; ++k)
+		if (indices[k] >= f->size)
+			return OK_SCAN_ERR( OPTKIT_ERROR_OUT_OF_BOUNDS );
+	return OPTKIT_SUCCESS;
+}
+
+/* f[indices[k]] <- h[k] (host), k = 0, ..., count - 1 */
+template<typename T>
+ok_status function_vector_scatter_va_(function_vector_<T> * f,
+	const function_t_<T> * h, const size_t * indices, size_t count)
+{
+	OK_CHECK_FNVECTOR(f);
+	if (count > 0 && !h)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_RETURNIF_ERR( function_vector_check_indices<T>(f, indices, count) );
+
+	ok_status err = OPTKIT_SUCCESS;
+	size_t k;
+	for (k = 0; k < count && !err; ++k)
+		err = ok_memcpy_gpu(f->objectives + indices[k], h + k,
+			sizeof(function_t));
+	return err;
+}
+
+/*
+ * scale (mul = 1) or divide (mul = 0) a, d, e of the entries
+ * indices[0:count] of f by the corresponding entries of v, as 1-element
+ * strided views
+ */
+template<typename T>
+static ok_status function_vector_scale_indexed(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count, int mul)
+{
+	OK_CHECK_FNVECTOR(f);
+	OK_CHECK_VECTOR(v);
+	if (f->size != v->size)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	OK_RETURNIF_ERR( function_vector_check_indices<T>(f, indices, count) );
+
+	ok_status err = OPTKIT_SUCCESS;
+	vector el, scal;
+	size_t k;
+
+	el.size = scal.size = 1;
+	el.stride = scal.stride = 1;
+	for (k = 0; k < count && !err; ++k) {
+		scal.data = v->data + indices[k] * v->stride;
+		el.data = &(f->objectives[indices[k]].a);
+		OK_CHECK_ERR( err, mul ? vector_mul(&el, &scal) :
+			vector_div(&el, &scal) );
+		el.data = &(f->objectives[indices[k]].d);
+		OK_CHECK_ERR( err, mul ? vector_mul(&el, &scal) :
+			vector_div(&el, &scal) );
+		el.data = &(f->objectives[indices[k]].e);
+		OK_CHECK_ERR( err, mul ? vector_mul(&el, &scal) :
+			vector_div(&el, &scal) );
+	}
+	return err;
+}
+
+template<typename T>
+ok_status function_vector_mul_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count)
+	{ return function_vector_scale_indexed<T>(f, v, indices, count, 1); }
+
+template<typename T>
+ok_status function_vector_div_indexed_(function_vector_<T> * f,
+	const vector_<T> * v, const size_t * indices, size_t count)
+	{ return function_vector_scale_indexed<T>(f, v, indices, count, 0); }
+
 template<typename T>
 ok_status function_vector_print_(function_vector_<T> * f)
 {
@@ -266,6 +344,18 @@ ok_status function_vector_mul(function_vector * f, const vector * v)
 ok_status function_vector_div(function_vector * f, const vector * v)
 	{ return function_vector_div_<ok_float>(f, v); }
 
+ok_status function_vector_scatter_va(function_vector * f, const function_t * h,
+	const size_t * indices, size_t count)
+	{ return function_vector_scatter_va_<ok_float>(f, h, indices, count); }
+
+ok_status function_vector_mul_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count)
+	{ return function_vector_mul_indexed_<ok_float>(f, v, indices, count); }
+
+ok_status function_vector_div_indexed(function_vector * f, const vector * v,
+	const size_t * indices, size_t count)
+	{ return function_vector_div_indexed_<ok_float>(f, v, indices, count); }
+
 ok_status function_vector_print(function_vector *f)
 	{ return function_vector_print_<ok_float>(f); }
 
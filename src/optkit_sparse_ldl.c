@@ -0,0 +1,500 @@
+#include "optkit_sparse_ldl.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+ok_status sparse_ldl_alloc(sparse_ldl * F, size_t size)
+{
+	OK_CHECK_PTR(F);
+	if (F->perm)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+
+	F->size = size;
+	F->nnz_L = 0;
+	ok_alloc(F->perm, size * sizeof(*F->perm));
+	ok_alloc(F->iperm, size * sizeof(*F->iperm));
+	ok_alloc(F->parent, size * sizeof(*F->parent));
+	ok_alloc(F->Lnz, size * sizeof(*F->Lnz));
+	ok_alloc(F->Lp, (size + 1) * sizeof(*F->Lp));
+	ok_alloc(F->D, size * sizeof(*F->D));
+	ok_alloc(F->y, size * sizeof(*F->y));
+	ok_alloc(F->pattern, size * sizeof(*F->pattern));
+	ok_alloc(F->flag, size * sizeof(*F->flag));
+	F->Li = OK_NULL;
+	F->Lx = OK_NULL;
+	F->Sp = OK_NULL;
+	F->Si = OK_NULL;
+	F->Sk = OK_NULL;
+	F->analyzed = 0;
+	F->factored = 0;
+	return OPTKIT_SUCCESS;
+}
+
+ok_status sparse_ldl_free(sparse_ldl * F)
+{
+	OK_CHECK_PTR(F);
+	ok_free(F->perm);
+	ok_free(F->iperm);
+	ok_free(F->parent);
+	ok_free(F->Lnz);
+	ok_free(F->Lp);
+	ok_free(F->Li);
+	ok_free(F->Lx);
+	ok_free(F->Sp);
+	ok_free(F->Si);
+	ok_free(F->Sk);
+	ok_free(F->D);
+	ok_free(F->y);
+	ok_free(F->pattern);
+	ok_free(F->flag);
+	F->size = 0;
+	F->nnz_L = 0;
+	F->analyzed = 0;
+	F->factored = 0;
+	return OPTKIT_SUCCESS;
+}
+
+/* growable index list */
+typedef struct ldl_list {
+	ok_int * data;
+	ok_int len, cap;
+} ldl_list;
+
+static ok_status ldl_list_push(ldl_list * l, ok_int value)
+{
+	ok_int * data;
+	if (l->len == l->cap) {
+		l->cap = 2 * l->cap + 4;
+		data = realloc(l->data, (size_t) l->cap * sizeof(*data));
+		if (!data)
+			return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+		l->data = data;
+	}
+	l->data[l->len++] = value;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * approximate minimum degree ordering on the quotient graph of K.
+ *
+ * each uneliminated variable i keeps its variable neighbors A(i) and the
+ * elements E(i) (eliminated pivots) it is adjacent to; each element e
+ * keeps its boundary L(e). eliminating pivot p forms the new element
+ *
+ *	L(p) = (A(p) ∪ L(e) for e in E(p)) \ {p},
+ *
+ * and absorbs the elements of E(p). for each i in L(p), variables of
+ * L(p) are pruned from A(i), and the external degree is bounded (as in
+ * AMD) by
+ *
+ *	d(i) <= |A(i)| + |L(p) \ i| + sum_{e in E(i), e != p} |L(e) \ L(p)|,
+ *
+ * so no cliques are formed explicitly. there is no supervariable
+ * detection or aggressive absorption. the graph is symmetric for K stored
+ * with either triangle or both.
+ */
+ok_status sparse_ldl_min_degree(size_t size, const ok_int * Kp,
+	const ok_int * Ki, ok_int * perm)
+{
+	OK_CHECK_PTR(Kp);
+	OK_CHECK_PTR(Ki);
+	OK_CHECK_PTR(perm);
+
+	ok_status err = OPTKIT_SUCCESS;
+	ldl_list * A = OK_NULL, * E = OK_NULL, * L = OK_NULL, * Lp;
+	ok_int * deg = OK_NULL, * w = OK_NULL, * mark = OK_NULL;
+	ok_int * head = OK_NULL, * next = OK_NULL, * prev = OK_NULL;
+	ok_int * alive = OK_NULL;
+	ok_int i, j, k, p, q, e, d, v, len, ext, n = (ok_int) size;
+	ok_int mindeg = 0, stamp = 0;
+
+	if (size == 0)
+		return OPTKIT_SUCCESS;
+
+	ok_alloc(A, size * sizeof(*A));
+	ok_alloc(E, size * sizeof(*E));
+	ok_alloc(L, size * sizeof(*L));
+	ok_alloc(deg, size * sizeof(*deg));
+	ok_alloc(w, size * sizeof(*w));
+	ok_alloc(mark, size * sizeof(*mark));
+	ok_alloc(head, size * sizeof(*head));
+	ok_alloc(next, size * sizeof(*next));
+	ok_alloc(prev, size * sizeof(*prev));
+	ok_alloc(alive, size * sizeof(*alive));
+
+	/* symmetric pattern of K, without the diagonal or duplicates */
+	for (j = 0; j < n && !err; ++j) {
+		++stamp;
+		mark[j] = stamp;
+		for (q = 0; q < A[j].len; ++q)
+			mark[A[j].data[q]] = stamp;
+		for (q = Kp[j]; q < Kp[j + 1] && !err; ++q) {
+			i = Ki[q];
+			if (mark[i] == stamp)
+				continue;
+			mark[i] = stamp;
+			OK_CHECK_ERR( err, ldl_list_push(&A[j], i) );
+			OK_CHECK_ERR( err, ldl_list_push(&A[i], j) );
+		}
+	}
+
+	/* degree buckets (doubly linked lists) */
+	for (j = 0; j < n; ++j)
+		head[j] = -1;
+	for (j = n - 1; j >= 0; --j) {
+		deg[j] = A[j].len;
+		prev[j] = -1;
+		next[j] = head[deg[j]];
+		if (next[j] >= 0)
+			prev[next[j]] = j;
+		head[deg[j]] = j;
+	}
+
+	for (k = 0; k < n && !err; ++k) {
+		while (head[mindeg] < 0)
+			++mindeg;
+		p = head[mindeg];
+		head[mindeg] = next[p];
+		if (next[p] >= 0)
+			prev[next[p]] = -1;
+		perm[k] = p;
+		deg[p] = -1;
+
+		/* form L(p) from A(p) and absorbed elements E(p) */
+		Lp = &L[p];
+		++stamp;
+		mark[p] = stamp;
+		for (q = 0; q < A[p].len && !err; ++q) {
+			v = A[p].data[q];
+			if (mark[v] != stamp && deg[v] >= 0) {
+				mark[v] = stamp;
+				OK_CHECK_ERR( err, ldl_list_push(Lp, v) );
+			}
+		}
+		for (q = 0; q < E[p].len && !err; ++q) {
+			e = E[p].data[q];
+			if (!alive[e])
+				continue;
+			for (i = 0; i < L[e].len && !err; ++i) {
+				v = L[e].data[i];
+				if (mark[v] != stamp && deg[v] >= 0) {
+					mark[v] = stamp;
+					OK_CHECK_ERR( err, ldl_list_push(Lp, v) );
+				}
+			}
+			alive[e] = 0;
+			ok_free(L[e].data);
+			L[e].len = L[e].cap = 0;
+		}
+		ok_free(A[p].data);
+		ok_free(E[p].data);
+		A[p].len = E[p].len = 0;
+		alive[p] = 1;
+		len = Lp->len;
+
+		/* w(e) = |L(e) \ L(p)| for elements adjacent to L(p) */
+		for (q = 0; q < len; ++q) {
+			i = Lp->data[q];
+			for (j = 0; j < E[i].len; ++j) {
+				e = E[i].data[j];
+				if (!alive[e])
+					continue;
+				if (w[e] >= 0)
+					w[e] = -L[e].len - 1;
+				w[e] += 1;
+			}
+		}
+
+		for (q = 0; q < len && !err; ++q) {
+			i = Lp->data[q];
+
+			/* prune A(i) by L(p), drop absorbed elements from E(i) */
+			for (d = 0, j = 0; j < A[i].len; ++j) {
+				v = A[i].data[j];
+				if (mark[v] != stamp)
+					A[i].data[d++] = v;
+			}
+			A[i].len = d;
+			ext = d + len - 1;
+			for (d = 0, j = 0; j < E[i].len; ++j) {
+				e = E[i].data[j];
+				if (alive[e]) {
+					E[i].data[d++] = e;
+					ext += -w[e] - 1;
+				}
+			}
+			E[i].len = d;
+			OK_CHECK_ERR( err, ldl_list_push(&E[i], p) );
+
+			/* unlink i, relink under its new degree bound */
+			if (prev[i] >= 0)
+				next[prev[i]] = next[i];
+			else
+				head[deg[i]] = next[i];
+			if (next[i] >= 0)
+				prev[next[i]] = prev[i];
+
+			d = deg[i] + len - 1;
+			d = ext < d ? ext : d;
+			d = (n - k - 2) < d ? (n - k - 2) : d;
+			deg[i] = d;
+			prev[i] = -1;
+			next[i] = head[d];
+			if (next[i] >= 0)
+				prev[next[i]] = i;
+			head[d] = i;
+			if (d < mindeg)
+				mindeg = d;
+		}
+
+		/* reset w(e) for the next pivot */
+		for (q = 0; q < len; ++q) {
+			i = Lp->data[q];
+			for (j = 0; j < E[i].len; ++j)
+				w[E[i].data[j]] = 0;
+		}
+	}
+
+	for (j = 0; j < n; ++j) {
+		ok_free(A[j].data);
+		ok_free(E[j].data);
+		ok_free(L[j].data);
+	}
+	ok_free(A);
+	ok_free(E);
+	ok_free(L);
+	ok_free(deg);
+	ok_free(w);
+	ok_free(mark);
+	ok_free(head);
+	ok_free(next);
+	ok_free(prev);
+	ok_free(alive);
+	return err;
+}
+
+/*
+ * pattern of K with both triangles (Sp, Si), from the entries of K on or
+ * above the diagonal, and their positions Sk in K
+ */
+static ok_status sparse_ldl_symmetrize(sparse_ldl * F, const ok_int * Kp,
+	const ok_int * Ki)
+{
+	ok_int i, j, p, q, nnz_S, n = (ok_int) F->size;
+	ok_int * count = F->pattern;
+
+	for (j = 0; j < n; ++j)
+		count[j] = 0;
+	for (j = 0; j < n; ++j)
+		for (p = Kp[j]; p < Kp[j + 1]; ++p) {
+			i = Ki[p];
+			if (i < 0 || i >= n)
+				return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+			if (i < j) {
+				count[i] += 1;
+				count[j] += 1;
+			} else if (i == j) {
+				count[j] += 1;
+			}
+		}
+
+	ok_free(F->Sp);
+	ok_free(F->Si);
+	ok_free(F->Sk);
+	ok_alloc(F->Sp, ((size_t) n + 1) * sizeof(*F->Sp));
+	F->Sp[0] = 0;
+	for (j = 0; j < n; ++j)
+		F->Sp[j + 1] = F->Sp[j] + count[j];
+	nnz_S = F->Sp[n];
+	ok_alloc(F->Si, ((size_t) nnz_S + 1) * sizeof(*F->Si));
+	ok_alloc(F->Sk, ((size_t) nnz_S + 1) * sizeof(*F->Sk));
+
+	for (j = 0; j < n; ++j)
+		count[j] = F->Sp[j];
+	for (j = 0; j < n; ++j)
+		for (p = Kp[j]; p < Kp[j + 1]; ++p) {
+			i = Ki[p];
+			if (i > j)
+				continue;
+			q = count[j]++;
+			F->Si[q] = i;
+			F->Sk[q] = p;
+			if (i < j) {
+				q = count[i]++;
+				F->Si[q] = j;
+				F->Sk[q] = p;
+			}
+		}
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * symbolic factorization: ordering, elimination tree (parent) and the
+ * column counts (Lnz) and pointers (Lp) of L; allocates L
+ */
+ok_status sparse_ldl_analyze(sparse_ldl * F, const ok_int * Kp,
+	const ok_int * Ki)
+{
+	OK_CHECK_PTR(F);
+	OK_CHECK_PTR(F->perm);
+	OK_CHECK_PTR(Kp);
+	OK_CHECK_PTR(Ki);
+
+	ok_int i, k, kk, p, n = (ok_int) F->size;
+
+	F->analyzed = 0;
+	F->factored = 0;
+	OK_RETURNIF_ERR( sparse_ldl_symmetrize(F, Kp, Ki) );
+	OK_RETURNIF_ERR(
+		sparse_ldl_min_degree(F->size, F->Sp, F->Si, F->perm) );
+	for (k = 0; k < n; ++k)
+		F->iperm[F->perm[k]] = k;
+
+	for (k = 0; k < n; ++k) {
+		F->parent[k] = -1;
+		F->flag[k] = k;
+		F->Lnz[k] = 0;
+		kk = F->perm[k];
+		for (p = F->Sp[kk]; p < F->Sp[kk + 1]; ++p) {
+			i = F->iperm[F->Si[p]];
+			if (i < k)
+				for (; F->flag[i] != k; i = F->parent[i]) {
+					if (F->parent[i] == -1)
+						F->parent[i] = k;
+					F->Lnz[i] += 1;
+					F->flag[i] = k;
+				}
+		}
+	}
+
+	F->Lp[0] = 0;
+	for (k = 0; k < n; ++k)
+		F->Lp[k + 1] = F->Lp[k] + F->Lnz[k];
+	F->nnz_L = (size_t) F->Lp[n];
+
+	ok_free(F->Li);
+	ok_free(F->Lx);
+	ok_alloc(F->Li, (F->nnz_L + 1) * sizeof(*F->Li));
+	ok_alloc(F->Lx, (F->nnz_L + 1) * sizeof(*F->Lx));
+	if (!F->Li || !F->Lx)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	F->analyzed = 1;
+	F->factored = 0;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * numeric factorization (up-looking, one row of L per step), for a K with
+ * the pattern given to sparse_ldl_analyze(); values are read through the
+ * symmetrized pattern kept by the analysis
+ */
+ok_status sparse_ldl_factor(sparse_ldl * F, const ok_int * Kp,
+	const ok_int * Ki, const ok_float * Kx)
+{
+	OK_CHECK_PTR(F);
+	OK_CHECK_PTR(Kp);
+	OK_CHECK_PTR(Ki);
+	OK_CHECK_PTR(Kx);
+	if (!F->analyzed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	ok_int i, k, kk, p, p2, len, top, n = (ok_int) F->size;
+	ok_float yi, l_ki;
+	ok_float * y = F->y;
+	ok_int * pattern = F->pattern, * flag = F->flag;
+
+	F->factored = 0;
+	for (k = 0; k < n; ++k) {
+		y[k] = kZero;
+		top = n;
+		flag[k] = k;
+		F->Lnz[k] = 0;
+		kk = F->perm[k];
+
+		/* scatter column kk of K, find the pattern of row k of L */
+		for (p = F->Sp[kk]; p < F->Sp[kk + 1]; ++p) {
+			i = F->iperm[F->Si[p]];
+			if (i <= k) {
+				y[i] += Kx[F->Sk[p]];
+				for (len = 0; flag[i] != k; i = F->parent[i]) {
+					pattern[len++] = i;
+					flag[i] = k;
+				}
+				while (len > 0)
+					pattern[--top] = pattern[--len];
+			}
+		}
+
+		/* sparse triangular solve for row k of L */
+		F->D[k] = y[k];
+		y[k] = kZero;
+		for (; top < n; ++top) {
+			i = pattern[top];
+			yi = y[i];
+			y[i] = kZero;
+			p2 = F->Lp[i] + F->Lnz[i];
+			for (p = F->Lp[i]; p < p2; ++p)
+				y[F->Li[p]] -= F->Lx[p] * yi;
+			l_ki = yi / F->D[i];
+			F->D[k] -= l_ki * yi;
+			F->Li[p] = k;
+			F->Lx[p] = l_ki;
+			F->Lnz[i] += 1;
+		}
+		if (F->D[k] == kZero)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+	}
+
+	F->factored = 1;
+	return OPTKIT_SUCCESS;
+}
+
+/* solve K x = b in place, x = b on input */
+ok_status sparse_ldl_solve(sparse_ldl * F, ok_float * x)
+{
+	OK_CHECK_PTR(F);
+	OK_CHECK_PTR(x);
+	if (!F->factored)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	ok_int j, p, n = (ok_int) F->size;
+	ok_float * y = F->y;
+
+	for (j = 0; j < n; ++j)
+		y[j] = x[F->perm[j]];
+
+	/* L y = b */
+	for (j = 0; j < n; ++j)
+		for (p = F->Lp[j]; p < F->Lp[j + 1]; ++p)
+			y[F->Li[p]] -= F->Lx[p] * y[j];
+
+	/* D y = y */
+	for (j = 0; j < n; ++j)
+		y[j] /= F->D[j];
+
+	/* Lᵀ y = y */
+	for (j = n - 1; j >= 0; --j)
+		for (p = F->Lp[j]; p < F->Lp[j + 1]; ++p)
+			y[j] -= F->Lx[p] * y[F->Li[p]];
+
+	for (j = 0; j < n; ++j)
+		x[F->perm[j]] = y[j];
+	return OPTKIT_SUCCESS;
+}
+
+/* bytes held by the factor: L (values, indices, pointers), D and ordering */
+ok_status sparse_ldl_memory(const sparse_ldl * F, size_t * bytes)
+{
+	OK_CHECK_PTR(F);
+	OK_CHECK_PTR(bytes);
+	*bytes = F->nnz_L * (sizeof(*F->Lx) + sizeof(*F->Li)) +
+		(F->size + 1) * sizeof(*F->Lp) + F->size * sizeof(*F->D) +
+		2 * F->size * sizeof(*F->perm);
+	return OPTKIT_SUCCESS;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,276 @@
+#include "optkit_anderson.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+anderson_accelerator * anderson_accelerator_alloc(size_t vector_dim,
+	size_t lookback_dim, uint type, ok_float safeguard)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	anderson_accelerator * aa = OK_NULL;
+
+	if (vector_dim == 0 || lookback_dim == 0 || (type != 1 && type != 2))
+		return OK_NULL;
+
+	ok_alloc(aa, sizeof(*aa));
+	aa->vector_dim = vector_dim;
+	aa->lookback_dim = lookback_dim;
+	aa->type = type;
+	aa->safeguard = safeguard;
+	aa->regularization = kANDERSONREG;
+	OK_CHECK_ERR( err, vector_calloc(&(aa->w), vector_dim) );
+	OK_CHECK_ERR( err, vector_calloc(&(aa->f), vector_dim) );
+	OK_CHECK_ERR( err, vector_calloc(&(aa->g), vector_dim) );
+	OK_CHECK_ERR( err, vector_calloc(&(aa->f_prev), vector_dim) );
+	OK_CHECK_ERR( err, vector_calloc(&(aa->g_prev), vector_dim) );
+	OK_CHECK_ERR( err, matrix_calloc(&(aa->DF), vector_dim, lookback_dim,
+		CblasColMajor) );
+	OK_CHECK_ERR( err, matrix_calloc(&(aa->DG), vector_dim, lookback_dim,
+		CblasColMajor) );
+	OK_CHECK_ERR( err, matrix_calloc(&(aa->gram), lookback_dim,
+		lookback_dim, CblasColMajor) );
+	OK_CHECK_ERR( err, vector_calloc(&(aa->gamma), lookback_dim) );
+	ok_alloc(aa->gram_host, lookback_dim * lookback_dim *
+		sizeof(*aa->gram_host));
+	ok_alloc(aa->gamma_host, lookback_dim * sizeof(*aa->gamma_host));
+	OK_CHECK_ERR( err, anderson_reset(aa) );
+	if (err) {
+		OK_MAX_ERR( err, anderson_accelerator_free(aa) );
+		aa = OK_NULL;
+	}
+	return aa;
+}
+
+ok_status anderson_accelerator_free(anderson_accelerator * aa)
+{
+	OK_CHECK_PTR(aa);
+	ok_status err = OPTKIT_SUCCESS;
+	OK_MAX_ERR( err, vector_free(&(aa->w)) );
+	OK_MAX_ERR( err, vector_free(&(aa->f)) );
+	OK_MAX_ERR( err, vector_free(&(aa->g)) );
+	OK_MAX_ERR( err, vector_free(&(aa->f_prev)) );
+	OK_MAX_ERR( err, vector_free(&(aa->g_prev)) );
+	OK_MAX_ERR( err, matrix_free(&(aa->DF)) );
+	OK_MAX_ERR( err, matrix_free(&(aa->DG)) );
+	OK_MAX_ERR( err, matrix_free(&(aa->gram)) );
+	OK_MAX_ERR( err, vector_free(&(aa->gamma)) );
+	ok_free(aa->gram_host);
+	ok_free(aa->gamma_host);
+	ok_free(aa);
+	return err;
+}
+
+/*
+ * discard history, e.g., when the fixed-point map changes (new rho);
+ * the next call to anderson_accelerate() takes a plain step
+ */
+ok_status anderson_reset(anderson_accelerator * aa)
+{
+	OK_CHECK_PTR(aa);
+	aa->n_hist = 0;
+	aa->index = 0;
+	aa->has_iterate = 0;
+	aa->has_prev = 0;
+	aa->accelerated = 0;
+	aa->norm_f_prev = OK_FLOAT_MAX;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * solve the n x n (column-major) system G * x = b in place by Gaussian
+ * elimination with partial pivoting, b overwritten with x.
+ *
+ * returns 0 if the system is (numerically) singular
+ */
+static int anderson_solve_host(ok_float * G, ok_float * b, size_t n)
+{
+	size_t i, j, k, p;
+	ok_float scale = kZero, pivot, mult, tmp;
+
+	for (i = 0; i < n; ++i)
+		scale = (MATH(fabs)(G[i + i * n]) > scale) ?
+			MATH(fabs)(G[i + i * n]) : scale;
+	if (!(scale > kZero))
+		return 0;
+
+	for (k = 0; k < n; ++k) {
+		p = k;
+		for (i = k + 1; i < n; ++i)
+			if (MATH(fabs)(G[i + k * n]) > MATH(fabs)(G[p + k * n]))
+				p = i;
+		pivot = G[p + k * n];
+		if (MATH(fabs)(pivot) <= MACHINETOL * scale)
+			return 0;
+		if (p != k) {
+			for (j = k; j < n; ++j) {
+				tmp = G[k + j * n];
+				G[k + j * n] = G[p + j * n];
+				G[p + j * n] = tmp;
+			}
+			tmp = b[k];
+			b[k] = b[p];
+			b[p] = tmp;
+		}
+		for (i = k + 1; i < n; ++i) {
+			mult = G[i + k * n] / pivot;
+			for (j = k + 1; j < n; ++j)
+				G[i + j * n] -= mult * G[k + j * n];
+			b[i] -= mult * b[k];
+		}
+	}
+	for (k = n; k-- > 0; ) {
+		for (j = k + 1; j < n; ++j)
+			b[k] -= G[k + j * n] * b[j];
+		b[k] /= G[k + k * n];
+	}
+	return 1;
+}
+
+/*
+ * form gram = DF' * DF (type 2) or DW' * DF = (DG - DF)' * DF (type 1) over
+ * the active history columns, and rhs = DF' * f or DW' * f accordingly;
+ * solve for gamma on the host.
+ *
+ * returns 0 in *solved if the system is singular
+ */
+static ok_status anderson_solve(void * linalg_handle,
+	anderson_accelerator * aa, int * solved)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	size_t i, n = aa->n_hist;
+	ok_float trace = kZero;
+	matrix DF = (matrix){0, 0, 0, OK_NULL, CblasColMajor};
+	matrix DG = (matrix){0, 0, 0, OK_NULL, CblasColMajor};
+	matrix gram = (matrix){0, 0, 0, OK_NULL, CblasColMajor};
+	vector gamma = (vector){0, 0, OK_NULL};
+
+	OK_CHECK_ERR( err, matrix_submatrix(&DF, &aa->DF, 0, 0, aa->vector_dim,
+		n) );
+	OK_CHECK_ERR( err, matrix_submatrix(&DG, &aa->DG, 0, 0, aa->vector_dim,
+		n) );
+	OK_CHECK_ERR( err, matrix_submatrix(&gram, &aa->gram, 0, 0, n, n) );
+	OK_CHECK_ERR( err, vector_subvector(&gamma, &aa->gamma, 0, n) );
+
+	if (aa->type == 1) {
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, kOne, &DG, &DF, kZero, &gram) );
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, -kOne, &DF, &DF, kOne, &gram) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasTrans, kOne,
+			&DG, &aa->f, kZero, &gamma) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasTrans, -kOne,
+			&DF, &aa->f, kOne, &gamma) );
+	} else {
+		OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, kOne, &DF, &DF, kZero, &gram) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasTrans, kOne,
+			&DF, &aa->f, kZero, &gamma) );
+	}
+	OK_CHECK_ERR( err, matrix_memcpy_am(aa->gram_host, &gram,
+		CblasColMajor) );
+	OK_CHECK_ERR( err, vector_memcpy_av(aa->gamma_host, &gamma, 1) );
+	if (err)
+		return err;
+
+	/* Tikhonov regularization, relative to the scale of the system */
+	for (i = 0; i < n; ++i)
+		trace += MATH(fabs)(aa->gram_host[i + i * n]);
+	for (i = 0; i < n; ++i)
+		aa->gram_host[i + i * n] += aa->regularization * trace;
+
+	*solved = anderson_solve_host(aa->gram_host, aa->gamma_host, n);
+	if (*solved)
+		OK_CHECK_ERR( err, vector_memcpy_va(&gamma, aa->gamma_host, 1) );
+	return err;
+}
+
+/*
+ * given iterate = T(w), with w the output of the previous call, overwrite
+ * iterate with the next point of the accelerated iteration:
+ *
+ *	T(w), if there is no history yet (plain step);
+ *	T(w) - DG * gamma, for an Anderson step;
+ *	T(w_prev), the plain iterate of the previous call, if the previous
+ *		Anderson step increased the fixed-point residual by more than
+ *		the safeguard factor (step rejected, history discarded).
+ */
+ok_status anderson_accelerate(void * linalg_handle, anderson_accelerator * aa,
+	vector * iterate)
+{
+	OK_CHECK_PTR(aa);
+	OK_CHECK_VECTOR(iterate);
+	if (iterate->size != aa->vector_dim)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	ok_float norm_f;
+	int solved = 0;
+	vector col = (vector){0, 0, OK_NULL};
+	matrix DG = (matrix){0, 0, 0, OK_NULL, CblasColMajor};
+
+	OK_RETURNIF_ERR( vector_memcpy_vv(&aa->g, iterate) );
+
+	/* first call after reset: record w = T(w_0) */
+	if (!aa->has_iterate) {
+		aa->has_iterate = 1;
+		return OK_SCAN_ERR( vector_memcpy_vv(&aa->w, &aa->g) );
+	}
+
+	/* f = g - w */
+	OK_RETURNIF_ERR( vector_memcpy_vv(&aa->f, &aa->g) );
+	OK_RETURNIF_ERR( blas_axpy(linalg_handle, -kOne, &aa->w, &aa->f) );
+	OK_RETURNIF_ERR( blas_nrm2(linalg_handle, &aa->f, &norm_f) );
+
+	/* safeguard: fall back to plain iterate preceding rejected step */
+	if (aa->accelerated && norm_f > aa->safeguard * aa->norm_f_prev) {
+		aa->rejected += 1;
+		aa->accepted -= 1;
+		OK_RETURNIF_ERR( vector_memcpy_vv(iterate, &aa->g_prev) );
+		OK_RETURNIF_ERR( anderson_reset(aa) );
+		aa->has_iterate = 1;
+		return OK_SCAN_ERR( vector_memcpy_vv(&aa->w, iterate) );
+	}
+	aa->accelerated = 0;
+
+	/* update history with df = f - f_prev, dg = g - g_prev */
+	if (aa->has_prev) {
+		OK_RETURNIF_ERR( matrix_column(&col, &aa->DF, aa->index) );
+		OK_RETURNIF_ERR( vector_memcpy_vv(&col, &aa->f) );
+		OK_RETURNIF_ERR( blas_axpy(linalg_handle, -kOne, &aa->f_prev,
+			&col) );
+		OK_RETURNIF_ERR( matrix_column(&col, &aa->DG, aa->index) );
+		OK_RETURNIF_ERR( vector_memcpy_vv(&col, &aa->g) );
+		OK_RETURNIF_ERR( blas_axpy(linalg_handle, -kOne, &aa->g_prev,
+			&col) );
+		aa->index = (aa->index + 1) % aa->lookback_dim;
+		if (aa->n_hist < aa->lookback_dim)
+			aa->n_hist += 1;
+	}
+	OK_RETURNIF_ERR( vector_memcpy_vv(&aa->f_prev, &aa->f) );
+	OK_RETURNIF_ERR( vector_memcpy_vv(&aa->g_prev, &aa->g) );
+	aa->norm_f_prev = norm_f;
+	aa->has_prev = 1;
+
+	/* w+ = g - DG * gamma, or plain step g if no (solvable) history */
+	if (aa->n_hist > 0)
+		OK_CHECK_ERR( err, anderson_solve(linalg_handle, aa, &solved) );
+	if (!err && solved) {
+		OK_CHECK_ERR( err, matrix_submatrix(&DG, &aa->DG, 0, 0,
+			aa->vector_dim, aa->n_hist) );
+		OK_CHECK_ERR( err, vector_subvector(&col, &aa->gamma, 0,
+			aa->n_hist) );
+		OK_CHECK_ERR( err, blas_gemv(linalg_handle, CblasNoTrans, -kOne,
+			&DG, &col, kOne, iterate) );
+		if (!err) {
+			aa->accelerated = 1;
+			aa->accepted += 1;
+		}
+	}
+	OK_CHECK_ERR( err, vector_memcpy_vv(&aa->w, iterate) );
+	return err;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -36,14 +36,68 @@ POGS_PRIVATE ok_status pogs_matrix_alloc(pogs_matrix ** M, size_t m, size_t n,
 	return err;
 }
 
+/*
+ * pogs_matrix over caller-owned host memory: A (and, for the direct
+ * projector, the factor L) view the arrays A_equil (and LLT_factorization)
+ * in place, which must outlive the matrix. host memory only.
+ */
+POGS_PRIVATE ok_status pogs_matrix_view(pogs_matrix ** M, ok_float * A_equil,
+	ok_float * LLT_factorization, size_t m, size_t n, enum CBLAS_ORDER ord)
+{
+	if (*M != OK_NULL)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_matrix * M_ = OK_NULL;
+	ok_alloc(M_, sizeof(*M_));
+	M_->borrowed = 1;
+	ok_alloc(M_->A, sizeof(*M_->A));
+	OK_CHECK_ERR( err, matrix_view_array(M_->A, A_equil, m, n, ord) );
+	ok_alloc(M_->P, sizeof(projector_));
+	#ifndef OPTKIT_INDIRECT
+	M_->P->A = M_->A;
+	ok_alloc(M_->P->L, sizeof(*M_->P->L));
+	OK_CHECK_ERR( err, matrix_view_array(M_->P->L, LLT_factorization,
+		(m < n) ? m : n, (m < n) ? m : n, ord) );
+	M_->P->skinny = (m >= n);
+	#else
+	OK_CHECK_ERR( err, PROJECTOR(alloc)(M_->P, M_->A) );
+	#endif
+	ok_alloc(M_->d, sizeof(*M_->d));
+	ok_alloc(M_->e, sizeof(*M_->e));
+	OK_CHECK_ERR( err, vector_calloc(M_->d, m) );
+	OK_CHECK_ERR( err, vector_calloc(M_->e, n) );
+	M_->skinny = (m >= n);
+	M_->normalized = 0;
+	M_->equilibrated = 0;
+	if (err)
+		OK_MAX_ERR( err, pogs_matrix_free(M_) );
+	else
+		*M = M_;
+	return err;
+}
+
 POGS_PRIVATE ok_status pogs_matrix_free(pogs_matrix * M)
 {
 	if (!M || !M->A)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
-	ok_status err = OK_SCAN_ERR( PROJECTOR(free)(M->P) );
-	ok_free(M->P);
-	OK_MAX_ERR( err, matrix_free(M->A) );
+	ok_status err = OPTKIT_SUCCESS;
+	if (M->borrowed) {
+		/* release the views, not the caller's arrays */
+		#ifndef OPTKIT_INDIRECT
+		if (M->P)
+			ok_free(M->P->L);
+		#else
+		err = OK_SCAN_ERR( PROJECTOR(free)(M->P) );
+		#endif
+		ok_free(M->P);
+		ok_free(M->A);
+	} else {
+		err = OK_SCAN_ERR( PROJECTOR(free)(M->P) );
+		ok_free(M->P);
+		OK_MAX_ERR( err, matrix_free(M->A) );
+	}
 	OK_MAX_ERR( err, vector_free(M->d) );
 	OK_MAX_ERR( err, vector_free(M->e) );
 	ok_free(M);
@@ -52,6 +106,17 @@ POGS_PRIVATE ok_status pogs_matrix_free(pogs_matrix * M)
 
 POGS_PRIVATE ok_status pogs_solver_alloc(pogs_solver ** solver, size_t m,
 	size_t n, enum CBLAS_ORDER ord)
+{
+	return pogs_solver_view_alloc(solver, OK_NULL, OK_NULL, m, n, ord);
+}
+
+/*
+ * allocate a solver; if A_equil is non-null, the solver's matrix (and
+ * factor) view A_equil (and LLT_factorization) instead of owning copies
+ */
+POGS_PRIVATE ok_status pogs_solver_view_alloc(pogs_solver ** solver,
+	ok_float * A_equil, ok_float * LLT_factorization, size_t m, size_t n,
+	enum CBLAS_ORDER ord)
 {
 	ok_status err = OPTKIT_SUCCESS;
 	pogs_solver * s = OK_NULL;
@@ -67,7 +132,11 @@ POGS_PRIVATE ok_status pogs_solver_alloc(pogs_solver ** solver, size_t m,
 	OK_CHECK_ERR( err, function_vector_calloc(s->f, m) );
 	OK_CHECK_ERR( err, function_vector_calloc(s->g, n) );
 	OK_CHECK_ERR( err, pogs_variables_alloc(&(s->z), m, n) );
-	OK_CHECK_ERR( err, pogs_matrix_alloc(&(s->M), m, n, ord) );
+	if (A_equil)
+		OK_CHECK_ERR( err, pogs_matrix_view(&(s->M), A_equil,
+			LLT_factorization, m, n, ord) );
+	else
+		OK_CHECK_ERR( err, pogs_matrix_alloc(&(s->M), m, n, ord) );
 	OK_CHECK_ERR( err, blas_make_handle(&(s->linalg_handle)) );
 	s->rho = kOne;
 	if (err)
@@ -80,7 +149,8 @@ POGS_PRIVATE ok_status pogs_solver_alloc(pogs_solver ** solver, size_t m,
 POGS_PRIVATE ok_status pogs_solver_free(pogs_solver * solver)
 {
 	OK_CHECK_PTR(solver);
-	ok_status err = blas_destroy_handle(solver->linalg_handle);
+	ok_status err = pogs_telemetry_disable(solver);
+	OK_MAX_ERR( err, blas_destroy_handle(solver->linalg_handle) );
 	OK_MAX_ERR( err, pogs_matrix_free(solver->M) );
 	OK_MAX_ERR( err, pogs_variables_free(solver->z) );
 	ok_free(solver->settings);
@@ -93,10 +163,13 @@ POGS_PRIVATE ok_status pogs_solver_free(pogs_solver * solver)
 }
 
 POGS_PRIVATE ok_status equilibrate(void * linalg_handle, ok_float * A_orig,
-	pogs_matrix * M, enum CBLAS_ORDER ord)
+	pogs_matrix * M, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings)
 {
-	ok_status err = regularized_sinkhorn_knopp(linalg_handle, A_orig, M->A,
-		M->d, M->e, ord);
+	OK_TIMER t = tic();
+	ok_status err = matrix_equilibrate(linalg_handle, A_orig, M->A, M->d,
+		M->e, ord, settings, &M->equil);
+	M->equil_time = toc(t);
 	M->equilibrated = (err == OPTKIT_SUCCESS);
 	return err;
 }
@@ -143,6 +216,253 @@ POGS_PRIVATE ok_status normalize_DAE(void * linalg_handle, pogs_matrix * M)
 	return err;
 }
 
+POGS_PRIVATE ok_status pogs_matrix_cache_key(pogs_cache_key * key,
+	const ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord,
+	const equilibration_settings * settings)
+{
+	OK_CHECK_PTR(key);
+	OK_CHECK_PTR(A);
+	uint64_t seed = 0, check_seed = kPOGSCACHECHECKSEED;
+	ok_float equil[3];
+
+	/* non-default equilibrations seed the hash; default keys are as is */
+	if (!equilibration_settings_are_default(settings)) {
+		equil[0] = (ok_float) settings->method;
+		equil[1] = (ok_float) settings->maxiter;
+		equil[2] = settings->tol;
+		seed = pogs_cache_hash(equil, sizeof(equil), seed);
+		check_seed = pogs_cache_hash(equil, sizeof(equil), check_seed);
+	}
+	return pogs_cache_key_set(key,
+		pogs_cache_hash(A, m * n * sizeof(*A), seed),
+		pogs_cache_hash(A, m * n * sizeof(*A), check_seed),
+		m, n, m * n, ord, (uint) is_direct());
+}
+
+/* restore equilibrated A, d, e, normA (and factor L) from a cache entry */
+POGS_PRIVATE ok_status pogs_matrix_load_cached(pogs_matrix * M,
+	const pogs_cache_entry * entry)
+{
+	OK_CHECK_PTR(M);
+	OK_CHECK_PTR(entry);
+	enum CBLAS_ORDER ord = entry->key.order;
+
+	OK_RETURNIF_ERR( matrix_memcpy_ma(M->A, entry->A_equil, ord) );
+	#ifndef OPTKIT_INDIRECT
+	OK_RETURNIF_ERR( matrix_memcpy_ma(M->P->L, entry->L, ord) );
+	M->P->normA = entry->normA;
+	M->P->normalized = 1;
+	#endif
+	OK_RETURNIF_ERR( vector_memcpy_va(M->d, entry->d, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(M->e, entry->e, 1) );
+	M->normA = entry->normA;
+	M->normalized = 1;
+	M->equilibrated = 1;
+	M->equil.iterations = 0;
+	M->equil.row_spread = entry->equil_row_spread;
+	M->equil.col_spread = entry->equil_col_spread;
+	M->equil_time = kZero;
+	return OPTKIT_SUCCESS;
+}
+
+/* copy equilibrated A, d, e, normA (and factor L) into the cache */
+POGS_PRIVATE ok_status pogs_matrix_cache(pogs_matrix * M,
+	const pogs_cache_key * key)
+{
+	OK_CHECK_PTR(M);
+	OK_CHECK_PTR(key);
+
+	ok_status err = OPTKIT_SUCCESS;
+	size_t L_size = 0;
+	pogs_cache_entry * entry = OK_NULL;
+
+	#ifndef OPTKIT_INDIRECT
+	L_size = M->P->L->size1 * M->P->L->size2;
+	#endif
+
+	entry = pogs_cache_entry_alloc(key, L_size);
+	OK_CHECK_PTR(entry);
+	OK_CHECK_ERR( err, matrix_memcpy_am(entry->A_equil, M->A,
+		key->order) );
+	#ifndef OPTKIT_INDIRECT
+	OK_CHECK_ERR( err, matrix_memcpy_am(entry->L, M->P->L, key->order) );
+	#endif
+	OK_CHECK_ERR( err, vector_memcpy_av(entry->d, M->d, 1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(entry->e, M->e, 1) );
+	entry->normA = M->normA;
+	entry->equil_row_spread = M->equil.row_spread;
+	entry->equil_col_spread = M->equil.col_spread;
+
+	if (err)
+		OK_MAX_ERR( err, pogs_cache_entry_free(entry) );
+	else
+		err = pogs_cache_insert(entry);
+	return err;
+}
+
+/*
+ * rebuild the row-indexed state of the solver (A, d, f and the y blocks of
+ * the iterates) for m - n_removed + n_appended rows: rows of the old state
+ * not listed in removed (sorted, distinct) are kept in order, followed by
+ * n_appended rows with A = 0, d = 0 and default objectives. the projector
+ * is pointed at the new A; its factor is left as is.
+ */
+POGS_PRIVATE ok_status pogs_solver_resize_rows(pogs_solver * solver,
+	const size_t * removed, size_t n_removed, size_t n_appended)
+{
+	OK_CHECK_PTR(solver);
+	if (n_removed && !removed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_matrix * M = solver->M;
+	size_t m = M->A->size1, n = M->A->size2;
+	size_t m_new = m - n_removed + n_appended;
+	size_t r, b, start, stop, len, offset = 0;
+	matrix * A = OK_NULL;
+	vector * d = OK_NULL;
+	function_vector * f = OK_NULL;
+	pogs_variables * z = OK_NULL;
+	function_t * h = OK_NULL, * h_new = OK_NULL;
+	block_vector * src[6], * dst[6];
+	matrix A_src, A_dst;
+	vector v_src, v_dst;
+
+	if (M->borrowed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+
+	A_src.data = OK_NULL;
+	A_dst.data = OK_NULL;
+	v_src.data = OK_NULL;
+	v_dst.data = OK_NULL;
+
+	ok_alloc(A, sizeof(*A));
+	OK_CHECK_ERR( err, matrix_calloc(A, m_new, n, M->A->order) );
+	ok_alloc(d, sizeof(*d));
+	OK_CHECK_ERR( err, vector_calloc(d, m_new) );
+	ok_alloc(f, sizeof(*f));
+	OK_CHECK_ERR( err, function_vector_calloc(f, m_new) );
+	OK_CHECK_ERR( err, pogs_variables_alloc(&z, m_new, n) );
+	ok_alloc(h, m * sizeof(*h));
+	ok_alloc(h_new, m_new * sizeof(*h_new));
+	OK_CHECK_ERR( err, function_vector_memcpy_av(h, solver->f) );
+	OK_CHECK_ERR( err, function_vector_memcpy_av(h_new, f) );
+
+	if (!err) {
+		src[0] = solver->z->primal;
+		src[1] = solver->z->primal12;
+		src[2] = solver->z->dual;
+		src[3] = solver->z->dual12;
+		src[4] = solver->z->prev;
+		src[5] = solver->z->temp;
+		dst[0] = z->primal;
+		dst[1] = z->primal12;
+		dst[2] = z->dual;
+		dst[3] = z->dual12;
+		dst[4] = z->prev;
+		dst[5] = z->temp;
+	}
+
+	/* copy the retained rows, one run [start, stop) at a time */
+	for (r = 0, start = 0; r <= n_removed && !err; ++r) {
+		stop = (r < n_removed) ? removed[r] : m;
+		if (stop > start) {
+			len = stop - start;
+			OK_CHECK_ERR( err, matrix_submatrix(&A_src, M->A, start, 0,
+				len, n) );
+			OK_CHECK_ERR( err, matrix_submatrix(&A_dst, A, offset, 0,
+				len, n) );
+			OK_CHECK_ERR( err, matrix_memcpy_mm(&A_dst, &A_src) );
+			OK_CHECK_ERR( err, vector_subvector(&v_src, M->d, start,
+				len) );
+			OK_CHECK_ERR( err, vector_subvector(&v_dst, d, offset, len) );
+			OK_CHECK_ERR( err, vector_memcpy_vv(&v_dst, &v_src) );
+			for (b = 0; b < 6 && !err; ++b) {
+				OK_CHECK_ERR( err, vector_subvector(&v_src, src[b]->y,
+					start, len) );
+				OK_CHECK_ERR( err, vector_subvector(&v_dst, dst[b]->y,
+					offset, len) );
+				OK_CHECK_ERR( err, vector_memcpy_vv(&v_dst, &v_src) );
+			}
+			memcpy(h_new + offset, h + start, len * sizeof(*h));
+			offset += len;
+		}
+		start = stop + 1;
+	}
+	for (b = 0; b < 6 && !err; ++b)
+		OK_CHECK_ERR( err, vector_memcpy_vv(dst[b]->x, src[b]->x) );
+	OK_CHECK_ERR( err, function_vector_memcpy_va(f, h_new) );
+	ok_free(h);
+	ok_free(h_new);
+
+	if (err) {
+		OK_MAX_ERR( err, matrix_free(A) );
+		OK_MAX_ERR( err, vector_free(d) );
+		OK_MAX_ERR( err, function_vector_free(f) );
+		if (z)
+			OK_MAX_ERR( err, pogs_variables_free(z) );
+		ok_free(A);
+		ok_free(d);
+		ok_free(f);
+		return err;
+	}
+
+	OK_MAX_ERR( err, matrix_free(M->A) );
+	ok_free(M->A);
+	M->A = A;
+	OK_MAX_ERR( err, vector_free(M->d) );
+	ok_free(M->d);
+	M->d = d;
+	OK_MAX_ERR( err, function_vector_free(solver->f) );
+	ok_free(solver->f);
+	solver->f = f;
+	OK_MAX_ERR( err, pogs_variables_free(solver->z) );
+	solver->z = z;
+	#ifndef OPTKIT_INDIRECT
+	M->P->A = A;
+	#endif
+	M->skinny = (m_new >= n);
+	return err;
+}
+
+/*
+ * re-form the projector's factor from the current (equilibrated and
+ * normalized) A, resizing it if min(m, n) changed; the equilibration and
+ * normalization of A are kept
+ */
+POGS_PRIVATE ok_status pogs_matrix_refactor(void * linalg_handle,
+	pogs_matrix * M)
+{
+	OK_CHECK_PTR(M);
+	#ifndef OPTKIT_INDIRECT
+	direct_projector * P = M->P;
+	size_t m = M->A->size1, n = M->A->size2;
+	size_t mindim = m < n ? m : n;
+	vector diag;
+
+	diag.data = OK_NULL;
+	if (P->L->size1 != mindim) {
+		OK_RETURNIF_ERR( matrix_free(P->L) );
+		OK_RETURNIF_ERR( matrix_calloc(P->L, mindim, mindim,
+			M->A->order) );
+	}
+	P->skinny = (m >= n);
+	if (P->skinny)
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasTrans,
+			CblasNoTrans, kOne, M->A, M->A, kZero, P->L) );
+	else
+		OK_RETURNIF_ERR( blas_gemm(linalg_handle, CblasNoTrans,
+			CblasTrans, kOne, M->A, M->A, kZero, P->L) );
+	OK_RETURNIF_ERR( matrix_diagonal(&diag, P->L) );
+	OK_RETURNIF_ERR( vector_add_constant(&diag, kOne) );
+	return OK_SCAN_ERR( linalg_cholesky_decomp(linalg_handle, P->L) );
+	#else
+	OK_RETURNIF_ERR( PROJECTOR(free)(M->P) );
+	OK_RETURNIF_ERR( PROJECTOR(alloc)(M->P, M->A) );
+	return OK_SCAN_ERR( PROJECTOR(initialize)(linalg_handle, M->P, 0) );
+	#endif
+}
+
 POGS_PRIVATE ok_status update_problem(pogs_solver * solver, function_vector * f,
 	function_vector * g)
 {
@@ -239,10 +559,8 @@ POGS_PRIVATE ok_status project_primal(void * linalg_handle, projector_ * proj,
 {
 	if (!proj || !z)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
-	vector_set_all(z->temp->vec, kZero);
-	blas_axpy(linalg_handle, alpha, z->primal12->vec, z->temp->vec);
-	blas_axpy(linalg_handle, kOne - alpha, z->prev->vec, z->temp->vec);
-	blas_axpy(linalg_handle, kOne, z->dual->vec, z->temp->vec);
+	OK_RETURNIF_ERR( vector_axpbypcz(z->temp->vec, alpha, z->primal12->vec,
+		kOne - alpha, z->prev->vec, kOne, z->dual->vec) );
 	return OK_SCAN_ERR( PROJECTOR(project)(linalg_handle, proj, z->temp->x,
 		z->temp->y, z->primal->x, z->primal->y) );
 }
@@ -253,7 +571,7 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
 	/* declare / get handles to all auxiliary types */
-	int converged = 0;
+	int converged = 0, checked, interrupt = 0;
 	uint k, PRINT_ITER = 10000u;
 	adapt_params rho_params = (adapt_params){kDELTAMIN, kZero, kZero, kOne};
 	pogs_settings * settings = solver->settings;
@@ -263,6 +581,11 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 	pogs_tolerances eps = (pogs_tolerances){0, 0, 0, 0, 0, 0, 0, 0};
 	ok_status err = initialize_conditions(&obj, &res, &eps, settings,
 		solver->z->m, solver->z->n);
+	anderson_accelerator * aa = OK_NULL;
+	vector iterate = (vector){0, 0, OK_NULL};
+	ok_float rho_prev;
+	pogs_telemetry_record record;
+	double start = pogs_telemetry_clock();
 
 	void * linalg_handle = solver->linalg_handle;
 
@@ -272,41 +595,72 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 		for (k = 0; k < settings->verbose && PRINT_ITER > 1; ++k)
 			PRINT_ITER /= 10;
 
+	OK_CHECK_ERR( err,
+		accelerator_alloc(&aa, &iterate, settings, z->m, z->n) );
+	if (solver->telemetry)
+		OK_CHECK_ERR( err, pogs_telemetry_clear(solver->telemetry) );
+
 	/* signal start of execution */
 	if (settings->verbose > 0)
 		print_header_string();
 
 	/* iterate until converged, or error/maxiter reached */
 	for (k = 1; !err && k <= settings->maxiter; ++k) {
+		pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			set_prev(z) );
 		OK_CHECK_ERR( err,
 			prox(linalg_handle, solver->f, solver->g, z,
 				solver->rho) );
+		record.t_prox = pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			project_primal(linalg_handle, solver->M->P, z,
 				settings->alpha) );
+		record.t_project = pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			update_dual(linalg_handle, z, settings->alpha) );
+		record.t_dual = pogs_telemetry_lap(solver->telemetry);
+
+		/* interrupted: full check of the iterate to be returned */
+		interrupt = interrupt_due(settings, &solver->cancel, start);
+		checked = interrupt ||
+			full_check_due(linalg_handle, settings, z, &eps, k);
+		if (checked)
+			converged = check_convergence(linalg_handle, solver,
+				&obj, &res, &eps);
+		record.t_check = pogs_telemetry_lap(solver->telemetry);
+		OK_CHECK_ERR( err,
+			telemetry_record(solver->telemetry, &record, k, checked,
+				&res, &eps, &obj, solver->rho) );
 
-		converged = check_convergence(linalg_handle, solver, &obj, &res,
-			&eps);
-
-		if ((k % PRINT_ITER == 0 || converged ||k == settings->maxiter)
-			&& settings->verbose)
+		if ((k % PRINT_ITER == 0 || converged || interrupt ||
+			k == settings->maxiter) && settings->verbose)
 			print_iter_string(&res, &eps, &obj, k);
 
-		if (converged || k == settings->maxiter)
+		if (converged || interrupt || k == settings->maxiter)
 			break;
 
-		if (settings->adaptiverho)
+		rho_prev = solver->rho;
+		if (checked && settings->adaptiverho)
 			OK_CHECK_ERR( err,
 				adaptrho(z, settings, &solver->rho, &rho_params,
 					&res, &eps, k) );
+
+		/* history is invalidated by changes to rho */
+		if (!err && aa) {
+			if (solver->rho != rho_prev)
+				OK_CHECK_ERR( err, anderson_reset(aa) );
+			OK_CHECK_ERR( err,
+				accelerate(linalg_handle, aa, &iterate, z) );
+		}
 	}
 
-	if (!converged && k == settings->maxiter)
+	if (!converged && !interrupt && k == settings->maxiter &&
+		settings->verbose)
 		printf("reached max iter = %u\n", k);
+	else if (!converged && interrupt && settings->verbose)
+		printf("%s at iter = %u\n", interrupt == OkPogsCancelled ?
+			"cancelled" : "reached time limit", k);
 
 	/* update info */
 	info->rho = solver->rho;
@@ -314,30 +668,485 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 	info->converged = converged;
 	info->err = err;
 	info->k = k;
+	info->k_accel = aa ? (uint) aa->accepted : 0;
+	if (err)
+		info->status = OkPogsUnsolved;
+	else if (converged)
+		info->status = OkPogsConverged;
+	else if (interrupt)
+		info->status = interrupt;
+	else
+		info->status = OkPogsMaxIter;
+	info->refinement_residual = kZero;
+	info->cg_iters = 0;
+	info->equil_time = solver->M->equil_time;
+	info->equil_row_spread = solver->M->equil.row_spread;
+	info->equil_col_spread = solver->M->equil.col_spread;
+	OK_MAX_ERR( err, accelerator_free(aa, &iterate) );
 	return err;
 }
 
-pogs_solver * pogs_init(ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord)
+/* view column j of the (m + n) x K matrix Z as the block vector [y; x] */
+POGS_PRIVATE ok_status block_vector_view_column(block_vector ** z,
+	matrix * Z, size_t j, size_t m, size_t n)
+{
+	if (*z != OK_NULL)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	OK_CHECK_MATRIX(Z);
+	if (Z->size1 != m + n || j >= Z->size2)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	block_vector * z_ = OK_NULL;
+	ok_alloc(z_, sizeof(*z_));
+	z_->size = m + n;
+	z_->m = m;
+	z_->n = n;
+	ok_alloc(z_->vec, sizeof(*z_->vec));
+	ok_alloc(z_->x, sizeof(*z_->x));
+	ok_alloc(z_->y, sizeof(*z_->y));
+	OK_CHECK_ERR( err, matrix_column(z_->vec, Z, j) );
+	OK_CHECK_ERR( err, vector_subvector(z_->y, z_->vec, 0, m) );
+	OK_CHECK_ERR( err, vector_subvector(z_->x, z_->vec, m, n) );
+	if (err)
+		OK_MAX_ERR( err, block_vector_view_free(z_) );
+	else
+		*z = z_;
+	return err;
+}
+
+POGS_PRIVATE ok_status block_vector_view_free(block_vector * z)
+{
+	OK_CHECK_PTR(z);
+	ok_free(z->x);
+	ok_free(z->y);
+	ok_free(z->vec);
+	ok_free(z);
+	return OPTKIT_SUCCESS;
+}
+
+POGS_PRIVATE ok_status pogs_batch_alloc(pogs_batch ** batch, size_t K,
+	size_t m, size_t n, enum CBLAS_ORDER ord)
+{
+	if (*batch != OK_NULL)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	if (K == 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_batch * b = OK_NULL;
+	pogs_variables * z = OK_NULL;
+	size_t j;
+
+	ok_alloc(b, sizeof(*b));
+	b->K = K;
+	b->m = m;
+	b->n = n;
+	ok_alloc(b->primal, sizeof(*b->primal));
+	ok_alloc(b->primal12, sizeof(*b->primal12));
+	ok_alloc(b->dual, sizeof(*b->dual));
+	ok_alloc(b->dual12, sizeof(*b->dual12));
+	ok_alloc(b->prev, sizeof(*b->prev));
+	ok_alloc(b->temp, sizeof(*b->temp));
+	ok_alloc(b->swap, sizeof(*b->swap));
+	OK_CHECK_ERR( err, matrix_calloc(b->primal, m + n, K, ord) );
+	OK_CHECK_ERR( err, matrix_calloc(b->primal12, m + n, K, ord) );
+	OK_CHECK_ERR( err, matrix_calloc(b->dual, m + n, K, ord) );
+	OK_CHECK_ERR( err, matrix_calloc(b->dual12, m + n, K, ord) );
+	OK_CHECK_ERR( err, matrix_calloc(b->prev, m + n, K, ord) );
+	OK_CHECK_ERR( err, matrix_calloc(b->temp, m + n, K, ord) );
+	OK_CHECK_ERR( err, vector_calloc(b->swap, m + n) );
+
+	ok_alloc(b->z, K * sizeof(*b->z));
+	for (j = 0; j < K && !err; ++j) {
+		ok_alloc(b->z[j], sizeof(*b->z[j]));
+		z = b->z[j];
+		z->m = m;
+		z->n = n;
+		OK_CHECK_ERR( err,
+			block_vector_view_column(&z->primal, b->primal, j, m, n) );
+		OK_CHECK_ERR( err, block_vector_view_column(&z->primal12,
+			b->primal12, j, m, n) );
+		OK_CHECK_ERR( err,
+			block_vector_view_column(&z->dual, b->dual, j, m, n) );
+		OK_CHECK_ERR( err,
+			block_vector_view_column(&z->dual12, b->dual12, j, m, n) );
+		OK_CHECK_ERR( err,
+			block_vector_view_column(&z->prev, b->prev, j, m, n) );
+		OK_CHECK_ERR( err,
+			block_vector_view_column(&z->temp, b->temp, j, m, n) );
+	}
+
+	ok_alloc(b->f, K * sizeof(*b->f));
+	ok_alloc(b->g, K * sizeof(*b->g));
+	for (j = 0; j < K && !err; ++j) {
+		OK_CHECK_ERR( err, function_vector_calloc(b->f + j, m) );
+		OK_CHECK_ERR( err, function_vector_calloc(b->g + j, n) );
+	}
+
+	ok_alloc(b->rho, K * sizeof(*b->rho));
+	ok_alloc(b->rho_params, K * sizeof(*b->rho_params));
+	ok_alloc(b->obj, K * sizeof(*b->obj));
+	ok_alloc(b->res, K * sizeof(*b->res));
+	ok_alloc(b->eps, K * sizeof(*b->eps));
+	ok_alloc(b->index, K * sizeof(*b->index));
+	for (j = 0; j < K; ++j)
+		b->index[j] = j;
+
+	if (err)
+		OK_MAX_ERR( err, pogs_batch_free(b) );
+	else
+		*batch = b;
+	return err;
+}
+
+POGS_PRIVATE ok_status pogs_batch_free(pogs_batch * batch)
+{
+	OK_CHECK_PTR(batch);
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_variables * z = OK_NULL;
+	size_t j;
+
+	for (j = 0; batch->z && j < batch->K; ++j) {
+		z = batch->z[j];
+		if (!z)
+			continue;
+		if (z->primal)
+			OK_MAX_ERR( err, block_vector_view_free(z->primal) );
+		if (z->primal12)
+			OK_MAX_ERR( err, block_vector_view_free(z->primal12) );
+		if (z->dual)
+			OK_MAX_ERR( err, block_vector_view_free(z->dual) );
+		if (z->dual12)
+			OK_MAX_ERR( err, block_vector_view_free(z->dual12) );
+		if (z->prev)
+			OK_MAX_ERR( err, block_vector_view_free(z->prev) );
+		if (z->temp)
+			OK_MAX_ERR( err, block_vector_view_free(z->temp) );
+		ok_free(batch->z[j]);
+	}
+	ok_free(batch->z);
+
+	for (j = 0; batch->f && j < batch->K; ++j)
+		if (batch->f[j].objectives)
+			OK_MAX_ERR( err, function_vector_free(batch->f + j) );
+	for (j = 0; batch->g && j < batch->K; ++j)
+		if (batch->g[j].objectives)
+			OK_MAX_ERR( err, function_vector_free(batch->g + j) );
+	ok_free(batch->f);
+	ok_free(batch->g);
+
+	if (batch->primal && batch->primal->data)
+		OK_MAX_ERR( err, matrix_free(batch->primal) );
+	if (batch->primal12 && batch->primal12->data)
+		OK_MAX_ERR( err, matrix_free(batch->primal12) );
+	if (batch->dual && batch->dual->data)
+		OK_MAX_ERR( err, matrix_free(batch->dual) );
+	if (batch->dual12 && batch->dual12->data)
+		OK_MAX_ERR( err, matrix_free(batch->dual12) );
+	if (batch->prev && batch->prev->data)
+		OK_MAX_ERR( err, matrix_free(batch->prev) );
+	if (batch->temp && batch->temp->data)
+		OK_MAX_ERR( err, matrix_free(batch->temp) );
+	if (batch->swap && batch->swap->data)
+		OK_MAX_ERR( err, vector_free(batch->swap) );
+	ok_free(batch->primal);
+	ok_free(batch->primal12);
+	ok_free(batch->dual);
+	ok_free(batch->dual12);
+	ok_free(batch->prev);
+	ok_free(batch->temp);
+	ok_free(batch->swap);
+
+	ok_free(batch->rho);
+	ok_free(batch->rho_params);
+	ok_free(batch->obj);
+	ok_free(batch->res);
+	ok_free(batch->eps);
+	ok_free(batch->index);
+	ok_free(batch);
+	return err;
+}
+
+/* exchange the iterates (and problem assignments) of batch slots i and j */
+POGS_PRIVATE ok_status pogs_batch_swap(pogs_batch * batch, size_t i, size_t j)
+{
+	OK_CHECK_PTR(batch);
+	if (i >= batch->K || j >= batch->K)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OUT_OF_BOUNDS );
+	if (i == j)
+		return OPTKIT_SUCCESS;
+
+	ok_status err = OPTKIT_SUCCESS;
+	matrix * iterates[6] = {batch->primal, batch->primal12, batch->dual,
+		batch->dual12, batch->prev, batch->temp};
+	vector col_i, col_j;
+	size_t l, idx;
+
+	for (l = 0; l < 6 && !err; ++l) {
+		OK_CHECK_ERR( err, matrix_column(&col_i, iterates[l], i) );
+		OK_CHECK_ERR( err, matrix_column(&col_j, iterates[l], j) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->swap, &col_i) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(&col_i, &col_j) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(&col_j, batch->swap) );
+	}
+
+	idx = batch->index[i];
+	batch->index[i] = batch->index[j];
+	batch->index[j] = idx;
+	return err;
+}
+
+/*
+ * batched version of project_primal() over the first K slots of the batch:
+ * the projection inputs are formed column-wise, then projected with
+ * matrix-matrix products and triangular solves against the cached factor
+ */
+POGS_PRIVATE ok_status project_primal_batch(void * linalg_handle,
+	projector_ * proj, pogs_batch * batch, size_t K, ok_float alpha)
+{
+	if (!proj || !batch)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (K > batch->K)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_variables * z = OK_NULL;
+	size_t j;
+
+	for (j = 0; j < K && !err; ++j) {
+		z = batch->z[j];
+		OK_CHECK_ERR( err, vector_axpbypcz(z->temp->vec, alpha,
+			z->primal12->vec, kOne - alpha, z->prev->vec, kOne,
+			z->dual->vec) );
+	}
+
+	#ifndef OPTKIT_INDIRECT
+	size_t m = batch->m, n = batch->n;
+	matrix X_in, Y_in, X_out, Y_out;
+	OK_CHECK_ERR( err, matrix_submatrix(&Y_in, batch->temp, 0, 0, m, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&X_in, batch->temp, m, 0, n, K) );
+	OK_CHECK_ERR( err,
+		matrix_submatrix(&Y_out, batch->primal, 0, 0, m, K) );
+	OK_CHECK_ERR( err,
+		matrix_submatrix(&X_out, batch->primal, m, 0, n, K) );
+	OK_CHECK_ERR( err, direct_projector_project_batch(linalg_handle, proj,
+		&X_in, &Y_in, &X_out, &Y_out) );
+	#else
+	for (j = 0; j < K && !err; ++j) {
+		z = batch->z[j];
+		OK_CHECK_ERR( err, PROJECTOR(project)(linalg_handle, proj,
+			z->temp->x, z->temp->y, z->primal->x, z->primal->y) );
+	}
+	#endif
+	return err;
+}
+
+/*
+ * batched version of update_residuals() over the first K slots: the primal
+ * and dual residuals
+ *
+ *	||AX^(k+1/2) - Y^(k+1/2)||, ||A'Yt^(k+1/2) + Xt^(k+1/2)||
+ *
+ * are formed with one GEMM each, then reduced column-wise.
+ */
+POGS_PRIVATE ok_status update_residuals_batch(void * linalg_handle,
+	pogs_solver * solver, pogs_batch * batch, size_t K)
+{
+	if (!solver || !batch)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (K > batch->K)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	ok_status err = OPTKIT_SUCCESS;
+	matrix * A = solver->M->A;
+	matrix X12, Y12, Xt12, Yt12, Tx, Ty;
+	pogs_residuals * res = OK_NULL;
+	size_t j, m = batch->m, n = batch->n;
+
+	OK_CHECK_ERR( err, matrix_submatrix(&Y12, batch->primal12, 0, 0, m, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&X12, batch->primal12, m, 0, n, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&Yt12, batch->dual12, 0, 0, m, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&Xt12, batch->dual12, m, 0, n, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&Ty, batch->temp, 0, 0, m, K) );
+	OK_CHECK_ERR( err, matrix_submatrix(&Tx, batch->temp, m, 0, n, K) );
+
+	OK_CHECK_ERR( err, matrix_memcpy_mm(&Ty, &Y12) );
+	OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasNoTrans, CblasNoTrans,
+		kOne, A, &X12, -kOne, &Ty) );
+	OK_CHECK_ERR( err, matrix_memcpy_mm(&Tx, &Xt12) );
+	OK_CHECK_ERR( err, blas_gemm(linalg_handle, CblasTrans, CblasNoTrans,
+		kOne, A, &Yt12, kOne, &Tx) );
+
+	for (j = 0; j < K && !err; ++j) {
+		res = batch->res + batch->index[j];
+		OK_CHECK_ERR( err, blas_nrm2(linalg_handle,
+			batch->z[j]->temp->y, &res->primal) );
+		OK_CHECK_ERR( err, blas_nrm2(linalg_handle,
+			batch->z[j]->temp->x, &res->dual) );
+	}
+	return err;
+}
+
+/*
+ * run the POGS iteration on every problem in the batch in lock step;
+ * problems that converge (or reach maxiter) are copied out and swapped to the
+ * back of the batch, so the level-3 calls only touch the active slots
+ */
+POGS_PRIVATE ok_status pogs_batch_loop(pogs_solver * solver,
+	pogs_batch * batch, pogs_info * info, pogs_output * output)
+{
+	if (!solver || !batch || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	int converged = 0;
+	uint k = 0;
+	size_t j, p, n_active = batch->K;
+	pogs_settings * settings = solver->settings;
+	pogs_variables * z = OK_NULL;
+	ok_status err = OPTKIT_SUCCESS;
+	void * linalg_handle = solver->linalg_handle;
+	OK_TIMER t = tic();
+
+	if (settings->verbose > 0)
+		print_header_string();
+
+	for (k = 1; !err && n_active > 0 && k <= settings->maxiter; ++k) {
+		for (j = 0; j < n_active && !err; ++j) {
+			p = batch->index[j];
+			OK_CHECK_ERR( err,
+				set_prev(batch->z[j]) );
+			OK_CHECK_ERR( err,
+				prox(linalg_handle, batch->f + p, batch->g + p,
+					batch->z[j], batch->rho[p]) );
+		}
+		OK_CHECK_ERR( err,
+			project_primal_batch(linalg_handle, solver->M->P, batch,
+				n_active, settings->alpha) );
+		for (j = 0; j < n_active && !err; ++j)
+			OK_CHECK_ERR( err,
+				update_dual(linalg_handle, batch->z[j],
+					settings->alpha) );
+
+		/* full checks every settings->check_interval iterations */
+		if (settings->check_interval > 1 &&
+			k % settings->check_interval != 0 && k < settings->maxiter)
+			continue;
+
+		OK_CHECK_ERR( err,
+			update_residuals_batch(linalg_handle, solver, batch,
+				n_active) );
+
+		/* visit slots back to front, so retired problems swap out */
+		for (j = n_active; j > 0 && !err; --j) {
+			z = batch->z[j - 1];
+			p = batch->index[j - 1];
+			OK_CHECK_ERR( err, update_objective(linalg_handle,
+				batch->f + p, batch->g + p, batch->rho[p], z,
+				batch->obj + p) );
+			OK_CHECK_ERR( err, update_tolerances(linalg_handle, z,
+				batch->obj + p, batch->eps + p) );
+			batch->res[p].gap = batch->obj[p].gap;
+
+			converged = !err &&
+				batch->res[p].primal < batch->eps[p].primal &&
+				batch->res[p].dual < batch->eps[p].dual &&
+				(batch->res[p].gap < batch->eps[p].gap ||
+				!(settings->gapstop));
+
+			if (converged || k == settings->maxiter) {
+				if (settings->verbose) {
+					printf("   problem %u\n", (uint) p);
+					print_iter_string(batch->res + p,
+						batch->eps + p, batch->obj + p, k);
+				}
+				info[p].rho = batch->rho[p];
+				info[p].obj = batch->obj[p].primal;
+				info[p].converged = converged;
+				info[p].status = converged ? OkPogsConverged :
+					OkPogsMaxIter;
+				info[p].err = err;
+				info[p].k = k;
+				info[p].k_accel = 0;
+				info[p].refinement_residual = kZero;
+				info[p].cg_iters = 0;
+				info[p].solve_time = toc(t);
+				OK_CHECK_ERR( err, copy_output(output + p, z,
+					solver->M->d, solver->M->e,
+					batch->rho[p], settings->suppress) );
+				OK_CHECK_ERR( err,
+					pogs_batch_swap(batch, j - 1, n_active - 1) );
+				--n_active;
+			} else if (settings->adaptiverho) {
+				OK_CHECK_ERR( err, adaptrho(z, settings,
+					batch->rho + p, batch->rho_params + p,
+					batch->res + p, batch->eps + p, k) );
+			}
+		}
+	}
+
+	/* problems still in the batch stopped on error (or maxiter == 0) */
+	for (j = 0; j < n_active; ++j) {
+		p = batch->index[j];
+		info[p].rho = batch->rho[p];
+		info[p].obj = batch->obj[p].primal;
+		info[p].converged = 0;
+		info[p].status = OkPogsUnsolved;
+		info[p].err = err;
+		info[p].k = k - 1;
+		info[p].k_accel = 0;
+		info[p].refinement_residual = kZero;
+		info[p].cg_iters = 0;
+		info[p].solve_time = toc(t);
+	}
+	return err;
+}
+
+/*
+ * as pogs_init, equilibrating A with the given method, iteration cap and
+ * tolerance (NULL: defaults, regularized Sinkhorn-Knopp)
+ */
+pogs_solver * pogs_init_equil(ok_float * A, size_t m, size_t n,
+	enum CBLAS_ORDER ord, const equilibration_settings * equil)
 {
 	ok_status err = OPTKIT_SUCCESS;
 	pogs_solver * solver = OK_NULL;
 	pogs_matrix * M = OK_NULL;
+	pogs_cache_key key;
+	pogs_cache_entry * cached = OK_NULL;
 	OK_TIMER t = tic();
 
 	/* make variables, matrix */
 	err = pogs_solver_alloc(&solver, m , n, ord);
 
-	/* equilibrate A as (D * A_equil * E) = A */
+	/* reuse equilibration & factorization of a previously seen A */
 	OK_CHECK_ERR( err,
-		equilibrate(solver->linalg_handle, A, solver->M, ord) );
+		pogs_matrix_cache_key(&key, A, m, n, ord, equil) );
+	if (!err)
+		cached = pogs_cache_lookup(&key);
 
-	/* make projector; normalize A; adjust d, e accordingly */
-	if (!err) {
-		M = solver->M;
+	if (cached) {
 		OK_CHECK_ERR( err,
-			PROJECTOR(initialize)(solver->linalg_handle, M->P, 1) );
+			pogs_matrix_load_cached(solver->M, cached) );
+		OK_MAX_ERR( err, pogs_cache_release(cached) );
+	} else {
+		/* equilibrate A as (D * A_equil * E) = A */
+		OK_CHECK_ERR( err,
+			equilibrate(solver->linalg_handle, A, solver->M, ord,
+				equil) );
+
+		/* make projector; normalize A; adjust d, e accordingly */
+		if (!err) {
+			M = solver->M;
+			OK_CHECK_ERR( err,
+				PROJECTOR(initialize)(solver->linalg_handle,
+					M->P, 1) );
+			OK_CHECK_ERR( err,
+				normalize_DAE(solver->linalg_handle, M) );
+		}
+
 		OK_CHECK_ERR( err,
-			normalize_DAE(solver->linalg_handle, M) );
+			pogs_matrix_cache(solver->M, &key) );
 	}
 
 	solver->init_time = toc(t);
@@ -347,25 +1156,32 @@ pogs_solver * pogs_init(ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord)
 	return solver;
 }
 
+pogs_solver * pogs_init(ok_float * A, size_t m, size_t n, enum CBLAS_ORDER ord)
+{
+	return pogs_init_equil(A, m, n, ord, OK_NULL);
+}
+
 ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	function_vector * g, const pogs_settings * settings, pogs_info * info,
 	pogs_output * output)
 {
 	if (!solver || !settings || !info || !output)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
-	OK_CHECK_FNVECTOR(f);
-	OK_CHECK_FNVECTOR(g);
 
 	ok_status err = OPTKIT_SUCCESS;
 	OK_TIMER t = tic();
 
+	/* pogs_cancel() applies to the solve in progress only */
+	solver->cancel = 0;
+
 	/* copy settings */
 	OK_CHECK_ERR( err,
 		update_settings(solver->settings, settings) );
 
-	/* copy and scale function vectors */
-	OK_CHECK_ERR( err,
-		update_problem(solver, f, g) );
+	/* copy and scale function vectors (f = g = NULL: keep the solver's) */
+	if (f || g)
+		OK_CHECK_ERR( err,
+			update_problem(solver, f, g) );
 
 	/* get warm start variables */
 	if (!err && settings->warmstart)
@@ -391,6 +1207,412 @@ ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	return err;
 }
 
+/*
+ * replace entries f_indices[0:f_count] of the solver's objective f by
+ * f_values (and likewise for g), rescaled by the equilibration d (e);
+ * pogs_solve with f = g = NULL then solves the updated problem. the
+ * setup is O(f_count + g_count), instead of O(m + n) for the full copy
+ * and rescaling of f, g by pogs_solve
+ */
+ok_status pogs_update_objectives(pogs_solver * solver,
+	const size_t * f_indices, const function_t * f_values, size_t f_count,
+	const size_t * g_indices, const function_t * g_values, size_t g_count)
+{
+	OK_CHECK_PTR(solver);
+	size_t k;
+
+	/* entry by entry, so a repeated index is scaled once */
+	for (k = 0; k < f_count; ++k) {
+		OK_RETURNIF_ERR( function_vector_scatter_va(solver->f,
+			f_values + k, f_indices + k, 1) );
+		OK_RETURNIF_ERR( function_vector_div_indexed(solver->f,
+			solver->M->d, f_indices + k, 1) );
+	}
+	for (k = 0; k < g_count; ++k) {
+		OK_RETURNIF_ERR( function_vector_scatter_va(solver->g,
+			g_values + k, g_indices + k, 1) );
+		OK_RETURNIF_ERR( function_vector_mul_indexed(solver->g,
+			solver->M->e, g_indices + k, 1) );
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * append k rows R (k x n, layout ord, in the units of the A given to
+ * pogs_init) to the solver's matrix, without re-equilibrating: each new
+ * row is scaled by the column scaling e and by a row scaling d_i chosen, as
+ * in a Sinkhorn-Knopp row step, to give it the average row 1-norm of the
+ * equilibrated A. while A is skinny (m >= n), the factor of I + AᵀA is
+ * updated by k rank-one updates, in O(kn²); otherwise it is re-formed
+ * from the equilibrated A.
+ *
+ * the iterate is kept, with y = 0 for the new rows, whose objectives are
+ * FnZero until set by pogs_update_objectives or pogs_solve.
+ */
+ok_status pogs_solver_append_rows(pogs_solver * solver, const ok_float * R,
+	size_t k, enum CBLAS_ORDER ord)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(R);
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_matrix * M = solver->M;
+	size_t m = M->A->size1, n = M->A->size2, i;
+	ok_float norm_row = kZero, norm_mean = kZero, scaling;
+	matrix R_equil;
+	vector row, d_i, x;
+
+	if (M->borrowed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	if (k == 0)
+		return OPTKIT_SUCCESS;
+
+	R_equil.data = OK_NULL;
+	row.data = OK_NULL;
+	d_i.data = OK_NULL;
+	x.data = OK_NULL;
+
+	/* average row 1-norm of the equilibrated A */
+	for (i = 0; i < m && !err; ++i) {
+		OK_CHECK_ERR( err, matrix_row(&row, M->A, i) );
+		OK_CHECK_ERR( err, blas_asum(solver->linalg_handle, &row,
+			&norm_row) );
+		norm_mean += norm_row;
+	}
+	norm_mean /= (ok_float) m;
+
+	OK_CHECK_ERR( err, pogs_solver_resize_rows(solver, OK_NULL, 0, k) );
+	OK_CHECK_ERR( err, matrix_submatrix(&R_equil, M->A, m, 0, k, n) );
+	OK_CHECK_ERR( err, matrix_memcpy_ma(&R_equil, R, ord) );
+	for (i = 0; i < k && !err; ++i) {
+		OK_CHECK_ERR( err, matrix_row(&row, &R_equil, i) );
+		OK_CHECK_ERR( err, vector_mul(&row, M->e) );
+		OK_CHECK_ERR( err, blas_asum(solver->linalg_handle, &row,
+			&norm_row) );
+		scaling = (norm_row > 0) ? norm_mean / norm_row : kOne;
+		OK_CHECK_ERR( err, vector_scale(&row, scaling) );
+		OK_CHECK_ERR( err, vector_subvector(&d_i, M->d, m + i, 1) );
+		OK_CHECK_ERR( err, vector_set_all(&d_i, scaling) );
+	}
+	if (err)
+		return err;
+
+	#ifndef OPTKIT_INDIRECT
+	if (m >= n) {
+		OK_CHECK_ERR( err, vector_calloc(&x, n) );
+		for (i = 0; i < k && !err; ++i) {
+			OK_CHECK_ERR( err, matrix_row(&row, &R_equil, i) );
+			OK_CHECK_ERR( err, vector_memcpy_vv(&x, &row) );
+			OK_CHECK_ERR( err, linalg_cholesky_update(
+				solver->linalg_handle, M->P->L, &x, 0) );
+		}
+		OK_MAX_ERR( err, vector_free(&x) );
+		return err;
+	}
+	#endif
+	return OK_SCAN_ERR( pogs_matrix_refactor(solver->linalg_handle, M) );
+}
+
+static int __compare_size_t(const void * a, const void * b)
+{
+	size_t i = *(const size_t *) a, j = *(const size_t *) b;
+	return (i > j) - (i < j);
+}
+
+/*
+ * remove the rows listed in indices (count k, in any order; repeats are
+ * ignored) from the solver's matrix, keeping the equilibration of the
+ * remaining rows. while A stays skinny (m >= n), the factor of I + AᵀA is
+ * downdated by the removed rows, in O(kn²); otherwise, or if a downdate
+ * fails numerically, it is re-formed from the equilibrated A.
+ *
+ * the iterate and objectives of the remaining rows are kept.
+ */
+ok_status pogs_solver_remove_rows(pogs_solver * solver,
+	const size_t * indices, size_t k)
+{
+	OK_CHECK_PTR(solver);
+	if (k == 0)
+		return OPTKIT_SUCCESS;
+	OK_CHECK_PTR(indices);
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_matrix * M = solver->M;
+	size_t m = M->A->size1, n = M->A->size2, i, count = 0;
+	size_t * removed = OK_NULL;
+	int refactor = 1;
+	vector row, x;
+
+	if (M->borrowed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	for (i = 0; i < k; ++i)
+		if (indices[i] >= m)
+			return OK_SCAN_ERR( OPTKIT_ERROR_OUT_OF_BOUNDS );
+
+	row.data = OK_NULL;
+	x.data = OK_NULL;
+
+	ok_alloc(removed, k * sizeof(*removed));
+	memcpy(removed, indices, k * sizeof(*removed));
+	qsort(removed, k, sizeof(*removed), __compare_size_t);
+	for (i = 0; i < k; ++i)
+		if (count == 0 || removed[i] != removed[count - 1])
+			removed[count++] = removed[i];
+
+	if (count == m)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	#ifndef OPTKIT_INDIRECT
+	if (!err && m - count >= n) {
+		refactor = 0;
+		OK_CHECK_ERR( err, vector_calloc(&x, n) );
+		for (i = 0; i < count && !err && !refactor; ++i) {
+			OK_CHECK_ERR( err, matrix_row(&row, M->A, removed[i]) );
+			OK_CHECK_ERR( err, vector_memcpy_vv(&x, &row) );
+			/* loss of definiteness to roundoff: re-form the factor */
+			if (!err)
+				refactor = linalg_cholesky_update(solver->linalg_handle,
+					M->P->L, &x, 1) == OPTKIT_ERROR_DOMAIN;
+		}
+		OK_MAX_ERR( err, vector_free(&x) );
+	}
+	#endif
+
+	OK_CHECK_ERR( err, pogs_solver_resize_rows(solver, removed, count, 0) );
+	if (refactor)
+		OK_CHECK_ERR( err, pogs_matrix_refactor(solver->linalg_handle,
+			M) );
+	ok_free(removed);
+	return err;
+}
+
+/*
+ * solve K problems
+ *
+ *	min. f_k(y) + g_k(x) s.t. y = Ax, k = 1, ..., K,
+ *
+ * that share the solver's (equilibrated, factorized) matrix A. arrays f, g,
+ * info and output are of length K; every problem starts from the solver's
+ * current iterate and the settings are shared across the batch.
+ * (Anderson acceleration, settings->accelerate, is not applied to batches.)
+ */
+ok_status pogs_solve_batch(pogs_solver * solver, size_t K,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output)
+{
+	if (!solver || !f || !g || !settings || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_batch * batch = OK_NULL;
+	pogs_variables * z = solver->z;
+	ok_float setup_time;
+	size_t p, m = z->m, n = z->n;
+	OK_TIMER t = tic();
+
+	for (p = 0; p < K; ++p) {
+		OK_CHECK_FNVECTOR((f + p));
+		OK_CHECK_FNVECTOR((g + p));
+		if (f[p].size != m || g[p].size != n)
+			return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	}
+
+	/* copy settings */
+	OK_CHECK_ERR( err,
+		update_settings(solver->settings, settings) );
+
+	/* get warm start variables */
+	if (!err && settings->warmstart)
+		OK_SCAN_ERR( initialize_variables(solver) );
+
+	OK_CHECK_ERR( err,
+		pogs_batch_alloc(&batch, K, m, n, solver->M->A->order) );
+
+	/* copy and scale function vectors, start from the solver's iterate */
+	for (p = 0; p < K && !err; ++p) {
+		OK_CHECK_ERR( err, function_vector_memcpy_va(batch->f + p,
+			f[p].objectives) );
+		OK_CHECK_ERR( err, function_vector_memcpy_va(batch->g + p,
+			g[p].objectives) );
+		OK_CHECK_ERR( err,
+			function_vector_div(batch->f + p, solver->M->d) );
+		OK_CHECK_ERR( err,
+			function_vector_mul(batch->g + p, solver->M->e) );
+
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->z[p]->primal->vec,
+			z->primal->vec) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->z[p]->primal12->vec,
+			z->primal12->vec) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->z[p]->dual->vec,
+			z->dual->vec) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->z[p]->dual12->vec,
+			z->dual12->vec) );
+		OK_CHECK_ERR( err, vector_memcpy_vv(batch->z[p]->prev->vec,
+			z->prev->vec) );
+
+		batch->rho[p] = settings->resume ? solver->rho : settings->rho;
+		batch->rho_params[p] =
+			(adapt_params){kDELTAMIN, kZero, kZero, kOne};
+		OK_CHECK_ERR( err, initialize_conditions(batch->obj + p,
+			batch->res + p, batch->eps + p, settings, m, n) );
+	}
+
+	setup_time = toc(t);
+	if (!(settings->warmstart || settings->resume))
+		setup_time += solver->init_time;
+	for (p = 0; p < K; ++p) {
+		info[p].setup_time = setup_time;
+		info[p].equil_time = solver->M->equil_time;
+		info[p].equil_row_spread = solver->M->equil.row_spread;
+		info[p].equil_col_spread = solver->M->equil.col_spread;
+	}
+
+	/* run solver */
+	OK_CHECK_ERR( err,
+		pogs_batch_loop(solver, batch, info, output) );
+
+	if (batch)
+		OK_MAX_ERR( err, pogs_batch_free(batch) );
+	return err;
+}
+
+/*
+ * regularization path: solve the K problems in which the weight c of
+ * every FnAbs term of f and g is scaled by lambda[k], k = 0, ..., K - 1.
+ * the first point starts as specified by settings; each later point is
+ * warm started from the iterate and rho of the previous point (resume).
+ * info and output are arrays of length K. a point interrupted by the time
+ * limit or by pogs_cancel() ends the path: later points are not solved
+ * (status OkPogsUnsolved). an error also ends the path, and the point
+ * that failed is marked unsolved along with the later ones.
+ */
+ok_status pogs_solve_path(pogs_solver * solver, function_vector * f,
+	function_vector * g, const pogs_settings * settings, size_t K,
+	const ok_float * lambda, pogs_info * info, pogs_output * output)
+{
+	if (!solver || !settings || !lambda || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_CHECK_FNVECTOR(f);
+	OK_CHECK_FNVECTOR(g);
+
+	ok_status err = OPTKIT_SUCCESS;
+	function_vector f_path = (function_vector){f->size, OK_NULL};
+	function_vector g_path = (function_vector){g->size, OK_NULL};
+	pogs_settings path_settings = *settings;
+	size_t k, unsolved = K;
+
+	ok_alloc(f_path.objectives, f->size * sizeof(*f_path.objectives));
+	ok_alloc(g_path.objectives, g->size * sizeof(*g_path.objectives));
+
+	for (k = 0; k < K; ++k) {
+		OK_CHECK_ERR( err,
+			scale_path_objectives(&f_path, f, lambda[k]) );
+		OK_CHECK_ERR( err,
+			scale_path_objectives(&g_path, g, lambda[k]) );
+		OK_CHECK_ERR( err, pogs_solve(solver, &f_path, &g_path,
+			&path_settings, info + k, output + k) );
+		if (err) {
+			unsolved = k;
+			break;
+		}
+
+		path_settings.warmstart = 0;
+		path_settings.resume = 1;
+		if (info[k].status == OkPogsTimeLimit ||
+			info[k].status == OkPogsCancelled) {
+			unsolved = k + 1;
+			break;
+		}
+	}
+	for (k = unsolved; k < K; ++k)
+		info[k].status = OkPogsUnsolved;
+
+	ok_free(f_path.objectives);
+	ok_free(g_path.objectives);
+	return err;
+}
+
+typedef struct pogs_solve_many_args {
+	pogs_solver ** solvers;
+	function_vector * f, * g;
+	const pogs_settings * settings;
+	pogs_info * info;
+	pogs_output * output;
+} pogs_solve_many_args;
+
+static ok_status pogs_solve_many_task(void * data, size_t i)
+{
+	pogs_solve_many_args * args = (pogs_solve_many_args *) data;
+	return pogs_solve(args->solvers[i], args->f + i, args->g + i,
+		args->settings, args->info + i, args->output + i);
+}
+
+/*
+ * solve N independent problems (solvers[i], f[i], g[i]) concurrently on a
+ * pool of n_threads threads (n_threads = 0: one per online processor),
+ * with shared settings; info and output are arrays of length N. the
+ * solvers must be distinct: a solver is not safe for concurrent use, but
+ * distinct solvers share no mutable state.
+ */
+ok_status pogs_solve_many_threads(size_t N, pogs_solver ** solvers,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output, size_t n_threads)
+{
+	if (!solvers || !f || !g || !settings || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	pogs_solve_many_args args = {solvers, f, g, settings, info, output};
+	return pogs_parallel_for(N, n_threads, pogs_solve_many_task, &args);
+}
+
+/*
+ * record telemetry (pogs_telemetry_record) for the last capacity
+ * iterations of each subsequent solve; re-enabling resizes the buffer
+ */
+ok_status pogs_telemetry_enable(pogs_solver * solver, size_t capacity)
+{
+	OK_CHECK_PTR(solver);
+	OK_RETURNIF_ERR( pogs_telemetry_disable(solver) );
+	return OK_SCAN_ERR( pogs_telemetry_alloc(&solver->telemetry, capacity) );
+}
+
+ok_status pogs_telemetry_disable(pogs_solver * solver)
+{
+	OK_CHECK_PTR(solver);
+	ok_status err = OPTKIT_SUCCESS;
+	if (solver->telemetry) {
+		err = OK_SCAN_ERR( pogs_telemetry_free(solver->telemetry) );
+		solver->telemetry = OK_NULL;
+	}
+	return err;
+}
+
+/*
+ * copy the telemetry of the most recent solve, oldest iteration first, to
+ * records (room for *count records); set *count to the number copied
+ */
+ok_status pogs_telemetry_read(const pogs_solver * solver,
+	pogs_telemetry_record * records, size_t * count)
+{
+	OK_CHECK_PTR(solver);
+	if (!solver->telemetry)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	return OK_SCAN_ERR( pogs_telemetry_copy(solver->telemetry, records,
+		count) );
+}
+
+/*
+ * request that the solve in progress on solver stop (may be called from
+ * another thread): the solver loop returns at the end of the current
+ * iteration, with the iterate reached so far and status OkPogsCancelled
+ */
+ok_status pogs_cancel(pogs_solver * solver)
+{
+	OK_CHECK_PTR(solver);
+	solver->cancel = 1;
+	return OPTKIT_SUCCESS;
+}
+
 ok_status pogs_finish(pogs_solver * solver, int reset)
 {
 	ok_status err = OK_SCAN_ERR( pogs_solver_free(solver) );
@@ -409,6 +1631,22 @@ ok_status pogs(ok_float * A, function_vector * f, function_vector * g,
 	return pogs_finish(solver, reset);
 }
 
+static ok_status pogs_load_state(pogs_solver * solver, ok_float * d,
+	ok_float * e, ok_float * z, ok_float * z12, ok_float * z_dual,
+	ok_float * z_dual12, ok_float * z_prev, ok_float rho)
+{
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->M->d, d, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->M->e, e, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->z->primal->vec, z, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->z->primal12->vec, z12, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->z->dual->vec, z_dual, 1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->z->dual12->vec, z_dual12,
+		1) );
+	OK_RETURNIF_ERR( vector_memcpy_va(solver->z->prev->vec, z_prev, 1) );
+	solver->rho = rho;
+	return OPTKIT_SUCCESS;
+}
+
 pogs_solver * pogs_load_solver(ok_float * A_equil, ok_float * LLT_factorization,
 	ok_float * d, ok_float * e, ok_float * z, ok_float * z12,
 	ok_float * z_dual, ok_float * z_dual12, ok_float * z_prev, ok_float rho,
@@ -426,24 +1664,44 @@ pogs_solver * pogs_load_solver(ok_float * A_equil, ok_float * LLT_factorization,
 		matrix_memcpy_ma(solver->M->P->L, LLT_factorization, ord) );
 	#endif
 
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->M->d, d, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->M->e, e, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->z->primal->vec, z, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->z->primal12->vec, z12, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->z->dual->vec, z_dual, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->z->dual12->vec, z_dual12, 1) );
-	OK_CHECK_ERR( err,
-		vector_memcpy_va(solver->z->prev->vec, z_prev, 1) );
+	OK_CHECK_ERR( err, pogs_load_state(solver, d, e, z, z12, z_dual,
+		z_dual12, z_prev, rho) );
 
-	solver->rho = rho;
-	if (err)
+	if (err && solver) {
 		pogs_solver_free(solver);
+		solver = OK_NULL;
+	}
+
+	return solver;
+}
+
+/*
+ * as pogs_load_solver, but the solver views A_equil and LLT_factorization
+ * in place rather than copying them (e.g., from a memory-mapped snapshot);
+ * both arrays must outlive the solver and are not modified by
+ * pogs_solve. host memory only: GPU builds should use pogs_load_solver.
+ */
+pogs_solver * pogs_load_solver_view(ok_float * A_equil,
+	ok_float * LLT_factorization, ok_float * d, ok_float * e, ok_float * z,
+	ok_float * z12, ok_float * z_dual, ok_float * z_dual12,
+	ok_float * z_prev, ok_float rho, size_t m, size_t n,
+	enum CBLAS_ORDER ord)
+{
+	ok_status err;
+	pogs_solver * solver = OK_NULL;
+
+	if (!A_equil)
+		return OK_NULL;
+
+	err = pogs_solver_view_alloc(&solver, A_equil, LLT_factorization, m, n,
+		ord);
+	OK_CHECK_ERR( err, pogs_load_state(solver, d, e, z, z12, z_dual,
+		z_dual12, z_prev, rho) );
+
+	if (err && solver) {
+		pogs_solver_free(solver);
+		solver = OK_NULL;
+	}
 
 	return solver;
 }
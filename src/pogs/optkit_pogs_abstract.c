@@ -5,6 +5,9 @@ extern "C" {
 #endif
 
 const ok_float kProjectorTolInitial = (ok_float) 1e-6;
+const ok_float kProjectorTolIndirect = (ok_float) 1e-5;
+const ok_float kProjectorTolFactor = (ok_float) 3e-4;
+const ok_float kProjectorTolMin = (ok_float) 1e-8;
 
 POGS_PRIVATE ok_status pogs_work_alloc(pogs_work ** W, operator * A, int direct)
 {
@@ -20,11 +23,36 @@ POGS_PRIVATE ok_status pogs_work_alloc(pogs_work ** W, operator * A, int direct)
 	pogs_work * W_ = OK_NULL;
 	ok_alloc(W_, sizeof(*W_));
 	W_->A = A;
+	OK_CHECK_ERR( err, equilibration_randomized_settings(&W_->equil) );
+
+	/* scale other operators through a wrapper, leaving A as given */
+	if (!dense_or_sparse && A->kind != OkOperatorPanel) {
+		W_->A = scaled_operator_alloc(A);
+		W_->wrapped = 1;
+		if (!W_->A) {
+			ok_free(W_);
+			return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+		}
+	}
 
 	/* set projector */
-	if (direct && A->kind == OkOperatorDense)
+	if (direct == OkPrecondJacobi || direct == OkPrecondBlockJacobi)
+		W_->P = pcg_projector_alloc(W_->A,
+				(OPTKIT_PRECONDITIONER) direct, kPRECONDBLOCK);
+	else if (direct == OkDirectMixed && A->kind == OkOperatorDense)
+		W_->P = dense_direct_projector_alloc_mixed(
+				dense_operator_get_matrix_pointer(W_->A));
+	else if (direct == OkDirectPacked && A->kind == OkOperatorDense)
+		W_->P = dense_direct_projector_alloc_packed(
+				dense_operator_get_matrix_pointer(W_->A));
+	else if (direct && A->kind == OkOperatorDense)
 		W_->P = dense_direct_projector_alloc(
 				dense_operator_get_matrix_pointer(W_->A));
+	else if (direct && A->kind == OkOperatorPanel && A->size1 >= A->size2)
+		W_->P = panel_direct_projector_alloc(W_->A);
+	else if (direct && dense_or_sparse)
+		W_->P = sparse_direct_projector_alloc(
+				sparse_operator_get_matrix_pointer(W_->A));
 	else
 		W_->P = indirect_projector_generic_alloc(W_->A);
 
@@ -32,9 +60,12 @@ POGS_PRIVATE ok_status pogs_work_alloc(pogs_work ** W, operator * A, int direct)
 		err = OPTKIT_ERROR_UNALLOCATED;
 
 	/* set equilibration */
-	if  (!dense_or_sparse) {
+	if (A->kind == OkOperatorPanel) {
+		W_->operator_equilibrate = panel_operator_equilibrate;
+		W_->operator_scale = panel_operator_scale;
+	} else if  (!dense_or_sparse) {
 		W_->operator_equilibrate = operator_equilibrate;
-		W_->operator_scale = typesafe_operator_scale;
+		W_->operator_scale = scaled_operator_scale;
 	} else {
 		W_->operator_equilibrate = operator_regularized_sinkhorn;
 		if (A->kind == OkOperatorDense)
@@ -62,8 +93,15 @@ POGS_PRIVATE ok_status pogs_work_free(pogs_work * W)
 	if (!W)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
-	ok_status err = OK_SCAN_ERR( W->P->free(W->P->data) );
-	ok_free(W->P);
+	ok_status err = OPTKIT_SUCCESS;
+	if (W->P) {
+		OK_MAX_ERR( err, W->P->free(W->P->data) );
+		ok_free(W->P);
+	}
+	if (W->wrapped && W->A) {
+		OK_MAX_ERR( err, W->A->free(W->A->data) );
+		ok_free(W->A);
+	}
 	OK_MAX_ERR( err, vector_free(W->d) );
 	OK_MAX_ERR( err, vector_free(W->e) );
 	ok_free(W);
@@ -101,7 +139,9 @@ POGS_PRIVATE ok_status pogs_solver_alloc(pogs_solver ** solver, operator * A,
 POGS_PRIVATE ok_status pogs_solver_free(pogs_solver * solver)
 {
 	OK_CHECK_PTR(solver);
-	ok_status err = blas_destroy_handle(solver->linalg_handle);
+	ok_status err = pogs_checkpoint_disable(solver);
+	OK_MAX_ERR( err, pogs_telemetry_disable(solver) );
+	OK_MAX_ERR( err, blas_destroy_handle(solver->linalg_handle) );
 	OK_MAX_ERR( err, pogs_work_free(solver->W) );
 	OK_MAX_ERR( err, pogs_variables_free(solver->z) );
 	ok_free(solver->settings);
@@ -116,17 +156,52 @@ POGS_PRIVATE ok_status pogs_solver_free(pogs_solver * solver)
 POGS_PRIVATE ok_status equilibrate(void * linalg_handle, pogs_work * W,
 	const ok_float pnorm)
 {
-	ok_status err = W->operator_equilibrate(linalg_handle, W->A, W->d, W->e,
-		pnorm);
+	OK_TIMER t = tic();
+	ok_status err;
+	if (W->wrapped)
+		err = operator_equilibrate_settings(linalg_handle, W->A, W->d,
+			W->e, &W->equil, &W->equil_info);
+	else
+		err = W->operator_equilibrate(linalg_handle, W->A, W->d, W->e,
+			pnorm);
+	W->equil_time = toc(t);
 	W->equilibrated = (err == OPTKIT_SUCCESS);
 	return OK_SCAN_ERR( err );
 }
 
+/*
+ * block Lanczos estimate of ||W->A||, started from the subspace of the
+ * last estimate for the same operator (as given to pogs_init), if any;
+ * the new estimate replaces it
+ */
 POGS_PRIVATE ok_float estimate_norm(void * linalg_handle, pogs_work * W,
 	ok_float * normest)
 {
-	return OK_SCAN_ERR(
-		operator_estimate_norm(linalg_handle, W->A, normest) );
+	OK_CHECK_PTR(W);
+	OK_CHECK_PTR(normest);
+
+	ok_status err = OPTKIT_SUCCESS;
+	operator_norm_estimate est = {kZero, 0, 0, OK_NULL, 0, 0};
+	operator * A = W->wrapped ?
+		((scaled_operator_data *) W->A->data)->A : W->A;
+	ok_float norm_prev = kZero;
+
+	OK_CHECK_ERR( err, pogs_norm_cache_load(A, A->kind, A->size1, A->size2,
+		&est.V, &est.block, &norm_prev) );
+	if (est.V)
+		est.size2 = A->size2;
+	OK_CHECK_ERR( err, operator_estimate_norm_lanczos(linalg_handle, W->A,
+		kNORMESTTOL, kNORMESTMAXITER, &est) );
+	W->norm_products = est.products;
+	if (!err && est.norm == kZero)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_DIVIDE_BY_ZERO );
+	if (!err) {
+		*normest = est.norm;
+		OK_CHECK_ERR( err, pogs_norm_cache_store(A, A->kind, A->size1,
+			A->size2, est.V, est.block, est.norm) );
+	}
+	OK_MAX_ERR( err, operator_norm_estimate_free(&est) );
+	return err;
 }
 
 POGS_PRIVATE ok_status normalize_DAE(void * linalg_handle, pogs_work * W)
@@ -165,6 +240,185 @@ POGS_PRIVATE ok_status normalize_DAE(void * linalg_handle, pogs_work * W)
 	return err;
 }
 
+/*
+ * cache keys are formed from the contents of dense and sparse operators;
+ * for other operator kinds *cacheable is set to 0
+ */
+POGS_PRIVATE ok_status pogs_work_cache_key(pogs_cache_key * key, operator * A,
+	const int direct, const ok_float equil_norm, int * cacheable)
+{
+	OK_CHECK_PTR(key);
+	OK_CHECK_OPERATOR(A);
+	OK_CHECK_PTR(cacheable);
+
+	ok_status err = OPTKIT_SUCCESS;
+	uint64_t hash = pogs_cache_hash(&equil_norm, sizeof(equil_norm), 0);
+	uint64_t check = pogs_cache_hash(&equil_norm, sizeof(equil_norm),
+		kPOGSCACHECHECKSEED);
+	/*
+	 * packed factors get a separate range, leaving existing keys as is;
+	 * PCG projectors (no factor) share the entries of the CGLS projector
+	 */
+	int pcg = direct == OkPrecondJacobi || direct == OkPrecondBlockJacobi;
+	uint variant = 3u * (uint) A->kind + (uint) (direct != 0 && !pcg) +
+		(uint) (direct == OkDirectMixed && A->kind == OkOperatorDense) +
+		((direct == OkDirectPacked && A->kind == OkOperatorDense) ?
+			(1u << 16) : 0u);
+	matrix * A_mat = OK_NULL;
+	sp_matrix * A_sp = OK_NULL;
+	ok_float * val = OK_NULL;
+	ok_int * ind = OK_NULL, * ptr = OK_NULL;
+
+	*cacheable = 0;
+	if (A->kind == OkOperatorDense) {
+		A_mat = dense_operator_get_matrix_pointer(A);
+		OK_CHECK_MATRIX(A_mat);
+		ok_alloc(val, A_mat->size1 * A_mat->size2 * sizeof(*val));
+		OK_CHECK_ERR( err, matrix_memcpy_am(val, A_mat, A_mat->order) );
+		hash = pogs_cache_hash(val,
+			A_mat->size1 * A_mat->size2 * sizeof(*val), hash);
+		check = pogs_cache_hash(val,
+			A_mat->size1 * A_mat->size2 * sizeof(*val), check);
+		OK_CHECK_ERR( err, pogs_cache_key_set(key, hash, check,
+			A_mat->size1, A_mat->size2, A_mat->size1 * A_mat->size2,
+			A_mat->order, variant) );
+		*cacheable = !err;
+	} else if (A->kind == OkOperatorSparseCSC ||
+		A->kind == OkOperatorSparseCSR) {
+		A_sp = sparse_operator_get_matrix_pointer(A);
+		OK_CHECK_PTR(A_sp);
+		ok_alloc(val, A_sp->nnz * sizeof(*val));
+		ok_alloc(ind, A_sp->nnz * sizeof(*ind));
+		ok_alloc(ptr, A_sp->ptrlen * sizeof(*ptr));
+		OK_CHECK_ERR( err, sp_matrix_memcpy_am(val, ind, ptr, A_sp) );
+		hash = pogs_cache_hash(val, A_sp->nnz * sizeof(*val), hash);
+		hash = pogs_cache_hash(ind, A_sp->nnz * sizeof(*ind), hash);
+		hash = pogs_cache_hash(ptr, A_sp->ptrlen * sizeof(*ptr), hash);
+		check = pogs_cache_hash(val, A_sp->nnz * sizeof(*val), check);
+		check = pogs_cache_hash(ind, A_sp->nnz * sizeof(*ind), check);
+		check = pogs_cache_hash(ptr, A_sp->ptrlen * sizeof(*ptr), check);
+		OK_CHECK_ERR( err, pogs_cache_key_set(key, hash, check,
+			A_sp->size1, A_sp->size2, A_sp->nnz, A_sp->order, variant) );
+		*cacheable = !err;
+	}
+	ok_free(val);
+	ok_free(ind);
+	ok_free(ptr);
+	return err;
+}
+
+/*
+ * restore equilibrated operator, d, e, normA (and the factor L of a dense
+ * direct projector) from a cache entry; a sparse direct projector, or a
+ * dense one with a single precision factor, is refactored from the
+ * restored operator
+ */
+POGS_PRIVATE ok_status pogs_work_load_cached(pogs_work * W,
+	const pogs_cache_entry * entry)
+{
+	OK_CHECK_PTR(W);
+	OK_CHECK_PTR(entry);
+
+	ok_status err = OPTKIT_SUCCESS;
+	dense_direct_projector * P = OK_NULL;
+	sparse_direct_projector * Psd = OK_NULL;
+	void * sparse_handle = OK_NULL;
+
+	if (W->A->kind == OkOperatorDense) {
+		OK_CHECK_ERR( err, matrix_memcpy_ma(
+			dense_operator_get_matrix_pointer(W->A), entry->A_equil,
+			entry->key.order) );
+	} else {
+		OK_CHECK_ERR( err, sp_make_handle(&sparse_handle) );
+		OK_CHECK_ERR( err, sp_matrix_memcpy_vals_ma(sparse_handle,
+			sparse_operator_get_matrix_pointer(W->A),
+			entry->A_equil) );
+		if (sparse_handle)
+			OK_MAX_ERR( err, sp_destroy_handle(sparse_handle) );
+	}
+
+	if (W->P->kind == OkProjectorDenseDirect) {
+		P = (dense_direct_projector *) W->P->data;
+		if (P->L32)
+			OK_CHECK_ERR( err, dense_direct_projector_factor(P) );
+		else if (!entry->L)
+			return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+		else
+			OK_CHECK_ERR( err, matrix_memcpy_ma(P->L, entry->L,
+				entry->key.order) );
+		P->normA = entry->normA;
+		P->normalized = 1;
+	} else if (W->P->kind == OkProjectorSparseDirect) {
+		Psd = (sparse_direct_projector *) W->P->data;
+		Psd->normA = entry->normA;
+		Psd->normalized = 1;
+		OK_CHECK_ERR( err, sparse_direct_projector_factor(Psd) );
+	} else if (W->P->kind == OkProjectorIndirectPCG) {
+		OK_CHECK_ERR( err, W->P->initialize(W->P->data, 0) );
+	}
+
+	OK_CHECK_ERR( err, vector_memcpy_va(W->d, entry->d, 1) );
+	OK_CHECK_ERR( err, vector_memcpy_va(W->e, entry->e, 1) );
+	W->normA = entry->normA;
+	W->normalized = 1;
+	W->equilibrated = 1;
+	return err;
+}
+
+/*
+ * copy equilibrated operator, d, e, normA (and the factor L of a dense
+ * direct projector) into a new (host) cache entry
+ */
+POGS_PRIVATE ok_status pogs_work_export(pogs_work * W,
+	const pogs_cache_key * key, pogs_cache_entry ** entry)
+{
+	OK_CHECK_PTR(W);
+	OK_CHECK_PTR(key);
+	OK_CHECK_PTR(entry);
+
+	ok_status err = OPTKIT_SUCCESS;
+	dense_direct_projector * P = OK_NULL;
+	pogs_cache_entry * entry_ = OK_NULL;
+	size_t L_size = 0;
+
+	/* a single precision factor is not cached, but recomputed from A */
+	if (W->P->kind == OkProjectorDenseDirect) {
+		P = (dense_direct_projector *) W->P->data;
+		L_size = P->L ? P->L->size1 * P->L->size2 : 0;
+	}
+
+	entry_ = pogs_cache_entry_alloc(key, L_size);
+	OK_CHECK_PTR(entry_);
+
+	if (W->A->kind == OkOperatorDense)
+		OK_CHECK_ERR( err, matrix_memcpy_am(entry_->A_equil,
+			dense_operator_get_matrix_pointer(W->A), key->order) );
+	else
+		OK_CHECK_ERR( err, sp_matrix_memcpy_vals_am(entry_->A_equil,
+			sparse_operator_get_matrix_pointer(W->A)) );
+	if (P && P->L)
+		OK_CHECK_ERR( err, matrix_memcpy_am(entry_->L, P->L,
+			key->order) );
+	OK_CHECK_ERR( err, vector_memcpy_av(entry_->d, W->d, 1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(entry_->e, W->e, 1) );
+	entry_->normA = W->normA;
+
+	if (err)
+		OK_MAX_ERR( err, pogs_cache_entry_free(entry_) );
+	else
+		*entry = entry_;
+	return err;
+}
+
+/* copy the equilibrated work state into the cache */
+POGS_PRIVATE ok_status pogs_work_cache(pogs_work * W,
+	const pogs_cache_key * key)
+{
+	pogs_cache_entry * entry = OK_NULL;
+	OK_RETURNIF_ERR( pogs_work_export(W, key, &entry) );
+	return pogs_cache_insert(entry);
+}
+
 POGS_PRIVATE ok_status update_problem(pogs_solver * solver, function_vector * f,
 	function_vector * g)
 {
@@ -259,22 +513,47 @@ POGS_PRIVATE ok_status project_primal(void * linalg_handle, projector * proj,
 	if (!proj || !proj->data || !z)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
-	vector_set_all(z->temp->vec, kZero);
-	blas_axpy(linalg_handle, alpha, z->primal12->vec, z->temp->vec);
-	blas_axpy(linalg_handle, kOne - alpha, z->prev->vec, z->temp->vec);
-	blas_axpy(linalg_handle, kOne, z->dual->vec, z->temp->vec);
+	OK_RETURNIF_ERR( vector_axpbypcz(z->temp->vec, alpha, z->primal12->vec,
+		kOne - alpha, z->prev->vec, kOne, z->dual->vec) );
 	return OK_SCAN_ERR( proj->project(proj->data, z->temp->x, z->temp->y,
 		z->primal->x, z->primal->y, tol) );
 }
 
+/*
+ * tolerance schedule for inexact (CGLS) projections: start loose, then
+ * tighten with the ADMM residuals,
+ *
+ *	tol = max(tol_min, min(tol, factor * reltol * max_i(res_i / eps_i))),
+ *
+ * where reltol * res_i / eps_i approximates the relative residual of the
+ * outer loop. tol never increases over a solve.
+ */
+POGS_PRIVATE ok_status update_projector_tol(const pogs_residuals * res,
+	const pogs_tolerances * eps, ok_float * tol)
+{
+	ok_float ratio, tol_next;
+	if (!res || !eps || !tol)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	if (!(eps->primal > 0) || !(eps->dual > 0) ||
+		isnan(res->primal) || isnan(res->dual))
+		return OPTKIT_SUCCESS;
+
+	ratio = res->primal / eps->primal;
+	ratio = (res->dual / eps->dual > ratio) ? res->dual / eps->dual : ratio;
+	tol_next = kProjectorTolFactor * eps->reltol * ratio;
+	tol_next = (tol_next > kProjectorTolMin) ? tol_next : kProjectorTolMin;
+	*tol = (tol_next < *tol) ? tol_next : *tol;
+	return OPTKIT_SUCCESS;
+}
+
 POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 {
 	if (!solver || !info)
 		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
 
 	/* declare / get handles to all auxiliary types */
-	int converged = 0;
-	uint k, PRINT_ITER = 10000u;
+	int converged = 0, checked, interrupt = 0;
+	uint k, k0, PRINT_ITER = 10000u;
 	adapt_params rho_params = (adapt_params){kDELTAMIN, kZero, kZero, kOne};
 	pogs_settings * settings = solver->settings;
 	pogs_variables * z = solver->z;
@@ -283,11 +562,24 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 	pogs_tolerances eps = (pogs_tolerances){0, 0, 0, 0, 0, 0, 0, 0};
 	ok_status err = initialize_conditions(&obj, &res, &eps, settings,
 		solver->z->m, solver->z->n);
+	anderson_accelerator * aa = OK_NULL;
+	vector iterate = (vector){0, 0, OK_NULL};
+	ok_float rho_prev;
+	pogs_telemetry_record record;
+	double start = pogs_telemetry_clock();
 
 	void * linalg_handle = solver->linalg_handle;
-	ok_float tol_proj = kProjectorTolInitial;
+	int inexact = solver->W->P->kind == OkProjectorIndirect ||
+		solver->W->P->kind == OkProjectorIndirectPCG;
+	ok_float tol_proj = inexact ? kProjectorTolIndirect :
+		kProjectorTolInitial;
+	uint cg_iters = 0;
 
-	/* TODO: SET TOLPROJ!!!!!! */
+	/* projections are warm-started within, not across, solves */
+	OK_CHECK_ERR( err,
+		projector_clear_warm_start(solver->W->P) );
+	OK_CHECK_ERR( err,
+		projector_get_cg_iterations(solver->W->P, &cg_iters) );
 
 	if (settings->verbose == 0)
 		PRINT_ITER = settings->maxiter * 2u;
@@ -295,41 +587,95 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 		for (k = 0; k < settings->verbose && PRINT_ITER > 1; ++k)
 			PRINT_ITER /= 10;
 
+	OK_CHECK_ERR( err,
+		accelerator_alloc(&aa, &iterate, settings, z->m, z->n) );
+	if (solver->telemetry)
+		OK_CHECK_ERR( err, pogs_telemetry_clear(solver->telemetry) );
+
+	/*
+	 * a solve resuming from a restored checkpoint continues its
+	 * iteration count, within the same maxiter budget
+	 */
+	k0 = settings->resume ? solver->k_start : 0;
+	solver->k_start = 0;
+
 	/* signal start of execution */
 	if (settings->verbose > 0)
 		print_header_string();
 
 	/* iterate until converged, or error/maxiter reached */
-	for (k = 1; !err && k <= settings->maxiter; ++k) {
+	for (k = k0 + 1; !err && k <= settings->maxiter; ++k) {
+		pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			set_prev(z) );
 		OK_CHECK_ERR( err,
 			prox(linalg_handle, solver->f, solver->g, z,
 				solver->rho) );
+		record.t_prox = pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			project_primal(linalg_handle, solver->W->P, z,
 				settings->alpha, tol_proj) );
+		record.t_project = pogs_telemetry_lap(solver->telemetry);
 		OK_CHECK_ERR( err,
 			update_dual(linalg_handle, z, settings->alpha) );
+		record.t_dual = pogs_telemetry_lap(solver->telemetry);
+
+		/* interrupted: full check of the iterate to be returned */
+		interrupt = interrupt_due(settings, &solver->cancel, start);
+		checked = interrupt ||
+			full_check_due(linalg_handle, settings, z, &eps, k);
+		if (checked)
+			converged = check_convergence(linalg_handle, solver,
+				&obj, &res, &eps);
+		if (checked && inexact)
+			OK_CHECK_ERR( err,
+				update_projector_tol(&res, &eps, &tol_proj) );
+		record.t_check = pogs_telemetry_lap(solver->telemetry);
+		OK_CHECK_ERR( err,
+			telemetry_record(solver->telemetry, &record, k, checked,
+				&res, &eps, &obj, solver->rho) );
 
-		converged = check_convergence(linalg_handle, solver, &obj, &res,
-			&eps);
-
-		if ((k % PRINT_ITER == 0 || converged || k == settings->maxiter)
-			&& settings->verbose)
+		if ((k % PRINT_ITER == 0 || converged || interrupt ||
+			k == settings->maxiter) && settings->verbose)
 			print_iter_string(&res, &eps, &obj, k);
 
-		if (converged || k == settings->maxiter)
+		if (converged || interrupt || k == settings->maxiter)
 			break;
 
-		if (!err && settings->adaptiverho)
+		rho_prev = solver->rho;
+		if (!err && checked && settings->adaptiverho)
 			OK_CHECK_ERR( err,
 				adaptrho(z, settings, &solver->rho, &rho_params,
 					&res, &eps, k) );
+
+		/* history is invalidated by changes to rho */
+		if (!err && aa) {
+			if (solver->rho != rho_prev)
+				OK_CHECK_ERR( err, anderson_reset(aa) );
+			OK_CHECK_ERR( err,
+				accelerate(linalg_handle, aa, &iterate, z) );
+		}
+
+		if (!err && solver->checkpoint &&
+			k % solver->checkpoint->interval == 0)
+			OK_CHECK_ERR( err, pogs_checkpoint_async(solver, k) );
 	}
 
-	if (!converged && k == settings->maxiter)
+	/* the last checkpoint is complete when the solve returns */
+	if (solver->checkpoint)
+		OK_MAX_ERR( err, pogs_checkpoint_wait(solver->checkpoint) );
+
+	/* budget already spent by the restored iterations */
+	if (k0 >= settings->maxiter)
+		k = k0;
+	solver->k = k;
+
+	if (!converged && !interrupt && k >= settings->maxiter &&
+		settings->verbose)
 		printf("reached max iter = %u\n", k);
+	else if (!converged && interrupt && settings->verbose)
+		printf("%s at iter = %u\n", interrupt == OkPogsCancelled ?
+			"cancelled" : "reached time limit", k);
 
 	/* update info */
 	info->rho = solver->rho;
@@ -337,36 +683,93 @@ POGS_PRIVATE ok_status pogs_solver_loop(pogs_solver * solver, pogs_info * info)
 	info->converged = converged;
 	info->err = err;
 	info->k = k;
+	info->k_accel = aa ? (uint) aa->accepted : 0;
+	info->cg_iters = 0;
+	if (!projector_get_cg_iterations(solver->W->P, &info->cg_iters))
+		info->cg_iters -= cg_iters;
+	if (err)
+		info->status = OkPogsUnsolved;
+	else if (converged)
+		info->status = OkPogsConverged;
+	else if (interrupt)
+		info->status = interrupt;
+	else
+		info->status = OkPogsMaxIter;
+	OK_MAX_ERR( err, projector_get_refinement_residual(solver->W->P,
+		&info->refinement_residual) );
+	info->equil_time = solver->W->equil_time;
+	info->equil_row_spread = solver->W->equil_info.row_spread;
+	info->equil_col_spread = solver->W->equil_info.col_spread;
+	OK_MAX_ERR( err, accelerator_free(aa, &iterate) );
 	return err;
 }
 
-pogs_solver * pogs_init(operator * A, const int direct,
-	const ok_float equil_norm)
+/*
+ * equil sets the randomized equilibration of operators other than dense,
+ * sparse and panel operators (NULL: equilibration_randomized_settings)
+ */
+pogs_solver * pogs_init_equil(operator * A, const int direct,
+	const ok_float equil_norm, const equilibration_settings * equil)
 {
 	ok_status err = OPTKIT_SUCCESS;
-	int normalize;
+	int normalize, cacheable = 0;
 	pogs_solver * solver = OK_NULL;
 	projector * P = OK_NULL;
+	pogs_cache_key key;
+	pogs_cache_entry * cached = OK_NULL;
 
 	OK_TIMER t = tic();
 
 	/* make solver variables */
 	OK_CHECK_ERR( err,
 		pogs_solver_alloc(&solver, A, direct) );
+	if (!err && equil)
+		solver->W->equil = *equil;
 
-	/* equilibrate A as (D * A_equil * E) = A */
+	/* reuse equilibration & factorization of a previously seen A */
 	OK_CHECK_ERR( err,
-		equilibrate(solver->linalg_handle, solver->W, equil_norm) );
+		pogs_work_cache_key(&key, A, direct, equil_norm, &cacheable) );
+	if (!err && cacheable) {
+		solver->W->key = key;
+		solver->W->keyed = 1;
+		cached = pogs_cache_lookup(&key);
+	}
 
-	/* make projector; normalize A; adjust d, e accordingly */
-	if (!err) {
-		P = solver->W->P;
-		normalize = (int)(P->kind == OkProjectorDenseDirect);
+	if (cached) {
 		OK_CHECK_ERR( err,
-			P->initialize(P->data, normalize) );
-		OK_CHECK_ERR( err,
-			normalize_DAE(solver->linalg_handle, solver->W) );
+			pogs_work_load_cached(solver->W, cached) );
+		OK_MAX_ERR( err, pogs_cache_release(cached) );
 		solver->init_time = toc(t);
+	} else {
+		/* equilibrate A as (D * A_equil * E) = A */
+		OK_CHECK_ERR( err,
+			equilibrate(solver->linalg_handle, solver->W,
+				equil_norm) );
+
+		/*
+		 * make projector; normalize A; adjust d, e accordingly.
+		 * direct projectors normalize A as they factor it, indirect
+		 * projectors are initialized on the normalized A
+		 */
+		if (!err) {
+			P = solver->W->P;
+			normalize = (int)(P->kind == OkProjectorDenseDirect ||
+				P->kind == OkProjectorSparseDirect ||
+				P->kind == OkProjectorPanelDirect);
+			if (normalize)
+				OK_CHECK_ERR( err,
+					P->initialize(P->data, normalize) );
+			OK_CHECK_ERR( err,
+				normalize_DAE(solver->linalg_handle, solver->W) );
+			if (!normalize)
+				OK_CHECK_ERR( err,
+					P->initialize(P->data, normalize) );
+			solver->init_time = toc(t);
+		}
+
+		if (cacheable)
+			OK_CHECK_ERR( err,
+				pogs_work_cache(solver->W, &key) );
 	}
 
 	if (err)
@@ -375,6 +778,12 @@ pogs_solver * pogs_init(operator * A, const int direct,
 	return solver;
 }
 
+pogs_solver * pogs_init(operator * A, const int direct,
+	const ok_float equil_norm)
+{
+	return pogs_init_equil(A, direct, equil_norm, OK_NULL);
+}
+
 
 ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	function_vector * g, const pogs_settings * settings, pogs_info * info,
@@ -382,19 +791,21 @@ ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 {
 	if (!solver || !settings || !info || !output)
 		return OPTKIT_ERROR_UNALLOCATED;
-	OK_CHECK_FNVECTOR(f);
-	OK_CHECK_FNVECTOR(g);
 
 	ok_status err = OPTKIT_SUCCESS;
 	OK_TIMER t = tic();
 
+	/* pogs_cancel() applies to the solve in progress only */
+	solver->cancel = 0;
+
 	/* copy settings */
 	OK_CHECK_ERR( err,
 		update_settings(solver->settings, settings) );
 
-	/* copy and scale function vectors */
-	OK_CHECK_ERR( err,
-		update_problem(solver, f, g) );
+	/* copy and scale function vectors (f = g = NULL: keep the solver's) */
+	if (f || g)
+		OK_CHECK_ERR( err,
+			update_problem(solver, f, g) );
 
 	/* get warm start variables */
 	if (!err && settings->warmstart)
@@ -420,6 +831,544 @@ ok_status pogs_solve(pogs_solver * solver, function_vector * f,
 	return err;
 }
 
+/*
+ * replace entries f_indices[0:f_count] of the solver's objective f by
+ * f_values (and likewise for g), rescaled by the equilibration d (e);
+ * pogs_solve with f = g = NULL then solves the updated problem. the
+ * setup is O(f_count + g_count), instead of O(m + n) for the full copy
+ * and rescaling of f, g by pogs_solve
+ */
+ok_status pogs_update_objectives(pogs_solver * solver,
+	const size_t * f_indices, const function_t * f_values, size_t f_count,
+	const size_t * g_indices, const function_t * g_values, size_t g_count)
+{
+	OK_CHECK_PTR(solver);
+	size_t k;
+
+	/* entry by entry, so a repeated index is scaled once */
+	for (k = 0; k < f_count; ++k) {
+		OK_RETURNIF_ERR( function_vector_scatter_va(solver->f,
+			f_values + k, f_indices + k, 1) );
+		OK_RETURNIF_ERR( function_vector_div_indexed(solver->f,
+			solver->W->d, f_indices + k, 1) );
+	}
+	for (k = 0; k < g_count; ++k) {
+		OK_RETURNIF_ERR( function_vector_scatter_va(solver->g,
+			g_values + k, g_indices + k, 1) );
+		OK_RETURNIF_ERR( function_vector_mul_indexed(solver->g,
+			solver->W->e, g_indices + k, 1) );
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * regularization path: solve the K problems in which the weight c of
+ * every FnAbs term of f and g is scaled by lambda[k], k = 0, ..., K - 1.
+ * the first point starts as specified by settings; each later point is
+ * warm started from the iterate and rho of the previous point (resume).
+ * info and output are arrays of length K. a point interrupted by the time
+ * limit or by pogs_cancel() ends the path: later points are not solved
+ * (status OkPogsUnsolved). an error also ends the path, including an
+ * error of the solver loop (reported in info[k].err, not by pogs_solve);
+ * the point that failed is marked unsolved along with the later ones,
+ * and its error is returned.
+ */
+ok_status pogs_solve_path(pogs_solver * solver, function_vector * f,
+	function_vector * g, const pogs_settings * settings, size_t K,
+	const ok_float * lambda, pogs_info * info, pogs_output * output)
+{
+	if (!solver || !settings || !lambda || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	OK_CHECK_FNVECTOR(f);
+	OK_CHECK_FNVECTOR(g);
+
+	ok_status err = OPTKIT_SUCCESS;
+	function_vector f_path = (function_vector){f->size, OK_NULL};
+	function_vector g_path = (function_vector){g->size, OK_NULL};
+	pogs_settings path_settings = *settings;
+	size_t k, unsolved = K;
+
+	ok_alloc(f_path.objectives, f->size * sizeof(*f_path.objectives));
+	ok_alloc(g_path.objectives, g->size * sizeof(*g_path.objectives));
+
+	for (k = 0; k < K; ++k) {
+		OK_CHECK_ERR( err,
+			scale_path_objectives(&f_path, f, lambda[k]) );
+		OK_CHECK_ERR( err,
+			scale_path_objectives(&g_path, g, lambda[k]) );
+		OK_CHECK_ERR( err, pogs_solve(solver, &f_path, &g_path,
+			&path_settings, info + k, output + k) );
+		/* later points must not resume from a failed iterate */
+		if (!err && info[k].err)
+			err = (ok_status) info[k].err;
+		else if (!err && info[k].status == OkPogsUnsolved)
+			err = OK_SCAN_ERR( OPTKIT_ERROR );
+		if (err) {
+			unsolved = k;
+			break;
+		}
+
+		path_settings.warmstart = 0;
+		path_settings.resume = 1;
+		if (info[k].status == OkPogsTimeLimit ||
+			info[k].status == OkPogsCancelled) {
+			unsolved = k + 1;
+			break;
+		}
+	}
+	for (k = unsolved; k < K; ++k)
+		info[k].status = OkPogsUnsolved;
+
+	ok_free(f_path.objectives);
+	ok_free(g_path.objectives);
+	return err;
+}
+
+typedef struct pogs_solve_many_args {
+	pogs_solver ** solvers;
+	function_vector * f, * g;
+	const pogs_settings * settings;
+	pogs_info * info;
+	pogs_output * output;
+} pogs_solve_many_args;
+
+static ok_status pogs_solve_many_task(void * data, size_t i)
+{
+	pogs_solve_many_args * args = (pogs_solve_many_args *) data;
+	return pogs_solve(args->solvers[i], args->f + i, args->g + i,
+		args->settings, args->info + i, args->output + i);
+}
+
+/*
+ * solve N independent problems (solvers[i], f[i], g[i]) concurrently on a
+ * pool of n_threads threads (n_threads = 0: one per online processor),
+ * with shared settings; info and output are arrays of length N. the
+ * solvers must be distinct: a solver is not safe for concurrent use, but
+ * distinct solvers share no mutable state.
+ */
+ok_status pogs_solve_many_threads(size_t N, pogs_solver ** solvers,
+	function_vector * f, function_vector * g, const pogs_settings * settings,
+	pogs_info * info, pogs_output * output, size_t n_threads)
+{
+	if (!solvers || !f || !g || !settings || !info || !output)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+
+	pogs_solve_many_args args = {solvers, f, g, settings, info, output};
+	return pogs_parallel_for(N, n_threads, pogs_solve_many_task, &args);
+}
+
+static const char kCheckpointMagic[8] = "OKPOGSCK";
+
+static int pogs_checkpoint_fwrite(const ok_float * x, size_t count, FILE * fp)
+{
+	return count == 0 || fwrite(x, sizeof(*x), count, fp) == count;
+}
+
+static int pogs_checkpoint_fread(ok_float * x, size_t count, FILE * fp)
+{
+	return count == 0 || fread(x, sizeof(*x), count, fp) == count;
+}
+
+static ok_status pogs_checkpoint_write(const char * filename,
+	const pogs_checkpoint_header * header, const pogs_cache_entry * entry,
+	const ok_float * z)
+{
+	size_t len = strlen(filename);
+	size_t mn = header->key.size1 + header->key.size2;
+	char * tmp = OK_NULL;
+	FILE * fp = OK_NULL;
+	int ok;
+
+	/* write a temporary file, then rename over the last checkpoint */
+	ok_alloc(tmp, len + 5);
+	memcpy(tmp, filename, len);
+	memcpy(tmp + len, ".tmp", 5);
+
+	fp = fopen(tmp, "wb");
+	ok = fp != OK_NULL;
+	ok = ok && fwrite(header, sizeof(*header), 1, fp) == 1;
+	ok = ok && pogs_checkpoint_fwrite(entry->A_equil, header->key.nnz, fp);
+	ok = ok && pogs_checkpoint_fwrite(entry->L, header->L_size, fp);
+	ok = ok && pogs_checkpoint_fwrite(entry->d, header->key.size1, fp);
+	ok = ok && pogs_checkpoint_fwrite(entry->e, header->key.size2, fp);
+	ok = ok && pogs_checkpoint_fwrite(z, 5 * mn, fp);
+	if (fp)
+		ok = (fclose(fp) == 0) && ok;
+	ok = ok && rename(tmp, filename) == 0;
+	if (!ok)
+		remove(tmp);
+
+	ok_free(tmp);
+	return ok ? OPTKIT_SUCCESS : OK_SCAN_ERR( OPTKIT_ERROR );
+}
+
+static ok_status pogs_checkpointer_alloc(pogs_checkpointer ** ckpt,
+	const char * filename, uint interval)
+{
+	OK_CHECK_PTR(filename);
+	if (*ckpt)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+
+	pogs_checkpointer * c = OK_NULL;
+	ok_alloc(c, sizeof(*c));
+	ok_alloc(c->filename, strlen(filename) + 1);
+	memcpy(c->filename, filename, strlen(filename) + 1);
+	c->interval = interval;
+	if (pthread_mutex_init(&c->lock, OK_NULL)) {
+		ok_free(c->filename);
+		ok_free(c);
+		return OK_SCAN_ERR( OPTKIT_ERROR );
+	}
+	*ckpt = c;
+	return OPTKIT_SUCCESS;
+}
+
+static ok_status pogs_checkpointer_free(pogs_checkpointer * ckpt)
+{
+	OK_CHECK_PTR(ckpt);
+	ok_status err = pogs_checkpoint_wait(ckpt);
+	if (ckpt->entry)
+		OK_MAX_ERR( err, pogs_cache_entry_free(ckpt->entry) );
+	pthread_mutex_destroy(&ckpt->lock);
+	ok_free(ckpt->z);
+	ok_free(ckpt->filename);
+	ok_free(ckpt);
+	return err;
+}
+
+/*
+ * copy the iterates, rho and iteration count (and, the first time, the
+ * equilibrated operator, factor, d and e) to the host staging area of
+ * ckpt; the caller ensures no write from the staging area is in flight
+ */
+POGS_PRIVATE ok_status pogs_checkpoint_stage(pogs_solver * solver,
+	pogs_checkpointer * ckpt, uint k)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(ckpt);
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_variables * z = solver->z;
+	size_t mn = z->m + z->n;
+
+	/* checkpoints are supported for the operators cached by pogs_init */
+	if (!solver->W->keyed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	if (!ckpt->entry) {
+		OK_RETURNIF_ERR( pogs_work_export(solver->W, &solver->W->key,
+			&ckpt->entry) );
+		ok_alloc(ckpt->z, 5 * mn * sizeof(*ckpt->z));
+		memcpy(ckpt->header.magic, kCheckpointMagic, 8);
+		ckpt->header.version = OPTKIT_POGS_CHECKPOINT_VERSION;
+		ckpt->header.key = solver->W->key;
+		ckpt->header.L_size = ckpt->entry->L_size;
+		ckpt->header.normA = ckpt->entry->normA;
+	}
+
+	OK_CHECK_ERR( err, vector_memcpy_av(ckpt->z, z->primal->vec, 1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(ckpt->z + mn, z->primal12->vec,
+		1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(ckpt->z + 2 * mn, z->dual->vec,
+		1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(ckpt->z + 3 * mn, z->dual12->vec,
+		1) );
+	OK_CHECK_ERR( err, vector_memcpy_av(ckpt->z + 4 * mn, z->prev->vec,
+		1) );
+	ckpt->header.rho = solver->rho;
+	ckpt->header.k = k;
+	return err;
+}
+
+static void * pogs_checkpoint_writer(void * arg)
+{
+	pogs_checkpointer * ckpt = (pogs_checkpointer *) arg;
+	ok_status err = pogs_checkpoint_write(ckpt->filename, &ckpt->header,
+		ckpt->entry, ckpt->z);
+
+	pthread_mutex_lock(&ckpt->lock);
+	ckpt->err = ckpt->err > err ? ckpt->err : err;
+	if (!err)
+		++ckpt->written;
+	ckpt->busy = 0;
+	pthread_mutex_unlock(&ckpt->lock);
+	return OK_NULL;
+}
+
+/*
+ * stage a checkpoint at iteration k and start its write in the
+ * background; skipped if the previous write is still in flight
+ */
+POGS_PRIVATE ok_status pogs_checkpoint_async(pogs_solver * solver, uint k)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(solver->checkpoint);
+
+	pogs_checkpointer * ckpt = solver->checkpoint;
+	int busy;
+
+	pthread_mutex_lock(&ckpt->lock);
+	busy = ckpt->busy;
+	pthread_mutex_unlock(&ckpt->lock);
+	if (busy)
+		return OPTKIT_SUCCESS;
+
+	if (ckpt->joinable) {
+		pthread_join(ckpt->thread, OK_NULL);
+		ckpt->joinable = 0;
+	}
+
+	OK_RETURNIF_ERR( pogs_checkpoint_stage(solver, ckpt, k) );
+
+	ckpt->busy = 1;
+	if (pthread_create(&ckpt->thread, OK_NULL, pogs_checkpoint_writer,
+		ckpt)) {
+		ckpt->busy = 0;
+		return OK_SCAN_ERR( OPTKIT_ERROR );
+	}
+	ckpt->joinable = 1;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * wait for the write in flight (if any) to finish; return (and clear)
+ * the most severe error of the background writes since the last wait
+ */
+POGS_PRIVATE ok_status pogs_checkpoint_wait(pogs_checkpointer * ckpt)
+{
+	OK_CHECK_PTR(ckpt);
+	ok_status err;
+
+	if (ckpt->joinable) {
+		pthread_join(ckpt->thread, OK_NULL);
+		ckpt->joinable = 0;
+	}
+	err = ckpt->err;
+	ckpt->err = OPTKIT_SUCCESS;
+	return err;
+}
+
+/*
+ * write a checkpoint of the solver state to filename, in the calling
+ * thread. only solvers over dense or sparse operators can be
+ * checkpointed.
+ */
+ok_status pogs_checkpoint_save(pogs_solver * solver, const char * filename)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(filename);
+
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_checkpointer * ckpt = solver->checkpoint;
+
+	if (ckpt)
+		OK_CHECK_ERR( err, pogs_checkpoint_wait(ckpt) );
+	else
+		OK_CHECK_ERR( err, pogs_checkpointer_alloc(&ckpt, filename, 0) );
+
+	OK_CHECK_ERR( err, pogs_checkpoint_stage(solver, ckpt, solver->k) );
+	OK_CHECK_ERR( err, pogs_checkpoint_write(filename, &ckpt->header,
+		ckpt->entry, ckpt->z) );
+
+	if (ckpt && ckpt != solver->checkpoint)
+		OK_MAX_ERR( err, pogs_checkpointer_free(ckpt) );
+	return err;
+}
+
+/*
+ * build a solver over operator A from a checkpoint written for a solver
+ * made by pogs_init(A, direct, equil_norm) with the same A: the
+ * equilibrated operator, factor (a sparse direct projector is refactored)
+ * d, e, iterates and rho are restored, without equilibrating A again.
+ * A is overwritten with its equilibrated values, as by pogs_init.
+ * continue with pogs_solve(..., settings) with settings->resume = 1 and
+ * settings->warmstart = 0; that solve continues the iteration count of
+ * the checkpoint, so settings->maxiter bounds the total count.
+ *
+ * the header key, including its content check hash (see
+ * pogs_cache_key), must match that of A.
+ */
+pogs_solver * pogs_checkpoint_restore(operator * A, const int direct,
+	const ok_float equil_norm, const char * filename)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	int cacheable = 0;
+	pogs_solver * solver = OK_NULL;
+	pogs_checkpoint_header header;
+	pogs_cache_key key;
+	pogs_cache_entry * entry = OK_NULL;
+	dense_direct_projector * P = OK_NULL;
+	ok_float * z = OK_NULL;
+	size_t mn = 0, L_size = 0;
+	FILE * fp = OK_NULL;
+	OK_TIMER t = tic();
+
+	if (!filename)
+		return OK_NULL;
+
+	OK_CHECK_ERR( err,
+		pogs_solver_alloc(&solver, A, direct) );
+	OK_CHECK_ERR( err,
+		pogs_work_cache_key(&key, A, direct, equil_norm, &cacheable) );
+	if (!err && !cacheable)
+		err = OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	if (!err) {
+		fp = fopen(filename, "rb");
+		if (!fp || fread(&header, sizeof(header), 1, fp) != 1 ||
+			memcmp(header.magic, kCheckpointMagic, 8) != 0 ||
+			header.version != OPTKIT_POGS_CHECKPOINT_VERSION)
+			err = OK_SCAN_ERR( OPTKIT_ERROR );
+	}
+
+	/* the checkpoint must be of this operator, projector and precision */
+	if (!err) {
+		if (solver->W->P->kind == OkProjectorDenseDirect) {
+			P = (dense_direct_projector *) solver->W->P->data;
+			L_size = P->L ? P->L->size1 * P->L->size2 : 0;
+		}
+		if (!pogs_cache_key_match(&key, &header.key) ||
+			header.L_size != L_size)
+			err = OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+	}
+
+	if (!err) {
+		mn = key.size1 + key.size2;
+		entry = pogs_cache_entry_alloc(&key, L_size);
+		ok_alloc(z, 5 * mn * sizeof(*z));
+		if (!entry ||
+			!pogs_checkpoint_fread(entry->A_equil, key.nnz, fp) ||
+			!pogs_checkpoint_fread(entry->L, L_size, fp) ||
+			!pogs_checkpoint_fread(entry->d, key.size1, fp) ||
+			!pogs_checkpoint_fread(entry->e, key.size2, fp) ||
+			!pogs_checkpoint_fread(z, 5 * mn, fp))
+			err = OK_SCAN_ERR( OPTKIT_ERROR );
+		else
+			entry->normA = header.normA;
+	}
+	if (fp)
+		fclose(fp);
+
+	OK_CHECK_ERR( err,
+		pogs_work_load_cached(solver->W, entry) );
+	OK_CHECK_ERR( err,
+		vector_memcpy_va(solver->z->primal->vec, z, 1) );
+	OK_CHECK_ERR( err,
+		vector_memcpy_va(solver->z->primal12->vec, z + mn, 1) );
+	OK_CHECK_ERR( err,
+		vector_memcpy_va(solver->z->dual->vec, z + 2 * mn, 1) );
+	OK_CHECK_ERR( err,
+		vector_memcpy_va(solver->z->dual12->vec, z + 3 * mn, 1) );
+	OK_CHECK_ERR( err,
+		vector_memcpy_va(solver->z->prev->vec, z + 4 * mn, 1) );
+
+	if (!err) {
+		solver->rho = header.rho;
+		solver->k = solver->k_start = header.k;
+		solver->W->key = key;
+		solver->W->keyed = 1;
+		solver->init_time = toc(t);
+	}
+
+	if (entry)
+		pogs_cache_entry_free(entry);
+	ok_free(z);
+	if (err && solver) {
+		pogs_solver_free(solver);
+		solver = OK_NULL;
+	}
+	return solver;
+}
+
+/*
+ * write a checkpoint to filename every interval iterations of subsequent
+ * calls to pogs_solve, in the background (see pogs_checkpointer)
+ */
+ok_status pogs_checkpoint_enable(pogs_solver * solver, const char * filename,
+	uint interval)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(filename);
+	if (interval == 0 || !solver->W->keyed)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	OK_RETURNIF_ERR( pogs_checkpoint_disable(solver) );
+	return pogs_checkpointer_alloc(&solver->checkpoint, filename, interval);
+}
+
+ok_status pogs_checkpoint_disable(pogs_solver * solver)
+{
+	OK_CHECK_PTR(solver);
+	ok_status err = OPTKIT_SUCCESS;
+	if (solver->checkpoint) {
+		err = pogs_checkpointer_free(solver->checkpoint);
+		solver->checkpoint = OK_NULL;
+	}
+	return err;
+}
+
+/* number of background checkpoints written since checkpoints were enabled */
+ok_status pogs_checkpoint_count(pogs_solver * solver, size_t * count)
+{
+	OK_CHECK_PTR(solver);
+	OK_CHECK_PTR(count);
+	*count = 0;
+	if (solver->checkpoint) {
+		pthread_mutex_lock(&solver->checkpoint->lock);
+		*count = solver->checkpoint->written;
+		pthread_mutex_unlock(&solver->checkpoint->lock);
+	}
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * record telemetry (pogs_telemetry_record) for the last capacity
+ * iterations of each subsequent solve; re-enabling resizes the buffer
+ */
+ok_status pogs_telemetry_enable(pogs_solver * solver, size_t capacity)
+{
+	OK_CHECK_PTR(solver);
+	OK_RETURNIF_ERR( pogs_telemetry_disable(solver) );
+	return OK_SCAN_ERR( pogs_telemetry_alloc(&solver->telemetry, capacity) );
+}
+
+ok_status pogs_telemetry_disable(pogs_solver * solver)
+{
+	OK_CHECK_PTR(solver);
+	ok_status err = OPTKIT_SUCCESS;
+	if (solver->telemetry) {
+		err = OK_SCAN_ERR( pogs_telemetry_free(solver->telemetry) );
+		solver->telemetry = OK_NULL;
+	}
+	return err;
+}
+
+/*
+ * copy the telemetry of the most recent solve, oldest iteration first, to
+ * records (room for *count records); set *count to the number copied
+ */
+ok_status pogs_telemetry_read(const pogs_solver * solver,
+	pogs_telemetry_record * records, size_t * count)
+{
+	OK_CHECK_PTR(solver);
+	if (!solver->telemetry)
+		return OK_SCAN_ERR( OPTKIT_ERROR_UNALLOCATED );
+	return OK_SCAN_ERR( pogs_telemetry_copy(solver->telemetry, records,
+		count) );
+}
+
+/*
+ * request that the solve in progress on solver stop (may be called from
+ * another thread): the solver loop returns at the end of the current
+ * iteration, with the iterate reached so far and status OkPogsCancelled
+ */
+ok_status pogs_cancel(pogs_solver * solver)
+{
+	OK_CHECK_PTR(solver);
+	solver->cancel = 1;
+	return OPTKIT_SUCCESS;
+}
+
 ok_status pogs_finish(pogs_solver * solver, const int reset)
 {
 	ok_status err = OK_SCAN_ERR( pogs_solver_free(solver) );
@@ -486,6 +1435,19 @@ operator * pogs_sparse_operator_gen(const ok_float * val, const ok_int * ind,
 	return o;
 }
 
+/*
+ * operator over a row-major m x n array A that is never copied: A is
+ * streamed in panels of panel_rows rows, so it may be a memory mapping of
+ * a file larger than memory. A must outlive the operator. with a direct
+ * solver and m >= n, pogs_init() equilibrates A and forms AᵀA in a single
+ * pass over A, and each iteration then takes two passes.
+ */
+operator * pogs_panel_operator_gen(const ok_float * A, size_t m, size_t n,
+	size_t panel_rows)
+{
+	return panel_operator_alloc(A, m, n, panel_rows);
+}
+
 ok_status pogs_dense_operator_free(operator * A)
 {
 	OK_CHECK_OPERATOR(A);
@@ -508,58 +1470,13 @@ ok_status pogs_sparse_operator_free(operator * A)
 	return err;
 }
 
-/*
-pogs_solver * pogs_load_solver(ok_float * A_equil, ok_float * LLT_factorization,
-	ok_float * d, ok_float * e, ok_float * z, ok_float * z12,
-	ok_float * z_dual, ok_float * z_dual12, ok_float * z_prev, ok_float rho,
-	size_t m, size_t n, enum CBLAS_ORDER ord)
-{
-	pogs_solver * solver = OK_NULL;
-	pogs_solver_alloc(&solver, m , n, ord);
-
-	matrix_memcpy_ma(solver->W->A, A_equil, ord);
-
-	#ifndef OPTKIT_INDIRECT
-	matrix_memcpy_ma(solver->W->P->L, LLT_factorization, ord);
-	#endif
-
-	vector_memcpy_va(solver->W->d, d, 1);
-	vector_memcpy_va(solver->W->e, e, 1);
-
-	vector_memcpy_va(solver->z->primal->vec, z, 1);
-	vector_memcpy_va(solver->z->primal12->vec, z12, 1);
-	vector_memcpy_va(solver->z->dual->vec, z_dual, 1);
-	vector_memcpy_va(solver->z->dual12->vec, z_dual12, 1);
-	vector_memcpy_va(solver->z->prev->vec, z_prev, 1);
-
-	solver->rho = rho;
-
-	return solver;
-}
-
-void pogs_extract_solver(pogs_solver * solver, ok_float * A_equil,
-	ok_float * LLT_factorization, ok_float * d, ok_float * e, ok_float * z,
-	ok_float * z12, ok_float * z_dual, ok_float * z_dual12,
-	ok_float * z_prev, ok_float * rho, enum CBLAS_ORDER ord)
+ok_status pogs_panel_operator_free(operator * A)
 {
-	matrix_memcpy_am(A_equil, solver->W->A, ord);
-
-	#ifndef OPTKIT_INDIRECT
-	matrix_memcpy_am(LLT_factorization, solver->W->P->L, ord);
-	#endif
-
-	vector_memcpy_av(d, solver->W->d, 1);
-	vector_memcpy_av(e, solver->W->e, 1);
-
-	vector_memcpy_av(z, solver->z->primal->vec, 1);
-	vector_memcpy_av(z12, solver->z->primal12->vec, 1);
-	vector_memcpy_av(z_dual, solver->z->dual->vec, 1);
-	vector_memcpy_av(z_dual12, solver->z->dual12->vec, 1);
-	vector_memcpy_av(z_prev, solver->z->prev->vec, 1);
-
-	*rho = solver->rho;
+	OK_CHECK_OPERATOR(A);
+	ok_status err = A->free(A->data);
+	ok_free(A);
+	return err;
 }
-*/
 
 #ifdef __cplusplus
 }
@@ -0,0 +1,376 @@
+#include <pthread.h>
+#include "optkit_pogs_cache.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * process-wide LRU list, most recently used entry at head. all access to
+ * the list and counters is serialized by cache_mutex.
+ */
+static pogs_cache_entry * cache_head = OK_NULL;
+static pogs_cache_entry * cache_tail = OK_NULL;
+static pogs_cache_stats cache_stats = {0, 0, 0, 0, 0, kPOGSCACHECAPACITY};
+static pthread_mutex_t cache_mutex = PTHREAD_MUTEX_INITIALIZER;
+
+/* norm estimates, replaced least recently stored first */
+static pogs_norm_cache_entry norm_cache[kPOGSNORMCACHESIZE];
+static uint64_t norm_cache_stamp = 0;
+
+/* 64-bit primes of xxHash */
+static const uint64_t kHashPrime1 = 11400714785074694791ULL;
+static const uint64_t kHashPrime2 = 14029467366897019727ULL;
+static const uint64_t kHashPrime3 = 1609587929392839161ULL;
+static const uint64_t kHashPrime4 = 9650029242287828579ULL;
+static const uint64_t kHashPrime5 = 2870177450012600261ULL;
+
+static uint64_t pogs_cache_rotl(uint64_t x, int r)
+{
+	return (x << r) | (x >> (64 - r));
+}
+
+/* mix one 8-byte word into h (xxHash64 round and merge) */
+static uint64_t pogs_cache_round(uint64_t h, uint64_t word)
+{
+	word *= kHashPrime2;
+	word = pogs_cache_rotl(word, 31);
+	word *= kHashPrime1;
+	h ^= word;
+	return pogs_cache_rotl(h, 27) * kHashPrime1 + kHashPrime4;
+}
+
+/*
+ * hash of bytes of data, chained from seed: each 8-byte word (and the
+ * zero-padded tail) is multiplied and rotated before it enters the state,
+ * and the result is avalanched, so that changes in any bits of the input
+ * (e.g., the sign bits of several entries) do not cancel
+ */
+uint64_t pogs_cache_hash(const void * data, size_t bytes, uint64_t seed)
+{
+	const unsigned char * p = (const unsigned char *) data;
+	uint64_t h = seed + kHashPrime5 + (uint64_t) bytes, word;
+	size_t i, words = bytes / sizeof(word);
+
+	if (data) {
+		for (i = 0; i < words; ++i) {
+			memcpy(&word, p + i * sizeof(word), sizeof(word));
+			h = pogs_cache_round(h, word);
+		}
+		if (bytes > words * sizeof(word)) {
+			word = 0;
+			memcpy(&word, p + words * sizeof(word),
+				bytes - words * sizeof(word));
+			h = pogs_cache_round(h, word);
+		}
+	}
+
+	h ^= h >> 33;
+	h *= kHashPrime2;
+	h ^= h >> 29;
+	h *= kHashPrime3;
+	h ^= h >> 32;
+	return h;
+}
+
+ok_status pogs_cache_key_set(pogs_cache_key * key, uint64_t hash,
+	uint64_t check, size_t size1, size_t size2, size_t nnz,
+	enum CBLAS_ORDER order, uint variant)
+{
+	OK_CHECK_PTR(key);
+	key->hash = hash;
+	key->check = check;
+	key->size1 = size1;
+	key->size2 = size2;
+	key->nnz = nnz;
+	key->order = order;
+	key->variant = variant;
+	key->precision = sizeof(ok_float);
+	return OPTKIT_SUCCESS;
+}
+
+int pogs_cache_key_match(const pogs_cache_key * k1,
+	const pogs_cache_key * k2)
+{
+	return k1->hash == k2->hash && k1->check == k2->check &&
+		k1->size1 == k2->size1 &&
+		k1->size2 == k2->size2 && k1->nnz == k2->nnz &&
+		k1->order == k2->order && k1->variant == k2->variant &&
+		k1->precision == k2->precision;
+}
+
+pogs_cache_entry * pogs_cache_entry_alloc(const pogs_cache_key * key,
+	size_t L_size)
+{
+	pogs_cache_entry * entry = OK_NULL;
+	if (!key)
+		return OK_NULL;
+
+	ok_alloc(entry, sizeof(*entry));
+	entry->key = *key;
+	entry->L_size = L_size;
+	ok_alloc(entry->A_equil, key->nnz * sizeof(ok_float));
+	ok_alloc(entry->d, key->size1 * sizeof(ok_float));
+	ok_alloc(entry->e, key->size2 * sizeof(ok_float));
+	if (L_size > 0)
+		ok_alloc(entry->L, L_size * sizeof(ok_float));
+	entry->bytes = sizeof(*entry) + sizeof(ok_float) *
+		(key->nnz + key->size1 + key->size2 + L_size);
+	return entry;
+}
+
+ok_status pogs_cache_entry_free(pogs_cache_entry * entry)
+{
+	OK_CHECK_PTR(entry);
+	ok_free(entry->A_equil);
+	ok_free(entry->d);
+	ok_free(entry->e);
+	ok_free(entry->L);
+	ok_free(entry);
+	return OPTKIT_SUCCESS;
+}
+
+static void pogs_cache_unlink(pogs_cache_entry * entry)
+{
+	if (entry->prev)
+		entry->prev->next = entry->next;
+	else
+		cache_head = entry->next;
+	if (entry->next)
+		entry->next->prev = entry->prev;
+	else
+		cache_tail = entry->prev;
+	entry->prev = entry->next = OK_NULL;
+}
+
+static void pogs_cache_push_front(pogs_cache_entry * entry)
+{
+	entry->prev = OK_NULL;
+	entry->next = cache_head;
+	if (cache_head)
+		cache_head->prev = entry;
+	cache_head = entry;
+	if (!cache_tail)
+		cache_tail = entry;
+}
+
+/*
+ * evict least recently used entries until the cache holds <= bytes;
+ * entries pinned by a lookup are skipped. caller holds cache_mutex.
+ */
+static ok_status pogs_cache_evict_to(size_t bytes)
+{
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_cache_entry * entry = cache_tail, * prev = OK_NULL;
+
+	while (entry && cache_stats.bytes > bytes) {
+		prev = entry->prev;
+		if (entry->pins == 0) {
+			pogs_cache_unlink(entry);
+			cache_stats.bytes -= entry->bytes;
+			cache_stats.entries -= 1;
+			cache_stats.evictions += 1;
+			OK_MAX_ERR( err, pogs_cache_entry_free(entry) );
+		}
+		entry = prev;
+	}
+	return err;
+}
+
+/*
+ * return the entry matching key (and mark it most recently used), or
+ * OK_NULL on a miss. entries remain owned by the cache; a returned entry
+ * is pinned (not evicted) until released with pogs_cache_release.
+ */
+pogs_cache_entry * pogs_cache_lookup(const pogs_cache_key * key)
+{
+	pogs_cache_entry * entry = OK_NULL;
+	if (!key)
+		return OK_NULL;
+
+	pthread_mutex_lock(&cache_mutex);
+	if (cache_stats.capacity > 0)
+		for (entry = cache_head; entry; entry = entry->next)
+			if (pogs_cache_key_match(&entry->key, key))
+				break;
+
+	if (entry) {
+		cache_stats.hits += 1;
+		entry->pins += 1;
+		pogs_cache_unlink(entry);
+		pogs_cache_push_front(entry);
+	} else if (cache_stats.capacity > 0) {
+		cache_stats.misses += 1;
+	}
+	pthread_mutex_unlock(&cache_mutex);
+	return entry;
+}
+
+ok_status pogs_cache_release(pogs_cache_entry * entry)
+{
+	OK_CHECK_PTR(entry);
+	ok_status err = OPTKIT_SUCCESS;
+
+	pthread_mutex_lock(&cache_mutex);
+	if (entry->pins > 0)
+		entry->pins -= 1;
+	OK_CHECK_ERR( err, pogs_cache_evict_to(cache_stats.capacity) );
+	pthread_mutex_unlock(&cache_mutex);
+	return err;
+}
+
+/*
+ * take ownership of entry. entries larger than the cache capacity, or
+ * duplicating a cached key, are freed instead of inserted.
+ */
+ok_status pogs_cache_insert(pogs_cache_entry * entry)
+{
+	OK_CHECK_PTR(entry);
+	ok_status err = OPTKIT_SUCCESS;
+	pogs_cache_entry * e = OK_NULL;
+	int keep;
+
+	pthread_mutex_lock(&cache_mutex);
+	keep = entry->bytes <= cache_stats.capacity;
+	for (e = cache_head; e && keep; e = e->next)
+		if (pogs_cache_key_match(&e->key, &entry->key))
+			keep = 0;
+
+	if (keep) {
+		OK_CHECK_ERR( err, pogs_cache_evict_to(
+			cache_stats.capacity - entry->bytes) );
+		pogs_cache_push_front(entry);
+		cache_stats.bytes += entry->bytes;
+		cache_stats.entries += 1;
+	}
+	pthread_mutex_unlock(&cache_mutex);
+
+	if (!keep)
+		err = pogs_cache_entry_free(entry);
+	return err;
+}
+
+ok_status pogs_cache_set_capacity(size_t bytes)
+{
+	ok_status err;
+	pthread_mutex_lock(&cache_mutex);
+	cache_stats.capacity = bytes;
+	err = pogs_cache_evict_to(bytes);
+	pthread_mutex_unlock(&cache_mutex);
+	return err;
+}
+
+/* caller holds cache_mutex */
+static void pogs_norm_cache_drop(pogs_norm_cache_entry * entry)
+{
+	ok_free(entry->V);
+	memset(entry, 0, sizeof(*entry));
+}
+
+/*
+ * copy of the subspace V (allocated; free with ok_free) and the norm last
+ * stored for the operator; *V = NULL if there is none
+ */
+ok_status pogs_norm_cache_load(const void * id, uint kind, size_t size1,
+	size_t size2, ok_float ** V, size_t * block, ok_float * norm)
+{
+	OK_CHECK_PTR(id);
+	OK_CHECK_PTR(V);
+	OK_CHECK_PTR(block);
+	OK_CHECK_PTR(norm);
+	pogs_norm_cache_entry * entry;
+	uint i;
+
+	*V = OK_NULL;
+	pthread_mutex_lock(&cache_mutex);
+	for (i = 0; i < kPOGSNORMCACHESIZE; ++i) {
+		entry = norm_cache + i;
+		if (entry->V && entry->id == id && entry->kind == kind &&
+			entry->size1 == size1 && entry->size2 == size2) {
+			ok_alloc(*V, size2 * entry->block * sizeof(**V));
+			memcpy(*V, entry->V, size2 * entry->block * sizeof(**V));
+			*block = entry->block;
+			*norm = entry->norm;
+			break;
+		}
+	}
+	pthread_mutex_unlock(&cache_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status pogs_norm_cache_store(const void * id, uint kind, size_t size1,
+	size_t size2, const ok_float * V, size_t block, ok_float norm)
+{
+	OK_CHECK_PTR(id);
+	OK_CHECK_PTR(V);
+	pogs_norm_cache_entry * entry = OK_NULL;
+	uint i;
+
+	pthread_mutex_lock(&cache_mutex);
+	for (i = 0; i < kPOGSNORMCACHESIZE && !entry; ++i)
+		if (norm_cache[i].id == id)
+			entry = norm_cache + i;
+	for (i = 0; i < kPOGSNORMCACHESIZE && !entry; ++i)
+		if (!norm_cache[i].V)
+			entry = norm_cache + i;
+	if (!entry) {
+		entry = norm_cache;
+		for (i = 1; i < kPOGSNORMCACHESIZE; ++i)
+			if (norm_cache[i].stamp < entry->stamp)
+				entry = norm_cache + i;
+	}
+	pogs_norm_cache_drop(entry);
+	ok_alloc(entry->V, size2 * block * sizeof(*entry->V));
+	memcpy(entry->V, V, size2 * block * sizeof(*entry->V));
+	entry->id = id;
+	entry->kind = kind;
+	entry->size1 = size1;
+	entry->size2 = size2;
+	entry->block = block;
+	entry->norm = norm;
+	entry->stamp = ++norm_cache_stamp;
+	pthread_mutex_unlock(&cache_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status pogs_norm_cache_clear(void)
+{
+	uint i;
+	pthread_mutex_lock(&cache_mutex);
+	for (i = 0; i < kPOGSNORMCACHESIZE; ++i)
+		pogs_norm_cache_drop(norm_cache + i);
+	pthread_mutex_unlock(&cache_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * drop all (unpinned) entries, and all norm estimates, and reset the
+ * counters; capacity is kept
+ */
+ok_status pogs_cache_clear(void)
+{
+	ok_status err;
+	uint i;
+	pthread_mutex_lock(&cache_mutex);
+	for (i = 0; i < kPOGSNORMCACHESIZE; ++i)
+		pogs_norm_cache_drop(norm_cache + i);
+	err = pogs_cache_evict_to(0);
+	cache_stats.hits = 0;
+	cache_stats.misses = 0;
+	cache_stats.evictions = 0;
+	pthread_mutex_unlock(&cache_mutex);
+	return err;
+}
+
+ok_status pogs_cache_get_stats(pogs_cache_stats * stats)
+{
+	OK_CHECK_PTR(stats);
+	pthread_mutex_lock(&cache_mutex);
+	*stats = cache_stats;
+	pthread_mutex_unlock(&cache_mutex);
+	return OPTKIT_SUCCESS;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -1,3 +1,5 @@
+#include <pthread.h>
+#include <unistd.h>
 #include "optkit_pogs_common.h"
 
 #ifdef __cplusplus
@@ -29,9 +31,104 @@ ok_status set_default_settings(pogs_settings * s)
 	s->resume = kRESUME;
 	s->x0 = OK_NULL;
 	s->nu0 = OK_NULL;
+	s->accelerate = kACCELERATE;
+	s->anderson_type = kANDERSONTYPE;
+	s->anderson_memory = kANDERSONMEMORY;
+	s->anderson_safeguard = kANDERSONSAFEGUARD;
+	s->check_interval = kCHECKINTERVAL;
+	s->time_limit = kTIMELIMIT;
 	return OPTKIT_SUCCESS;
 }
 
+typedef struct pogs_parallel_work {
+	pthread_mutex_t lock;
+	size_t next, N;
+	ok_status (* task)(void * data, size_t i);
+	void * data;
+	ok_status err;
+} pogs_parallel_work;
+
+static void * pogs_parallel_worker(void * arg)
+{
+	pogs_parallel_work * work = (pogs_parallel_work *) arg;
+	ok_status err;
+	size_t i;
+
+	for (;;) {
+		pthread_mutex_lock(&work->lock);
+		i = work->next++;
+		pthread_mutex_unlock(&work->lock);
+		if (i >= work->N)
+			break;
+
+		err = work->task(work->data, i);
+		if (err) {
+			pthread_mutex_lock(&work->lock);
+			work->err = work->err > err ? work->err : err;
+			pthread_mutex_unlock(&work->lock);
+		}
+	}
+	return OK_NULL;
+}
+
+/*
+ * run task(data, i) for i = 0, ..., N - 1 on a pool of n_threads POSIX
+ * threads (n_threads = 0: one per online processor), each thread taking
+ * the next unclaimed index. returns the largest error code of any task.
+ */
+ok_status pogs_parallel_for(size_t N, size_t n_threads,
+	ok_status (* task)(void * data, size_t i), void * data)
+{
+	OK_CHECK_PTR(task);
+	pogs_parallel_work work;
+	pthread_t * threads = OK_NULL;
+	size_t t, started = 0;
+	long cpus;
+
+	if (n_threads == 0) {
+		cpus = sysconf(_SC_NPROCESSORS_ONLN);
+		n_threads = cpus > 0 ? (size_t) cpus : 1;
+	}
+	if (n_threads > N)
+		n_threads = N;
+
+	work.next = 0;
+	work.N = N;
+	work.task = task;
+	work.data = data;
+	work.err = OPTKIT_SUCCESS;
+	if (pthread_mutex_init(&work.lock, OK_NULL))
+		return OK_SCAN_ERR( OPTKIT_ERROR );
+
+	/* run serially in the calling thread */
+	if (n_threads <= 1) {
+		pogs_parallel_worker(&work);
+		pthread_mutex_destroy(&work.lock);
+		return work.err;
+	}
+
+	ok_alloc(threads, n_threads * sizeof(*threads));
+
+	for (t = 0; t < n_threads; ++t) {
+		if (pthread_create(threads + t, OK_NULL, pogs_parallel_worker,
+			&work)) {
+			OK_SCAN_ERR( OPTKIT_ERROR );
+			break;
+		}
+		++started;
+	}
+
+	/* if thread creation failed, the started threads (or this one) finish */
+	if (started == 0)
+		pogs_parallel_worker(&work);
+	for (t = 0; t < started; ++t)
+		pthread_join(threads[t], OK_NULL);
+
+	ok_free(threads);
+	pthread_mutex_destroy(&work.lock);
+	return work.err;
+}
+
 #ifdef __cplusplus
 }
 #endif
@@ -0,0 +1,100 @@
+/* clock_gettime(CLOCK_MONOTONIC, ...) under -std=c99 */
+#define _POSIX_C_SOURCE 199309L
+#include <time.h>
+#include "optkit_pogs_telemetry.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * seconds on a monotonic, high resolution clock (unlike tic()/toc(), not
+ * affected by adjustments of the system time)
+ */
+double pogs_telemetry_clock(void)
+{
+	struct timespec ts;
+	clock_gettime(CLOCK_MONOTONIC, &ts);
+	return (double) ts.tv_sec + (double) ts.tv_nsec * 1e-9;
+}
+
+ok_status pogs_telemetry_alloc(pogs_telemetry ** t, size_t capacity)
+{
+	OK_CHECK_PTR(t);
+	if (*t)
+		return OK_SCAN_ERR( OPTKIT_ERROR_OVERWRITE );
+	if (capacity == 0)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DOMAIN );
+
+	pogs_telemetry * t_ = OK_NULL;
+	ok_alloc(t_, sizeof(*t_));
+	ok_alloc(t_->records, capacity * sizeof(*t_->records));
+	t_->capacity = capacity;
+	*t = t_;
+	return pogs_telemetry_clear(t_);
+}
+
+ok_status pogs_telemetry_free(pogs_telemetry * t)
+{
+	OK_CHECK_PTR(t);
+	ok_free(t->records);
+	ok_free(t);
+	return OPTKIT_SUCCESS;
+}
+
+ok_status pogs_telemetry_clear(pogs_telemetry * t)
+{
+	OK_CHECK_PTR(t);
+	t->count = 0;
+	t->lap = pogs_telemetry_clock();
+	return OPTKIT_SUCCESS;
+}
+
+/* seconds since the previous lap (or clear); 0 if t is NULL */
+double pogs_telemetry_lap(pogs_telemetry * t)
+{
+	double now, elapsed;
+	if (!t)
+		return 0;
+	now = pogs_telemetry_clock();
+	elapsed = now - t->lap;
+	t->lap = now;
+	return elapsed;
+}
+
+ok_status pogs_telemetry_push(pogs_telemetry * t,
+	const pogs_telemetry_record * record)
+{
+	OK_CHECK_PTR(t);
+	OK_CHECK_PTR(record);
+	t->records[t->count % t->capacity] = *record;
+	++t->count;
+	return OPTKIT_SUCCESS;
+}
+
+/*
+ * copy the retained records, oldest first, to records (which holds at
+ * least *count records on input); set *count to the number copied
+ */
+ok_status pogs_telemetry_copy(const pogs_telemetry * t,
+	pogs_telemetry_record * records, size_t * count)
+{
+	OK_CHECK_PTR(t);
+	OK_CHECK_PTR(records);
+	OK_CHECK_PTR(count);
+
+	size_t i, retained = t->count < t->capacity ? t->count : t->capacity;
+	size_t first = t->count - retained;
+
+	if (*count < retained)
+		return OK_SCAN_ERR( OPTKIT_ERROR_DIMENSION_MISMATCH );
+
+	for (i = 0; i < retained; ++i)
+		records[i] = t->records[(first + i) % t->capacity];
+	*count = retained;
+	return OPTKIT_SUCCESS;
+}
+
+#ifdef __cplusplus
+}
+#endif